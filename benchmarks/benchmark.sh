@@ -0,0 +1,8 @@
+#!/usr/bin/env bash
+
+set -o nounset -o errexit -o pipefail
+
+script_directory_path="$( cd "$( dirname "${BASH_SOURCE[0]}" )" &> /dev/null && pwd )"
+
+echo Running invocation round trip benchmark... >&2
+uv run --isolated --directory "${script_directory_path}" python "${script_directory_path}/invocation_round_trip_benchmark.py" "$@"
@@ -0,0 +1,208 @@
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+from time import perf_counter
+from typing import Any, Dict, List
+from uuid import uuid4
+
+from aws_test_harness.domain.buffered_invocation_post_office import BufferedInvocationPostOffice
+from aws_test_harness.domain.invocation_handler import InvocationHandler
+from aws_test_harness.domain.invocation_post_office import InvocationPostOffice as HarnessInvocationPostOffice
+from aws_test_harness.domain.invocation_target_twin_service import InvocationTargetTwinService
+from aws_test_harness.domain.invocation_timing_recorder import InvocationTimingRecorder
+from aws_test_harness.domain.timed_invocation_post_office import TimedInvocationPostOffice
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
+from aws_test_harness.infrastructure.in_memory_aws_resource_registry import InMemoryAwsResourceRegistry
+from aws_test_harness.infrastructure.result_queue_invocation_post_office import \
+    ResultQueueInvocationPostOffice as HarnessResultQueueInvocationPostOffice
+from aws_test_harness.infrastructure.serverless_invocation_post_office import \
+    ServerlessInvocationPostOffice as HarnessServerlessInvocationPostOffice
+from aws_test_harness.infrastructure.thread_pool_repeating_task_scheduler import ThreadPoolRepeatingTaskScheduler
+from aws_test_harness_test_support.in_memory_boto_session import InMemoryBotoSession
+from aws_test_harness_test_support.in_memory_dynamodb_resource import InMemoryDynamoDBResource
+from aws_test_harness_test_support.in_memory_sqs_client import InMemorySQSClient
+from test_double_invocation_handler_function_code.domain.invocation_result_service import InvocationResultService, \
+    DEFAULT_RESULT_POLLING_BACKOFF
+from test_double_invocation_handler_function_code.domain.result_polling_backoff import ResultPollingBackoff
+from test_double_invocation_handler_messaging.domain.invocation import Invocation
+from test_double_invocation_handler_messaging.domain.invocation_post_office import \
+    InvocationPostOffice as FunctionInvocationPostOffice
+from test_double_invocation_handler_messaging.infrastructure.result_queue_invocation_post_office import \
+    ResultQueueInvocationPostOffice as FunctionResultQueueInvocationPostOffice
+from test_double_invocation_handler_messaging.infrastructure.serverless_invocation_post_office import \
+    ServerlessInvocationPostOffice as FunctionServerlessInvocationPostOffice
+
+DEFAULT_CONCURRENCY_LEVELS = [1, 2, 4, 8, 16, 32]
+
+DEFAULT_INVOCATION_COUNT = 200
+
+INVOCATION_TABLE_RESULT_DELIVERY = 'invocation-table'
+
+RESULT_QUEUE_RESULT_DELIVERY = 'result-queue'
+
+INVOCATION_TABLE_NAME = 'AWSTestHarnessTestDoubleInvocationTable'
+
+TWIN_STATE_MACHINE_NAME = 'Benchmark'
+
+RESULT_TIMEOUT_MILLIS = 30000
+
+# As used by the function when results are delivered through the result queue
+RESULT_QUEUE_POLLING_BACKOFF = ResultPollingBackoff(initial_delay_millis=5, maximum_delay_millis=50)
+
+
+# Measures the round trip of invocations from the test double invocation handler function, through the invocation
+# queue, harness and twin, and back via either the invocation table or the result queue. SQS and DynamoDB are replaced
+# by in-memory stand-ins, so that the numbers reflect the overhead of the pipeline itself rather than of the network.
+def measure_round_trips(concurrency: int, invocation_count: int, invocation_handling_worker_count: int,
+                        result_delivery: str, logger: Logger) -> Dict[str, Any]:
+    sqs_client = InMemorySQSClient()
+    invocation_queue_url = sqs_client.create_queue(QueueName='AWSTestHarnessTestDoubleInvocationQueue')['QueueUrl']
+    result_queue_url = sqs_client.create_queue(QueueName='AWSTestHarnessTestDoubleResultQueue')['QueueUrl']
+    dynamodb_resource = InMemoryDynamoDBResource()
+    dynamodb_resource.create_table(TableName=INVOCATION_TABLE_NAME, KeySchema=[dict(AttributeName='id',
+                                                                                    KeyType='HASH')])
+    boto_session = InMemoryBotoSession(sqs_client, dynamodb_resource).as_boto_session()
+
+    harness_invocation_post_office: HarnessInvocationPostOffice
+    function_invocation_post_office: FunctionInvocationPostOffice
+
+    if result_delivery == RESULT_QUEUE_RESULT_DELIVERY:
+        harness_invocation_post_office = HarnessResultQueueInvocationPostOffice(
+            invocation_queue_url, result_queue_url, sqs_client.as_sqs_client(), logger
+        )
+        function_invocation_post_office = FunctionResultQueueInvocationPostOffice(
+            invocation_queue_url, result_queue_url, sqs_client.as_sqs_client()
+        )
+        result_polling_backoff = RESULT_QUEUE_POLLING_BACKOFF
+    else:
+        harness_invocation_post_office = HarnessServerlessInvocationPostOffice(
+            invocation_queue_url, INVOCATION_TABLE_NAME, BotoClientPool(boto_session), logger
+        )
+        function_invocation_post_office = FunctionServerlessInvocationPostOffice(
+            invocation_queue_url, INVOCATION_TABLE_NAME, boto_session
+        )
+        result_polling_backoff = DEFAULT_RESULT_POLLING_BACKOFF
+
+    aws_resource_registry = InMemoryAwsResourceRegistry()
+    timing_recorder = InvocationTimingRecorder()
+    invocation_target_twin_service = InvocationTargetTwinService(aws_resource_registry, timing_recorder)
+    invocation_target_twin_service.create_twin_for_state_machine(TWIN_STATE_MACHINE_NAME,
+                                                                 lambda execution_input: execution_input)
+    invocation_target = aws_resource_registry.get_resource_arn(f'{TWIN_STATE_MACHINE_NAME}AWSTestHarnessStateMachine')
+
+    invocation_handler = InvocationHandler(
+        BufferedInvocationPostOffice(TimedInvocationPostOffice(harness_invocation_post_office, timing_recorder),
+                                     logger),
+        invocation_target_twin_service.generate_result_for_invocation,
+        logger
+    )
+    invocation_result_service = InvocationResultService(function_invocation_post_office, RESULT_TIMEOUT_MILLIS, logger,
+                                                        result_polling_backoff)
+
+    def measure_round_trip(invocation_index: int) -> float:
+        start_time = perf_counter()
+        invocation_result_service.generate_result_for(Invocation(
+            id=str(uuid4()),
+            target=invocation_target,
+            parameters=dict(input=dict(index=invocation_index))
+        ))
+
+        return (perf_counter() - start_time) * 1000
+
+    invocation_handling_scheduler = ThreadPoolRepeatingTaskScheduler(logger, invocation_handling_worker_count)
+    invocation_handling_scheduler.schedule(invocation_handler.handle_pending_invocations)
+
+    try:
+        start_time = perf_counter()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            latencies_millis = list(executor.map(measure_round_trip, range(invocation_count)))
+
+        elapsed_seconds = perf_counter() - start_time
+    finally:
+        invocation_handling_scheduler.reset_schedule()
+
+    percentiles = statistics.quantiles(latencies_millis, n=100, method='inclusive')
+
+    return dict(
+        concurrency=concurrency,
+        result_delivery=result_delivery,
+        invocation_count=invocation_count,
+        latency_millis=dict(
+            p50=round(percentiles[49], 3),
+            p99=round(percentiles[98], 3),
+            mean=round(statistics.fmean(latencies_millis), 3),
+            max=round(max(latencies_millis), 3)
+        ),
+        throughput_per_second=round(invocation_count / elapsed_seconds, 1),
+        # Where the time goes within the harness, as recorded by its timing instrumentation
+        stage_p50_latency_millis={
+            stage: round(statistics.median(timing_recorder.durations_seconds(stage)) * 1000, 3)
+            for stage in sorted(set(timing.stage for timing in timing_recorder.timings))
+        },
+        request_counts=dict(
+            sqs=dict(send_message=sqs_client.request_count('send_message'),
+                     send_message_batch=sqs_client.request_count('send_message_batch'),
+                     receive_message=sqs_client.request_count('receive_message'),
+                     delete_message_batch=sqs_client.request_count('delete_message_batch'),
+                     change_message_visibility_batch=sqs_client.request_count('change_message_visibility_batch')),
+            dynamodb=dict(get_item=dynamodb_resource.request_count('get_item'),
+                          batch_write_item=dynamodb_resource.request_count('batch_write_item'))
+        )
+    )
+
+
+def run_benchmark(concurrency_levels: List[int], invocation_count: int, invocation_handling_worker_count: int,
+                  result_delivery: str) -> Dict[str, Any]:
+    logger = logging.getLogger('invocation_round_trip_benchmark')
+
+    return dict(
+        benchmark='invocation_round_trip',
+        python_version=platform.python_version(),
+        invocation_handling_worker_count=invocation_handling_worker_count,
+        result_delivery=result_delivery,
+        results=[
+            measure_round_trips(concurrency, invocation_count, invocation_handling_worker_count, result_delivery,
+                                logger)
+            for concurrency in concurrency_levels
+        ]
+    )
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description='Measures invocation round trip latency and throughput '
+                                                          'through the test double invocation pipeline')
+    argument_parser.add_argument('--concurrency', type=int, nargs='+', default=DEFAULT_CONCURRENCY_LEVELS,
+                                 help='Numbers of invocations to make at once')
+    argument_parser.add_argument('--invocation-count', type=int, default=DEFAULT_INVOCATION_COUNT,
+                                 help='Number of invocations to make at each concurrency level')
+    argument_parser.add_argument('--invocation-handling-worker-count', type=int, default=1,
+                                 help='Number of harness threads collecting invocations')
+    argument_parser.add_argument('--result-delivery', choices=[INVOCATION_TABLE_RESULT_DELIVERY,
+                                                               RESULT_QUEUE_RESULT_DELIVERY],
+                                 default=INVOCATION_TABLE_RESULT_DELIVERY,
+                                 help='How results are delivered from the harness back to the function')
+    argument_parser.add_argument('--output', help='Path of file to write results to, instead of standard output')
+    arguments = argument_parser.parse_args()
+
+    # Only problems are worth reporting, as the pipeline logs every invocation at info level
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+
+    benchmark_results = run_benchmark(arguments.concurrency, arguments.invocation_count,
+                                      arguments.invocation_handling_worker_count, arguments.result_delivery)
+
+    if arguments.output:
+        with open(arguments.output, 'w') as output_file:
+            json.dump(benchmark_results, output_file, indent=2)
+    else:
+        json.dump(benchmark_results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
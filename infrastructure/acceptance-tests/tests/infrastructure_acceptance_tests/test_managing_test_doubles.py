@@ -16,7 +16,8 @@ from aws_test_harness_test_support.step_functions_utils import wait_for_state_ma
 from aws_test_harness_test_support.system_command_executor import SystemCommandExecutor
 from aws_test_harness_test_support.test_cloudformation_stack import TestCloudFormationStack
 from test_double_invocation_handler_messaging.test_support.invocation_messaging_utils import \
-    put_invocation_result_dynamodb_record, wait_for_invocation_sqs_message, get_invocation_parameters_from_sqs_message
+    put_invocation_result_dynamodb_record, send_invocation_result_sqs_message, wait_for_invocation_sqs_message, \
+    get_invocation_parameters_from_sqs_message
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -66,6 +67,25 @@ def test_stack(cfn_stack_name_prefix: str, logger: Logger, boto_session: Session
     return stack
 
 
+@pytest.fixture(scope="module")
+def result_queue_test_stack(cfn_stack_name_prefix: str, logger: Logger,
+                            boto_session: Session) -> TestCloudFormationStack:
+    stack = TestCloudFormationStack(f'{cfn_stack_name_prefix}acceptance-result-queue', logger, boto_session)
+
+    stack.ensure_state_is(
+        Transform=['infrastructure-tests-AWSTestHarness-TestDoubles'],
+        Parameters=dict(
+            AWSTestHarnessStateMachines=dict(Type='CommaDelimitedList'),
+            AWSTestHarnessResultQueue=dict(Type='String'),
+        ),
+        Resources=dict(Bucket=dict(Type='AWS::S3::Bucket', Properties={})),
+        AWSTestHarnessStateMachines='Blue',
+        AWSTestHarnessResultQueue='true'
+    )
+
+    return stack
+
+
 def test_managing_test_double_s3_buckets(test_stack: TestCloudFormationStack) -> None:
     assert_s3_bucket_resource_exists_in(test_stack, 'RedAWSTestHarnessS3Bucket')
     assert_s3_bucket_resource_exists_in(test_stack, 'GreenAWSTestHarnessS3Bucket')
@@ -102,6 +122,39 @@ def test_managing_test_double_state_machines(test_stack: TestCloudFormationStack
     state_machine_execution.assert_succeeded_with_output(dict(randomString=random_output_string))
 
 
+def test_delivering_test_double_state_machine_results_via_result_queue(
+        result_queue_test_stack: TestCloudFormationStack, boto_session: Session) -> None:
+    blue_state_machine = assert_state_machine_resource_exists_in(
+        result_queue_test_stack, 'BlueAWSTestHarnessStateMachine'
+    )
+
+    random_input_string = str(uuid4())
+
+    state_machine_execution = start_statemachine_execution(
+        dict(randomString=random_input_string),
+        state_machine_arn=blue_state_machine['PhysicalResourceId'],
+        boto_session=boto_session
+    )
+
+    assert_invocation_present_in_invocation_queue(
+        result_queue_test_stack.get_stack_resource_physical_id('AWSTestHarnessTestDoubleInvocationQueue'),
+        expected_execution_arn=state_machine_execution.execution_arn,
+        expected_input=dict(randomString=random_input_string),
+        boto_session=boto_session
+    )
+
+    random_output_string = str(uuid4())
+
+    send_invocation_result_sqs_message(
+        state_machine_execution.execution_arn,
+        dict(status='succeeded', context=dict(result=dict(randomString=random_output_string))),
+        result_queue_test_stack.get_stack_resource_physical_id('AWSTestHarnessTestDoubleResultQueue'),
+        boto_session.client('sqs')
+    )
+
+    state_machine_execution.assert_succeeded_with_output(dict(randomString=random_output_string))
+
+
 def assert_s3_bucket_resource_exists_in(test_stack: TestCloudFormationStack,
                                         resource_logical_id: str) -> StackResourceDetailTypeDef:
     return assert_resource_exists_in_stack(test_stack, resource_logical_id, 'AWS::S3::Bucket')
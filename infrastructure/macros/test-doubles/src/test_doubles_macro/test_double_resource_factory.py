@@ -15,7 +15,7 @@ class TestDoubleResourceFactory:
             invocation_handler_function_code_s3_bucket,
             invocation_handler_function_code_s3_key)
 
-    def generate_additional_resources(self, desired_test_doubles: Dict[str, List[str]]) -> Dict[str, Any]:
+    def generate_additional_resources(self, desired_test_doubles: Dict[str, Any]) -> Dict[str, Any]:
         additional_resources: Dict[str, Dict[str, Any]] = {}
 
         for s3_bucket_id in self.__try_get_string_list('AWSTestHarnessS3Buckets', desired_test_doubles):
@@ -27,7 +27,9 @@ class TestDoubleResourceFactory:
 
         if state_machine_ids:
             self.__add_test_double_invocation_handling_resources_for(
-                test_double_invocation_handler_function_logical_id, additional_resources
+                test_double_invocation_handler_function_logical_id,
+                self.__try_get_flag('AWSTestHarnessResultQueue', desired_test_doubles),
+                additional_resources
             )
 
         for state_machine_id in state_machine_ids:
@@ -56,21 +58,29 @@ class TestDoubleResourceFactory:
         additional_resources[state_machine_role_logical_id] = resource_descriptions.role
         additional_resources[f'{state_machine_id}AWSTestHarnessStateMachine'] = resource_descriptions.state_machine
 
-    def __add_test_double_invocation_handling_resources_for(self, function_logical_id: str,
+    def __add_test_double_invocation_handling_resources_for(self, function_logical_id: str, with_result_queue: bool,
                                                             additional_resources: Dict[str, Dict[str, Any]]) -> None:
         function_role_logical_id = 'AWSTestHarnessTestDoubleInvocationHandlerFunctionRole'
         queue_logical_id = 'AWSTestHarnessTestDoubleInvocationQueue'
         invocation_table_logical_id = 'AWSTestHarnessTestDoubleInvocationTable'
+        # Opt-in, since results are otherwise delivered via the invocation table with lower latency and fewer requests
+        result_queue_logical_id = 'AWSTestHarnessTestDoubleResultQueue' if with_result_queue else None
 
         resource_descriptions = self.__invocation_handling_resource_factory.generate_resources(
-            function_role_logical_id, queue_logical_id, invocation_table_logical_id
+            function_role_logical_id, queue_logical_id, invocation_table_logical_id, result_queue_logical_id
         )
 
         additional_resources[queue_logical_id] = resource_descriptions.invocation_queue
         additional_resources[invocation_table_logical_id] = resource_descriptions.invocation_table
+        if result_queue_logical_id is not None and resource_descriptions.result_queue is not None:
+            additional_resources[result_queue_logical_id] = resource_descriptions.result_queue
         additional_resources[function_role_logical_id] = resource_descriptions.invocation_handler_function_role
         additional_resources[function_logical_id] = resource_descriptions.invocation_handler_function
 
     @staticmethod
-    def __try_get_string_list(key: str, dictionary: Dict[str, List[str]]) -> List[str]:
+    def __try_get_string_list(key: str, dictionary: Dict[str, Any]) -> List[str]:
         return dictionary.get(key, [])
+
+    @staticmethod
+    def __try_get_flag(key: str, dictionary: Dict[str, Any]) -> bool:
+        return str(dictionary.get(key, 'false')).lower() == 'true'
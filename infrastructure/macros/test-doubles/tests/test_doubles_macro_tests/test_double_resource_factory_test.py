@@ -3,7 +3,7 @@ import tempfile
 import zipfile
 from datetime import datetime
 from logging import Logger
-from typing import cast, Dict, List, Optional
+from typing import cast, Any, Dict, List, Optional
 
 import pytest
 from boto3 import Session
@@ -117,6 +117,38 @@ def test_generates_invocation_handling_cloudformation_resources(
     assert invocation_table_resource is not None
     assert invocation_table_resource['ResourceType'] == 'AWS::DynamoDB::Table'
 
+    assert test_stack.get_stack_resource('AWSTestHarnessTestDoubleResultQueue') is None
+
+
+def test_generates_result_queue_cloudformation_resource_for_function_to_use_if_opted_into() -> None:
+    desired_test_doubles: Dict[str, Any] = dict(
+        create_test_double_parameters_with(AWSTestHarnessStateMachines=['Blue']),
+        AWSTestHarnessResultQueue='true'
+    )
+    test_double_resource_factory = TestDoubleResourceFactory(ANY_S3_BUCKET_NAME, ANY_S3_KEY)
+
+    resources = test_double_resource_factory.generate_additional_resources(desired_test_doubles)
+
+    assert resources['AWSTestHarnessTestDoubleResultQueue']['Type'] == 'AWS::SQS::Queue'
+    function_environment_variables = \
+        resources['AWSTestHarnessTestDoubleInvocationHandlerFunction']['Properties']['Environment']['Variables']
+    assert function_environment_variables['RESULT_QUEUE_URL'] == dict(Ref='AWSTestHarnessTestDoubleResultQueue')
+
+
+def test_omits_result_queue_cloudformation_resource_unless_opted_into() -> None:
+    desired_test_doubles: Dict[str, Any] = dict(
+        create_test_double_parameters_with(AWSTestHarnessStateMachines=['Blue']),
+        AWSTestHarnessResultQueue='false'
+    )
+    test_double_resource_factory = TestDoubleResourceFactory(ANY_S3_BUCKET_NAME, ANY_S3_KEY)
+
+    resources = test_double_resource_factory.generate_additional_resources(desired_test_doubles)
+
+    assert 'AWSTestHarnessTestDoubleResultQueue' not in resources
+    function_environment_variables = \
+        resources['AWSTestHarnessTestDoubleInvocationHandlerFunction']['Properties']['Environment']['Variables']
+    assert 'RESULT_QUEUE_URL' not in function_environment_variables
+
 
 def test_omits_test_double_invocation_handling_cloudformation_resources_if_no_state_machines_specified() -> None:
     desired_test_doubles = create_test_double_parameters_with(AWSTestHarnessStateMachines=[])
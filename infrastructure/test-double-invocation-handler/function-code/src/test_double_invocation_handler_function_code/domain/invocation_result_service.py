@@ -1,32 +1,138 @@
 import time
-from typing import Any
+from logging import Logger
+from typing import Any, Dict, List, Optional
 
 from test_double_invocation_handler_messaging.domain.invocation_result_retrieval_timeout_exception import \
     InvocationResultRetrievalTimeoutException
 from test_double_invocation_handler_messaging.domain.invocation import Invocation
 from test_double_invocation_handler_messaging.domain.invocation_post_office import InvocationPostOffice
+from test_double_invocation_handler_messaging.domain.retrieval_attempt import RetrievalAttempt
+from test_double_invocation_handler_function_code.domain.invocation_span import InvocationSpan
+from test_double_invocation_handler_function_code.domain.invocation_trace_logger import InvocationTraceLogger
+from test_double_invocation_handler_function_code.domain.result_polling_backoff import ResultPollingBackoff
+
+DEFAULT_RESULT_POLLING_BACKOFF = ResultPollingBackoff(initial_delay_millis=10, maximum_delay_millis=200)
 
 
 class InvocationResultService:
 
-    def __init__(self, invocation_post_office: InvocationPostOffice, timeout_millis: int):
+    def __init__(self, invocation_post_office: InvocationPostOffice, timeout_millis: int, logger: Logger,
+                 result_polling_backoff: ResultPollingBackoff = DEFAULT_RESULT_POLLING_BACKOFF,
+                 invocation_trace_logger: Optional[InvocationTraceLogger] = None):
         self.__invocation_post_office = invocation_post_office
         self.__timeout_millis = timeout_millis
+        self.__logger = logger
+        self.__result_polling_backoff = result_polling_backoff
+        self.__invocation_trace_logger = invocation_trace_logger
 
     def generate_result_for(self, invocation: Invocation) -> Any:
+        posting_start_time = time.time()
         self.__invocation_post_office.post_invocation(invocation)
+        posting_end_time = time.time()
 
         timeout_time = time.time() * 1000 + self.__timeout_millis
+        retrieval_request_count = 0
 
-        while True:
+        for delay_millis in self.__result_polling_backoff.delays_millis():
             retrieval_attempt = self.__invocation_post_office.maybe_collect_result(invocation)
+            retrieval_request_count += 1
 
             if retrieval_attempt.succeeded:
+                self.__logger.info(
+                    f'Retrieved result for invocation {invocation.id} after {retrieval_request_count} request(s)'
+                )
+                self.__trace(invocation.id, posting_start_time, posting_end_time, retrieval_attempt, time.time())
                 return retrieval_attempt.value
 
-            if time.time() * 1000 > timeout_time:
+            remaining_millis = timeout_time - time.time() * 1000
+
+            if remaining_millis < 0:
+                self.__logger.info(
+                    f'Gave up retrieving result for invocation {invocation.id} after {retrieval_request_count} '
+                    f'request(s)'
+                )
+                self.__invocation_post_office.abandon([invocation])
                 raise InvocationResultRetrievalTimeoutException(
                     f'Timed out after {self.__timeout_millis}ms waiting for result for invocation {invocation.id}'
                 )
 
-            time.sleep(0.001)
+            # Never sleep past the timeout, so that one final attempt is made just before giving up
+            time.sleep(min(delay_millis, remaining_millis) / 1000)
+
+        # The backoff provides delays for as long as they are asked for, so attempts only stop at the timeout
+        raise AssertionError('Result polling backoff provided no further delays')
+
+    def generate_results_for(self, invocations: List[Invocation]) -> Dict[str, Any]:
+        posting_start_time = time.time()
+
+        for invocation in invocations:
+            self.__invocation_post_office.post_invocation(invocation)
+
+        posting_end_time = time.time()
+
+        timeout_time = time.time() * 1000 + self.__timeout_millis
+        outstanding_invocations = list(invocations)
+        results: Dict[str, Any] = {}
+        retrieval_request_count = 0
+
+        for delay_millis in self.__result_polling_backoff.delays_millis():
+            # Collect results for every outstanding invocation together, rather than polling for each in turn
+            retrieval_attempts = self.__invocation_post_office.maybe_collect_results(outstanding_invocations)
+            retrieval_request_count += 1
+
+            retrieval_time = time.time()
+
+            for invocation_id, retrieval_attempt in retrieval_attempts.items():
+                if retrieval_attempt.succeeded:
+                    results[invocation_id] = retrieval_attempt.value
+                    self.__trace(invocation_id, posting_start_time, posting_end_time, retrieval_attempt,
+                                 retrieval_time)
+
+            outstanding_invocations = [invocation for invocation in outstanding_invocations
+                                       if invocation.id not in results]
+
+            if not outstanding_invocations:
+                self.__logger.info(
+                    f'Retrieved results for {len(invocations)} invocation(s) after {retrieval_request_count} request(s)'
+                )
+                return results
+
+            remaining_millis = timeout_time - time.time() * 1000
+
+            if remaining_millis < 0:
+                outstanding_invocation_ids = ', '.join(invocation.id for invocation in outstanding_invocations)
+                self.__logger.info(
+                    f'Gave up retrieving results for invocations {outstanding_invocation_ids} after '
+                    f'{retrieval_request_count} request(s)'
+                )
+                self.__invocation_post_office.abandon(outstanding_invocations)
+                raise InvocationResultRetrievalTimeoutException(
+                    f'Timed out after {self.__timeout_millis}ms waiting for results for invocations '
+                    f'{outstanding_invocation_ids}'
+                )
+
+            # Never sleep past the timeout, so that one final attempt is made just before giving up
+            time.sleep(min(delay_millis, remaining_millis) / 1000)
+
+        # The backoff provides delays for as long as they are asked for, so attempts only stop at the timeout
+        raise AssertionError('Result polling backoff provided no further delays')
+
+    def __trace(self, invocation_id: str, posting_start_time: float, posting_end_time: float,
+                retrieval_attempt: RetrievalAttempt, retrieval_time: float) -> None:
+        if self.__invocation_trace_logger is None:
+            return
+
+        spans = [
+            InvocationSpan('invocation', posting_start_time, retrieval_time),
+            InvocationSpan('invocation_posting', posting_start_time, posting_end_time),
+        ]
+
+        if retrieval_attempt.posted_time is None:
+            spans.append(InvocationSpan('result_waiting', posting_end_time, retrieval_time))
+        else:
+            # Split at the time the harness posted the result, as measured by its clock, so that time spent by the
+            # harness can be told apart from time spent delivering and retrieving the result
+            spans.append(InvocationSpan('harness_handling', posting_end_time, retrieval_attempt.posted_time))
+            spans.append(InvocationSpan('result_delivery', retrieval_attempt.posted_time, retrieval_time))
+
+        self.__invocation_trace_logger.log(invocation_id, spans)
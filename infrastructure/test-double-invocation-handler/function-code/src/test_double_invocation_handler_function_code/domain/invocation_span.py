@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class InvocationSpan:
+    name: str
+    # Seconds since the epoch
+    start_time: float
+    end_time: float
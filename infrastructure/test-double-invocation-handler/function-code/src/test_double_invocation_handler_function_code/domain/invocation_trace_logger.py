@@ -0,0 +1,27 @@
+import json
+from logging import Logger
+from typing import List
+
+from test_double_invocation_handler_function_code.domain.invocation_span import InvocationSpan
+
+
+# Logs the spans of each invocation as a single line of JSON, so that the path of an invocation through this function
+# can be found by invocation ID and lined up with the spans recorded for it by the harness
+class InvocationTraceLogger:
+    def __init__(self, logger: Logger):
+        self.__logger = logger
+
+    def log(self, invocation_id: str, spans: List[InvocationSpan]) -> None:
+        trace = dict(
+            invocationId=invocation_id,
+            spans=[
+                dict(
+                    name=span.name,
+                    startTimeUnixMillis=round(span.start_time * 1000, 1),
+                    durationMillis=round((span.end_time - span.start_time) * 1000, 1)
+                )
+                for span in spans
+            ]
+        )
+
+        self.__logger.info(f'Trace for invocation {invocation_id}: {json.dumps(trace)}')
@@ -0,0 +1,35 @@
+import random
+from dataclasses import dataclass
+from typing import Iterator, Callable
+
+
+@dataclass(frozen=True)
+class ResultPollingBackoff:
+    initial_delay_millis: float
+    maximum_delay_millis: float
+    multiplier: float = 2
+    # Fraction of each delay that may be randomly removed, so that concurrent invocations don't poll in lockstep
+    jitter: float = 0.5
+
+    def __post_init__(self) -> None:
+        if self.initial_delay_millis <= 0:
+            raise ValueError(f'Initial delay must be positive but was {self.initial_delay_millis}ms')
+
+        if self.maximum_delay_millis < self.initial_delay_millis:
+            raise ValueError(
+                f'Maximum delay ({self.maximum_delay_millis}ms) must be at least '
+                f'the initial delay ({self.initial_delay_millis}ms)'
+            )
+
+        if self.multiplier < 1:
+            raise ValueError(f'Multiplier must be at least 1 but was {self.multiplier}')
+
+        if not 0 <= self.jitter < 1:
+            raise ValueError(f'Jitter must be at least 0 and less than 1 but was {self.jitter}')
+
+    def delays_millis(self, random_fraction: Callable[[], float] = random.random) -> Iterator[float]:
+        delay = self.initial_delay_millis
+
+        while True:
+            yield delay * (1 - self.jitter * random_fraction())
+            delay = min(delay * self.multiplier, self.maximum_delay_millis)
@@ -1,3 +1,4 @@
+import logging
 import os
 from typing import Dict, Any, Optional
 
@@ -6,11 +7,22 @@ from aws_lambda_typing.context import Context
 
 from test_double_invocation_handler_messaging.domain.invocation import Invocation
 from test_double_invocation_handler_function_code.domain.invocation_result_service import InvocationResultService
+from test_double_invocation_handler_function_code.domain.invocation_trace_logger import InvocationTraceLogger
+from test_double_invocation_handler_function_code.domain.result_polling_backoff import ResultPollingBackoff
+from test_double_invocation_handler_messaging.infrastructure.result_queue_invocation_post_office import \
+    ResultQueueInvocationPostOffice
 from test_double_invocation_handler_messaging.infrastructure.serverless_invocation_post_office import \
     ServerlessInvocationPostOffice
 
 TIMEOUT_BUFFER_MILLIS = 1000
 
+# Each attempt to collect a result from the result queue is a long poll, so only a short pause is needed between
+# attempts to avoid repeatedly receiving results for other invocations
+RESULT_QUEUE_POLLING_BACKOFF = ResultPollingBackoff(initial_delay_millis=5, maximum_delay_millis=50)
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
 invocation_result_service: Optional[InvocationResultService] = None
 
 
@@ -18,16 +30,37 @@ def get_invocation_result_service(context: Context) -> InvocationResultService:
     global invocation_result_service
 
     if invocation_result_service is None:
-        timeout_millis = max(0, context.get_remaining_time_in_millis() - TIMEOUT_BUFFER_MILLIS)
-
-        invocation_result_service = InvocationResultService(
-            ServerlessInvocationPostOffice(
-                os.environ['INVOCATION_QUEUE_URL'],
-                os.environ['INVOCATION_TABLE_NAME'],
-                boto3.Session()
-            ),
-            timeout_millis
-        )
+        remaining_time_millis = context.get_remaining_time_in_millis()
+        timeout_millis = max(0, remaining_time_millis - TIMEOUT_BUFFER_MILLIS)
+
+        # Only given a result queue by stacks that opted into one, otherwise results are collected from the invocation
+        # table
+        if 'RESULT_QUEUE_URL' in os.environ:
+            invocation_result_service = InvocationResultService(
+                ResultQueueInvocationPostOffice(
+                    os.environ['INVOCATION_QUEUE_URL'],
+                    os.environ['RESULT_QUEUE_URL'],
+                    boto3.client('sqs'),
+                    # Every invocation of this function has ended by the time a result is this old, so whichever
+                    # instance receives it can delete it
+                    abandoned_result_age_millis=remaining_time_millis + TIMEOUT_BUFFER_MILLIS
+                ),
+                timeout_millis,
+                logger,
+                RESULT_QUEUE_POLLING_BACKOFF,
+                InvocationTraceLogger(logger)
+            )
+        else:
+            invocation_result_service = InvocationResultService(
+                ServerlessInvocationPostOffice(
+                    os.environ['INVOCATION_QUEUE_URL'],
+                    os.environ['INVOCATION_TABLE_NAME'],
+                    boto3.Session()
+                ),
+                timeout_millis,
+                logger,
+                invocation_trace_logger=InvocationTraceLogger(logger)
+            )
 
     return invocation_result_service
 
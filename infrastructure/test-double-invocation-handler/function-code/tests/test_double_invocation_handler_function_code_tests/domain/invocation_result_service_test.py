@@ -1,21 +1,27 @@
-from time import sleep
+from logging import Logger
+from time import sleep, time
+from typing import List
 from unittest.mock import ANY
 from uuid import uuid4
 
 import pytest
 
-from aws_test_harness_test_support.mocking import mock_class, when_calling, verify, as_calls, typed_call
+from aws_test_harness_test_support.mocking import mock_class, when_calling, verify, as_calls, typed_call, inspect
 from test_double_invocation_handler_messaging.test_support.builders.invocation_builder import an_invocation_with
 from test_double_invocation_handler_messaging.domain.invocation_result_retrieval_timeout_exception import InvocationResultRetrievalTimeoutException
 from test_double_invocation_handler_messaging.domain.invocation import Invocation
 from test_double_invocation_handler_messaging.domain.invocation_post_office import InvocationPostOffice
 from test_double_invocation_handler_function_code.domain.invocation_result_service import InvocationResultService
+from test_double_invocation_handler_function_code.domain.invocation_trace_logger import InvocationTraceLogger
+from test_double_invocation_handler_function_code.domain.result_polling_backoff import ResultPollingBackoff
 from test_double_invocation_handler_messaging.domain.retrieval_attempt import RetrievalAttempt
 
 LONG_TIMEOUT_MILLIS = 5000
 
+FAST_BACKOFF = ResultPollingBackoff(initial_delay_millis=1, maximum_delay_millis=1)
 
-def test_retrieves_result_from_invocation_post_office() -> None:
+
+def test_retrieves_result_from_invocation_post_office(logger: Logger) -> None:
     invocation_post_office = mock_class(InvocationPostOffice)
     the_invocation = an_invocation_with(invocation_id=str(uuid4()))
     when_calling(invocation_post_office.maybe_collect_result).invoke(
@@ -24,16 +30,18 @@ def test_retrieves_result_from_invocation_post_office() -> None:
         else RetrievalAttempt.failed()
     )
 
-    invocation_result_service = InvocationResultService(invocation_post_office, LONG_TIMEOUT_MILLIS)
+    invocation_result_service = InvocationResultService(invocation_post_office, LONG_TIMEOUT_MILLIS, logger,
+                                                        FAST_BACKOFF)
 
     generated_result = invocation_result_service.generate_result_for(the_invocation)
 
     assert generated_result == 'the retrieved result'
 
 
-def test_posts_invocation_before_attempting_to_retrieve_result() -> None:
+def test_posts_invocation_before_attempting_to_retrieve_result(logger: Logger) -> None:
     invocation_post_office = mock_class(InvocationPostOffice)
-    invocation_result_service = InvocationResultService(invocation_post_office, LONG_TIMEOUT_MILLIS)
+    invocation_result_service = InvocationResultService(invocation_post_office, LONG_TIMEOUT_MILLIS, logger,
+                                                        FAST_BACKOFF)
     the_invocation = an_invocation_with(invocation_id=str(uuid4()))
 
     invocation_result_service.generate_result_for(the_invocation)
@@ -47,7 +55,7 @@ def test_posts_invocation_before_attempting_to_retrieve_result() -> None:
     )
 
 
-def test_keeps_trying_to_retrieve_result_until_available() -> None:
+def test_keeps_trying_to_retrieve_result_until_available(logger: Logger) -> None:
     invocation_post_office = mock_class(InvocationPostOffice)
     the_invocation = an_invocation_with(invocation_id=str(uuid4()))
     when_calling(invocation_post_office.maybe_collect_result).respond_with(
@@ -56,14 +64,15 @@ def test_keeps_trying_to_retrieve_result_until_available() -> None:
         RetrievalAttempt('the retrieved result')
     )
 
-    invocation_result_service = InvocationResultService(invocation_post_office, LONG_TIMEOUT_MILLIS)
+    invocation_result_service = InvocationResultService(invocation_post_office, LONG_TIMEOUT_MILLIS, logger,
+                                                        FAST_BACKOFF)
 
     generated_result = invocation_result_service.generate_result_for(the_invocation)
 
     assert generated_result == 'the retrieved result'
 
 
-def test_raises_timeout_exception_if_no_result_retrieved_before_timeout() -> None:
+def test_raises_timeout_exception_if_no_result_retrieved_before_timeout(logger: Logger) -> None:
     invocation_post_office = mock_class(InvocationPostOffice)
     invocation_id = str(uuid4())
     the_invocation = an_invocation_with(invocation_id=invocation_id)
@@ -74,10 +83,177 @@ def test_raises_timeout_exception_if_no_result_retrieved_before_timeout() -> Non
 
     when_calling(invocation_post_office.maybe_collect_result).invoke(maybe_collect_result)
 
-    invocation_result_service = InvocationResultService(invocation_post_office, 10)
+    invocation_result_service = InvocationResultService(invocation_post_office, 10, logger, FAST_BACKOFF)
 
     with pytest.raises(
             InvocationResultRetrievalTimeoutException,
             match=f'Timed out after 10ms waiting for result for invocation {invocation_id}'
     ):
         invocation_result_service.generate_result_for(the_invocation)
+
+    verify(invocation_post_office.abandon).was_called_once_with([the_invocation])
+
+
+def test_backs_off_exponentially_between_retrieval_attempts(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    retrieval_attempt_times: List[float] = []
+
+    def maybe_collect_result(_: Invocation) -> RetrievalAttempt:
+        retrieval_attempt_times.append(time())
+        return RetrievalAttempt('the retrieved result') if len(retrieval_attempt_times) == 4 \
+            else RetrievalAttempt.failed()
+
+    when_calling(invocation_post_office.maybe_collect_result).invoke(maybe_collect_result)
+
+    invocation_result_service = InvocationResultService(
+        invocation_post_office, LONG_TIMEOUT_MILLIS, logger,
+        ResultPollingBackoff(initial_delay_millis=20, maximum_delay_millis=50, multiplier=2, jitter=0)
+    )
+
+    invocation_result_service.generate_result_for(an_invocation_with(invocation_id=str(uuid4())))
+
+    intervals = [later - earlier for earlier, later in zip(retrieval_attempt_times, retrieval_attempt_times[1:])]
+    assert len(intervals) == 3
+    assert intervals[0] >= 0.02
+    assert intervals[1] >= 0.04
+    assert 0.05 <= intervals[2] < 0.08
+
+
+def test_makes_final_retrieval_attempt_at_timeout_rather_than_sleeping_past_it(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.maybe_collect_result).always_return(RetrievalAttempt.failed())
+
+    invocation_result_service = InvocationResultService(
+        invocation_post_office, 50, logger,
+        ResultPollingBackoff(initial_delay_millis=10_000, maximum_delay_millis=10_000)
+    )
+
+    start_time = time()
+
+    with pytest.raises(InvocationResultRetrievalTimeoutException):
+        invocation_result_service.generate_result_for(an_invocation_with(invocation_id=str(uuid4())))
+
+    assert time() - start_time < 1
+
+
+def test_reports_number_of_retrieval_requests_made_for_invocation() -> None:
+    logger = mock_class(Logger)
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.maybe_collect_result).respond_with(
+        RetrievalAttempt.failed(),
+        RetrievalAttempt.failed(),
+        RetrievalAttempt('the retrieved result')
+    )
+
+    invocation_result_service = InvocationResultService(invocation_post_office, LONG_TIMEOUT_MILLIS, logger,
+                                                        FAST_BACKOFF)
+
+    invocation_id = str(uuid4())
+    invocation_result_service.generate_result_for(an_invocation_with(invocation_id=invocation_id))
+
+    verify(logger.info).was_called_once_with(f'Retrieved result for invocation {invocation_id} after 3 request(s)')
+
+
+def test_retrieves_results_for_many_invocations_together_until_all_available(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    first_invocation = an_invocation_with(invocation_id=str(uuid4()))
+    second_invocation = an_invocation_with(invocation_id=str(uuid4()))
+    when_calling(invocation_post_office.maybe_collect_results).respond_with(
+        {first_invocation.id: RetrievalAttempt('the first result'), second_invocation.id: RetrievalAttempt.failed()},
+        {second_invocation.id: RetrievalAttempt('the second result')}
+    )
+
+    invocation_result_service = InvocationResultService(invocation_post_office, LONG_TIMEOUT_MILLIS, logger,
+                                                        FAST_BACKOFF)
+
+    results = invocation_result_service.generate_results_for([first_invocation, second_invocation])
+
+    assert results == {first_invocation.id: 'the first result', second_invocation.id: 'the second result'}
+    verify(invocation_post_office).had_calls(
+        as_calls(
+            typed_call(InvocationPostOffice).post_invocation(first_invocation),
+            typed_call(InvocationPostOffice).post_invocation(second_invocation),
+            typed_call(InvocationPostOffice).maybe_collect_results([first_invocation, second_invocation]),
+            typed_call(InvocationPostOffice).maybe_collect_results([second_invocation])
+        ),
+        any_order=False
+    )
+
+
+def test_raises_timeout_exception_naming_invocations_without_results_before_timeout(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    first_invocation = an_invocation_with(invocation_id=str(uuid4()))
+    second_invocation = an_invocation_with(invocation_id=str(uuid4()))
+    when_calling(invocation_post_office.maybe_collect_results).always_return(
+        {first_invocation.id: RetrievalAttempt('the first result'), second_invocation.id: RetrievalAttempt.failed()}
+    )
+
+    invocation_result_service = InvocationResultService(invocation_post_office, 10, logger, FAST_BACKOFF)
+
+    with pytest.raises(
+            InvocationResultRetrievalTimeoutException,
+            match=f'Timed out after 10ms waiting for results for invocations {second_invocation.id}$'
+    ):
+        invocation_result_service.generate_results_for([first_invocation, second_invocation])
+
+    verify(invocation_post_office.abandon).was_called_once_with([second_invocation])
+
+
+def test_traces_invocation_split_at_time_result_posted_by_harness(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    invocation_trace_logger = mock_class(InvocationTraceLogger)
+    invocation_id = str(uuid4())
+    result_posted_time = time()
+    when_calling(invocation_post_office.maybe_collect_result).always_return(
+        RetrievalAttempt('the retrieved result', posted_time=result_posted_time)
+    )
+
+    invocation_result_service = InvocationResultService(invocation_post_office, LONG_TIMEOUT_MILLIS, logger,
+                                                        FAST_BACKOFF, invocation_trace_logger)
+
+    invocation_result_service.generate_result_for(an_invocation_with(invocation_id=invocation_id))
+
+    traced_invocation_id, spans = inspect(invocation_trace_logger.log).call_args.args
+    assert traced_invocation_id == invocation_id
+    assert [span.name for span in spans] == ['invocation', 'invocation_posting', 'harness_handling',
+                                             'result_delivery']
+    invocation_span, posting_span, harness_handling_span, result_delivery_span = spans
+    assert posting_span.start_time == invocation_span.start_time
+    assert harness_handling_span.start_time == posting_span.end_time
+    assert harness_handling_span.end_time == result_posted_time
+    assert result_delivery_span.start_time == result_posted_time
+    assert result_delivery_span.end_time == invocation_span.end_time
+
+
+def test_traces_time_spent_waiting_for_result_when_not_stamped_by_harness(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    invocation_trace_logger = mock_class(InvocationTraceLogger)
+    when_calling(invocation_post_office.maybe_collect_result).always_return(RetrievalAttempt('the retrieved result'))
+
+    invocation_result_service = InvocationResultService(invocation_post_office, LONG_TIMEOUT_MILLIS, logger,
+                                                        FAST_BACKOFF, invocation_trace_logger)
+
+    invocation_result_service.generate_result_for(an_invocation_with(invocation_id=str(uuid4())))
+
+    _, spans = inspect(invocation_trace_logger.log).call_args.args
+    assert [span.name for span in spans] == ['invocation', 'invocation_posting', 'result_waiting']
+
+
+def test_traces_each_of_many_invocations_once_result_retrieved(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    invocation_trace_logger = mock_class(InvocationTraceLogger)
+    first_invocation = an_invocation_with(invocation_id=str(uuid4()))
+    second_invocation = an_invocation_with(invocation_id=str(uuid4()))
+    when_calling(invocation_post_office.maybe_collect_results).respond_with(
+        {first_invocation.id: RetrievalAttempt('the first result'), second_invocation.id: RetrievalAttempt.failed()},
+        {second_invocation.id: RetrievalAttempt('the second result')}
+    )
+
+    invocation_result_service = InvocationResultService(invocation_post_office, LONG_TIMEOUT_MILLIS, logger,
+                                                        FAST_BACKOFF, invocation_trace_logger)
+
+    invocation_result_service.generate_results_for([first_invocation, second_invocation])
+
+    assert [call.args[0] for call in inspect(invocation_trace_logger.log).call_args_list] == [
+        first_invocation.id, second_invocation.id
+    ]
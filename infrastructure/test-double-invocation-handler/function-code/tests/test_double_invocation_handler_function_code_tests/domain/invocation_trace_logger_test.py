@@ -0,0 +1,26 @@
+import json
+from logging import Logger
+
+from aws_test_harness_test_support.mocking import mock_class, inspect
+from test_double_invocation_handler_function_code.domain.invocation_span import InvocationSpan
+from test_double_invocation_handler_function_code.domain.invocation_trace_logger import InvocationTraceLogger
+
+
+def test_logs_spans_of_invocation_as_single_line_of_json() -> None:
+    logger = mock_class(Logger)
+
+    InvocationTraceLogger(logger).log('the invocation id', [
+        InvocationSpan('invocation', 1700000000, 1700000000.5),
+        InvocationSpan('invocation_posting', 1700000000, 1700000000.0125),
+    ])
+
+    [message] = inspect(logger.info).call_args.args
+    prefix = 'Trace for invocation the invocation id: '
+    assert message.startswith(prefix)
+    assert json.loads(message[len(prefix):]) == dict(
+        invocationId='the invocation id',
+        spans=[
+            dict(name='invocation', startTimeUnixMillis=1700000000000, durationMillis=500.0),
+            dict(name='invocation_posting', startTimeUnixMillis=1700000000000, durationMillis=12.5),
+        ]
+    )
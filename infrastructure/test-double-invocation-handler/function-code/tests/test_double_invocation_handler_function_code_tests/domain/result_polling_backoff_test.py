@@ -0,0 +1,30 @@
+from itertools import islice
+
+import pytest
+
+from test_double_invocation_handler_function_code.domain.result_polling_backoff import ResultPollingBackoff
+
+
+def test_increases_delay_exponentially_up_to_maximum() -> None:
+    backoff = ResultPollingBackoff(initial_delay_millis=10, maximum_delay_millis=50, multiplier=2, jitter=0)
+
+    assert list(islice(backoff.delays_millis(), 6)) == [10, 20, 40, 50, 50, 50]
+
+
+def test_randomly_shortens_each_delay_by_up_to_jitter_fraction() -> None:
+    backoff = ResultPollingBackoff(initial_delay_millis=10, maximum_delay_millis=50, multiplier=2, jitter=0.5)
+    random_fractions = iter([0, 0.5, 1, 0.999])
+
+    assert list(islice(backoff.delays_millis(lambda: next(random_fractions)), 4)) == [10, 15, 20, 25.025]
+
+
+@pytest.mark.parametrize('initial_delay_millis,maximum_delay_millis,multiplier,jitter,expected_message', [
+    (0, 10, 2, 0, 'Initial delay must be positive but was 0ms'),
+    (10, 5, 2, 0, r'Maximum delay \(5ms\) must be at least the initial delay \(10ms\)'),
+    (10, 50, 0.5, 0, 'Multiplier must be at least 1 but was 0.5'),
+    (10, 50, 2, 1, 'Jitter must be at least 0 and less than 1 but was 1'),
+])
+def test_rejects_invalid_configuration(initial_delay_millis: float, maximum_delay_millis: float, multiplier: float,
+                                       jitter: float, expected_message: str) -> None:
+    with pytest.raises(ValueError, match=expected_message):
+        ResultPollingBackoff(initial_delay_millis, maximum_delay_millis, multiplier, jitter)
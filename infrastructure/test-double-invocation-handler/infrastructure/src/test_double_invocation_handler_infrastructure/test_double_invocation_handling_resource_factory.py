@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from test_double_invocation_handler_messaging.infrastructure.test_double_invocation_messaging_resource_factory import \
     TestDoubleInvocationMessagingResourceFactory
@@ -14,6 +14,7 @@ class TestDoubleInvocationHandlingResourceDescriptions:
     invocation_handler_function_role: Dict[str, Any]
     invocation_queue: Dict[str, Any]
     invocation_table: Dict[str, Any]
+    result_queue: Optional[Dict[str, Any]] = None
 
 
 class TestDoubleInvocationHandlingResourceFactory:
@@ -27,32 +28,40 @@ class TestDoubleInvocationHandlingResourceFactory:
 
     def generate_resources(self, invocation_handler_function_role_logical_id: str,
                            invocation_queue_logical_id: str,
-                           invocation_table_logical_id: str) -> TestDoubleInvocationHandlingResourceDescriptions:
+                           invocation_table_logical_id: str,
+                           result_queue_logical_id: Optional[str] = None
+                           ) -> TestDoubleInvocationHandlingResourceDescriptions:
         return TestDoubleInvocationHandlingResourceDescriptions(
             invocation_handler_function=self.__generate_function_resource(invocation_handler_function_role_logical_id,
                                                                           invocation_queue_logical_id,
-                                                                          invocation_table_logical_id),
+                                                                          invocation_table_logical_id,
+                                                                          result_queue_logical_id),
             invocation_handler_function_role=self.__generate_function_role_resource(
-                invocation_queue_logical_id, invocation_table_logical_id),
+                invocation_queue_logical_id, invocation_table_logical_id, result_queue_logical_id),
             invocation_queue=TestDoubleInvocationMessagingResourceFactory.generate_queue_resource(),
-            invocation_table=TestDoubleInvocationMessagingResourceFactory.generate_invocations_table()
+            invocation_table=TestDoubleInvocationMessagingResourceFactory.generate_invocations_table(),
+            result_queue=TestDoubleInvocationMessagingResourceFactory.generate_result_queue_resource()
+            if result_queue_logical_id else None
         )
 
     def __generate_function_resource(self, function_role_logical_id: str,
-                                     invocation_queue_logical_id: str, invocation_table_logical_id: str) -> Dict[
-        str, Any]:
+                                     invocation_queue_logical_id: str, invocation_table_logical_id: str,
+                                     result_queue_logical_id: Optional[str]) -> Dict[str, Any]:
+        environment_variables: Dict[str, Any] = dict(
+            INVOCATION_QUEUE_URL=dict(Ref=invocation_queue_logical_id),
+            INVOCATION_TABLE_NAME=dict(Ref=invocation_table_logical_id)
+        )
+
+        if result_queue_logical_id:
+            environment_variables['RESULT_QUEUE_URL'] = dict(Ref=result_queue_logical_id)
+
         return dict(
             Type='AWS::Lambda::Function',
             Properties=dict(
                 Runtime='python3.13',
                 Handler='test_double_invocation_handler_function_code.index.handler',
                 Timeout=5,
-                Environment=dict(
-                    Variables=dict(
-                        INVOCATION_QUEUE_URL=dict(Ref=invocation_queue_logical_id),
-                        INVOCATION_TABLE_NAME=dict(Ref=invocation_table_logical_id)
-                    )
-                ),
+                Environment=dict(Variables=environment_variables),
                 Code=dict(
                     S3Bucket=self.__invocation_handler_function_code_s3_bucket,
                     S3Key=self.__invocation_handler_function_code_s3_key,
@@ -63,7 +72,46 @@ class TestDoubleInvocationHandlingResourceFactory:
 
     @staticmethod
     def __generate_function_role_resource(invocation_queue_logical_id: str,
-                                          invocation_table_logical_id: str) -> Dict[str, Any]:
+                                          invocation_table_logical_id: str,
+                                          result_queue_logical_id: Optional[str]) -> Dict[str, Any]:
+        policies = [
+            dict(
+                PolicyName='SendMessagesToInvocationQueue',
+                PolicyDocument=dict(
+                    Version='2012-10-17',
+                    Statement=[dict(
+                        Effect='Allow',
+                        Action=['sqs:SendMessage'],
+                        Resource={'Fn::GetAtt': f'{invocation_queue_logical_id}.Arn'}
+                    )]
+                )
+            ),
+            dict(
+                PolicyName='GetRecordsFromInvocationTable',
+                PolicyDocument=dict(
+                    Version='2012-10-17',
+                    Statement=[dict(
+                        Effect='Allow',
+                        Action=['dynamodb:GetItem', 'dynamodb:BatchGetItem'],
+                        Resource={'Fn::GetAtt': f'{invocation_table_logical_id}.Arn'}
+                    )]
+                )
+            )
+        ]
+
+        if result_queue_logical_id:
+            policies.append(dict(
+                PolicyName='ReceiveMessagesFromResultQueue',
+                PolicyDocument=dict(
+                    Version='2012-10-17',
+                    Statement=[dict(
+                        Effect='Allow',
+                        Action=['sqs:ReceiveMessage', 'sqs:DeleteMessage', 'sqs:ChangeMessageVisibility'],
+                        Resource={'Fn::GetAtt': f'{result_queue_logical_id}.Arn'}
+                    )]
+                )
+            ))
+
         return dict(
             Type='AWS::IAM::Role',
             Properties=dict(
@@ -76,29 +124,6 @@ class TestDoubleInvocationHandlingResourceFactory:
                     )]
                 ),
                 ManagedPolicyArns=['arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole'],
-                Policies=[
-                    dict(
-                        PolicyName='SendMessagesToInvocationQueue',
-                        PolicyDocument=dict(
-                            Version='2012-10-17',
-                            Statement=[dict(
-                                Effect='Allow',
-                                Action=['sqs:SendMessage'],
-                                Resource={'Fn::GetAtt': f'{invocation_queue_logical_id}.Arn'}
-                            )]
-                        )
-                    ),
-                    dict(
-                        PolicyName='GetRecordsFromInvocationTable',
-                        PolicyDocument=dict(
-                            Version='2012-10-17',
-                            Statement=[dict(
-                                Effect='Allow',
-                                Action=['dynamodb:GetItem'],
-                                Resource={'Fn::GetAtt': f'{invocation_table_logical_id}.Arn'}
-                            )]
-                        )
-                    )
-                ]
+                Policies=policies
             )
         )
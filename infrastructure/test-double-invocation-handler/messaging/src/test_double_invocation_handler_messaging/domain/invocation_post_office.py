@@ -1,4 +1,5 @@
 from abc import ABCMeta, abstractmethod
+from typing import Dict, List
 
 from test_double_invocation_handler_messaging.domain.invocation import Invocation
 from test_double_invocation_handler_messaging.domain.retrieval_attempt import RetrievalAttempt
@@ -12,3 +13,13 @@ class InvocationPostOffice(metaclass=ABCMeta):
     @abstractmethod
     def maybe_collect_result(self, invocation: Invocation) -> RetrievalAttempt:
         pass
+
+    @abstractmethod
+    def maybe_collect_results(self, invocations: List[Invocation]) -> Dict[str, RetrievalAttempt]:
+        pass
+
+    # Called once nothing is waiting for results for these invocations any longer, so that results that arrive late
+    # need not be kept
+    @abstractmethod
+    def abandon(self, invocations: List[Invocation]) -> None:
+        pass
@@ -1,12 +1,14 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 
 
 @dataclass
 class RetrievalAttempt:
     value: Any
     succeeded: bool = True
+    # Seconds since the epoch at which the harness posted the result, when stamped by the harness
+    posted_time: Optional[float] = None
 
     @staticmethod
     def failed() -> RetrievalAttempt:
@@ -0,0 +1,118 @@
+import json
+import time
+from threading import Lock
+from typing import Dict, List, Optional, Set
+
+from mypy_boto3_sqs.client import SQSClient
+from mypy_boto3_sqs.type_defs import MessageTypeDef
+
+from test_double_invocation_handler_messaging.domain.invocation import Invocation
+from test_double_invocation_handler_messaging.domain.invocation_post_office import InvocationPostOffice
+from test_double_invocation_handler_messaging.domain.retrieval_attempt import RetrievalAttempt
+
+# The most messages that SQS will return from a single ReceiveMessage request or delete in a single
+# DeleteMessageBatch request
+MAXIMUM_MESSAGE_BATCH_SIZE = 10
+
+
+class ResultQueueInvocationPostOffice(InvocationPostOffice):
+    def __init__(self, invocation_queue_url: str, result_queue_url: str, sqs_client: SQSClient,
+                 result_wait_time_seconds: int = 1, abandoned_result_age_millis: Optional[int] = None):
+        self.__invocation_queue_url = invocation_queue_url
+        self.__result_queue_url = result_queue_url
+        self.__sqs_client = sqs_client
+        self.__result_wait_time_seconds = result_wait_time_seconds
+        # No invocation can still be waiting for a result posted longer ago than this
+        self.__abandoned_result_age_millis = abandoned_result_age_millis
+        self.__abandoned_invocation_ids: Set[str] = set()
+        self.__abandoned_invocation_ids_lock = Lock()
+
+    def post_invocation(self, invocation: Invocation) -> None:
+        self.__sqs_client.send_message(
+            QueueUrl=self.__invocation_queue_url,
+            MessageBody=json.dumps(dict(parameters=invocation.parameters)),
+            MessageAttributes={
+                'InvocationTarget': {'StringValue': invocation.target, 'DataType': 'String'},
+                'InvocationId': {'StringValue': invocation.id, 'DataType': 'String'},
+                # Lets the harness measure how long invocations take to be delivered
+                'InvocationSentTime': {'StringValue': str(round(time.time() * 1000)), 'DataType': 'Number'},
+            }
+        )
+
+    def maybe_collect_result(self, invocation: Invocation) -> RetrievalAttempt:
+        return self.maybe_collect_results([invocation])[invocation.id]
+
+    def maybe_collect_results(self, invocations: List[Invocation]) -> Dict[str, RetrievalAttempt]:
+        retrieval_attempts = {invocation.id: RetrievalAttempt.failed() for invocation in invocations}
+
+        receive_message_result = self.__sqs_client.receive_message(
+            QueueUrl=self.__result_queue_url,
+            MessageAttributeNames=['InvocationId', 'ResultPostedTime'],
+            MaxNumberOfMessages=MAXIMUM_MESSAGE_BATCH_SIZE,
+            WaitTimeSeconds=self.__result_wait_time_seconds
+        )
+
+        messages_to_delete: List[MessageTypeDef] = []
+        messages_for_other_invocations: List[MessageTypeDef] = []
+
+        for message in receive_message_result.get('Messages', []):
+            invocation_id = message['MessageAttributes']['InvocationId']['StringValue']
+
+            if invocation_id in retrieval_attempts:
+                posted_time_attribute = message['MessageAttributes'].get('ResultPostedTime')
+                retrieval_attempts[invocation_id] = RetrievalAttempt(
+                    json.loads(message['Body'])['result'],
+                    # Stamped in milliseconds since the epoch by versions of the harness that support it
+                    posted_time=int(posted_time_attribute['StringValue']) / 1000 if posted_time_attribute else None
+                )
+                messages_to_delete.append(message)
+            elif self.__abandoned(invocation_id, message):
+                # Deleted rather than released, so that a result that nothing is waiting for stops being received
+                # by every function instance until it expires
+                messages_to_delete.append(message)
+            else:
+                messages_for_other_invocations.append(message)
+
+        if messages_to_delete:
+            self.__delete(messages_to_delete)
+
+        if messages_for_other_invocations:
+            self.__release(messages_for_other_invocations)
+
+        return retrieval_attempts
+
+    def abandon(self, invocations: List[Invocation]) -> None:
+        with self.__abandoned_invocation_ids_lock:
+            self.__abandoned_invocation_ids.update(invocation.id for invocation in invocations)
+
+    def __abandoned(self, invocation_id: str, message: MessageTypeDef) -> bool:
+        with self.__abandoned_invocation_ids_lock:
+            if invocation_id in self.__abandoned_invocation_ids:
+                self.__abandoned_invocation_ids.discard(invocation_id)
+                return True
+
+        posted_time_attribute = message['MessageAttributes'].get('ResultPostedTime')
+
+        if self.__abandoned_result_age_millis is None or posted_time_attribute is None:
+            return False
+
+        return time.time() * 1000 - int(posted_time_attribute['StringValue']) > self.__abandoned_result_age_millis
+
+    def __delete(self, messages: List[MessageTypeDef]) -> None:
+        self.__sqs_client.delete_message_batch(
+            QueueUrl=self.__result_queue_url,
+            Entries=[
+                dict(Id=str(index), ReceiptHandle=message['ReceiptHandle'])
+                for index, message in enumerate(messages)
+            ]
+        )
+
+    def __release(self, messages: List[MessageTypeDef]) -> None:
+        # Make results for invocations being handled by other function instances immediately visible to them again
+        self.__sqs_client.change_message_visibility_batch(
+            QueueUrl=self.__result_queue_url,
+            Entries=[
+                dict(Id=str(index), ReceiptHandle=message['ReceiptHandle'], VisibilityTimeout=0)
+                for index, message in enumerate(messages)
+            ]
+        )
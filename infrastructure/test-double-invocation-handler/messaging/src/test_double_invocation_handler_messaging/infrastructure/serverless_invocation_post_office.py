@@ -1,32 +1,39 @@
 import json
-from typing import Dict, Any, cast
+import time
+from typing import Dict, Any, List, cast
 
 from boto3 import Session
-from mypy_boto3_dynamodb import DynamoDBServiceResource
-from mypy_boto3_dynamodb.service_resource import Table
+from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource, Table
+from mypy_boto3_dynamodb.type_defs import KeysAndAttributesServiceResourceTypeDef
 from mypy_boto3_sqs.client import SQSClient
 
 from test_double_invocation_handler_messaging.domain.invocation import Invocation
 from test_double_invocation_handler_messaging.domain.invocation_post_office import InvocationPostOffice
 from test_double_invocation_handler_messaging.domain.retrieval_attempt import RetrievalAttempt
 
+# The most items that DynamoDB will return from a single BatchGetItem request
+MAXIMUM_BATCH_GET_ITEM_KEYS = 100
+
 
 class ServerlessInvocationPostOffice(InvocationPostOffice):
     def __init__(self, invocation_queue_url: str, invocation_table_name: str, boto_session: Session):
         self.__invocation_queue_url = invocation_queue_url
         self.__sqs_client: SQSClient = boto_session.client('sqs')
 
-        dynamodb_resource: DynamoDBServiceResource = boto_session.resource('dynamodb')
-        self.__invocation_table: Table = dynamodb_resource.Table(invocation_table_name)
+        self.__dynamodb_resource: DynamoDBServiceResource = boto_session.resource('dynamodb')
+        self.__invocation_table_name = invocation_table_name
+        self.__invocation_table: Table = self.__dynamodb_resource.Table(invocation_table_name)
 
     def post_invocation(self, invocation: Invocation) -> None:
         self.__sqs_client.send_message(
             QueueUrl=self.__invocation_queue_url,
             MessageBody=json.dumps(dict(parameters=invocation.parameters)),
-            MessageAttributes=dict(
-                InvocationTarget=dict(StringValue=invocation.target, DataType='String'),
-                InvocationId=dict(StringValue=invocation.id, DataType='String'),
-            )
+            MessageAttributes={
+                'InvocationTarget': {'StringValue': invocation.target, 'DataType': 'String'},
+                'InvocationId': {'StringValue': invocation.id, 'DataType': 'String'},
+                # Lets the harness measure how long invocations take to be delivered
+                'InvocationSentTime': {'StringValue': str(round(time.time() * 1000)), 'DataType': 'Number'},
+            }
         )
 
     def maybe_collect_result(self, invocation: Invocation) -> RetrievalAttempt:
@@ -36,5 +43,39 @@ class ServerlessInvocationPostOffice(InvocationPostOffice):
         if table_item is None:
             return RetrievalAttempt.failed()
 
-        item = cast(Dict[str, Any], table_item)
-        return RetrievalAttempt(item['result'])
+        return self.__to_retrieval_attempt(cast(Dict[str, Any], table_item))
+
+    def maybe_collect_results(self, invocations: List[Invocation]) -> Dict[str, RetrievalAttempt]:
+        retrieval_attempts = {invocation.id: RetrievalAttempt.failed() for invocation in invocations}
+        invocation_ids = list(retrieval_attempts)
+
+        for batch_start in range(0, len(invocation_ids), MAXIMUM_BATCH_GET_ITEM_KEYS):
+            keys_and_attributes: KeysAndAttributesServiceResourceTypeDef = {'Keys': [
+                {'id': invocation_id}
+                for invocation_id in invocation_ids[batch_start:batch_start + MAXIMUM_BATCH_GET_ITEM_KEYS]
+            ]}
+            batch_get_item_response = self.__dynamodb_resource.batch_get_item(
+                RequestItems={self.__invocation_table_name: keys_and_attributes}
+            )
+
+            # Any keys left unprocessed are reported as failed attempts, to be retried along with the invocations
+            # whose results are not yet available
+            for table_item in batch_get_item_response['Responses'].get(self.__invocation_table_name, []):
+                item = cast(Dict[str, Any], table_item)
+                retrieval_attempts[item['id']] = self.__to_retrieval_attempt(item)
+
+        return retrieval_attempts
+
+    def abandon(self, invocations: List[Invocation]) -> None:
+        # Results left in the table expire by themselves
+        pass
+
+    @staticmethod
+    def __to_retrieval_attempt(item: Dict[str, Any]) -> RetrievalAttempt:
+        posted_time = item.get('posted_time')
+
+        return RetrievalAttempt(
+            item['result'],
+            # Stamped in milliseconds since the epoch by versions of the harness that support it
+            posted_time=int(posted_time) / 1000 if posted_time is not None else None
+        )
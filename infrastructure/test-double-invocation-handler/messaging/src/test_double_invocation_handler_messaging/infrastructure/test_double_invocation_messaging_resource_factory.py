@@ -12,6 +12,18 @@ class TestDoubleInvocationMessagingResourceFactory:
             Properties=dict(MessageRetentionPeriod=60)
         )
 
+    @staticmethod
+    def generate_result_queue_resource() -> Dict[str, Any]:
+        return dict(
+            Type='AWS::SQS::Queue',
+            Properties=dict(
+                MessageRetentionPeriod=60,
+                # Results are deleted as soon as they are received by the function instance awaiting them, and released
+                # straight away by any other instance, so only a crashed instance would leave a result hidden
+                VisibilityTimeout=2
+            )
+        )
+
     @staticmethod
     def generate_invocations_table() -> Dict[str, Any]:
         return dict(
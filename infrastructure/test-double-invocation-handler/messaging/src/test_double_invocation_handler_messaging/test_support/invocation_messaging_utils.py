@@ -17,6 +17,15 @@ def put_invocation_result_dynamodb_record(invocation_id: str, result: Any, invoc
     ))
 
 
+def send_invocation_result_sqs_message(invocation_id: str, result: Any, result_queue_url: str,
+                                      sqs_client: SQSClient) -> None:
+    sqs_client.send_message(
+        QueueUrl=result_queue_url,
+        MessageBody=json.dumps(dict(result=result)),
+        MessageAttributes={'InvocationId': {'StringValue': invocation_id, 'DataType': 'String'}}
+    )
+
+
 def wait_for_invocation_sqs_message(invocation_id: str, invocation_queue_url: str,
                                     sqs_client: SQSClient) -> Optional[MessageTypeDef]:
     return wait_for_sqs_message_matching(
@@ -0,0 +1,206 @@
+import json
+import time
+from threading import Timer
+from uuid import uuid4
+
+import pytest
+
+from aws_test_harness_test_support.in_memory_sqs_client import InMemorySQSClient
+from test_double_invocation_handler_messaging.infrastructure.result_queue_invocation_post_office import \
+    ResultQueueInvocationPostOffice
+from test_double_invocation_handler_messaging.test_support.builders.invocation_builder import an_invocation_with
+from test_double_invocation_handler_messaging.test_support.invocation_messaging_utils import \
+    get_invocation_parameters_from_sqs_message, get_invocation_target_from_sqs_message, \
+    send_invocation_result_sqs_message
+
+
+@pytest.fixture()
+def sqs_client() -> InMemorySQSClient:
+    return InMemorySQSClient()
+
+
+@pytest.fixture()
+def invocation_queue_url(sqs_client: InMemorySQSClient) -> str:
+    return sqs_client.create_queue(QueueName='invocations')['QueueUrl']
+
+
+@pytest.fixture()
+def result_queue_url(sqs_client: InMemorySQSClient) -> str:
+    return sqs_client.create_queue(QueueName='results')['QueueUrl']
+
+
+@pytest.fixture()
+def post_office(sqs_client: InMemorySQSClient, invocation_queue_url: str,
+                result_queue_url: str) -> ResultQueueInvocationPostOffice:
+    return ResultQueueInvocationPostOffice(invocation_queue_url, result_queue_url, sqs_client.as_sqs_client(),
+                                           result_wait_time_seconds=0)
+
+
+def test_sends_invocation_to_invocation_queue(post_office: ResultQueueInvocationPostOffice,
+                                              sqs_client: InMemorySQSClient, invocation_queue_url: str) -> None:
+    invocation_id = str(uuid4())
+
+    post_office.post_invocation(an_invocation_with(
+        invocation_id=invocation_id, invocation_target='the-invocation-target', parameters=dict(colour='orange')
+    ))
+
+    received_message = sqs_client.receive_message(
+        QueueUrl=invocation_queue_url, MessageAttributeNames=['All']
+    )['Messages'][0]
+    assert received_message['MessageAttributes']['InvocationId']['StringValue'] == invocation_id
+    assert get_invocation_target_from_sqs_message(received_message) == 'the-invocation-target'
+    assert get_invocation_parameters_from_sqs_message(received_message) == dict(colour='orange')
+
+
+def test_stamps_invocation_with_time_at_which_it_was_sent(post_office: ResultQueueInvocationPostOffice,
+                                                         sqs_client: InMemorySQSClient,
+                                                         invocation_queue_url: str) -> None:
+    time_before_sending_millis = time.time() * 1000
+    post_office.post_invocation(an_invocation_with(invocation_id=str(uuid4())))
+    time_after_sending_millis = time.time() * 1000
+
+    received_message = sqs_client.receive_message(
+        QueueUrl=invocation_queue_url, MessageAttributeNames=['All']
+    )['Messages'][0]
+    sent_time_millis = int(received_message['MessageAttributes']['InvocationSentTime']['StringValue'])
+    assert time_before_sending_millis - 1 <= sent_time_millis <= time_after_sending_millis + 1
+
+
+def test_collects_result_for_invocation_from_result_queue(post_office: ResultQueueInvocationPostOffice,
+                                                          sqs_client: InMemorySQSClient, result_queue_url: str) -> None:
+    invocation_id = str(uuid4())
+    send_invocation_result_sqs_message(invocation_id, dict(status='succeeded', context=dict(result='the result')),
+                                       result_queue_url, sqs_client.as_sqs_client())
+
+    retrieval_attempt = post_office.maybe_collect_result(an_invocation_with(invocation_id=invocation_id))
+
+    assert retrieval_attempt.succeeded is True
+    assert retrieval_attempt.value == dict(status='succeeded', context=dict(result='the result'))
+    assert sqs_client.receive_message(QueueUrl=result_queue_url) == {}
+
+
+def test_indicates_retrieval_attempt_failed_when_no_result_received(
+        post_office: ResultQueueInvocationPostOffice) -> None:
+    retrieval_attempt = post_office.maybe_collect_result(an_invocation_with(invocation_id=str(uuid4())))
+
+    assert retrieval_attempt.succeeded is False
+
+
+def test_leaves_results_for_other_invocations_immediately_available_to_collect(
+        post_office: ResultQueueInvocationPostOffice, sqs_client: InMemorySQSClient, result_queue_url: str) -> None:
+    other_invocation_id = str(uuid4())
+    send_invocation_result_sqs_message(other_invocation_id, 'the other result', result_queue_url,
+                                       sqs_client.as_sqs_client())
+
+    retrieval_attempt = post_office.maybe_collect_result(an_invocation_with(invocation_id=str(uuid4())))
+
+    assert retrieval_attempt.succeeded is False
+
+    other_retrieval_attempt = post_office.maybe_collect_result(an_invocation_with(invocation_id=other_invocation_id))
+
+    assert other_retrieval_attempt.succeeded is True
+    assert other_retrieval_attempt.value == 'the other result'
+
+
+def test_deletes_results_for_abandoned_invocations_rather_than_releasing_them(
+        post_office: ResultQueueInvocationPostOffice, sqs_client: InMemorySQSClient, result_queue_url: str) -> None:
+    abandoned_invocation = an_invocation_with(invocation_id=str(uuid4()))
+    post_office.abandon([abandoned_invocation])
+    send_invocation_result_sqs_message(abandoned_invocation.id, 'the late result', result_queue_url,
+                                       sqs_client.as_sqs_client())
+
+    retrieval_attempt = post_office.maybe_collect_result(an_invocation_with(invocation_id=str(uuid4())))
+
+    assert retrieval_attempt.succeeded is False
+    assert sqs_client.receive_message(QueueUrl=result_queue_url) == {}
+
+
+def test_deletes_results_posted_too_long_ago_for_any_invocation_to_still_be_waiting(
+        sqs_client: InMemorySQSClient, invocation_queue_url: str, result_queue_url: str) -> None:
+    post_office = ResultQueueInvocationPostOffice(invocation_queue_url, result_queue_url, sqs_client.as_sqs_client(),
+                                                  result_wait_time_seconds=0, abandoned_result_age_millis=1000)
+    current_time_millis = round(time.time() * 1000)
+
+    for invocation_id, posted_time_millis in [('stale invocation id', current_time_millis - 2000),
+                                              ('recent invocation id', current_time_millis)]:
+        sqs_client.send_message(
+            QueueUrl=result_queue_url,
+            MessageBody=json.dumps(dict(result='the result')),
+            MessageAttributes=dict(
+                InvocationId=dict(StringValue=invocation_id, DataType='String'),
+                ResultPostedTime=dict(StringValue=str(posted_time_millis), DataType='Number'),
+            )
+        )
+
+    retrieval_attempt = post_office.maybe_collect_result(an_invocation_with(invocation_id=str(uuid4())))
+
+    assert retrieval_attempt.succeeded is False
+    remaining_messages = sqs_client.receive_message(QueueUrl=result_queue_url, MaxNumberOfMessages=10,
+                                                    MessageAttributeNames=['All'])['Messages']
+    assert [message['MessageAttributes']['InvocationId']['StringValue'] for message in remaining_messages] == \
+           ['recent invocation id']
+
+
+def test_waits_for_result_to_arrive_using_single_long_poll(sqs_client: InMemorySQSClient, invocation_queue_url: str,
+                                                           result_queue_url: str) -> None:
+    post_office = ResultQueueInvocationPostOffice(invocation_queue_url, result_queue_url, sqs_client.as_sqs_client(),
+                                                  result_wait_time_seconds=5)
+    invocation_id = str(uuid4())
+
+    Timer(0.05, lambda: send_invocation_result_sqs_message(
+        invocation_id, 'the result', result_queue_url, sqs_client.as_sqs_client()
+    )).start()
+
+    retrieval_attempt = post_office.maybe_collect_result(an_invocation_with(invocation_id=invocation_id))
+
+    assert retrieval_attempt.value == 'the result'
+    assert sqs_client.request_count('receive_message') == 1
+
+
+def test_collects_results_for_many_invocations_from_single_receive(post_office: ResultQueueInvocationPostOffice,
+                                                                    sqs_client: InMemorySQSClient,
+                                                                    result_queue_url: str) -> None:
+    invocation_ids = [str(uuid4()) for _ in range(3)]
+    for invocation_id in invocation_ids[:2]:
+        send_invocation_result_sqs_message(invocation_id, f'result for {invocation_id}', result_queue_url,
+                                           sqs_client.as_sqs_client())
+
+    retrieval_attempts = post_office.maybe_collect_results([
+        an_invocation_with(invocation_id=invocation_id) for invocation_id in invocation_ids
+    ])
+
+    assert retrieval_attempts[invocation_ids[0]].value == f'result for {invocation_ids[0]}'
+    assert retrieval_attempts[invocation_ids[1]].value == f'result for {invocation_ids[1]}'
+    assert retrieval_attempts[invocation_ids[2]].succeeded is False
+    assert sqs_client.request_count('receive_message') == 1
+    assert sqs_client.request_count('delete_message_batch') == 1
+    assert sqs_client.receive_message(QueueUrl=result_queue_url) == {}
+
+
+def test_collects_time_at_which_result_was_posted_when_stamped(post_office: ResultQueueInvocationPostOffice,
+                                                               sqs_client: InMemorySQSClient,
+                                                               result_queue_url: str) -> None:
+    invocation_id = str(uuid4())
+    sqs_client.send_message(
+        QueueUrl=result_queue_url,
+        MessageBody=json.dumps(dict(result='the result')),
+        MessageAttributes=dict(
+            InvocationId=dict(StringValue=invocation_id, DataType='String'),
+            ResultPostedTime=dict(StringValue='1700000000123', DataType='Number'),
+        )
+    )
+
+    retrieval_attempt = post_office.maybe_collect_result(an_invocation_with(invocation_id=invocation_id))
+
+    assert retrieval_attempt.posted_time == 1700000000.123
+
+
+def test_collects_no_posted_time_when_result_not_stamped(post_office: ResultQueueInvocationPostOffice,
+                                                         sqs_client: InMemorySQSClient, result_queue_url: str) -> None:
+    invocation_id = str(uuid4())
+    send_invocation_result_sqs_message(invocation_id, 'the result', result_queue_url, sqs_client.as_sqs_client())
+
+    retrieval_attempt = post_office.maybe_collect_result(an_invocation_with(invocation_id=invocation_id))
+
+    assert retrieval_attempt.succeeded is True
+    assert retrieval_attempt.posted_time is None
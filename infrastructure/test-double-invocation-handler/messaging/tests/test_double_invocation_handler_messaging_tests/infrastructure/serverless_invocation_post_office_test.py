@@ -111,3 +111,18 @@ def test_indicates_retrieval_attempt_failed_when_no_invocation_result_table_reco
         invocation_id=invocation_id))
 
     assert retrieval_attempt.succeeded is False
+
+
+def test_retrieves_results_for_many_invocations_from_specified_dynamodb_table(
+        serverless_invocation_post_office: ServerlessInvocationPostOffice, invocation_table: Table) -> None:
+    invocation_ids = [str(uuid4()) for _ in range(3)]
+    for invocation_id in invocation_ids[:2]:
+        put_invocation_result_dynamodb_record(invocation_id, dict(invocationId=invocation_id), invocation_table)
+
+    retrieval_attempts = serverless_invocation_post_office.maybe_collect_results([
+        an_invocation_with(invocation_id=invocation_id) for invocation_id in invocation_ids
+    ])
+
+    assert retrieval_attempts[invocation_ids[0]].value == dict(invocationId=invocation_ids[0])
+    assert retrieval_attempts[invocation_ids[1]].value == dict(invocationId=invocation_ids[1])
+    assert retrieval_attempts[invocation_ids[2]].succeeded is False
@@ -1,28 +1,65 @@
-from logging import Logger
-
-from boto3 import Session
-
-from aws_test_harness.infrastructure.boto_aws_resource_factory import BotoAwsResourceFactory
-from aws_test_harness.infrastructure.cloudformation_aws_resource_registry import CloudFormationAwsResourceRegistry
-from aws_test_harness.infrastructure.serverless_invocation_post_office import ServerlessInvocationPostOffice
-from aws_test_harness.infrastructure.thread_based_repeating_task_scheduler import ThreadBasedRepeatingTaskScheduler
-from aws_test_harness.domain.test_harness import TestHarness
-
-__all__ = ["aws_test_harness", "TestHarness"]
-
-
-def aws_test_harness(test_stack_name: str, aws_profile: str, logger: Logger) -> TestHarness:
-    boto_session = Session(profile_name=aws_profile)
-    aws_resource_registry = CloudFormationAwsResourceRegistry(test_stack_name, boto_session)
-
-    return TestHarness(
-        aws_resource_registry,
-        ServerlessInvocationPostOffice(
-            aws_resource_registry.get_resource_arn('AWSTestHarnessTestDoubleInvocationQueue'),
-            aws_resource_registry.get_resource_arn('AWSTestHarnessTestDoubleInvocationTable'),
-            boto_session,
-            logger
-        ),
-        ThreadBasedRepeatingTaskScheduler(logger),
-        BotoAwsResourceFactory(boto_session, aws_resource_registry, logger)
-    )
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from botocore.config import Config
+
+    from aws_test_harness.domain.async_test_harness import AsyncTestHarness
+    from aws_test_harness.domain.invocation_timing_sink import InvocationTimingSink
+    from aws_test_harness.domain.test_harness import TestHarness
+    from aws_test_harness.infrastructure.in_memory_state_machine import InMemoryStateMachineDefinition
+
+__all__ = ["aws_test_harness", "TestHarness", "async_aws_test_harness", "AsyncTestHarness", "aws_test_harness_local"]
+
+# Nothing beyond the standard library is imported until a harness is created or a harness class is accessed, so that
+# importing the package stays cheap for test processes that never use it, or use it only after start-up
+
+
+def aws_test_harness(test_stack_name: str, aws_profile: str, logger: Logger,
+                     invocation_handling_worker_count: int = 1,
+                     stack_resource_cache_directory_path: Optional[str] = None,
+                     aws_client_config: Optional[Config] = None,
+                     invocation_timing_sink: Optional[InvocationTimingSink] = None) -> TestHarness:
+    from aws_test_harness.infrastructure.boto_test_harness_assembly import assemble_test_harness
+
+    return assemble_test_harness(test_stack_name, aws_profile, logger, invocation_handling_worker_count,
+                                 stack_resource_cache_directory_path, aws_client_config, invocation_timing_sink)
+
+
+def async_aws_test_harness(test_stack_name: str, aws_profile: str, logger: Logger,
+                           stack_resource_cache_directory_path: Optional[str] = None,
+                           aws_client_config: Optional[Config] = None,
+                           invocation_timing_sink: Optional[InvocationTimingSink] = None) -> AsyncTestHarness:
+    from aws_test_harness.infrastructure.boto_test_harness_assembly import assemble_async_test_harness
+
+    return assemble_async_test_harness(test_stack_name, aws_profile, logger, stack_resource_cache_directory_path,
+                                       aws_client_config, invocation_timing_sink)
+
+
+# Runs twins and the harness plumbing in process, against state machines defined in Python or Amazon States Language
+# rather than deployed to AWS
+def aws_test_harness_local(
+        logger: Logger,
+        state_machine_definitions: Optional[Dict[str, InMemoryStateMachineDefinition | Dict[str, Any]]] = None,
+        invocation_handling_worker_count: int = 1,
+        invocation_timing_sink: Optional[InvocationTimingSink] = None
+) -> TestHarness:
+    from aws_test_harness.infrastructure.in_memory_test_harness_assembly import assemble_in_memory_test_harness
+
+    return assemble_in_memory_test_harness(logger, state_machine_definitions, invocation_handling_worker_count,
+                                           invocation_timing_sink)
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'TestHarness':
+        from aws_test_harness.domain.test_harness import TestHarness
+        return TestHarness
+
+    if name == 'AsyncTestHarness':
+        from aws_test_harness.domain.async_test_harness import AsyncTestHarness
+        return AsyncTestHarness
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,47 @@
+import asyncio
+from typing import Callable, Any, Awaitable, Set
+
+from aws_test_harness.domain.invocation import Invocation
+from aws_test_harness.domain.invocation_error_result import to_invocation_error_result
+from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
+
+
+class AsyncInvocationHandler:
+    def __init__(self, invocation_post_office: InvocationPostOffice,
+                 get_invocation_result: Callable[[Invocation], Awaitable[Any]]):
+        self.__invocation_post_office = invocation_post_office
+        self.__get_invocation_result = get_invocation_result
+        self.__pending_invocation_handlers: Set[asyncio.Task[None]] = set()
+
+    async def handle_pending_invocations(self) -> None:
+        invocations = await asyncio.to_thread(self.__invocation_post_office.collect_invocations)
+
+        invocation_handlers = [asyncio.create_task(self.__handle_invocation(invocation)) for invocation in invocations]
+
+        for invocation_handler in invocation_handlers:
+            self.__pending_invocation_handlers.add(invocation_handler)
+            invocation_handler.add_done_callback(self.__pending_invocation_handlers.discard)
+
+        # Let every invocation in the batch complete before surfacing the first failure, so that one failing twin
+        # doesn't prevent results being posted for the others. Shielded, so that invocations already collected are
+        # still handled if handling stops whilst waiting for them.
+        outcomes = await asyncio.shield(asyncio.gather(*invocation_handlers, return_exceptions=True))
+
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+    async def wait_for_pending_invocations(self) -> None:
+        if self.__pending_invocation_handlers:
+            await asyncio.wait(set(self.__pending_invocation_handlers))
+
+    async def __handle_invocation(self, invocation: Invocation) -> None:
+        try:
+            result = await self.__get_invocation_result(invocation)
+        except Exception as e:
+            # Reported once the rest of the batch has been handled
+            await asyncio.to_thread(self.__invocation_post_office.post_result, invocation.id,
+                                    to_invocation_error_result(e))
+            raise
+
+        await asyncio.to_thread(self.__invocation_post_office.post_result, invocation.id, result)
@@ -0,0 +1,10 @@
+from abc import ABCMeta, abstractmethod
+
+from aws_test_harness.domain.repeating_task_scheduler import RepeatingTaskScheduler
+
+
+class AsyncRepeatingTaskScheduler(RepeatingTaskScheduler, metaclass=ABCMeta):
+    # Resets the schedule, returning once any run of the task in progress has stopped
+    @abstractmethod
+    async def reset_schedule_async(self) -> None:
+        pass
@@ -0,0 +1,16 @@
+import asyncio
+from typing import Dict, Any
+
+from aws_test_harness.domain.state_machine import StateMachine
+from aws_test_harness.domain.state_machine_execution import StateMachineExecution
+
+
+class AsyncStateMachine:
+    def __init__(self, state_machine: StateMachine):
+        self.__state_machine = state_machine
+
+    async def start(self, execution_input: Dict[str, Any]) -> StateMachineExecution:
+        return await asyncio.to_thread(self.__state_machine.start, execution_input)
+
+    async def execute(self, execution_input: Dict[str, Any]) -> StateMachineExecution:
+        return await self.__state_machine.execute_async(execution_input)
@@ -0,0 +1,57 @@
+import asyncio
+from typing import Optional
+
+from aws_test_harness.domain.async_invocation_handler import AsyncInvocationHandler
+from aws_test_harness.domain.async_repeating_task_scheduler import AsyncRepeatingTaskScheduler
+from aws_test_harness.domain.async_state_machine import AsyncStateMachine
+from aws_test_harness.domain.aws_resource_factory import AwsResourceFactory
+from aws_test_harness.domain.aws_resource_registry import AwsResourceRegistry
+from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
+from aws_test_harness.domain.invocation_target_twin_service import InvocationTargetTwinService
+from aws_test_harness.domain.invocation_timing_sink import InvocationTimingSink
+from aws_test_harness.domain.s3_bucket import S3Bucket
+from aws_test_harness.domain.state_machine_twin import StateMachineExecutionHandler, StateMachineTwin
+
+
+class AsyncTestHarness:
+    # Tell pytest to treat this class as a normal class
+    __test__ = False
+
+    def __init__(self, aws_resource_registry: AwsResourceRegistry, invocation_post_office: InvocationPostOffice,
+                 invocation_handling_scheduler: AsyncRepeatingTaskScheduler,
+                 aws_resource_factory: AwsResourceFactory,
+                 invocation_timing_sink: Optional[InvocationTimingSink] = None):
+        self.__aws_resource_factory = aws_resource_factory
+        self.__invocation_post_office = invocation_post_office
+        self.__invocation_handling_scheduler: AsyncRepeatingTaskScheduler = invocation_handling_scheduler
+        self.__invocation_target_twin_service = InvocationTargetTwinService(aws_resource_registry,
+                                                                            invocation_timing_sink)
+        self.__invocation_handler = AsyncInvocationHandler(
+            invocation_post_office,
+            self.__invocation_target_twin_service.generate_result_for_invocation_async
+        )
+
+    def state_machine(self, cfn_logical_resource_id: str) -> AsyncStateMachine:
+        return AsyncStateMachine(self.__aws_resource_factory.get_state_machine(cfn_logical_resource_id))
+
+    def test_s3_bucket(self, test_resource_name: str) -> S3Bucket:
+        return self.__aws_resource_factory.get_s3_bucket(f'{test_resource_name}AWSTestHarnessS3Bucket')
+
+    def twin_state_machine(self, state_machine_name: str,
+                           execution_handler: Optional[StateMachineExecutionHandler] = None) -> StateMachineTwin:
+        if not self.__invocation_handling_scheduler.scheduled():
+            self.__invocation_handling_scheduler.schedule(self.__invocation_handler.handle_pending_invocations)
+
+        return self.__invocation_target_twin_service.create_twin_for_state_machine(state_machine_name,
+                                                                                   execution_handler)
+
+    async def tear_down(self) -> None:
+        # Stops invocation handling without leaving a long poll in progress to collect invocations that won't be handled
+        await asyncio.to_thread(self.__invocation_post_office.interrupt_collection)
+        await self.__invocation_handling_scheduler.reset_schedule_async()
+        await asyncio.to_thread(self.__invocation_post_office.resume_collection)
+        # Invocations already collected are still handled by the twins they were intended for
+        await self.__invocation_handler.wait_for_pending_invocations()
+        # Results still buffered would otherwise be lost, leaving the invocations they were for to time out
+        await asyncio.to_thread(self.__invocation_post_office.flush)
+        self.__invocation_target_twin_service.reset()
@@ -0,0 +1,173 @@
+from dataclasses import dataclass
+from logging import Logger
+from queue import Queue, Empty
+from threading import Lock, Thread
+from time import monotonic, sleep
+from typing import Any, Dict, List, Optional, Set
+
+from aws_test_harness.domain.invocation import Invocation
+from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
+from aws_test_harness.domain.results_not_posted_exception import ResultsNotPostedException
+
+# No result is held back waiting for others by default, so a lone result is posted straight away. Results buffered
+# whilst a batch is being written are still posted together in the next batch.
+DEFAULT_RESULT_LINGER_SECONDS = 0
+
+# The most items that DynamoDB will write in a single BatchWriteItem request
+DEFAULT_MAXIMUM_RESULT_BATCH_SIZE = 25
+
+DEFAULT_MAXIMUM_BUFFERED_RESULTS = 100
+
+DEFAULT_MAXIMUM_RESULT_POSTING_ATTEMPTS = 3
+
+DEFAULT_RESULT_POSTING_RETRY_DELAY_SECONDS = 0.1
+
+# How long the posting thread waits for another result before stopping
+POSTING_THREAD_IDLE_SECONDS = 1
+
+
+@dataclass
+class BufferedResult:
+    invocation_id: str
+    result: Any
+    posting_attempt_count: int = 0
+
+
+# Posts results in batches from a thread of its own, so that invocation handling threads don't wait for a write round
+# trip per result. Results are held for up to the linger time so that others generated around the same time can be
+# posted with them, and posting blocks once the buffer is full so that results can't be generated faster than they
+# are written. Results that fail to post are posted again, up to the maximum number of attempts.
+class BufferedInvocationPostOffice(InvocationPostOffice):
+    def __init__(self, invocation_post_office: InvocationPostOffice, logger: Logger,
+                 result_linger_seconds: float = DEFAULT_RESULT_LINGER_SECONDS,
+                 maximum_result_batch_size: int = DEFAULT_MAXIMUM_RESULT_BATCH_SIZE,
+                 maximum_buffered_results: int = DEFAULT_MAXIMUM_BUFFERED_RESULTS,
+                 maximum_result_posting_attempts: int = DEFAULT_MAXIMUM_RESULT_POSTING_ATTEMPTS,
+                 result_posting_retry_delay_seconds: float = DEFAULT_RESULT_POSTING_RETRY_DELAY_SECONDS):
+        if maximum_result_batch_size < 1:
+            raise ValueError(f'Maximum result batch size must be at least 1 but was {maximum_result_batch_size}')
+
+        if maximum_buffered_results < 1:
+            raise ValueError(f'Maximum buffered results must be at least 1 but was {maximum_buffered_results}')
+
+        if maximum_result_posting_attempts < 1:
+            raise ValueError(
+                f'Maximum result posting attempts must be at least 1 but was {maximum_result_posting_attempts}'
+            )
+
+        self.__invocation_post_office = invocation_post_office
+        self.__logger = logger
+        self.__result_linger_seconds = result_linger_seconds
+        self.__maximum_result_batch_size = maximum_result_batch_size
+        self.__maximum_result_posting_attempts = maximum_result_posting_attempts
+        self.__result_posting_retry_delay_seconds = result_posting_retry_delay_seconds
+        self.__buffered_results: Queue[BufferedResult] = Queue(maxsize=maximum_buffered_results)
+        self.__posting_thread_lock = Lock()
+        self.__posting_thread: Optional[Thread] = None
+
+    def collect_invocations(self) -> List[Invocation]:
+        return self.__invocation_post_office.collect_invocations()
+
+    def post_result(self, invocation_id: str, result: Any) -> None:
+        self.__buffered_results.put(BufferedResult(invocation_id, result))
+        self.__ensure_posting()
+
+    def post_results(self, results: Dict[str, Any]) -> None:
+        for invocation_id, result in results.items():
+            self.post_result(invocation_id, result)
+
+    def interrupt_collection(self) -> None:
+        self.__invocation_post_office.interrupt_collection()
+
+    def resume_collection(self) -> None:
+        self.__invocation_post_office.resume_collection()
+
+    # Returns once every result buffered so far has been posted, or given up on
+    def flush(self) -> None:
+        self.__buffered_results.join()
+
+    def __ensure_posting(self) -> None:
+        with self.__posting_thread_lock:
+            if self.__posting_thread is None:
+                self.__posting_thread = Thread(target=self.__post_until_none_buffered, daemon=True,
+                                               name='BufferedInvocationPostOffice')
+                self.__posting_thread.start()
+
+    def __post_until_none_buffered(self) -> None:
+        # Kept by this thread rather than buffered again, as the buffer may be full of results waiting for these to be
+        # posted
+        results_to_retry: List[BufferedResult] = []
+
+        while True:
+            if results_to_retry:
+                # Gives whatever caused the failure a chance to pass
+                sleep(self.__result_posting_retry_delay_seconds)
+                first_results = results_to_retry[:self.__maximum_result_batch_size]
+                results_to_retry = results_to_retry[self.__maximum_result_batch_size:]
+            else:
+                try:
+                    first_results = [self.__buffered_results.get(timeout=POSTING_THREAD_IDLE_SECONDS)]
+                except Empty:
+                    with self.__posting_thread_lock:
+                        # Stop rather than idle, so that a post office that is no longer used holds no thread.
+                        # Checked under the lock so that a result buffered since the timeout is always picked up by a
+                        # thread.
+                        if self.__buffered_results.empty():
+                            self.__posting_thread = None
+                            return
+
+                    continue
+
+            results_to_retry.extend(self.__post(self.__collect_batch_starting_with(first_results)))
+
+    def __collect_batch_starting_with(self, first_results: List[BufferedResult]) -> List[BufferedResult]:
+        batch = list(first_results)
+        linger_end_time = monotonic() + self.__result_linger_seconds
+
+        while len(batch) < self.__maximum_result_batch_size:
+            remaining_linger_seconds = linger_end_time - monotonic()
+
+            try:
+                # Results already buffered are always included, however short the linger time
+                batch.append(
+                    self.__buffered_results.get(timeout=remaining_linger_seconds) if remaining_linger_seconds > 0
+                    else self.__buffered_results.get_nowait()
+                )
+            except Empty:
+                break
+
+        return batch
+
+    # Returns the results that failed to post but may be attempted again
+    def __post(self, batch: List[BufferedResult]) -> List[BufferedResult]:
+        try:
+            self.__invocation_post_office.post_results(
+                {buffered_result.invocation_id: buffered_result.result for buffered_result in batch}
+            )
+            failed_invocation_ids: Set[str] = set()
+        except ResultsNotPostedException as e:
+            failed_invocation_ids = set(e.invocation_ids)
+            self.__logger.exception(f'Failed to post results for {len(failed_invocation_ids)} invocation(s)',
+                                    exc_info=e)
+        except BaseException as e:
+            failed_invocation_ids = {buffered_result.invocation_id for buffered_result in batch}
+            self.__logger.exception(f'Failed to post results for {len(batch)} invocation(s)', exc_info=e)
+
+        results_to_retry: List[BufferedResult] = []
+
+        for buffered_result in batch:
+            if buffered_result.invocation_id in failed_invocation_ids:
+                buffered_result.posting_attempt_count += 1
+
+                if buffered_result.posting_attempt_count < self.__maximum_result_posting_attempts:
+                    results_to_retry.append(buffered_result)
+                    continue
+
+                self.__logger.error(
+                    f'Gave up posting result for invocation {buffered_result.invocation_id} after '
+                    f'{buffered_result.posting_attempt_count} attempt(s)'
+                )
+
+            self.__buffered_results.task_done()
+
+        return results_to_retry
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass(frozen=True)
+class ExponentialBackoff:
+    initial_delay_seconds: float
+    maximum_delay_seconds: float
+    multiplier: float = 2
+
+    def __post_init__(self) -> None:
+        if self.initial_delay_seconds <= 0:
+            raise ValueError(f'Initial delay must be positive but was {self.initial_delay_seconds}s')
+
+        if self.maximum_delay_seconds < self.initial_delay_seconds:
+            raise ValueError(
+                f'Maximum delay ({self.maximum_delay_seconds}s) must be at least '
+                f'the initial delay ({self.initial_delay_seconds}s)'
+            )
+
+        if self.multiplier < 1:
+            raise ValueError(f'Multiplier must be at least 1 but was {self.multiplier}')
+
+    def delays(self) -> Iterator[float]:
+        delay = self.initial_delay_seconds
+
+        while True:
+            yield delay
+            delay = min(delay * self.multiplier, self.maximum_delay_seconds)
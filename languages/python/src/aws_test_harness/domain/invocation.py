@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 @dataclass
@@ -7,3 +7,5 @@ class Invocation:
     target: str
     id: str
     parameters: Dict[str, Any]
+    # Seconds since the epoch at which the invocation was sent, when stamped by the sender
+    sent_time: Optional[float] = None
@@ -0,0 +1,7 @@
+from typing import Any, Dict
+
+
+# Fails an invocation in the same way as a twin that reports a failure, so that its caller fails straight away rather
+# than waiting for a result until it times out
+def to_invocation_error_result(exception: BaseException) -> Dict[str, Any]:
+    return dict(status='failed', context=dict(error=type(exception).__name__, cause=str(exception)))
@@ -1,18 +1,86 @@
-from typing import Callable, Any
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+from threading import Condition
+from typing import Callable, Any, Optional
 
 from aws_test_harness.domain.invocation import Invocation
+from aws_test_harness.domain.invocation_error_result import to_invocation_error_result
 from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
 
+DEFAULT_MAX_CONCURRENT_INVOCATIONS = 10
 
+
+# Hands collected invocations to a pool of workers rather than waiting for their results, so that the next invocations
+# are being collected whilst results are generated for the last. Collection blocks once the maximum number of pending
+# invocations is reached, so that invocations can't be collected faster than results are generated for them.
 class InvocationHandler:
     def __init__(self, invocation_post_office: InvocationPostOffice,
-                 get_invocation_result: Callable[[Invocation], Any]):
+                 get_invocation_result: Callable[[Invocation], Any],
+                 logger: Logger,
+                 max_concurrent_invocations: int = DEFAULT_MAX_CONCURRENT_INVOCATIONS,
+                 max_pending_invocations: Optional[int] = None):
+        if max_pending_invocations is None:
+            # Enough for the next batch to be waiting for workers whilst the last is being handled
+            max_pending_invocations = max_concurrent_invocations * 2
+
+        if max_pending_invocations < max_concurrent_invocations:
+            raise ValueError(f'Maximum pending invocations must be at least the maximum concurrent invocations '
+                             f'({max_concurrent_invocations}) but was {max_pending_invocations}')
+
         self.__invocation_post_office = invocation_post_office
         self.__get_invocation_result = get_invocation_result
+        self.__logger = logger
+        self.__max_concurrent_invocations = max_concurrent_invocations
+        self.__max_pending_invocations = max_pending_invocations
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__pending_invocation_count = 0
+        self.__pending_invocation_count_changed = Condition()
+
+    def handle_pending_invocations(self) -> None:
+        invocations = self.__invocation_post_office.collect_invocations()
+
+        for invocation in invocations:
+            with self.__pending_invocation_count_changed:
+                self.__pending_invocation_count_changed.wait_for(
+                    lambda: self.__pending_invocation_count < self.__max_pending_invocations
+                )
+                self.__pending_invocation_count += 1
+
+                # Started again after a shutdown, so that invocations can be handled for as long as the handler is used
+                if self.__executor is None:
+                    self.__executor = ThreadPoolExecutor(max_workers=self.__max_concurrent_invocations,
+                                                         thread_name_prefix='InvocationHandler')
+
+                executor = self.__executor
+
+            executor.submit(self.__handle_invocation, invocation)
+
+    def wait_for_pending_invocations(self) -> None:
+        with self.__pending_invocation_count_changed:
+            self.__pending_invocation_count_changed.wait_for(lambda: self.__pending_invocation_count == 0)
+
+    # Stops the worker threads once the invocations already handed to them have been handled
+    def shutdown(self) -> None:
+        with self.__pending_invocation_count_changed:
+            executor = self.__executor
+            self.__executor = None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
 
-    def handle_pending_invocation(self) -> None:
-        invocation = self.__invocation_post_office.maybe_collect_invocation()
+    def __handle_invocation(self, invocation: Invocation) -> None:
+        try:
+            try:
+                result = self.__get_invocation_result(invocation)
+            except Exception as e:
+                self.__logger.exception(f'Failed to generate result for invocation {invocation.id}', exc_info=e)
+                result = to_invocation_error_result(e)
 
-        if invocation:
-            # TODO: Post invocation error result if an exception is thrown whilst generating / serialising result
-            self.__invocation_post_office.post_result(invocation.id, self.__get_invocation_result(invocation))
+            self.__invocation_post_office.post_result(invocation.id, result)
+        except BaseException as e:
+            # Nothing waits on the outcome of an individual invocation, so failures are reported here instead
+            self.__logger.exception(f'Failed to handle invocation {invocation.id}', exc_info=e)
+        finally:
+            with self.__pending_invocation_count_changed:
+                self.__pending_invocation_count -= 1
+                self.__pending_invocation_count_changed.notify_all()
@@ -1,14 +1,32 @@
 from abc import ABCMeta, abstractmethod
-from typing import Any, Optional
+from typing import Any, Dict, List
 
 from aws_test_harness.domain.invocation import Invocation
 
 
 class InvocationPostOffice(metaclass=ABCMeta):
     @abstractmethod
-    def maybe_collect_invocation(self) -> Optional[Invocation]:
+    def collect_invocations(self) -> List[Invocation]:
         pass
 
     @abstractmethod
     def post_result(self, invocation_id: str, result: Any) -> None:
         pass
+
+    @abstractmethod
+    def post_results(self, results: Dict[str, Any]) -> None:
+        pass
+
+    # Makes collection, including any in progress, return no invocations straight away until resumed, so that the
+    # harness can stop handling invocations without waiting for a long poll to finish
+    @abstractmethod
+    def interrupt_collection(self) -> None:
+        pass
+
+    @abstractmethod
+    def resume_collection(self) -> None:
+        pass
+
+    # Returns once every result posted so far has been written, for post offices that don't write results straight away
+    def flush(self) -> None:
+        pass
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Optional
+
+# From the invocation being sent by the test double invocation handler to it being collected by the harness
+QUEUE_DELIVERY_STAGE = 'queue_delivery'
+
+# A single request by the harness for pending invocations, recorded only when invocations are collected
+COLLECTION_STAGE = 'collection'
+
+# Generation of the result by the twin, including the user's handler
+RESULT_GENERATION_STAGE = 'result_generation'
+
+# Writing of the result for the test double invocation handler to collect
+RESULT_POSTING_STAGE = 'result_posting'
+
+
+@dataclass(frozen=True)
+class InvocationStageTiming:
+    stage: str
+    # Seconds since the epoch
+    start_time: float
+    duration_seconds: float
+    # Absent for stages that apply to a batch of invocations at once
+    invocation_id: Optional[str] = None
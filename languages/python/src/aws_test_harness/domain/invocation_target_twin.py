@@ -1,6 +1,9 @@
+import asyncio
 from abc import ABCMeta, abstractmethod
 from copy import deepcopy
-from typing import Any, List, Callable
+from inspect import isawaitable
+from threading import Lock
+from typing import Any, List, Callable, Awaitable
 
 from aws_test_harness.domain.invocation import Invocation
 from aws_test_harness.domain.state_machine_execution_failure import StateMachineExecutionFailure
@@ -10,23 +13,27 @@ class InvocationTargetTwin(metaclass=ABCMeta):
 
     def __init__(self, invocation_handler: Callable[..., Any]) -> None:
         self.__invocation_handler = invocation_handler
+        # Guards recording of invocations, which may be handled on several threads at once
+        self.__lock = Lock()
         self.__invocation_count = 0
         self.__invocations: List[List[Any]] = []
 
     def get_result_for(self, invocation: Invocation) -> Any:
-        # TODO: Ensure threadsafe
-        self.__invocation_count += 1
-        invocation_args = self._get_invocation_args(invocation)
-        self.__invocations.append(invocation_args)
-        invocation_handler_result = self.__invocation_handler(*invocation_args)
+        invocation_handler_result = self.__invocation_handler(*self.__record(invocation))
 
-        if isinstance(invocation_handler_result, StateMachineExecutionFailure):
-            return dict(
-                status='failed',
-                context=dict(error=invocation_handler_result.error, cause=invocation_handler_result.cause)
-            )
-        else:
-            return dict(status='succeeded', context=dict(result=invocation_handler_result))
+        if isawaitable(invocation_handler_result):
+            # No event loop runs on invocation handling threads, so give the asynchronous handler one of its own
+            invocation_handler_result = asyncio.run(self.__await(invocation_handler_result))
+
+        return self.__to_result(invocation_handler_result)
+
+    async def get_result_for_async(self, invocation: Invocation) -> Any:
+        invocation_handler_result = self.__invocation_handler(*self.__record(invocation))
+
+        if isawaitable(invocation_handler_result):
+            invocation_handler_result = await invocation_handler_result
+
+        return self.__to_result(invocation_handler_result)
 
     @property
     def invocation_count(self) -> int:
@@ -34,7 +41,12 @@ class InvocationTargetTwin(metaclass=ABCMeta):
 
     @property
     def invocations(self) -> List[List[Any]]:
-        return deepcopy(self.__invocations)
+        with self.__lock:
+            recorded_invocations = self.__invocations[:]
+
+        # Copied once per read to guard the history against external mutation. The recorded snapshots are never
+        # modified, so this doesn't need to hold up recording.
+        return deepcopy(recorded_invocations)
 
     def _set_invocation_handler(self, invocation_handler: Callable[..., Any]) -> None:
         self.__invocation_handler = invocation_handler
@@ -42,3 +54,28 @@ class InvocationTargetTwin(metaclass=ABCMeta):
     @abstractmethod
     def _get_invocation_args(self, invocation: Invocation) -> List[Any]:
         pass
+
+    def __record(self, invocation: Invocation) -> List[Any]:
+        invocation_args = self._get_invocation_args(invocation)
+        # Snapshot the arguments before the handler gets a chance to mutate them
+        invocation_args_snapshot = deepcopy(invocation_args)
+
+        with self.__lock:
+            self.__invocation_count += 1
+            self.__invocations.append(invocation_args_snapshot)
+
+        return invocation_args
+
+    @staticmethod
+    async def __await(awaitable: Awaitable[Any]) -> Any:
+        return await awaitable
+
+    @staticmethod
+    def __to_result(invocation_handler_result: Any) -> Any:
+        if isinstance(invocation_handler_result, StateMachineExecutionFailure):
+            return dict(
+                status='failed',
+                context=dict(error=invocation_handler_result.error, cause=invocation_handler_result.cause)
+            )
+        else:
+            return dict(status='succeeded', context=dict(result=invocation_handler_result))
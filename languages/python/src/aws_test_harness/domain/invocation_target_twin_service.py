@@ -1,8 +1,11 @@
+from time import perf_counter, time
 from typing import Dict, TypeVar, Optional, Any
 
 from aws_test_harness.domain.aws_resource_registry import AwsResourceRegistry
 from aws_test_harness.domain.invocation import Invocation
+from aws_test_harness.domain.invocation_stage_timing import InvocationStageTiming, RESULT_GENERATION_STAGE
 from aws_test_harness.domain.invocation_target_twin import InvocationTargetTwin
+from aws_test_harness.domain.invocation_timing_sink import InvocationTimingSink
 from aws_test_harness.domain.state_machine_twin import StateMachineTwin, StateMachineExecutionHandler
 from aws_test_harness.domain.unknown_invocation_target_exception import UnknownInvocationTargetException
 
@@ -11,8 +14,10 @@ InvocationTargetTwinType = TypeVar('InvocationTargetTwinType', bound=InvocationT
 
 class InvocationTargetTwinService:
 
-    def __init__(self, aws_resource_registry: AwsResourceRegistry):
+    def __init__(self, aws_resource_registry: AwsResourceRegistry,
+                 timing_sink: Optional[InvocationTimingSink] = None):
         self.__aws_resource_registry = aws_resource_registry
+        self.__timing_sink = timing_sink
         self.__twins: Dict[str, InvocationTargetTwin] = dict()
 
     def reset(self) -> None:
@@ -27,12 +32,42 @@ class InvocationTargetTwinService:
 
     def generate_result_for_invocation(self, invocation: Invocation) -> Any:
         twin = self.__get_twin_for_invocation_target(invocation.target)
-        return twin.get_result_for(invocation)
+
+        if self.__timing_sink is None:
+            return twin.get_result_for(invocation)
+
+        start_time = time()
+        start_counter = perf_counter()
+
+        try:
+            return twin.get_result_for(invocation)
+        finally:
+            self.__record_result_generation(invocation, start_time, perf_counter() - start_counter)
+
+    async def generate_result_for_invocation_async(self, invocation: Invocation) -> Any:
+        twin = self.__get_twin_for_invocation_target(invocation.target)
+
+        if self.__timing_sink is None:
+            return await twin.get_result_for_async(invocation)
+
+        start_time = time()
+        start_counter = perf_counter()
+
+        try:
+            return await twin.get_result_for_async(invocation)
+        finally:
+            self.__record_result_generation(invocation, start_time, perf_counter() - start_counter)
 
     def __add_twin(self, cfn_logical_resource_id: str, twin: InvocationTargetTwin) -> None:
         invocation_target = self.__aws_resource_registry.get_resource_arn(cfn_logical_resource_id)
         self.__twins[invocation_target] = twin
 
+    def __record_result_generation(self, invocation: Invocation, start_time: float, duration_seconds: float) -> None:
+        if self.__timing_sink is not None:
+            self.__timing_sink.record(
+                InvocationStageTiming(RESULT_GENERATION_STAGE, start_time, duration_seconds, invocation.id)
+            )
+
     def __get_twin_for_invocation_target(self, invocation_target: str) -> InvocationTargetTwin:
         twin = self.__twins.get(invocation_target)
 
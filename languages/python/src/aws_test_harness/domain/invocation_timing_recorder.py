@@ -0,0 +1,24 @@
+from threading import Lock
+from typing import List
+
+from aws_test_harness.domain.invocation_stage_timing import InvocationStageTiming
+from aws_test_harness.domain.invocation_timing_sink import InvocationTimingSink
+
+
+class InvocationTimingRecorder(InvocationTimingSink):
+    def __init__(self) -> None:
+        # Timings are recorded from invocation handling and result posting threads at once
+        self.__lock = Lock()
+        self.__timings: List[InvocationStageTiming] = []
+
+    @property
+    def timings(self) -> List[InvocationStageTiming]:
+        with self.__lock:
+            return list(self.__timings)
+
+    def record(self, timing: InvocationStageTiming) -> None:
+        with self.__lock:
+            self.__timings.append(timing)
+
+    def durations_seconds(self, stage: str) -> List[float]:
+        return [timing.duration_seconds for timing in self.timings if timing.stage == stage]
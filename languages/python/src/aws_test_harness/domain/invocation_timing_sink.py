@@ -0,0 +1,9 @@
+from abc import ABCMeta, abstractmethod
+
+from aws_test_harness.domain.invocation_stage_timing import InvocationStageTiming
+
+
+class InvocationTimingSink(metaclass=ABCMeta):
+    @abstractmethod
+    def record(self, timing: InvocationStageTiming) -> None:
+        pass
@@ -0,0 +1,38 @@
+from threading import Lock
+from typing import Dict, List
+
+from aws_test_harness.domain.invocation_stage_timing import InvocationStageTiming
+from aws_test_harness.domain.invocation_timing_sink import InvocationTimingSink
+
+
+# Collects the timings of each invocation handled during a test, so that the path of any one invocation can be followed
+# from it being sent by the test double invocation handler to its result being posted. Cleared between tests to report
+# on each test separately.
+class InvocationTraceReport(InvocationTimingSink):
+    def __init__(self) -> None:
+        # Timings are recorded from invocation handling and result posting threads at once
+        self.__lock = Lock()
+        self.__timings_by_invocation_id: Dict[str, List[InvocationStageTiming]] = {}
+
+    @property
+    def invocation_ids(self) -> List[str]:
+        with self.__lock:
+            return list(self.__timings_by_invocation_id)
+
+    def record(self, timing: InvocationStageTiming) -> None:
+        # Stages that apply to a batch of invocations at once belong to the trace of no single invocation
+        if timing.invocation_id is None:
+            return
+
+        with self.__lock:
+            self.__timings_by_invocation_id.setdefault(timing.invocation_id, []).append(timing)
+
+    def timings_for(self, invocation_id: str) -> List[InvocationStageTiming]:
+        with self.__lock:
+            timings = list(self.__timings_by_invocation_id.get(invocation_id, []))
+
+        return sorted(timings, key=lambda timing: timing.start_time)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__timings_by_invocation_id.clear()
@@ -0,0 +1,19 @@
+from logging import Logger
+
+from aws_test_harness.domain.invocation_stage_timing import InvocationStageTiming
+from aws_test_harness.domain.invocation_timing_sink import InvocationTimingSink
+
+
+class LoggingInvocationTimingSink(InvocationTimingSink):
+    def __init__(self, logger: Logger):
+        self.__logger = logger
+
+    def record(self, timing: InvocationStageTiming) -> None:
+        duration_millis = timing.duration_seconds * 1000
+
+        if timing.invocation_id is None:
+            self.__logger.info(f'Stage {timing.stage} took {duration_millis:.1f}ms')
+        else:
+            self.__logger.info(
+                f'Stage {timing.stage} took {duration_millis:.1f}ms for invocation {timing.invocation_id}'
+            )
@@ -0,0 +1,9 @@
+from typing import List
+
+
+# Raised by post offices that post some of a batch of results but not others, naming the invocations whose results
+# were not posted so that only those need posting again
+class ResultsNotPostedException(Exception):
+    def __init__(self, message: str, invocation_ids: List[str]):
+        super().__init__(message)
+        self.invocation_ids = invocation_ids
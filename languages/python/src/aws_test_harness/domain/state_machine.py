@@ -5,6 +5,14 @@ from aws_test_harness.domain.state_machine_execution import StateMachineExecutio
 
 
 class StateMachine(metaclass=ABCMeta):
+    @abstractmethod
+    def start(self, execution_input: Dict[str, Any]) -> StateMachineExecution:
+        pass
+
     @abstractmethod
     def execute(self, execution_input: Dict[str, Any]) -> StateMachineExecution:
         pass
+
+    @abstractmethod
+    async def execute_async(self, execution_input: Dict[str, Any]) -> StateMachineExecution:
+        pass
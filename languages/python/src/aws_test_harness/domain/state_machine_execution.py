@@ -1,28 +1,41 @@
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import Future
 from typing import Optional
 
+from aws_test_harness.domain.state_machine_execution_description import StateMachineExecutionDescription
+
 
 class StateMachineExecution(metaclass=ABCMeta):
     @property
-    @abstractmethod
     def status(self) -> Optional[str]:
-        pass
+        return self.describe().status
 
     @property
-    @abstractmethod
     def output(self) -> Optional[str]:
-        pass
+        return self.describe().output
 
     @property
-    @abstractmethod
     def error(self) -> Optional[str]:
-        pass
+        return self.describe().error
 
     @property
-    @abstractmethod
     def cause(self) -> Optional[str]:
+        return self.describe().cause
+
+    @abstractmethod
+    def describe(self) -> StateMachineExecutionDescription:
         pass
 
     @abstractmethod
     def wait_for_completion(self) -> None:
         pass
+
+    @abstractmethod
+    async def wait_for_completion_async(self) -> None:
+        pass
+
+    # Resolved with the terminal description once the execution completes, without blocking the caller, so that many
+    # executions can be watched together before any of them is waited on
+    @abstractmethod
+    def completion(self) -> Future[StateMachineExecutionDescription]:
+        pass
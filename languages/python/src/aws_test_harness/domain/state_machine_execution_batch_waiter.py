@@ -0,0 +1,13 @@
+from typing import Iterable
+
+from aws_test_harness.domain.state_machine_execution import StateMachineExecution
+
+
+class StateMachineExecutionBatchWaiter:
+    def wait_for_all(self, executions: Iterable[StateMachineExecution]) -> None:
+        # Every execution is watched before any is waited on, so that executions sharing a watcher are all polled in
+        # each round and waiting for the batch takes no longer than waiting for the slowest execution
+        completions = [execution.completion() for execution in executions]
+
+        for completion in completions:
+            completion.result()
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Optional
+
+TERMINAL_EXECUTION_STATUSES = frozenset(['SUCCEEDED', 'FAILED', 'TIMED_OUT', 'ABORTED'])
+
+
+@dataclass(frozen=True)
+class StateMachineExecutionDescription:
+    status: str
+    output: Optional[str] = None
+    error: Optional[str] = None
+    cause: Optional[str] = None
+
+    @property
+    def terminal(self) -> bool:
+        return self.status in TERMINAL_EXECUTION_STATUSES
@@ -1,13 +1,17 @@
-from typing import Optional
+from logging import Logger
+from typing import Iterable, Optional
 
 from aws_test_harness.domain.aws_resource_factory import AwsResourceFactory
 from aws_test_harness.domain.aws_resource_registry import AwsResourceRegistry
 from aws_test_harness.domain.invocation_handler import InvocationHandler
 from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
 from aws_test_harness.domain.invocation_target_twin_service import InvocationTargetTwinService
+from aws_test_harness.domain.invocation_timing_sink import InvocationTimingSink
 from aws_test_harness.domain.repeating_task_scheduler import RepeatingTaskScheduler
 from aws_test_harness.domain.s3_bucket import S3Bucket
 from aws_test_harness.domain.state_machine import StateMachine
+from aws_test_harness.domain.state_machine_execution import StateMachineExecution
+from aws_test_harness.domain.state_machine_execution_batch_waiter import StateMachineExecutionBatchWaiter
 from aws_test_harness.domain.state_machine_twin import StateMachineExecutionHandler, StateMachineTwin
 
 
@@ -17,29 +21,46 @@ class TestHarness:
 
     def __init__(self, aws_resource_registry: AwsResourceRegistry, invocation_post_office: InvocationPostOffice,
                  invocation_handling_scheduler: RepeatingTaskScheduler,
-                 aws_resource_factory: AwsResourceFactory):
+                 aws_resource_factory: AwsResourceFactory,
+                 logger: Logger,
+                 invocation_timing_sink: Optional[InvocationTimingSink] = None):
         self.__aws_resource_factory = aws_resource_factory
+        self.__invocation_post_office = invocation_post_office
         self.__invocation_handling_scheduler: RepeatingTaskScheduler = invocation_handling_scheduler
-        self.__invocation_target_twin_service = InvocationTargetTwinService(aws_resource_registry)
+        self.__invocation_target_twin_service = InvocationTargetTwinService(aws_resource_registry,
+                                                                            invocation_timing_sink)
         self.__invocation_handler = InvocationHandler(
             invocation_post_office,
-            self.__invocation_target_twin_service.generate_result_for_invocation
+            self.__invocation_target_twin_service.generate_result_for_invocation,
+            logger
         )
+        self.__state_machine_execution_batch_waiter = StateMachineExecutionBatchWaiter()
 
     def state_machine(self, cfn_logical_resource_id: str) -> StateMachine:
         return self.__aws_resource_factory.get_state_machine(cfn_logical_resource_id)
 
+    def wait_for_state_machine_executions(self, executions: Iterable[StateMachineExecution]) -> None:
+        self.__state_machine_execution_batch_waiter.wait_for_all(executions)
+
     def test_s3_bucket(self, test_resource_name: str) -> S3Bucket:
         return self.__aws_resource_factory.get_s3_bucket(f'{test_resource_name}AWSTestHarnessS3Bucket')
 
     def twin_state_machine(self, state_machine_name: str,
                            execution_handler: Optional[StateMachineExecutionHandler] = None) -> StateMachineTwin:
         if not self.__invocation_handling_scheduler.scheduled():
-            self.__invocation_handling_scheduler.schedule(self.__invocation_handler.handle_pending_invocation)
+            self.__invocation_handling_scheduler.schedule(self.__invocation_handler.handle_pending_invocations)
 
         return self.__invocation_target_twin_service.create_twin_for_state_machine(state_machine_name,
                                                                                    execution_handler)
 
     def tear_down(self) -> None:
+        # Stops invocation handling without waiting for a long poll in progress to finish
+        self.__invocation_post_office.interrupt_collection()
         self.__invocation_handling_scheduler.reset_schedule()
+        self.__invocation_post_office.resume_collection()
+        # Invocations already collected are still handled by the twins they were intended for
+        self.__invocation_handler.wait_for_pending_invocations()
+        self.__invocation_handler.shutdown()
+        # Results still buffered would otherwise be lost, leaving the invocations they were for to time out
+        self.__invocation_post_office.flush()
         self.__invocation_target_twin_service.reset()
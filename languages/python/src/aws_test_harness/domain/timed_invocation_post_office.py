@@ -0,0 +1,67 @@
+from time import perf_counter, time
+from typing import Any, Dict, List
+
+from aws_test_harness.domain.invocation import Invocation
+from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
+from aws_test_harness.domain.invocation_stage_timing import InvocationStageTiming, COLLECTION_STAGE, \
+    QUEUE_DELIVERY_STAGE, RESULT_POSTING_STAGE
+from aws_test_harness.domain.invocation_timing_sink import InvocationTimingSink
+
+
+# Records how long invocations spend being delivered, collected and having their results posted. Only wraps a post
+# office when timings are wanted, so that there is no cost otherwise.
+class TimedInvocationPostOffice(InvocationPostOffice):
+    def __init__(self, invocation_post_office: InvocationPostOffice, timing_sink: InvocationTimingSink):
+        self.__invocation_post_office = invocation_post_office
+        self.__timing_sink = timing_sink
+
+    def collect_invocations(self) -> List[Invocation]:
+        start_time = time()
+        start_counter = perf_counter()
+        invocations = self.__invocation_post_office.collect_invocations()
+        duration_seconds = perf_counter() - start_counter
+
+        if not invocations:
+            return invocations
+
+        self.__timing_sink.record(InvocationStageTiming(COLLECTION_STAGE, start_time, duration_seconds))
+        collection_time = start_time + duration_seconds
+
+        for invocation in invocations:
+            if invocation.sent_time is not None:
+                # Measured against the clock of the sender, so includes any difference between the two clocks
+                self.__timing_sink.record(InvocationStageTiming(
+                    QUEUE_DELIVERY_STAGE,
+                    invocation.sent_time,
+                    collection_time - invocation.sent_time,
+                    invocation.id
+                ))
+
+        return invocations
+
+    def post_result(self, invocation_id: str, result: Any) -> None:
+        start_time = time()
+        start_counter = perf_counter()
+        self.__invocation_post_office.post_result(invocation_id, result)
+        self.__record_result_posting([invocation_id], start_time, perf_counter() - start_counter)
+
+    def post_results(self, results: Dict[str, Any]) -> None:
+        start_time = time()
+        start_counter = perf_counter()
+        self.__invocation_post_office.post_results(results)
+        self.__record_result_posting(list(results), start_time, perf_counter() - start_counter)
+
+    def interrupt_collection(self) -> None:
+        self.__invocation_post_office.interrupt_collection()
+
+    def resume_collection(self) -> None:
+        self.__invocation_post_office.resume_collection()
+
+    def flush(self) -> None:
+        self.__invocation_post_office.flush()
+
+    def __record_result_posting(self, invocation_ids: List[str], start_time: float, duration_seconds: float) -> None:
+        for invocation_id in invocation_ids:
+            self.__timing_sink.record(
+                InvocationStageTiming(RESULT_POSTING_STAGE, start_time, duration_seconds, invocation_id)
+            )
@@ -0,0 +1,2 @@
+class UnknownAwsResourceException(Exception):
+    pass
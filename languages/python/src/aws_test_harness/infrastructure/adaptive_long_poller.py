@@ -0,0 +1,115 @@
+from concurrent.futures import Future
+from logging import Logger
+from queue import SimpleQueue
+from threading import Condition, Thread
+from typing import Callable, List, Optional, Tuple
+
+DEFAULT_MINIMUM_WAIT_TIME_SECONDS = 1
+
+# The longest that SQS will wait for messages to arrive before responding to a ReceiveMessage request
+DEFAULT_MAXIMUM_WAIT_TIME_SECONDS = 20
+
+
+# Long polls for longer whilst nothing is being received, so that an idle harness makes fewer requests, and for less
+# time once items arrive. Each poll is made from a single long-lived receiving thread, so that it can be interrupted
+# and resumed rather than waited for, without a poll that was interrupted overlapping those that follow it. Anything
+# received by an interrupted poll is released, to be received again, once it completes.
+class AdaptiveLongPoller[T]:
+    def __init__(self, logger: Logger, minimum_wait_time_seconds: int = DEFAULT_MINIMUM_WAIT_TIME_SECONDS,
+                 maximum_wait_time_seconds: int = DEFAULT_MAXIMUM_WAIT_TIME_SECONDS):
+        if maximum_wait_time_seconds < minimum_wait_time_seconds:
+            raise ValueError(f'Maximum wait time ({maximum_wait_time_seconds}s) must be at least the minimum wait '
+                             f'time ({minimum_wait_time_seconds}s)')
+
+        self.__logger = logger
+        self.__minimum_wait_time_seconds = minimum_wait_time_seconds
+        self.__maximum_wait_time_seconds = maximum_wait_time_seconds
+        self.__wait_time_seconds = minimum_wait_time_seconds
+        self.__condition = Condition()
+        self.__interrupted = False
+        self.__receive_requests: SimpleQueue[Tuple[Callable[[int], List[T]], int, Future[List[T]]]] = SimpleQueue()
+        self.__receiving_thread: Optional[Thread] = None
+
+    @property
+    def wait_time_seconds(self) -> int:
+        with self.__condition:
+            return self.__wait_time_seconds
+
+    def poll(self, receive: Callable[[int], List[T]], release: Callable[[List[T]], None]) -> List[T]:
+        received: Future[List[T]] = Future()
+        received.add_done_callback(lambda _: self.__notify())
+
+        with self.__condition:
+            if self.__interrupted:
+                return []
+
+            wait_time_seconds = self.__wait_time_seconds
+
+            # A daemon thread, so that a long poll in progress doesn't hold up the exit of the process
+            if self.__receiving_thread is None:
+                self.__receiving_thread = Thread(target=self.__receive_as_requested, daemon=True,
+                                                 name='AdaptiveLongPoller')
+                self.__receiving_thread.start()
+
+        self.__receive_requests.put((receive, wait_time_seconds, received))
+
+        with self.__condition:
+            self.__condition.wait_for(lambda: received.done() or self.__interrupted)
+
+            if not received.done():
+                # Only a poll that has started receiving can have received anything that needs releasing
+                if not received.cancel():
+                    received.add_done_callback(lambda abandoned: self.__release(abandoned, release))
+
+                return []
+
+        items = received.result()
+
+        with self.__condition:
+            self.__wait_time_seconds = self.__minimum_wait_time_seconds if items \
+                else min(self.__wait_time_seconds * 2, self.__maximum_wait_time_seconds)
+
+        return items
+
+    # Makes polls, including any in progress, return nothing straight away until resumed
+    def interrupt(self) -> None:
+        with self.__condition:
+            self.__interrupted = True
+            self.__condition.notify_all()
+
+    # Returns straight away, rather than waiting for a poll that was interrupted whilst receiving, which the receiving
+    # thread finishes before starting the next
+    def resume(self) -> None:
+        with self.__condition:
+            self.__interrupted = False
+
+    def __receive_as_requested(self) -> None:
+        while True:
+            receive, wait_time_seconds, received = self.__receive_requests.get()
+
+            # Cancelled if interrupted whilst waiting for an earlier poll to finish
+            if not received.set_running_or_notify_cancel():
+                continue
+
+            try:
+                received.set_result(receive(wait_time_seconds))
+            except BaseException as e:
+                received.set_exception(e)
+
+    def __notify(self) -> None:
+        with self.__condition:
+            self.__condition.notify_all()
+
+    def __release(self, abandoned: Future[List[T]], release: Callable[[List[T]], None]) -> None:
+        if abandoned.exception() is not None:
+            return
+
+        items = abandoned.result()
+
+        if not items:
+            return
+
+        try:
+            release(items)
+        except BaseException as e:
+            self.__logger.exception(f'Failed to release {len(items)} item(s) received by interrupted poll', exc_info=e)
@@ -0,0 +1,108 @@
+import re
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from aws_test_harness.infrastructure.asl_execution_error import AslExecutionError
+from aws_test_harness.infrastructure.asl_json_path import path_exists, read_path
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _to_timestamp(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _compare_strings(comparison: Callable[[str, str], bool]) -> Callable[[Any, Any], bool]:
+    return lambda value, expected: isinstance(value, str) and isinstance(expected, str) and comparison(value, expected)
+
+
+def _compare_numbers(comparison: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    return lambda value, expected: _is_number(value) and _is_number(expected) and comparison(value, expected)
+
+
+def _compare_timestamps(comparison: Callable[[datetime, datetime], bool]) -> Callable[[Any, Any], bool]:
+    def compare(value: Any, expected: Any) -> bool:
+        value_timestamp = _to_timestamp(value)
+        expected_timestamp = _to_timestamp(expected)
+
+        return value_timestamp is not None and expected_timestamp is not None and \
+            comparison(value_timestamp, expected_timestamp)
+
+    return compare
+
+
+def _matches_wildcard_pattern(value: str, pattern: str) -> bool:
+    # Only * is special, matching any run of characters, unless escaped with a backslash
+    pattern_regex = ''.join(
+        '.*' if part == '*' else re.escape(part[1] if len(part) == 2 and part.startswith('\\') else part)
+        for part in re.findall(r'\\\*|\\\\|\*|[^*\\]+|\\', pattern)
+    )
+
+    return re.fullmatch(pattern_regex, value, re.DOTALL) is not None
+
+
+COMPARISON_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    'BooleanEquals': lambda value, expected: isinstance(value, bool) and value == expected,
+    'NumericEquals': _compare_numbers(lambda value, expected: value == expected),
+    'NumericGreaterThan': _compare_numbers(lambda value, expected: value > expected),
+    'NumericGreaterThanEquals': _compare_numbers(lambda value, expected: value >= expected),
+    'NumericLessThan': _compare_numbers(lambda value, expected: value < expected),
+    'NumericLessThanEquals': _compare_numbers(lambda value, expected: value <= expected),
+    'StringEquals': _compare_strings(lambda value, expected: value == expected),
+    'StringGreaterThan': _compare_strings(lambda value, expected: value > expected),
+    'StringGreaterThanEquals': _compare_strings(lambda value, expected: value >= expected),
+    'StringLessThan': _compare_strings(lambda value, expected: value < expected),
+    'StringLessThanEquals': _compare_strings(lambda value, expected: value <= expected),
+    'StringMatches': _compare_strings(_matches_wildcard_pattern),
+    'TimestampEquals': _compare_timestamps(lambda value, expected: value == expected),
+    'TimestampGreaterThan': _compare_timestamps(lambda value, expected: value > expected),
+    'TimestampGreaterThanEquals': _compare_timestamps(lambda value, expected: value >= expected),
+    'TimestampLessThan': _compare_timestamps(lambda value, expected: value < expected),
+    'TimestampLessThanEquals': _compare_timestamps(lambda value, expected: value <= expected),
+}
+
+TYPE_TEST_OPERATORS: Dict[str, Callable[[Any], bool]] = {
+    'IsBoolean': lambda value: isinstance(value, bool),
+    'IsNull': lambda value: value is None,
+    'IsNumeric': _is_number,
+    'IsString': lambda value: isinstance(value, str),
+    'IsTimestamp': lambda value: _to_timestamp(value) is not None,
+}
+
+
+def matches_choice_rule(rule: Dict[str, Any], data: Any, context: Dict[str, Any]) -> bool:
+    if 'And' in rule:
+        return all(matches_choice_rule(nested_rule, data, context) for nested_rule in rule['And'])
+
+    if 'Or' in rule:
+        return any(matches_choice_rule(nested_rule, data, context) for nested_rule in rule['Or'])
+
+    if 'Not' in rule:
+        return not matches_choice_rule(rule['Not'], data, context)
+
+    variable = rule['Variable']
+
+    if 'IsPresent' in rule:
+        return path_exists(variable, data, context) == rule['IsPresent']
+
+    value = read_path(variable, data, context)
+
+    for operator, operand in rule.items():
+        if operator in TYPE_TEST_OPERATORS:
+            return TYPE_TEST_OPERATORS[operator](value) == operand
+
+        if operator in COMPARISON_OPERATORS:
+            return COMPARISON_OPERATORS[operator](value, operand)
+
+        if operator.endswith('Path') and operator[:-len('Path')] in COMPARISON_OPERATORS:
+            return COMPARISON_OPERATORS[operator[:-len('Path')]](value, read_path(operand, data, context))
+
+    raise AslExecutionError('States.Runtime', f'Choice rule for variable "{variable}" has no supported comparison')
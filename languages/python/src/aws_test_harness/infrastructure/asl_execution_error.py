@@ -0,0 +1,7 @@
+# Raised whilst interpreting a state machine definition, carrying the error name and cause that Step Functions would
+# report, so that it can be matched by Retry and Catch fields or fail the execution
+class AslExecutionError(Exception):
+    def __init__(self, error: str, cause: str = ''):
+        super().__init__(f'{error}: {cause}' if cause else error)
+        self.error = error
+        self.cause = cause
@@ -0,0 +1,228 @@
+import base64
+import json
+import re
+from copy import deepcopy
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from aws_test_harness.infrastructure.asl_execution_error import AslExecutionError
+
+# Supports the reference paths that state machine definitions use in practice, rather than the whole of JSONPath
+PATH_SEGMENT_PATTERN = re.compile(r"\.([^.\[\]]+)|\['([^']*)'\]|\[(\d+)\]")
+
+INTRINSIC_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    'States.Array': lambda *values: list(values),
+    'States.ArrayContains': lambda array, value: value in array,
+    'States.ArrayGetItem': lambda array, index: array[index],
+    'States.ArrayLength': lambda array: len(array),
+    'States.ArrayPartition': lambda array, size: [array[start:start + size] for start in range(0, len(array), size)],
+    'States.ArrayRange': lambda start, end, step: list(range(start, end + (1 if step > 0 else -1), step)),
+    'States.ArrayUnique': lambda array: [value for index, value in enumerate(array) if value not in array[:index]],
+    'States.Base64Decode': lambda value: base64.b64decode(value).decode(),
+    'States.Base64Encode': lambda value: base64.b64encode(value.encode()).decode(),
+    'States.Format': lambda template, *values: _format(template, values),
+    'States.JsonToString': lambda value: json.dumps(value, separators=(',', ':')),
+    'States.MathAdd': lambda first_number, second_number: first_number + second_number,
+    'States.StringSplit': lambda value, delimiters: [part for part in re.split(
+        '|'.join(re.escape(delimiter) for delimiter in delimiters), value
+    ) if part],
+    'States.StringToJson': lambda value: json.loads(value),
+    'States.UUID': lambda: str(uuid4()),
+}
+
+
+def read_path(path: str, data: Any, context: Dict[str, Any]) -> Any:
+    # Paths starting with $$ select from the context object rather than the state's input
+    selects_context = path.startswith('$$')
+    value = context if selects_context else data
+
+    for segment in _parse_path(path, 2 if selects_context else 1):
+        if isinstance(segment, int) and isinstance(value, list) and segment < len(value):
+            value = value[segment]
+        elif isinstance(segment, str) and isinstance(value, dict) and segment in value:
+            value = value[segment]
+        else:
+            raise AslExecutionError('States.Runtime', f'Path "{path}" could not be found in the '
+                                                      f'{"context object" if selects_context else "input"}')
+
+    return value
+
+
+def path_exists(path: str, data: Any, context: Dict[str, Any]) -> bool:
+    try:
+        read_path(path, data, context)
+        return True
+    except AslExecutionError:
+        return False
+
+
+def write_path(path: str, data: Any, value: Any) -> Any:
+    segments = _parse_path(path)
+
+    if not segments:
+        return value
+
+    if not isinstance(data, dict):
+        raise AslExecutionError('States.Runtime', f'Result path "{path}" requires the input to be an object')
+
+    # Step Functions never modifies a state's input in place
+    updated_data = deepcopy(data)
+    parent = updated_data
+
+    for segment in segments[:-1]:
+        if not isinstance(segment, str):
+            raise AslExecutionError('States.Runtime', f'Result path "{path}" must only contain field names')
+
+        if not isinstance(parent.get(segment), dict):
+            parent[segment] = {}
+
+        parent = parent[segment]
+
+    if not isinstance(segments[-1], str):
+        raise AslExecutionError('States.Runtime', f'Result path "{path}" must only contain field names')
+
+    parent[segments[-1]] = value
+
+    return updated_data
+
+
+def apply_payload_template(template: Any, data: Any, context: Dict[str, Any]) -> Any:
+    if isinstance(template, dict):
+        payload = {}
+
+        for key, value in template.items():
+            if key.endswith('.$'):
+                payload[key[:-2]] = _evaluate_expression(value, data, context)
+            else:
+                payload[key] = apply_payload_template(value, data, context)
+
+        return payload
+
+    if isinstance(template, list):
+        return [apply_payload_template(item, data, context) for item in template]
+
+    return template
+
+
+def _evaluate_expression(expression: str, data: Any, context: Dict[str, Any]) -> Any:
+    if expression.startswith('States.'):
+        value, end = _evaluate_intrinsic_function(expression, 0, data, context)
+
+        if end != len(expression):
+            raise AslExecutionError('States.Runtime', f'Invalid intrinsic function "{expression}"')
+
+        return value
+
+    return read_path(expression, data, context)
+
+
+def _parse_path(path: str, position: int = 1) -> List[str | int]:
+    if not path.startswith('$'):
+        raise AslExecutionError('States.Runtime', f'Path "{path}" must start with "$"')
+
+    segments: List[str | int] = []
+
+    while position < len(path):
+        match = PATH_SEGMENT_PATTERN.match(path, position)
+
+        if match is None:
+            raise AslExecutionError('States.Runtime', f'Path "{path}" is not supported')
+
+        field_name, quoted_field_name, index = match.groups()
+        segments.append(int(index) if index is not None else field_name or quoted_field_name)
+        position = match.end()
+
+    return segments
+
+
+def _evaluate_intrinsic_function(expression: str, start: int, data: Any,
+                                 context: Dict[str, Any]) -> Tuple[Any, int]:
+    opening_parenthesis = expression.find('(', start)
+
+    if opening_parenthesis == -1:
+        raise AslExecutionError('States.Runtime', f'Invalid intrinsic function "{expression}"')
+
+    function_name = expression[start:opening_parenthesis].strip()
+
+    if function_name not in INTRINSIC_FUNCTIONS:
+        raise AslExecutionError('States.Runtime', f'Intrinsic function "{function_name}" is not supported')
+
+    arguments = []
+    position = _skip_whitespace(expression, opening_parenthesis + 1)
+
+    while position < len(expression) and expression[position] != ')':
+        argument, position = _evaluate_intrinsic_function_argument(expression, position, data, context)
+        arguments.append(argument)
+        position = _skip_whitespace(expression, position)
+
+        if position < len(expression) and expression[position] == ',':
+            position = _skip_whitespace(expression, position + 1)
+
+    if position >= len(expression):
+        raise AslExecutionError('States.Runtime', f'Invalid intrinsic function "{expression}"')
+
+    try:
+        return INTRINSIC_FUNCTIONS[function_name](*arguments), position + 1
+    except (TypeError, ValueError, IndexError) as e:
+        raise AslExecutionError('States.Runtime', f'Intrinsic function "{function_name}" failed: {e}')
+
+
+def _evaluate_intrinsic_function_argument(expression: str, start: int, data: Any,
+                                          context: Dict[str, Any]) -> Tuple[Any, int]:
+    if expression.startswith('States.', start):
+        return _evaluate_intrinsic_function(expression, start, data, context)
+
+    if expression[start] == "'":
+        return _read_string_literal(expression, start)
+
+    end = start
+
+    while end < len(expression) and expression[end] not in ',)':
+        end += 1
+
+    token = expression[start:end].strip()
+
+    if token.startswith('$'):
+        return read_path(token, data, context), end
+
+    try:
+        return json.loads(token), end
+    except ValueError:
+        raise AslExecutionError('States.Runtime', f'Invalid intrinsic function argument "{token}"')
+
+
+def _read_string_literal(expression: str, start: int) -> Tuple[str, int]:
+    characters = []
+    position = start + 1
+
+    while position < len(expression):
+        character = expression[position]
+
+        if character == '\\' and position + 1 < len(expression):
+            characters.append(expression[position + 1])
+            position += 2
+        elif character == "'":
+            return ''.join(characters), position + 1
+        else:
+            characters.append(character)
+            position += 1
+
+    raise AslExecutionError('States.Runtime', f'Unterminated string in intrinsic function "{expression}"')
+
+
+def _skip_whitespace(expression: str, position: int) -> int:
+    while position < len(expression) and expression[position].isspace():
+        position += 1
+
+    return position
+
+
+def _format(template: str, values: Tuple[Any, ...]) -> str:
+    parts = template.split('{}')
+
+    if len(parts) - 1 != len(values):
+        raise AslExecutionError('States.Runtime', f'Format template "{template}" expects {len(parts) - 1} value(s)')
+
+    formatted_values = [value if isinstance(value, str) else json.dumps(value) for value in values]
+
+    return ''.join(part + formatted_value for part, formatted_value in zip(parts, formatted_values + ['']))
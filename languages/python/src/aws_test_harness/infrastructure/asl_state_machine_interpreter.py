@@ -0,0 +1,275 @@
+import json
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from aws_test_harness.domain.state_machine_execution_failure import StateMachineExecutionFailure
+from aws_test_harness.domain.state_machine_twin import StateMachineExecutionResult
+from aws_test_harness.infrastructure.asl_choice_rules import matches_choice_rule
+from aws_test_harness.infrastructure.asl_execution_error import AslExecutionError
+from aws_test_harness.infrastructure.asl_json_path import apply_payload_template, read_path, write_path
+
+type StateMachineExecutor = Callable[[str, Dict[str, Any]], StateMachineExecutionResult]
+
+type StateRunner = Callable[[Dict[str, Any], Any, Dict[str, Any]], Any]
+
+START_EXECUTION_AND_WAIT_RESOURCES = frozenset([
+    'arn:aws:states:::states:startExecution.sync',
+    'arn:aws:states:::states:startExecution.sync:2',
+])
+
+DEFAULT_MAXIMUM_RETRY_ATTEMPTS = 3
+
+DEFAULT_MAXIMUM_CONCURRENCY = 32
+
+
+# Interprets an Amazon States Language definition in process, so that it can serve as the definition of an in-memory
+# state machine. Covers the Pass, Task, Choice, Succeed, Fail, Map and Parallel states and their input and output
+# processing, with tasks limited to running other state machines, which is how definitions reach twins. Map items and
+# Parallel branches run concurrently, with Map items limited by MaxConcurrency, but once one fails those already running
+# are left to finish in the background rather than stopped, and retries are made immediately rather than after their
+# interval.
+class AslStateMachineInterpreter:
+    def __init__(self, state_machine_arn: str, definition: Dict[str, Any],
+                 execute_state_machine: StateMachineExecutor):
+        self.__state_machine_arn = state_machine_arn
+        self.__definition = definition
+        self.__execute_state_machine = execute_state_machine
+
+    def __call__(self, execution_input: Dict[str, Any]) -> StateMachineExecutionResult:
+        try:
+            return self.__run_states(self.__definition, execution_input, self.__create_context(execution_input))
+        except AslExecutionError as e:
+            return StateMachineExecutionFailure(error=e.error, cause=e.cause)
+
+    def __create_context(self, execution_input: Dict[str, Any]) -> Dict[str, Any]:
+        execution_name = str(uuid4())
+        arn_prefix, state_machine_name = self.__state_machine_arn.split(':stateMachine:')
+        account_id = arn_prefix.split(':')[-1]
+
+        return dict(
+            Execution=dict(
+                Id=f'{arn_prefix}:execution:{state_machine_name}:{execution_name}',
+                Input=execution_input,
+                Name=execution_name,
+                # No role is assumed in memory, so the one provided is named after the state machine
+                RoleArn=f'arn:aws:iam::{account_id}:role/{state_machine_name}Role',
+                StartTime=_timestamp()
+            ),
+            StateMachine=dict(Id=self.__state_machine_arn, Name=state_machine_name)
+        )
+
+    def __run_states(self, definition: Dict[str, Any], state_input: Any, context: Dict[str, Any]) -> Any:
+        state_name = definition['StartAt']
+
+        while True:
+            if state_name not in definition['States']:
+                raise AslExecutionError('States.Runtime', f'State "{state_name}" is not defined')
+
+            state_context = {**context, 'State': dict(EnteredTime=_timestamp(), Name=state_name)}
+            state_output, next_state_name = self.__run_state(definition['States'][state_name], state_input,
+                                                             state_context)
+
+            if next_state_name is None:
+                return state_output
+
+            state_name, state_input = next_state_name, state_output
+
+    def __run_state(self, state: Dict[str, Any], state_input: Any,
+                    context: Dict[str, Any]) -> Tuple[Any, Optional[str]]:
+        state_type = state.get('Type')
+
+        if state_type == 'Pass':
+            effective_input = self.__get_effective_input(state, state_input, context)
+            result = state['Result'] if 'Result' in state else effective_input
+            return self.__get_output(state, state_input, result, context), self.__get_next_state_name(state)
+
+        if state_type == 'Choice':
+            effective_input = self.__read_optional_path(state.get('InputPath', '$'), state_input, context)
+            output = self.__read_optional_path(state.get('OutputPath', '$'), effective_input, context)
+            return output, self.__choose_next_state_name(state, effective_input, context)
+
+        if state_type == 'Succeed':
+            effective_input = self.__read_optional_path(state.get('InputPath', '$'), state_input, context)
+            return self.__read_optional_path(state.get('OutputPath', '$'), effective_input, context), None
+
+        if state_type == 'Fail':
+            raise AslExecutionError(state.get('Error', 'States.Fail'), state.get('Cause', ''))
+
+        if state_type == 'Task':
+            return self.__run_with_error_handling(state, state_input, context, self.__run_task)
+
+        if state_type == 'Map':
+            return self.__run_with_error_handling(state, state_input, context, self.__run_map)
+
+        if state_type == 'Parallel':
+            return self.__run_with_error_handling(state, state_input, context, self.__run_parallel)
+
+        raise AslExecutionError('States.Runtime', f'States of type "{state_type}" are not supported')
+
+    def __run_with_error_handling(self, state: Dict[str, Any], state_input: Any, context: Dict[str, Any],
+                                  run: StateRunner) -> Tuple[Any, Optional[str]]:
+        retry_attempts: Dict[int, int] = {}
+
+        while True:
+            try:
+                return run(state, state_input, context), self.__get_next_state_name(state)
+            except AslExecutionError as e:
+                retrier_index = self.__find_matching_error_handler(state.get('Retry', []), e.error)
+
+                if retrier_index is not None:
+                    attempts = retry_attempts.get(retrier_index, 0)
+
+                    # Retried immediately rather than after the retrier's interval, to keep local runs fast
+                    if attempts < state['Retry'][retrier_index].get('MaxAttempts', DEFAULT_MAXIMUM_RETRY_ATTEMPTS):
+                        retry_attempts[retrier_index] = attempts + 1
+                        continue
+
+                catcher_index = self.__find_matching_error_handler(state.get('Catch', []), e.error)
+
+                if catcher_index is None:
+                    raise
+
+                catcher = state['Catch'][catcher_index]
+                error_output = dict(Error=e.error, Cause=e.cause)
+                result_path = catcher.get('ResultPath', '$')
+
+                return (state_input if result_path is None else write_path(result_path, state_input, error_output),
+                        catcher['Next'])
+
+    def __run_task(self, state: Dict[str, Any], state_input: Any, context: Dict[str, Any]) -> Any:
+        parameters = self.__get_effective_input(state, state_input, context)
+        resource = state['Resource']
+
+        if resource not in START_EXECUTION_AND_WAIT_RESOURCES:
+            raise AslExecutionError('States.Runtime', f'Task resource "{resource}" is not supported')
+
+        execution_input = parameters.get('Input', {})
+        result = self.__execute_state_machine(
+            parameters['StateMachineArn'],
+            json.loads(execution_input) if isinstance(execution_input, str) else execution_input
+        )
+
+        if isinstance(result, StateMachineExecutionFailure):
+            raise AslExecutionError('States.TaskFailed', json.dumps(dict(Error=result.error, Cause=result.cause)))
+
+        # The original integration provides the output of the execution as a string, whereas version 2 parses it
+        output = result if resource.endswith(':2') else json.dumps(result)
+
+        return self.__get_output(state, state_input, dict(Output=output, Status='SUCCEEDED'), context)
+
+    def __run_map(self, state: Dict[str, Any], state_input: Any, context: Dict[str, Any]) -> Any:
+        effective_input = self.__read_optional_path(state.get('InputPath', '$'), state_input, context)
+        items = read_path(state.get('ItemsPath', '$'), effective_input, context)
+
+        if not isinstance(items, list):
+            raise AslExecutionError('States.Runtime', f'Items of state "{context['State']['Name']}" are not an array')
+
+        item_processor = state.get('ItemProcessor', state.get('Iterator'))
+        item_selector = state.get('ItemSelector', state.get('Parameters'))
+
+        def run_item(index: int, item: Any) -> Any:
+            item_context = {**context, 'Map': dict(Item=dict(Index=index, Value=item))}
+            item_input = item if item_selector is None else \
+                apply_payload_template(item_selector, effective_input, item_context)
+            return self.__run_states(item_processor, item_input, item_context)
+
+        results = self.__run_concurrently(
+            [partial(run_item, index, item) for index, item in enumerate(items)],
+            state.get('MaxConcurrency', 0)
+        )
+
+        return self.__get_output(state, state_input, results, context)
+
+    def __run_parallel(self, state: Dict[str, Any], state_input: Any, context: Dict[str, Any]) -> Any:
+        effective_input = self.__get_effective_input(state, state_input, context)
+        results = self.__run_concurrently(
+            [partial(self.__run_states, branch, effective_input, context) for branch in state['Branches']],
+            0
+        )
+
+        return self.__get_output(state, state_input, results, context)
+
+    # Runs each on a thread of its own, up to the maximum concurrency, so that twins invoked by one can wait on those
+    # invoked by another as they would in Step Functions. Zero, which means no limit for a Map state, is capped at a
+    # default, so that a large Map doesn't start a thread per item.
+    @staticmethod
+    def __run_concurrently(runs: List[Callable[[], Any]], maximum_concurrency: int) -> List[Any]:
+        if not runs:
+            return []
+
+        executor = ThreadPoolExecutor(max_workers=min(maximum_concurrency or DEFAULT_MAXIMUM_CONCURRENCY, len(runs)),
+                                      thread_name_prefix='AslStateMachineInterpreter')
+
+        try:
+            futures = [executor.submit(run) for run in runs]
+            wait(futures, return_when=FIRST_EXCEPTION)
+
+            # The error of the first to fail, in the order they were started, fails the state
+            for future in futures:
+                exception = future.exception() if future.done() else None
+
+                if exception is not None:
+                    raise exception
+
+            return [future.result() for future in futures]
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __get_effective_input(self, state: Dict[str, Any], state_input: Any, context: Dict[str, Any]) -> Any:
+        effective_input = self.__read_optional_path(state.get('InputPath', '$'), state_input, context)
+
+        if 'Parameters' in state:
+            return apply_payload_template(state['Parameters'], effective_input, context)
+
+        return effective_input
+
+    def __get_output(self, state: Dict[str, Any], state_input: Any, result: Any, context: Dict[str, Any]) -> Any:
+        if 'ResultSelector' in state:
+            result = apply_payload_template(state['ResultSelector'], result, context)
+
+        result_path = state.get('ResultPath', '$')
+        combined_output = state_input if result_path is None else write_path(result_path, state_input, result)
+
+        return self.__read_optional_path(state.get('OutputPath', '$'), combined_output, context)
+
+    @staticmethod
+    def __read_optional_path(path: Optional[str], data: Any, context: Dict[str, Any]) -> Any:
+        # A null path selects an empty object rather than reading anything from the data
+        return {} if path is None else read_path(path, data, context)
+
+    @staticmethod
+    def __choose_next_state_name(state: Dict[str, Any], effective_input: Any, context: Dict[str, Any]) -> str:
+        for choice_rule in state.get('Choices', []):
+            if matches_choice_rule(choice_rule, effective_input, context):
+                return choice_rule['Next']
+
+        if 'Default' in state:
+            return state['Default']
+
+        raise AslExecutionError('States.NoChoiceMatched',
+                                f'No choice rule matched in state "{context['State']['Name']}"')
+
+    @staticmethod
+    def __get_next_state_name(state: Dict[str, Any]) -> Optional[str]:
+        return None if state.get('End') else state['Next']
+
+    @staticmethod
+    def __find_matching_error_handler(error_handlers: List[Dict[str, Any]], error: str) -> Optional[int]:
+        for index, error_handler in enumerate(error_handlers):
+            error_equals = error_handler.get('ErrorEquals', [])
+
+            # As in Step Functions, the wildcards never match runtime errors, which are faults in the definition
+            if error in error_equals or \
+                    ('States.ALL' in error_equals and error != 'States.Runtime') or \
+                    ('States.TaskFailed' in error_equals and error not in ('States.Runtime', 'States.Timeout')):
+                return index
+
+        return None
+
+
+# In the format that Step Functions uses for times in the context object
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
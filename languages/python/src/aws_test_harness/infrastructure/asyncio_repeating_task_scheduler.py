@@ -0,0 +1,59 @@
+import asyncio
+from inspect import isawaitable
+from logging import Logger
+from typing import Callable, Any, Optional
+
+from aws_test_harness.domain.async_repeating_task_scheduler import AsyncRepeatingTaskScheduler
+
+
+class AsyncioRepeatingTaskScheduler(AsyncRepeatingTaskScheduler):
+    def __init__(self, logger: Logger):
+        self.__logger = logger
+        self.__repeating_task: Optional[asyncio.Task[None]] = None
+
+    def schedule(self, task: Callable[..., Any]) -> None:
+        if self.__repeating_task is not None:
+            raise RuntimeError('Task is already scheduled')
+
+        async def repeat_task_until_cancelled() -> None:
+            while True:
+                try:
+                    task_result = task()
+
+                    if isawaitable(task_result):
+                        await task_result
+                except asyncio.CancelledError:
+                    raise
+                except BaseException as e:
+                    self.__logger.exception('Uncaught exception in asyncio repeating task', exc_info=e)
+
+                # Yield to other tasks on the event loop even if the task never had to wait
+                await asyncio.sleep(0)
+
+        self.__logger.debug('Starting repeating task on event loop...')
+
+        # Runs on the event loop of the caller, so must be scheduled from a coroutine
+        self.__repeating_task = asyncio.get_running_loop().create_task(
+            repeat_task_until_cancelled(),
+            name='AsyncioRepeatingTask'
+        )
+
+    def scheduled(self) -> bool:
+        return self.__repeating_task is not None
+
+    def reset_schedule(self) -> None:
+        self.__logger.debug('Cancelling repeating task...')
+
+        if self.__repeating_task is not None:
+            self.__repeating_task.cancel()
+
+        self.__repeating_task = None
+
+        self.__logger.debug('Repeating task cancelled.')
+
+    async def reset_schedule_async(self) -> None:
+        repeating_task = self.__repeating_task
+        self.reset_schedule()
+
+        if repeating_task is not None:
+            await asyncio.wait([repeating_task])
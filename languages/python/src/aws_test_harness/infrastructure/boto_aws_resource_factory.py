@@ -1,28 +1,69 @@
+from collections import OrderedDict
 from logging import Logger
-
-from boto3 import Session
+from threading import Lock
+from typing import Callable, Optional, Tuple, cast
 
 from aws_test_harness.domain.aws_resource_factory import AwsResourceFactory
 from aws_test_harness.domain.aws_resource_registry import AwsResourceRegistry
 from aws_test_harness.domain.s3_bucket import S3Bucket
 from aws_test_harness.domain.state_machine import StateMachine
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
 from aws_test_harness.infrastructure.boto_s3_bucket import BotoS3Bucket
 from aws_test_harness.infrastructure.boto_state_machine import BotoStateMachine
+from aws_test_harness.infrastructure.step_functions_execution_watcher import StepFunctionsExecutionWatcher
 
 
 class BotoAwsResourceFactory(AwsResourceFactory):
-    def __init__(self, boto_session: Session, aws_resource_registry: AwsResourceRegistry, logger: Logger):
-        self.__boto_session = boto_session
+    def __init__(self, boto_client_pool: BotoClientPool, aws_resource_registry: AwsResourceRegistry, logger: Logger,
+                 maximum_cached_resources: Optional[int] = None):
+        if maximum_cached_resources is not None and maximum_cached_resources < 1:
+            raise ValueError(f'Maximum cached resources must be at least 1 but was {maximum_cached_resources}')
+
+        self.__boto_client_pool = boto_client_pool
         self.__aws_resource_registry = aws_resource_registry
         self.__logger = logger
+        # Shared by every state machine, so that waiting on many executions doesn't multiply DescribeExecution requests
+        self.__execution_watcher = StepFunctionsExecutionWatcher(logger)
+        self.__maximum_cached_resources = maximum_cached_resources
+        self.__lock = Lock()
+        # Ordered from least to most recently used
+        self.__cached_resources: OrderedDict[Tuple[str, str], object] = OrderedDict()
+        self.__reused_resource_count = 0
+
+    @property
+    def reused_resource_count(self) -> int:
+        return self.__reused_resource_count
 
     def get_s3_bucket(self, resource_id: str) -> S3Bucket:
+        return self.__get_cached('S3Bucket', resource_id, self.__create_s3_bucket)
+
+    def get_state_machine(self, cfn_logical_resource_id: str) -> StateMachine:
+        return self.__get_cached('StateMachine', cfn_logical_resource_id, self.__create_state_machine)
+
+    def __create_s3_bucket(self, resource_id: str) -> S3Bucket:
         bucket_arn = self.__aws_resource_registry.get_resource_arn(resource_id)
         bucket_name = bucket_arn.split('arn:aws:s3:::')[1]
 
-        return BotoS3Bucket(bucket_name, self.__boto_session)
+        return BotoS3Bucket(bucket_name, self.__boto_client_pool)
 
-    # TODO: Retrofit tests
-    def get_state_machine(self, cfn_logical_resource_id: str) -> StateMachine:
+    def __create_state_machine(self, cfn_logical_resource_id: str) -> StateMachine:
         state_machine_arn = self.__aws_resource_registry.get_resource_arn(cfn_logical_resource_id)
-        return BotoStateMachine(state_machine_arn, self.__boto_session, self.__logger)
+        return BotoStateMachine(state_machine_arn, self.__boto_client_pool, self.__logger, self.__execution_watcher)
+
+    def __get_cached[T](self, resource_type: str, resource_id: str, create: Callable[[str], T]) -> T:
+        cache_key = (resource_type, resource_id)
+
+        with self.__lock:
+            if cache_key in self.__cached_resources:
+                self.__cached_resources.move_to_end(cache_key)
+                self.__reused_resource_count += 1
+                return cast(T, self.__cached_resources[cache_key])
+
+            resource = create(resource_id)
+            self.__cached_resources[cache_key] = resource
+
+            if self.__maximum_cached_resources is not None and \
+                    len(self.__cached_resources) > self.__maximum_cached_resources:
+                self.__cached_resources.popitem(last=False)
+
+            return resource
@@ -0,0 +1,32 @@
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from boto3 import Session
+from botocore.config import Config
+
+DEFAULT_AWS_CLIENT_CONFIG = Config(
+    # Enough for every invocation handling worker, execution watcher and test thread to hold a connection at once
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries=dict(mode='standard')
+)
+
+
+# Creates at most one client per service, each with its own connection pool, so that the cost of loading service models
+# and establishing TLS connections is paid once per harness rather than once per use. Only clients are pooled, since
+# unlike boto3 resources they are thread safe.
+class BotoClientPool:
+    def __init__(self, boto_session: Session, aws_client_config: Optional[Config] = None):
+        self.__boto_session = boto_session
+        self.__aws_client_config = DEFAULT_AWS_CLIENT_CONFIG.merge(aws_client_config) if aws_client_config \
+            else DEFAULT_AWS_CLIENT_CONFIG
+        # Boto3 sessions are not thread safe, so clients are only created whilst holding the lock
+        self.__lock = Lock()
+        self.__clients: Dict[str, Any] = {}
+
+    def client(self, service_name: str) -> Any:
+        with self.__lock:
+            if service_name not in self.__clients:
+                self.__clients[service_name] = self.__boto_session.client(service_name, config=self.__aws_client_config)
+
+            return self.__clients[service_name]
@@ -1,16 +1,17 @@
 from typing import Unpack
 
-from boto3 import Session
-from mypy_boto3_s3 import S3ServiceResource
+from mypy_boto3_s3 import S3Client
 from mypy_boto3_s3.type_defs import PutObjectRequestBucketPutObjectTypeDef
 
 from aws_test_harness.domain.s3_bucket import S3Bucket
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
 
 
 class BotoS3Bucket(S3Bucket):
-    def __init__(self, bucket_name: str, boto_session: Session):
-        s3_resource: S3ServiceResource = boto_session.resource('s3')
-        self.__s3_bucket = s3_resource.Bucket(bucket_name)
+    def __init__(self, bucket_name: str, boto_client_pool: BotoClientPool):
+        self.__bucket_name = bucket_name
+        # Clients, unlike resources, can be shared by every thread that puts objects in the bucket
+        self.__s3_client: S3Client = boto_client_pool.client('s3')
 
     def put_object(self, **put_object_kwargs: Unpack[PutObjectRequestBucketPutObjectTypeDef]) -> None:
-        self.__s3_bucket.put_object(**put_object_kwargs)
+        self.__s3_client.put_object(Bucket=self.__bucket_name, **put_object_kwargs)
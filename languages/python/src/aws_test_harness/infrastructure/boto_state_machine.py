@@ -1,29 +1,40 @@
+import asyncio
 import json
 from logging import Logger
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from uuid import uuid4
 
-from boto3 import Session
 from mypy_boto3_stepfunctions import SFNClient
 
 from aws_test_harness.domain.state_machine import StateMachine
 from aws_test_harness.domain.state_machine_execution import StateMachineExecution
-from aws_test_harness.infrastructure.boto_state_machine_execution import BotoStateMachineExecution
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
+from aws_test_harness.infrastructure.boto_state_machine_execution import BotoStateMachineExecution, \
+    DEFAULT_COMPLETION_POLLING_BACKOFF
+from aws_test_harness.infrastructure.step_functions_execution_watcher import StepFunctionsExecutionWatcher
 
 
 class BotoStateMachine(StateMachine):
-    def __init__(self, state_machine_arn: str, boto_session: Session, logger: Logger):
+    def __init__(self, state_machine_arn: str, boto_client_pool: BotoClientPool, logger: Logger,
+                 execution_watcher: Optional[StepFunctionsExecutionWatcher] = None):
         self.__state_machine_arn = state_machine_arn
         self.__logger = logger
-        self.__step_functions_client: SFNClient = boto_session.client('stepfunctions')
+        self.__execution_watcher = execution_watcher
+        self.__step_functions_client: SFNClient = boto_client_pool.client('stepfunctions')
 
     def execute(self, execution_input: Dict[str, Any]) -> StateMachineExecution:
-        execution = self.__start_execution(execution_input)
+        execution = self.start(execution_input)
         execution.wait_for_completion()
 
         return execution
 
-    def __start_execution(self, execution_input: Dict[str, Any]) -> StateMachineExecution:
+    async def execute_async(self, execution_input: Dict[str, Any]) -> StateMachineExecution:
+        execution = await asyncio.to_thread(self.start, execution_input)
+        await execution.wait_for_completion_async()
+
+        return execution
+
+    def start(self, execution_input: Dict[str, Any]) -> StateMachineExecution:
         self.__logger.info('Starting state machine execution...')
         start_execution_result = self.__step_functions_client.start_execution(
             stateMachineArn=self.__state_machine_arn,
@@ -32,4 +43,4 @@ class BotoStateMachine(StateMachine):
         )
 
         return BotoStateMachineExecution(start_execution_result['executionArn'], self.__step_functions_client,
-                                         self.__logger)
+                                         self.__logger, DEFAULT_COMPLETION_POLLING_BACKOFF, self.__execution_watcher)
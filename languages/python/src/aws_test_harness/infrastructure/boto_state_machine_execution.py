@@ -1,56 +1,100 @@
+import asyncio
+from concurrent.futures import Future
 from logging import Logger
-from time import sleep
+from threading import Event, Thread
 from typing import Optional
 
 from mypy_boto3_stepfunctions import SFNClient
-from mypy_boto3_stepfunctions.literals import ExecutionStatusType
-from mypy_boto3_stepfunctions.type_defs import DescribeExecutionOutputTypeDef
 
+from aws_test_harness.domain.exponential_backoff import ExponentialBackoff
 from aws_test_harness.domain.state_machine_execution import StateMachineExecution
+from aws_test_harness.domain.state_machine_execution_description import StateMachineExecutionDescription
+from aws_test_harness.infrastructure.step_functions_execution_watcher import StepFunctionsExecutionWatcher
+
+DEFAULT_COMPLETION_POLLING_BACKOFF = ExponentialBackoff(
+    initial_delay_seconds=0.05,
+    maximum_delay_seconds=0.5,
+    multiplier=1.5
+)
 
 
 class BotoStateMachineExecution(StateMachineExecution):
-    def __init__(self, execution_arn: str, step_functions_client: SFNClient, logger: Logger):
+    def __init__(self, execution_arn: str, step_functions_client: SFNClient, logger: Logger,
+                 completion_polling_backoff: ExponentialBackoff = DEFAULT_COMPLETION_POLLING_BACKOFF,
+                 execution_watcher: Optional[StepFunctionsExecutionWatcher] = None):
         self.__step_functions_client = step_functions_client
         self.__execution_arn = execution_arn
         self.__logger = logger
+        self.__completion_polling_backoff = completion_polling_backoff
+        # When provided, polls for completion on behalf of this execution, sharing a request budget with others
+        self.__execution_watcher = execution_watcher
+        # Set as soon as any thread observes the execution in a terminal state
+        self.__completion_event = Event()
+        self.__terminal_description: Optional[StateMachineExecutionDescription] = None
+
+    def describe(self) -> StateMachineExecutionDescription:
+        # A terminal execution can no longer change, so there is no need to describe it again
+        if self.__terminal_description is not None:
+            return self.__terminal_description
+
+        describe_execution_result = self.__step_functions_client.describe_execution(
+            executionArn=self.__execution_arn
+        )
+
+        description = StateMachineExecutionDescription(
+            status=describe_execution_result['status'],
+            output=describe_execution_result.get('output'),
+            error=describe_execution_result.get('error'),
+            cause=describe_execution_result.get('cause')
+        )
+
+        if description.terminal:
+            self.__terminal_description = description
+            self.__completion_event.set()
 
-    @property
-    def status(self) -> Optional[str]:
-        describe_execution_result = self.__describe_execution()
-        return self.__get_status(describe_execution_result)
+        return description
 
-    @property
-    def output(self) -> Optional[str]:
-        describe_execution_result = self.__describe_execution()
-        return describe_execution_result.get('output')
+    def completion(self) -> Future[StateMachineExecutionDescription]:
+        if self.__execution_watcher is not None:
+            return self.__execution_watcher.watch(self)
 
-    @property
-    def error(self) -> Optional[str]:
-        describe_execution_result = self.__describe_execution()
-        return describe_execution_result.get('error')
+        completion: Future[StateMachineExecutionDescription] = Future()
+        Thread(target=self.__complete_once_terminal, args=(completion,), daemon=True,
+               name='BotoStateMachineExecution').start()
 
-    @property
-    def cause(self) -> Optional[str]:
-        describe_execution_result = self.__describe_execution()
-        return describe_execution_result.get('cause')
+        return completion
 
     def wait_for_completion(self) -> None:
-        while True:
-            describe_execution_result = self.__describe_execution()
-            status = self.__get_status(describe_execution_result)
+        if self.__execution_watcher is not None:
+            self.__execution_watcher.watch(self).result()
+            self.__logger.info('State machine execution completed.')
+            return
 
-            if status in ['SUCCEEDED', 'FAILED', 'TIMED_OUT', 'ABORTED']:
+        for delay in self.__completion_polling_backoff.delays():
+            self.describe()
+
+            if self.__completion_event.wait(delay):
                 self.__logger.info('State machine execution completed.')
                 return
 
-            sleep(0.1)
+    async def wait_for_completion_async(self) -> None:
+        if self.__execution_watcher is not None:
+            await asyncio.wrap_future(self.__execution_watcher.watch(self))
+            self.__logger.info('State machine execution completed.')
+            return
 
-    def __describe_execution(self) -> DescribeExecutionOutputTypeDef:
-        return self.__step_functions_client.describe_execution(
-            executionArn=self.__execution_arn
-        )
+        for delay in self.__completion_polling_backoff.delays():
+            description = await asyncio.to_thread(self.describe)
+
+            if description.terminal:
+                self.__logger.info('State machine execution completed.')
+                return
+
+            await asyncio.sleep(delay)
 
-    @staticmethod
-    def __get_status(describe_execution_result: DescribeExecutionOutputTypeDef) -> ExecutionStatusType:
-        return describe_execution_result['status']
+    def __complete_once_terminal(self, completion: Future[StateMachineExecutionDescription]) -> None:
+        try:
+            self.wait_for_completion()
+            completion.set_result(self.describe())
+        except BaseException as e:
+            completion.set_exception(e)
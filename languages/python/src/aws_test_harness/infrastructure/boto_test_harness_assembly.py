@@ -0,0 +1,101 @@
+from logging import Logger
+from typing import Optional
+
+from boto3 import Session
+from botocore.config import Config
+from mypy_boto3_sqs import SQSClient
+
+from aws_test_harness.domain.async_test_harness import AsyncTestHarness
+from aws_test_harness.domain.aws_resource_registry import AwsResourceRegistry
+from aws_test_harness.domain.buffered_invocation_post_office import BufferedInvocationPostOffice
+from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
+from aws_test_harness.domain.invocation_timing_sink import InvocationTimingSink
+from aws_test_harness.domain.timed_invocation_post_office import TimedInvocationPostOffice
+from aws_test_harness.domain.unknown_aws_resource_exception import UnknownAwsResourceException
+from aws_test_harness.infrastructure.asyncio_repeating_task_scheduler import AsyncioRepeatingTaskScheduler
+from aws_test_harness.infrastructure.boto_aws_resource_factory import BotoAwsResourceFactory
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
+from aws_test_harness.infrastructure.cloudformation_aws_resource_registry import CloudFormationAwsResourceRegistry
+from aws_test_harness.infrastructure.file_stack_resource_cache import FileStackResourceCache
+from aws_test_harness.infrastructure.result_queue_invocation_post_office import ResultQueueInvocationPostOffice
+from aws_test_harness.infrastructure.serverless_invocation_post_office import ServerlessInvocationPostOffice
+from aws_test_harness.infrastructure.thread_pool_repeating_task_scheduler import ThreadPoolRepeatingTaskScheduler
+from aws_test_harness.domain.test_harness import TestHarness
+
+
+def assemble_test_harness(test_stack_name: str, aws_profile: str, logger: Logger,
+                          invocation_handling_worker_count: int,
+                          stack_resource_cache_directory_path: Optional[str],
+                          aws_client_config: Optional[Config],
+                          invocation_timing_sink: Optional[InvocationTimingSink]) -> TestHarness:
+    boto_client_pool = BotoClientPool(Session(profile_name=aws_profile), aws_client_config)
+    aws_resource_registry = _create_aws_resource_registry(test_stack_name, boto_client_pool,
+                                                          stack_resource_cache_directory_path)
+
+    return TestHarness(
+        aws_resource_registry,
+        _create_invocation_post_office(aws_resource_registry, boto_client_pool, logger, invocation_timing_sink),
+        ThreadPoolRepeatingTaskScheduler(logger, invocation_handling_worker_count),
+        BotoAwsResourceFactory(boto_client_pool, aws_resource_registry, logger),
+        logger,
+        invocation_timing_sink
+    )
+
+
+def assemble_async_test_harness(test_stack_name: str, aws_profile: str, logger: Logger,
+                                stack_resource_cache_directory_path: Optional[str],
+                                aws_client_config: Optional[Config],
+                                invocation_timing_sink: Optional[InvocationTimingSink]) -> AsyncTestHarness:
+    boto_client_pool = BotoClientPool(Session(profile_name=aws_profile), aws_client_config)
+    aws_resource_registry = _create_aws_resource_registry(test_stack_name, boto_client_pool,
+                                                          stack_resource_cache_directory_path)
+
+    return AsyncTestHarness(
+        aws_resource_registry,
+        _create_invocation_post_office(aws_resource_registry, boto_client_pool, logger, invocation_timing_sink),
+        AsyncioRepeatingTaskScheduler(logger),
+        BotoAwsResourceFactory(boto_client_pool, aws_resource_registry, logger),
+        invocation_timing_sink
+    )
+
+
+def _create_aws_resource_registry(test_stack_name: str, boto_client_pool: BotoClientPool,
+                                  stack_resource_cache_directory_path: Optional[str]) -> AwsResourceRegistry:
+    return CloudFormationAwsResourceRegistry(
+        test_stack_name,
+        boto_client_pool,
+        FileStackResourceCache(stack_resource_cache_directory_path) if stack_resource_cache_directory_path else None
+    )
+
+
+def _create_invocation_post_office(aws_resource_registry: AwsResourceRegistry, boto_client_pool: BotoClientPool,
+                                   logger: Logger,
+                                   invocation_timing_sink: Optional[InvocationTimingSink]) -> InvocationPostOffice:
+    invocation_post_office = _create_unbuffered_invocation_post_office(aws_resource_registry, boto_client_pool, logger)
+
+    if invocation_timing_sink is not None:
+        # Timed beneath the buffer, so that result posting timings are of the writes rather than of buffering
+        invocation_post_office = TimedInvocationPostOffice(invocation_post_office, invocation_timing_sink)
+
+    return BufferedInvocationPostOffice(invocation_post_office, logger)
+
+
+def _create_unbuffered_invocation_post_office(aws_resource_registry: AwsResourceRegistry,
+                                              boto_client_pool: BotoClientPool,
+                                              logger: Logger) -> InvocationPostOffice:
+    invocation_queue_url = aws_resource_registry.get_resource_arn('AWSTestHarnessTestDoubleInvocationQueue')
+
+    try:
+        result_queue_url = aws_resource_registry.get_resource_arn('AWSTestHarnessTestDoubleResultQueue')
+    except UnknownAwsResourceException:
+        # Results are delivered via the invocation table unless the stack opted into a result queue, through the test
+        # doubles macro's AWSTestHarnessResultQueue parameter
+        return ServerlessInvocationPostOffice(
+            invocation_queue_url,
+            aws_resource_registry.get_resource_arn('AWSTestHarnessTestDoubleInvocationTable'),
+            boto_client_pool,
+            logger
+        )
+
+    sqs_client: SQSClient = boto_client_pool.client('sqs')
+    return ResultQueueInvocationPostOffice(invocation_queue_url, result_queue_url, sqs_client, logger)
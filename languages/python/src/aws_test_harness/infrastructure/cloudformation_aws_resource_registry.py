@@ -1,18 +1,93 @@
-from boto3 import Session
-from mypy_boto3_cloudformation.service_resource import CloudFormationServiceResource
+from threading import Lock
+from typing import Dict, Optional
+
+from mypy_boto3_cloudformation import CloudFormationClient
 
 from aws_test_harness.domain.aws_resource_registry import AwsResourceRegistry
+from aws_test_harness.domain.unknown_aws_resource_exception import UnknownAwsResourceException
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
+from aws_test_harness.infrastructure.cloudformation_stack_resource import CloudFormationStackResource
+from aws_test_harness.infrastructure.file_stack_resource_cache import FileStackResourceCache
 
 
 class CloudFormationAwsResourceRegistry(AwsResourceRegistry):
-    def __init__(self, stack_name: str, boto_session: Session):
+    def __init__(self, stack_name: str, boto_client_pool: BotoClientPool,
+                 stack_resource_cache: Optional[FileStackResourceCache] = None):
         self.__stack_name = stack_name
-        self.__boto_resource: CloudFormationServiceResource = boto_session.resource('cloudformation')
+        self.__stack_resource_cache = stack_resource_cache
+        self.__cloudformation_client: CloudFormationClient = boto_client_pool.client('cloudformation')
+        self.__lock = Lock()
+        self.__stack_resources: Optional[Dict[str, CloudFormationStackResource]] = None
 
     def get_resource_arn(self, resource_id: str) -> str:
-        stack_resource = self.__boto_resource.StackResource(self.__stack_name, resource_id)
+        stack_resource = self.__get_stack_resource(resource_id)
 
         if stack_resource.resource_type == 'AWS::S3::Bucket':
             return f'arn:aws:s3:::{stack_resource.physical_resource_id}'
 
         return stack_resource.physical_resource_id
+
+    def invalidate(self) -> None:
+        with self.__lock:
+            self.__stack_resources = None
+
+    def __get_stack_resource(self, resource_id: str) -> CloudFormationStackResource:
+        stack_resources = self.__stack_resources
+
+        if stack_resources is None:
+            stack_resources = self.__load_stack_resources_if_not_loaded()
+
+        stack_resource = stack_resources.get(resource_id)
+
+        if stack_resource is None:
+            # The stack may have been updated since its resources were loaded
+            self.invalidate()
+            stack_resource = self.__load_stack_resources_if_not_loaded().get(resource_id)
+
+        if stack_resource is None:
+            raise UnknownAwsResourceException(
+                f'No resource with logical ID "{resource_id}" found in stack "{self.__stack_name}"'
+            )
+
+        return stack_resource
+
+    def __load_stack_resources_if_not_loaded(self) -> Dict[str, CloudFormationStackResource]:
+        with self.__lock:
+            if self.__stack_resources is None:
+                self.__stack_resources = self.__load_stack_resources()
+
+            return self.__stack_resources
+
+    def __load_stack_resources(self) -> Dict[str, CloudFormationStackResource]:
+        if self.__stack_resource_cache is None:
+            return self.__list_stack_resources()
+
+        stack_version = self.__get_stack_version()
+        stack_resources = self.__stack_resource_cache.get(self.__stack_name, stack_version)
+
+        if stack_resources is None:
+            stack_resources = self.__list_stack_resources()
+            self.__stack_resource_cache.put(self.__stack_name, stack_version, stack_resources)
+
+        return stack_resources
+
+    def __get_stack_version(self) -> str:
+        stack = self.__cloudformation_client.describe_stacks(StackName=self.__stack_name)['Stacks'][0]
+        last_changed_time = stack.get('LastUpdatedTime', stack['CreationTime'])
+
+        # Include the stack ID so that a deleted and recreated stack with the same name isn't treated as unchanged
+        return f'{stack.get("StackId")}@{last_changed_time.isoformat()}'
+
+    def __list_stack_resources(self) -> Dict[str, CloudFormationStackResource]:
+        paginator = self.__cloudformation_client.get_paginator('list_stack_resources')
+
+        return {
+            resource_summary['LogicalResourceId']: CloudFormationStackResource(
+                physical_resource_id=resource_summary['PhysicalResourceId'],
+                resource_type=resource_summary['ResourceType']
+            )
+            for page in paginator.paginate(StackName=self.__stack_name)
+            for resource_summary in page['StackResourceSummaries']
+            # Resources that failed to be created have no physical ID
+            if 'PhysicalResourceId' in resource_summary
+        }
@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CloudFormationStackResource:
+    physical_resource_id: str
+    resource_type: str
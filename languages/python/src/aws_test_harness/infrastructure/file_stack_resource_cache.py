@@ -0,0 +1,117 @@
+import json
+import os
+from dataclasses import dataclass
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Dict, Optional, Any, Tuple
+
+from aws_test_harness.infrastructure.cloudformation_stack_resource import CloudFormationStackResource
+
+
+@dataclass(frozen=True)
+class _CacheFileContent:
+    # Changes whenever the file is replaced, since each version is written to a new file and then moved into place
+    file_identity: Tuple[int, int, int]
+    stack_version: Optional[str]
+    stack_resources: Dict[str, CloudFormationStackResource]
+
+
+# Remembers the content of each cache file it last read or wrote, so that a file that hasn't been replaced since is
+# neither parsed nor written again
+class FileStackResourceCache:
+    def __init__(self, cache_directory_path: str):
+        self.__cache_directory_path = cache_directory_path
+        self.__lock = Lock()
+        self.__cache_file_contents: Dict[str, _CacheFileContent] = {}
+
+    def get(self, stack_name: str, stack_version: str) -> Optional[Dict[str, CloudFormationStackResource]]:
+        try:
+            with open(self.__get_cache_file_path(stack_name), 'r') as cache_file:
+                # Identifies the file that was opened, rather than whichever is in place by the time it is read
+                file_identity = self.__identify(os.fstat(cache_file.fileno()))
+                cache_file_content = self.__remembered_content_of(stack_name, file_identity)
+
+                if cache_file_content is None:
+                    cache_entry: Dict[str, Any] = json.load(cache_file)
+                    cache_file_content = _CacheFileContent(
+                        file_identity,
+                        cache_entry.get('stackVersion'),
+                        {
+                            logical_id: CloudFormationStackResource(
+                                physical_resource_id=resource['physicalResourceId'],
+                                resource_type=resource['resourceType']
+                            )
+                            for logical_id, resource in cache_entry['resources'].items()
+                        }
+                    )
+                    self.__remember(stack_name, cache_file_content)
+        except (OSError, ValueError):
+            return None
+
+        if cache_file_content.stack_version != stack_version:
+            return None
+
+        return dict(cache_file_content.stack_resources)
+
+    def put(self, stack_name: str, stack_version: str,
+            stack_resources: Dict[str, CloudFormationStackResource]) -> None:
+        if self.__already_cached(stack_name, stack_version, stack_resources):
+            return
+
+        cache_entry = dict(
+            stackVersion=stack_version,
+            resources={
+                logical_id: dict(
+                    physicalResourceId=resource.physical_resource_id,
+                    resourceType=resource.resource_type
+                )
+                for logical_id, resource in stack_resources.items()
+            }
+        )
+
+        os.makedirs(self.__cache_directory_path, exist_ok=True)
+
+        # Write to a temporary file and then atomically move it into place, so that other processes sharing the cache
+        # (e.g. pytest-xdist workers) never read a partially-written file
+        with NamedTemporaryFile('w', dir=self.__cache_directory_path, prefix=f'.{stack_name}.', suffix='.tmp',
+                                delete=False) as temporary_file:
+            json.dump(cache_entry, temporary_file)
+            temporary_file.flush()
+            file_identity = self.__identify(os.fstat(temporary_file.fileno()))
+
+        os.replace(temporary_file.name, self.__get_cache_file_path(stack_name))
+
+        self.__remember(stack_name, _CacheFileContent(file_identity, stack_version, dict(stack_resources)))
+
+    def __already_cached(self, stack_name: str, stack_version: str,
+                         stack_resources: Dict[str, CloudFormationStackResource]) -> bool:
+        try:
+            file_identity = self.__identify(os.stat(self.__get_cache_file_path(stack_name)))
+        except OSError:
+            return False
+
+        cache_file_content = self.__remembered_content_of(stack_name, file_identity)
+
+        return cache_file_content is not None and cache_file_content.stack_version == stack_version and \
+            cache_file_content.stack_resources == stack_resources
+
+    def __remembered_content_of(self, stack_name: str, file_identity: Tuple[int, int, int]) -> \
+            Optional[_CacheFileContent]:
+        with self.__lock:
+            cache_file_content = self.__cache_file_contents.get(stack_name)
+
+        if cache_file_content is None or cache_file_content.file_identity != file_identity:
+            return None
+
+        return cache_file_content
+
+    def __remember(self, stack_name: str, cache_file_content: _CacheFileContent) -> None:
+        with self.__lock:
+            self.__cache_file_contents[stack_name] = cache_file_content
+
+    def __get_cache_file_path(self, stack_name: str) -> str:
+        return os.path.join(self.__cache_directory_path, f'{stack_name}.json')
+
+    @staticmethod
+    def __identify(file_status: os.stat_result) -> Tuple[int, int, int]:
+        return file_status.st_ino, file_status.st_mtime_ns, file_status.st_size
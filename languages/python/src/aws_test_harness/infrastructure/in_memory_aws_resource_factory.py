@@ -0,0 +1,103 @@
+import json
+from logging import Logger
+from threading import Lock
+from time import time
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+from aws_test_harness.domain.aws_resource_factory import AwsResourceFactory
+from aws_test_harness.domain.aws_resource_registry import AwsResourceRegistry
+from aws_test_harness.domain.invocation import Invocation
+from aws_test_harness.domain.s3_bucket import S3Bucket
+from aws_test_harness.domain.state_machine import StateMachine
+from aws_test_harness.domain.state_machine_execution_failure import StateMachineExecutionFailure
+from aws_test_harness.domain.state_machine_twin import StateMachineExecutionResult
+from aws_test_harness.domain.unknown_aws_resource_exception import UnknownAwsResourceException
+from aws_test_harness.infrastructure.asl_state_machine_interpreter import AslStateMachineInterpreter
+from aws_test_harness.infrastructure.in_memory_invocation_post_office import InMemoryInvocationPostOffice
+from aws_test_harness.infrastructure.in_memory_s3_bucket import InMemoryS3Bucket
+from aws_test_harness.infrastructure.in_memory_state_machine import InMemoryStateMachine, \
+    InMemoryStateMachineDefinition
+
+DEFAULT_TWIN_RESULT_TIMEOUT_SECONDS = 30
+
+
+class InMemoryAwsResourceFactory(AwsResourceFactory):
+    def __init__(self, aws_resource_registry: AwsResourceRegistry,
+                 invocation_post_office: InMemoryInvocationPostOffice, logger: Logger,
+                 state_machine_definitions: Optional[
+                     Dict[str, InMemoryStateMachineDefinition | Dict[str, Any]]
+                 ] = None,
+                 twin_result_timeout_seconds: float = DEFAULT_TWIN_RESULT_TIMEOUT_SECONDS):
+        self.__aws_resource_registry = aws_resource_registry
+        self.__invocation_post_office = invocation_post_office
+        self.__logger = logger
+        self.__state_machine_definitions = dict(state_machine_definitions) if state_machine_definitions else {}
+        self.__twin_result_timeout_seconds = twin_result_timeout_seconds
+        # Buckets and state machines hold their state in memory, so the same instance is provided every time
+        self.__lock = Lock()
+        self.__s3_buckets: Dict[str, InMemoryS3Bucket] = {}
+        self.__state_machines: Dict[str, InMemoryStateMachine] = {}
+
+    def get_s3_bucket(self, resource_id: str) -> S3Bucket:
+        with self.__lock:
+            if resource_id not in self.__s3_buckets:
+                bucket_arn = self.__aws_resource_registry.get_resource_arn(resource_id)
+                self.__s3_buckets[resource_id] = InMemoryS3Bucket(bucket_arn.split('arn:aws:s3:::')[1])
+
+            return self.__s3_buckets[resource_id]
+
+    def get_state_machine(self, cfn_logical_resource_id: str) -> StateMachine:
+        with self.__lock:
+            if cfn_logical_resource_id not in self.__state_machines:
+                self.__state_machines[cfn_logical_resource_id] = self.__create_state_machine(cfn_logical_resource_id)
+
+            return self.__state_machines[cfn_logical_resource_id]
+
+    def __create_state_machine(self, cfn_logical_resource_id: str) -> InMemoryStateMachine:
+        state_machine_arn = self.__aws_resource_registry.get_resource_arn(cfn_logical_resource_id)
+        return InMemoryStateMachine(state_machine_arn, self.__get_definition(cfn_logical_resource_id), self.__logger)
+
+    def __get_definition(self, cfn_logical_resource_id: str) -> InMemoryStateMachineDefinition:
+        if cfn_logical_resource_id in self.__state_machine_definitions:
+            definition = self.__state_machine_definitions[cfn_logical_resource_id]
+
+            # Amazon States Language definitions are provided as parsed JSON
+            if isinstance(definition, dict):
+                state_machine_arn = self.__aws_resource_registry.get_resource_arn(cfn_logical_resource_id)
+                return AslStateMachineInterpreter(state_machine_arn, definition, self.__execute_state_machine)
+
+            return definition
+
+        if cfn_logical_resource_id.endswith('AWSTestHarnessStateMachine'):
+            state_machine_arn = self.__aws_resource_registry.get_resource_arn(cfn_logical_resource_id)
+            return self.__create_twin_state_machine_definition(state_machine_arn)
+
+        raise UnknownAwsResourceException(
+            f'No in-memory state machine defined with logical ID "{cfn_logical_resource_id}"'
+        )
+
+    # Runs a state machine started by a task of another, on the thread of the task, which waits for it to complete.
+    # Definitions may identify the state machine by its logical ID rather than its ARN, which the split leaves intact.
+    def __execute_state_machine(self, state_machine_arn: str,
+                                execution_input: Dict[str, Any]) -> StateMachineExecutionResult:
+        definition = self.__get_definition(state_machine_arn.split(':stateMachine:')[-1])
+        return definition(json.loads(json.dumps(execution_input)))
+
+    # Behaves like the state machines generated by the test doubles macro, which hand each execution to the harness
+    # and then succeed or fail according to the result generated by the twin
+    def __create_twin_state_machine_definition(self, state_machine_arn: str) -> InMemoryStateMachineDefinition:
+        def get_twin_result(execution_input: Dict[str, Any]) -> StateMachineExecutionResult:
+            result = self.__invocation_post_office.invoke(
+                Invocation(target=state_machine_arn, id=str(uuid4()), parameters=dict(input=execution_input),
+                           sent_time=time()),
+                self.__twin_result_timeout_seconds
+            )
+
+            if result['status'] == 'failed':
+                return StateMachineExecutionFailure(error=result['context']['error'],
+                                                    cause=result['context']['cause'])
+
+            return result['context']['result']
+
+        return get_twin_result
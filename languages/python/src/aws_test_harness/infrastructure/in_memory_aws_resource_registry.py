@@ -0,0 +1,15 @@
+from aws_test_harness.domain.aws_resource_registry import AwsResourceRegistry
+
+IN_MEMORY_REGION = 'local'
+
+IN_MEMORY_ACCOUNT_ID = '000000000000'
+
+
+# Every resource exists in memory, so ARNs are derived from logical IDs in the same way for every test run, following
+# the naming conventions of the test doubles macro to tell buckets from state machines
+class InMemoryAwsResourceRegistry(AwsResourceRegistry):
+    def get_resource_arn(self, resource_id: str) -> str:
+        if resource_id.endswith('S3Bucket'):
+            return f'arn:aws:s3:::{resource_id.lower()}'
+
+        return f'arn:aws:states:{IN_MEMORY_REGION}:{IN_MEMORY_ACCOUNT_ID}:stateMachine:{resource_id}'
@@ -0,0 +1,83 @@
+from collections import deque
+from threading import Condition
+from time import monotonic
+from typing import Any, Deque, Dict, List, Set
+
+from aws_test_harness.domain.invocation import Invocation
+from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
+
+# Short compared to an SQS long poll, so that tearing down the harness doesn't wait long for collection to finish
+DEFAULT_COLLECTION_WAIT_SECONDS = 0.1
+
+
+# Delivers invocations from in-memory state machines to the harness, and results back to the waiting state machines,
+# without leaving the process
+class InMemoryInvocationPostOffice(InvocationPostOffice):
+    def __init__(self, collection_wait_seconds: float = DEFAULT_COLLECTION_WAIT_SECONDS):
+        self.__collection_wait_seconds = collection_wait_seconds
+        self.__condition = Condition()
+        self.__pending_invocations: Deque[Invocation] = deque()
+        self.__awaited_invocation_ids: Set[str] = set()
+        self.__results: Dict[str, Any] = {}
+        self.__collection_interrupted = False
+
+    def collect_invocations(self) -> List[Invocation]:
+        with self.__condition:
+            self.__condition.wait_for(
+                lambda: len(self.__pending_invocations) > 0 or self.__collection_interrupted,
+                self.__collection_wait_seconds
+            )
+
+            # Left pending, to be collected once collection resumes
+            if self.__collection_interrupted:
+                return []
+
+            invocations = list(self.__pending_invocations)
+            self.__pending_invocations.clear()
+
+            return invocations
+
+    def post_result(self, invocation_id: str, result: Any) -> None:
+        self.post_results({invocation_id: result})
+
+    def post_results(self, results: Dict[str, Any]) -> None:
+        with self.__condition:
+            # Results for invocations that are no longer awaited, having timed out, would otherwise be kept forever
+            self.__results.update({invocation_id: result for invocation_id, result in results.items()
+                                   if invocation_id in self.__awaited_invocation_ids})
+            self.__condition.notify_all()
+
+    def interrupt_collection(self) -> None:
+        with self.__condition:
+            self.__collection_interrupted = True
+            self.__condition.notify_all()
+
+    def resume_collection(self) -> None:
+        with self.__condition:
+            self.__collection_interrupted = False
+
+    def invoke(self, invocation: Invocation, timeout_seconds: float) -> Any:
+        deadline = monotonic() + timeout_seconds
+
+        with self.__condition:
+            self.__pending_invocations.append(invocation)
+            self.__awaited_invocation_ids.add(invocation.id)
+            self.__condition.notify_all()
+
+            try:
+                while invocation.id not in self.__results:
+                    remaining_seconds = deadline - monotonic()
+
+                    if remaining_seconds <= 0:
+                        if invocation in self.__pending_invocations:
+                            self.__pending_invocations.remove(invocation)
+
+                        raise TimeoutError(
+                            f'No result posted for invocation "{invocation.id}" within {timeout_seconds} seconds'
+                        )
+
+                    self.__condition.wait(remaining_seconds)
+
+                return self.__results.pop(invocation.id)
+            finally:
+                self.__awaited_invocation_ids.discard(invocation.id)
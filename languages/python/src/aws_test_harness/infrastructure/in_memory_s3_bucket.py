@@ -0,0 +1,26 @@
+from threading import Lock
+from typing import Any, Dict, Unpack
+
+from mypy_boto3_s3.type_defs import PutObjectRequestBucketPutObjectTypeDef
+
+from aws_test_harness.domain.s3_bucket import S3Bucket
+
+
+class InMemoryS3Bucket(S3Bucket):
+    def __init__(self, bucket_name: str):
+        self.__bucket_name = bucket_name
+        self.__lock = Lock()
+        self.__objects: Dict[str, Any] = {}
+
+    @property
+    def name(self) -> str:
+        return self.__bucket_name
+
+    @property
+    def objects(self) -> Dict[str, Any]:
+        with self.__lock:
+            return dict(self.__objects)
+
+    def put_object(self, **put_object_kwargs: Unpack[PutObjectRequestBucketPutObjectTypeDef]) -> None:
+        with self.__lock:
+            self.__objects[put_object_kwargs['Key']] = put_object_kwargs.get('Body')
@@ -0,0 +1,60 @@
+import json
+from concurrent.futures import Future
+from logging import Logger
+from threading import Thread
+from typing import Any, Callable, Dict
+
+from aws_test_harness.domain.state_machine import StateMachine
+from aws_test_harness.domain.state_machine_execution import StateMachineExecution
+from aws_test_harness.domain.state_machine_execution_description import StateMachineExecutionDescription
+from aws_test_harness.domain.state_machine_execution_failure import StateMachineExecutionFailure
+from aws_test_harness.domain.state_machine_twin import StateMachineExecutionResult
+from aws_test_harness.infrastructure.in_memory_state_machine_execution import InMemoryStateMachineExecution
+
+type InMemoryStateMachineDefinition = Callable[[Dict[str, Any]], StateMachineExecutionResult]
+
+
+class InMemoryStateMachine(StateMachine):
+    def __init__(self, state_machine_arn: str, definition: InMemoryStateMachineDefinition, logger: Logger):
+        self.__state_machine_arn = state_machine_arn
+        self.__definition = definition
+        self.__logger = logger
+
+    def execute(self, execution_input: Dict[str, Any]) -> StateMachineExecution:
+        execution = self.start(execution_input)
+        execution.wait_for_completion()
+
+        return execution
+
+    async def execute_async(self, execution_input: Dict[str, Any]) -> StateMachineExecution:
+        execution = self.start(execution_input)
+        await execution.wait_for_completion_async()
+
+        return execution
+
+    def start(self, execution_input: Dict[str, Any]) -> StateMachineExecution:
+        self.__logger.info('Starting state machine execution...')
+        # Serialised as Step Functions would, so that the definition can't observe or mutate the caller's input
+        serialised_execution_input = json.dumps(execution_input)
+        completion: Future[StateMachineExecutionDescription] = Future()
+
+        # Each execution runs on a thread of its own, as an execution may spend most of its time waiting for twins
+        Thread(
+            target=lambda: completion.set_result(self.__run(json.loads(serialised_execution_input))),
+            daemon=True,
+            name='InMemoryStateMachineExecution'
+        ).start()
+
+        return InMemoryStateMachineExecution(completion, self.__logger)
+
+    def __run(self, execution_input: Dict[str, Any]) -> StateMachineExecutionDescription:
+        try:
+            result = self.__definition(execution_input)
+        except BaseException as e:
+            self.__logger.exception(f'Execution of state machine "{self.__state_machine_arn}" failed', exc_info=e)
+            return StateMachineExecutionDescription(status='FAILED', error=type(e).__name__, cause=str(e))
+
+        if isinstance(result, StateMachineExecutionFailure):
+            return StateMachineExecutionDescription(status='FAILED', error=result.error, cause=result.cause)
+
+        return StateMachineExecutionDescription(status='SUCCEEDED', output=json.dumps(result))
@@ -0,0 +1,29 @@
+import asyncio
+from concurrent.futures import Future
+from logging import Logger
+
+from aws_test_harness.domain.state_machine_execution import StateMachineExecution
+from aws_test_harness.domain.state_machine_execution_description import StateMachineExecutionDescription
+
+
+class InMemoryStateMachineExecution(StateMachineExecution):
+    def __init__(self, completion: Future[StateMachineExecutionDescription], logger: Logger):
+        self.__completion = completion
+        self.__logger = logger
+
+    def describe(self) -> StateMachineExecutionDescription:
+        if not self.__completion.done():
+            return StateMachineExecutionDescription(status='RUNNING')
+
+        return self.__completion.result()
+
+    def completion(self) -> Future[StateMachineExecutionDescription]:
+        return self.__completion
+
+    def wait_for_completion(self) -> None:
+        self.__completion.result()
+        self.__logger.info('State machine execution completed.')
+
+    async def wait_for_completion_async(self) -> None:
+        await asyncio.wrap_future(self.__completion)
+        self.__logger.info('State machine execution completed.')
@@ -0,0 +1,34 @@
+from logging import Logger
+from typing import Any, Dict, Optional
+
+from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
+from aws_test_harness.domain.invocation_timing_sink import InvocationTimingSink
+from aws_test_harness.domain.test_harness import TestHarness
+from aws_test_harness.domain.timed_invocation_post_office import TimedInvocationPostOffice
+from aws_test_harness.infrastructure.in_memory_aws_resource_factory import InMemoryAwsResourceFactory
+from aws_test_harness.infrastructure.in_memory_aws_resource_registry import InMemoryAwsResourceRegistry
+from aws_test_harness.infrastructure.in_memory_invocation_post_office import InMemoryInvocationPostOffice
+from aws_test_harness.infrastructure.in_memory_state_machine import InMemoryStateMachineDefinition
+from aws_test_harness.infrastructure.thread_pool_repeating_task_scheduler import ThreadPoolRepeatingTaskScheduler
+
+
+def assemble_in_memory_test_harness(
+        logger: Logger,
+        state_machine_definitions: Optional[Dict[str, InMemoryStateMachineDefinition | Dict[str, Any]]],
+        invocation_handling_worker_count: int,
+        invocation_timing_sink: Optional[InvocationTimingSink]
+) -> TestHarness:
+    aws_resource_registry = InMemoryAwsResourceRegistry()
+    invocation_post_office = InMemoryInvocationPostOffice()
+
+    harness_invocation_post_office: InvocationPostOffice = invocation_post_office if invocation_timing_sink is None \
+        else TimedInvocationPostOffice(invocation_post_office, invocation_timing_sink)
+
+    return TestHarness(
+        aws_resource_registry,
+        harness_invocation_post_office,
+        ThreadPoolRepeatingTaskScheduler(logger, invocation_handling_worker_count),
+        InMemoryAwsResourceFactory(aws_resource_registry, invocation_post_office, logger, state_machine_definitions),
+        logger,
+        invocation_timing_sink
+    )
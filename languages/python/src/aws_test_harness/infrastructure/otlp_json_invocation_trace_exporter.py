@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+from tempfile import NamedTemporaryFile
+from typing import Any, Dict, List
+
+from aws_test_harness.domain.invocation_stage_timing import InvocationStageTiming
+from aws_test_harness.domain.invocation_trace_report import InvocationTraceReport
+
+# https://opentelemetry.io/docs/specs/otlp/#json-protobuf-encoding
+INTERNAL_SPAN_KIND = 1
+
+INVOCATION_SPAN_NAME = 'invocation'
+
+
+# Writes a trace per invocation in the OTLP JSON encoding, so that reports can be loaded into any tool that accepts
+# OpenTelemetry traces, or read as plain JSON. Trace IDs are derived from invocation IDs, so that the same invocation
+# always has the same trace ID. Only the spans recorded by the harness are exported. The test double invocation handler
+# function logs its own spans for each invocation to CloudWatch, where they can be found by invocation ID.
+class OtlpJsonInvocationTraceExporter:
+    def __init__(self, file_path: str, service_name: str = 'aws-test-harness'):
+        self.__file_path = file_path
+        self.__service_name = service_name
+
+    def export(self, report: InvocationTraceReport) -> None:
+        spans = [
+            span
+            for invocation_id in report.invocation_ids
+            for span in self.__to_spans(invocation_id, report.timings_for(invocation_id))
+        ]
+
+        traces = dict(resourceSpans=[dict(
+            resource=dict(attributes=[self.__to_attribute('service.name', self.__service_name)]),
+            scopeSpans=[dict(scope=dict(name='aws_test_harness'), spans=spans)]
+        )])
+
+        directory_path = os.path.dirname(os.path.abspath(self.__file_path))
+        os.makedirs(directory_path, exist_ok=True)
+
+        # Write to a temporary file and then atomically move it into place, so that a partially-written report is
+        # never read
+        with NamedTemporaryFile('w', dir=directory_path, suffix='.tmp', delete=False) as temporary_file:
+            json.dump(traces, temporary_file, indent=2)
+
+        os.replace(temporary_file.name, self.__file_path)
+
+    def __to_spans(self, invocation_id: str, timings: List[InvocationStageTiming]) -> List[Dict[str, Any]]:
+        if not timings:
+            return []
+
+        trace_id = hashlib.md5(invocation_id.encode(), usedforsecurity=False).hexdigest()
+        invocation_span_id = self.__span_id(invocation_id, INVOCATION_SPAN_NAME)
+        attributes = [self.__to_attribute('invocation.id', invocation_id)]
+
+        # Spans the stages recorded by the harness, from the invocation being sent to its result being posted
+        invocation_span = self.__to_span(
+            trace_id,
+            invocation_span_id,
+            INVOCATION_SPAN_NAME,
+            min(timing.start_time for timing in timings),
+            max(timing.start_time + timing.duration_seconds for timing in timings),
+            attributes
+        )
+
+        return [invocation_span] + [
+            dict(
+                self.__to_span(
+                    trace_id,
+                    self.__span_id(invocation_id, f'{timing.stage}/{index}'),
+                    timing.stage,
+                    timing.start_time,
+                    timing.start_time + timing.duration_seconds,
+                    attributes
+                ),
+                parentSpanId=invocation_span_id
+            )
+            for index, timing in enumerate(timings)
+        ]
+
+    def __to_span(self, trace_id: str, span_id: str, name: str, start_time: float, end_time: float,
+                  attributes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return dict(
+            traceId=trace_id,
+            spanId=span_id,
+            name=name,
+            kind=INTERNAL_SPAN_KIND,
+            # 64-bit integers are encoded as strings
+            startTimeUnixNano=str(self.__to_unix_nanos(start_time)),
+            endTimeUnixNano=str(self.__to_unix_nanos(end_time)),
+            attributes=attributes
+        )
+
+    @staticmethod
+    def __span_id(invocation_id: str, span_key: str) -> str:
+        return hashlib.md5(f'{invocation_id}/{span_key}'.encode(), usedforsecurity=False).hexdigest()[:16]
+
+    # Rounded to the microsecond first, beyond which times since the epoch can't be precisely held as floats
+    @staticmethod
+    def __to_unix_nanos(time_seconds: float) -> int:
+        return round(time_seconds * 1_000_000) * 1000
+
+    @staticmethod
+    def __to_attribute(key: str, value: str) -> Dict[str, Any]:
+        return dict(key=key, value=dict(stringValue=value))
@@ -0,0 +1,98 @@
+import json
+import time
+from logging import Logger
+from typing import Any, Dict, List
+
+from mypy_boto3_sqs.client import SQSClient
+
+from aws_test_harness.domain.invocation import Invocation
+from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
+from aws_test_harness.domain.results_not_posted_exception import ResultsNotPostedException
+from aws_test_harness.infrastructure.sqs_invocation_receiver import SqsInvocationReceiver
+
+# The most messages that SQS will send in a single SendMessageBatch request
+MAXIMUM_MESSAGE_BATCH_SIZE = 10
+
+
+class ResultQueueInvocationPostOffice(InvocationPostOffice):
+    def __init__(self, invocation_queue_url: str, result_queue_url: str, sqs_client: SQSClient, logger: Logger):
+        self.__result_queue_url = result_queue_url
+        self.__sqs_client = sqs_client
+        self.__invocation_receiver = SqsInvocationReceiver(invocation_queue_url, sqs_client, logger)
+
+    def collect_invocations(self) -> List[Invocation]:
+        return self.__invocation_receiver.receive_invocations()
+
+    def post_result(self, invocation_id: str, result: Any) -> None:
+        self.__sqs_client.send_message(
+            QueueUrl=self.__result_queue_url,
+            MessageBody=json.dumps(dict(result=result)),
+            MessageAttributes=self.__to_result_message_attributes(invocation_id, self.__posted_time())
+        )
+        self.__invocation_receiver.acknowledge([invocation_id])
+
+    def post_results(self, results: Dict[str, Any]) -> None:
+        result_items = list(results.items())
+        posted_time = self.__posted_time()
+        failed_invocation_ids: List[str] = []
+        failure_messages: List[str] = []
+
+        for batch_start in range(0, len(result_items), MAXIMUM_MESSAGE_BATCH_SIZE):
+            batch_result_items = result_items[batch_start:batch_start + MAXIMUM_MESSAGE_BATCH_SIZE]
+
+            try:
+                send_message_batch_result = self.__sqs_client.send_message_batch(
+                    QueueUrl=self.__result_queue_url,
+                    Entries=[
+                        dict(
+                            Id=str(index),
+                            MessageBody=json.dumps(dict(result=result)),
+                            MessageAttributes=self.__to_result_message_attributes(invocation_id, posted_time)
+                        )
+                        for index, (invocation_id, result) in enumerate(batch_result_items)
+                    ]
+                )
+            except Exception as e:
+                # Results sent by earlier batches must not be posted again, so only the rest are named as not posted
+                unsent_invocation_ids = failed_invocation_ids + [
+                    invocation_id for invocation_id, _ in result_items[batch_start:]
+                ]
+                raise ResultsNotPostedException(
+                    f'Failed to post results for invocations {", ".join(unsent_invocation_ids)}: {e}',
+                    unsent_invocation_ids
+                ) from e
+
+            failures = send_message_batch_result.get('Failed', [])
+            failed_indices = {int(failure['Id']) for failure in failures}
+            self.__invocation_receiver.acknowledge([
+                invocation_id for index, (invocation_id, _) in enumerate(batch_result_items)
+                if index not in failed_indices
+            ])
+
+            failed_invocation_ids.extend(batch_result_items[int(failure['Id'])][0] for failure in failures)
+            failure_messages.extend(failure.get('Message', '') for failure in failures)
+
+        if failed_invocation_ids:
+            raise ResultsNotPostedException(
+                f'Failed to post results for invocations {", ".join(failed_invocation_ids)}: {failure_messages[0]}',
+                failed_invocation_ids
+            )
+
+    def interrupt_collection(self) -> None:
+        self.__invocation_receiver.interrupt()
+
+    def resume_collection(self) -> None:
+        self.__invocation_receiver.resume()
+
+    @staticmethod
+    def __posted_time() -> str:
+        return str(round(time.time() * 1000))
+
+    @staticmethod
+    def __to_result_message_attributes(invocation_id: str, posted_time: str) -> Dict[str, Any]:
+        return dict(
+            InvocationId=dict(StringValue=invocation_id, DataType='String'),
+            # Lets test double invocation handlers trace how long results take to reach them, in milliseconds since
+            # the epoch
+            ResultPostedTime=dict(StringValue=posted_time, DataType='Number')
+        )
@@ -1,55 +1,85 @@
-import json
+import time
 from datetime import timedelta, datetime
 from logging import Logger
-from typing import Optional, Any
+from typing import Any, Dict, List, Mapping, Sequence
 
-from boto3 import Session
-from mypy_boto3_dynamodb import DynamoDBServiceResource
-from mypy_boto3_sqs.service_resource import Queue, SQSServiceResource
+from boto3.dynamodb.types import TypeSerializer
+from mypy_boto3_dynamodb.client import DynamoDBClient
+from mypy_boto3_dynamodb.type_defs import AttributeValueTypeDef, WriteRequestTypeDef, WriteRequestOutputTypeDef
+from mypy_boto3_sqs.client import SQSClient
 
 from aws_test_harness.domain.invocation import Invocation
 from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
+from aws_test_harness.infrastructure.sqs_invocation_receiver import SqsInvocationReceiver
+
+# The most items that DynamoDB will write in a single BatchWriteItem request
+MAXIMUM_BATCH_WRITE_ITEM_COUNT = 25
 
 
 class ServerlessInvocationPostOffice(InvocationPostOffice):
-    def __init__(self, invocation_queue_url: str, invocation_table_name: str, boto_session: Session, logger: Logger):
-        self.__logger = logger
-        sqs_resource: SQSServiceResource = boto_session.resource('sqs')
-        self.__invocation_queue: Queue = sqs_resource.Queue(invocation_queue_url)
-
-        dynamodb_resource: DynamoDBServiceResource = boto_session.resource('dynamodb')
-        self.__invocation_table = dynamodb_resource.Table(invocation_table_name)
-
-    def maybe_collect_invocation(self) -> Optional[Invocation]:
-        messages = self.__invocation_queue.receive_messages(
-            MessageAttributeNames=['All'],
-            MaxNumberOfMessages=1,
-            WaitTimeSeconds=1
-        )
+    def __init__(self, invocation_queue_url: str, invocation_table_name: str, boto_client_pool: BotoClientPool,
+                 logger: Logger):
+        sqs_client: SQSClient = boto_client_pool.client('sqs')
+        self.__invocation_receiver = SqsInvocationReceiver(invocation_queue_url, sqs_client, logger)
 
-        if not messages:
-            return None
+        # Writes through the pooled client, which unlike a DynamoDB resource can be shared by every posting thread
+        self.__dynamodb_client: DynamoDBClient = boto_client_pool.client('dynamodb')
+        self.__invocation_table_name = invocation_table_name
+        self.__type_serializer = TypeSerializer()
 
-        message = messages[0]
+    def collect_invocations(self) -> List[Invocation]:
+        return self.__invocation_receiver.receive_invocations()
 
-        self.__logger.info(
-            f'Invocation message received '
-            f'with attributes: {message.message_attributes}, '
-            f'and body: {message.body}'
+    def post_result(self, invocation_id: str, result: Any) -> None:
+        self.__dynamodb_client.put_item(
+            TableName=self.__invocation_table_name,
+            Item=self.__to_result_item(invocation_id, result, self.__result_expiry_time(), self.__posted_time())
         )
-        message.delete()
+        self.__invocation_receiver.acknowledge([invocation_id])
 
-        message_payload = json.loads(message.body)
+    def post_results(self, results: Dict[str, Any]) -> None:
+        result_expiry_time = self.__result_expiry_time()
+        posted_time = self.__posted_time()
+        write_requests: List[WriteRequestTypeDef] = [
+            {'PutRequest': {'Item': self.__to_result_item(invocation_id, result, result_expiry_time, posted_time)}}
+            for invocation_id, result in results.items()
+        ]
 
-        return Invocation(
-            target=message.message_attributes['InvocationTarget']['StringValue'],
-            id=message.message_attributes['InvocationId']['StringValue'],
-            parameters=message_payload['parameters']
-        )
+        for batch_start in range(0, len(write_requests), MAXIMUM_BATCH_WRITE_ITEM_COUNT):
+            self.__write(write_requests[batch_start:batch_start + MAXIMUM_BATCH_WRITE_ITEM_COUNT])
 
-    def post_result(self, invocation_id: str, result: Any) -> None:
-        self.__invocation_table.put_item(Item=dict(
-            id=invocation_id,
-            result=result,
-            ttl=int((datetime.now() + timedelta(days=1)).timestamp())
-        ))
+        self.__invocation_receiver.acknowledge(list(results))
+
+    def interrupt_collection(self) -> None:
+        self.__invocation_receiver.interrupt()
+
+    def resume_collection(self) -> None:
+        self.__invocation_receiver.resume()
+
+    # Resends any unprocessed items, as a DynamoDB resource's batch writer would
+    def __write(self, write_requests: Sequence[WriteRequestTypeDef | WriteRequestOutputTypeDef]) -> None:
+        request_items: Mapping[str, Sequence[WriteRequestTypeDef | WriteRequestOutputTypeDef]] = {
+            self.__invocation_table_name: write_requests
+        }
+
+        while request_items:
+            batch_write_item_response = self.__dynamodb_client.batch_write_item(RequestItems=request_items)
+            request_items = batch_write_item_response.get('UnprocessedItems', {})
+
+    @staticmethod
+    def __result_expiry_time() -> int:
+        return int((datetime.now() + timedelta(days=1)).timestamp())
+
+    # Lets test double invocation handlers trace how long results take to reach them
+    @staticmethod
+    def __posted_time() -> int:
+        return round(time.time() * 1000)
+
+    def __to_result_item(self, invocation_id: str, result: Any, result_expiry_time: int,
+                         posted_time: int) -> Dict[str, AttributeValueTypeDef]:
+        return {
+            name: self.__type_serializer.serialize(value)
+            for name, value in dict(id=invocation_id, result=result, ttl=result_expiry_time,
+                                    posted_time=posted_time).items()
+        }
@@ -0,0 +1,147 @@
+from logging import Logger
+from threading import Lock, Thread
+from time import monotonic, sleep
+from typing import Dict, List, Optional, Tuple
+
+from mypy_boto3_sqs.client import SQSClient
+
+# The most entries that SQS will accept in a single DeleteMessageBatch or ChangeMessageVisibilityBatch request
+MAXIMUM_BATCH_ENTRY_COUNT = 10
+
+DEFAULT_VISIBILITY_TIMEOUT_SECONDS = 30
+
+# Well within the 60 seconds for which invocation queues keep messages, so that a message released once held this long
+# can still be delivered again
+DEFAULT_MAXIMUM_HOLD_SECONDS = 30
+
+
+# Deletes invocation messages only once results have been posted for them. Messages are kept hidden from other
+# receivers for as long as results are being generated for them, up to the maximum hold time, after which they are
+# released to be delivered again, for as long as the queue still keeps them.
+class SqsInvocationMessageAcknowledger:
+    def __init__(self, invocation_queue_url: str, sqs_client: SQSClient, logger: Logger,
+                 visibility_timeout_seconds: int = DEFAULT_VISIBILITY_TIMEOUT_SECONDS,
+                 maximum_hold_seconds: float = DEFAULT_MAXIMUM_HOLD_SECONDS):
+        if visibility_timeout_seconds < 1:
+            raise ValueError(f'Visibility timeout must be at least 1 second but was {visibility_timeout_seconds}')
+
+        self.__invocation_queue_url = invocation_queue_url
+        self.__sqs_client = sqs_client
+        self.__logger = logger
+        self.__visibility_timeout_seconds = visibility_timeout_seconds
+        self.__maximum_hold_seconds = maximum_hold_seconds
+        self.__lock = Lock()
+        # Receipt handle, time at which the message was received and time at which it becomes visible again, for each
+        # held invocation, all measured by the monotonic clock
+        self.__held_messages: Dict[str, Tuple[str, float, float]] = {}
+        self.__extension_thread: Optional[Thread] = None
+
+    @property
+    def visibility_timeout_seconds(self) -> int:
+        return self.__visibility_timeout_seconds
+
+    def hold(self, invocation_id: str, receipt_handle: str) -> None:
+        # Messages are received with the visibility timeout, so become visible again no sooner than this
+        received_time = monotonic()
+
+        with self.__lock:
+            self.__held_messages[invocation_id] = (
+                receipt_handle, received_time, received_time + self.__visibility_timeout_seconds
+            )
+
+            if self.__extension_thread is None:
+                self.__extension_thread = Thread(target=self.__extend_visibility_until_none_held, daemon=True,
+                                                 name='SqsInvocationMessageAcknowledger')
+                self.__extension_thread.start()
+
+    def acknowledge(self, invocation_ids: List[str]) -> None:
+        with self.__lock:
+            receipt_handles = [self.__held_messages.pop(invocation_id)[0] for invocation_id in invocation_ids
+                               if invocation_id in self.__held_messages]
+
+        for batch_start in range(0, len(receipt_handles), MAXIMUM_BATCH_ENTRY_COUNT):
+            delete_message_batch_result = self.__sqs_client.delete_message_batch(
+                QueueUrl=self.__invocation_queue_url,
+                Entries=[
+                    dict(Id=str(index), ReceiptHandle=receipt_handle)
+                    for index, receipt_handle in
+                    enumerate(receipt_handles[batch_start:batch_start + MAXIMUM_BATCH_ENTRY_COUNT])
+                ]
+            )
+
+            for failure in delete_message_batch_result.get('Failed', []):
+                self.__logger.warning(
+                    f'Failed to delete invocation message {failure["Id"]} from queue: {failure.get("Message")}'
+                )
+
+    # Makes messages that were received but won't be handled immediately visible to be received again
+    def release(self, receipt_handles: List[str]) -> None:
+        self.__change_visibility(receipt_handles, 0)
+
+    def __extend_visibility_until_none_held(self) -> None:
+        while True:
+            # Checked often enough that every held message has its visibility extended well before it becomes visible
+            sleep(self.__visibility_timeout_seconds / 4)
+
+            with self.__lock:
+                # Stop rather than idle, so that an acknowledger that is no longer used holds no thread. Checked under
+                # the lock so that a message held since is always picked up by a thread.
+                if not self.__held_messages:
+                    self.__extension_thread = None
+                    return
+
+                receipt_handles_to_extend, receipt_handles_to_release = self.__take_receipt_handles_to_extend()
+
+            if receipt_handles_to_release:
+                try:
+                    self.release(receipt_handles_to_release)
+                except BaseException as e:
+                    self.__logger.exception(
+                        f'Failed to release {len(receipt_handles_to_release)} invocation message(s) held for the '
+                        f'maximum hold time',
+                        exc_info=e
+                    )
+
+            if receipt_handles_to_extend:
+                try:
+                    self.__change_visibility(receipt_handles_to_extend, self.__visibility_timeout_seconds)
+                except BaseException as e:
+                    self.__logger.exception(
+                        f'Failed to extend visibility of {len(receipt_handles_to_extend)} invocation message(s)',
+                        exc_info=e
+                    )
+
+    # Also takes the receipt handles of messages held for the maximum hold time, which are released rather than kept
+    # hidden indefinitely by an invocation whose result is never posted
+    def __take_receipt_handles_to_extend(self) -> Tuple[List[str], List[str]]:
+        now = monotonic()
+        receipt_handles_to_extend: List[str] = []
+        receipt_handles_to_release: List[str] = []
+
+        for invocation_id, (receipt_handle, received_time, visible_time) in list(self.__held_messages.items()):
+            if now - received_time >= self.__maximum_hold_seconds:
+                del self.__held_messages[invocation_id]
+                receipt_handles_to_release.append(receipt_handle)
+            elif visible_time - now < self.__visibility_timeout_seconds / 2:
+                self.__held_messages[invocation_id] = (
+                    receipt_handle, received_time, now + self.__visibility_timeout_seconds
+                )
+                receipt_handles_to_extend.append(receipt_handle)
+
+        return receipt_handles_to_extend, receipt_handles_to_release
+
+    def __change_visibility(self, receipt_handles: List[str], visibility_timeout_seconds: int) -> None:
+        for batch_start in range(0, len(receipt_handles), MAXIMUM_BATCH_ENTRY_COUNT):
+            change_message_visibility_batch_result = self.__sqs_client.change_message_visibility_batch(
+                QueueUrl=self.__invocation_queue_url,
+                Entries=[
+                    dict(Id=str(index), ReceiptHandle=receipt_handle, VisibilityTimeout=visibility_timeout_seconds)
+                    for index, receipt_handle in
+                    enumerate(receipt_handles[batch_start:batch_start + MAXIMUM_BATCH_ENTRY_COUNT])
+                ]
+            )
+
+            for failure in change_message_visibility_batch_result.get('Failed', []):
+                self.__logger.warning(
+                    f'Failed to change visibility of invocation message {failure["Id"]}: {failure.get("Message")}'
+                )
@@ -0,0 +1,85 @@
+import json
+from logging import Logger
+from typing import List
+
+from mypy_boto3_sqs.client import SQSClient
+from mypy_boto3_sqs.type_defs import MessageTypeDef
+
+from aws_test_harness.domain.invocation import Invocation
+from aws_test_harness.infrastructure.adaptive_long_poller import AdaptiveLongPoller
+from aws_test_harness.infrastructure.sqs_invocation_message_acknowledger import SqsInvocationMessageAcknowledger
+
+# The most messages that SQS will return from a single ReceiveMessage request
+MAXIMUM_MESSAGE_BATCH_SIZE = 10
+
+
+# Receives invocations from the invocation queue on behalf of the SQS based post offices, however they deliver results.
+# Invocation messages are held until results have been posted for them.
+class SqsInvocationReceiver:
+    def __init__(self, invocation_queue_url: str, sqs_client: SQSClient, logger: Logger):
+        self.__invocation_queue_url = invocation_queue_url
+        self.__sqs_client = sqs_client
+        self.__logger = logger
+        self.__invocation_message_acknowledger = SqsInvocationMessageAcknowledger(invocation_queue_url, sqs_client,
+                                                                                 logger)
+        self.__invocation_long_poller: AdaptiveLongPoller[MessageTypeDef] = AdaptiveLongPoller(logger)
+
+    def receive_invocations(self) -> List[Invocation]:
+        messages = self.__invocation_long_poller.poll(self.__receive_invocation_messages,
+                                                      self.__release_invocation_messages)
+
+        if not messages:
+            return []
+
+        for message in messages:
+            self.__logger.info(
+                f'Invocation message received '
+                f'with attributes: {message.get("MessageAttributes")}, '
+                f'and body: {message["Body"]}'
+            )
+
+        invocations = [self.__to_invocation(message) for message in messages]
+
+        # Deleted only once their results have been posted
+        for invocation, message in zip(invocations, messages):
+            self.__invocation_message_acknowledger.hold(invocation.id, message['ReceiptHandle'])
+
+        return invocations
+
+    # Deletes the messages for invocations whose results have been posted
+    def acknowledge(self, invocation_ids: List[str]) -> None:
+        self.__invocation_message_acknowledger.acknowledge(invocation_ids)
+
+    def interrupt(self) -> None:
+        self.__invocation_long_poller.interrupt()
+
+    def resume(self) -> None:
+        self.__invocation_long_poller.resume()
+
+    def __receive_invocation_messages(self, wait_time_seconds: int) -> List[MessageTypeDef]:
+        receive_message_result = self.__sqs_client.receive_message(
+            QueueUrl=self.__invocation_queue_url,
+            MessageAttributeNames=['All'],
+            MaxNumberOfMessages=MAXIMUM_MESSAGE_BATCH_SIZE,
+            WaitTimeSeconds=wait_time_seconds,
+            VisibilityTimeout=self.__invocation_message_acknowledger.visibility_timeout_seconds
+        )
+
+        return receive_message_result.get('Messages', [])
+
+    def __release_invocation_messages(self, messages: List[MessageTypeDef]) -> None:
+        self.__invocation_message_acknowledger.release([message['ReceiptHandle'] for message in messages])
+
+    @staticmethod
+    def __to_invocation(message: MessageTypeDef) -> Invocation:
+        message_payload = json.loads(message['Body'])
+
+        sent_time_attribute = message['MessageAttributes'].get('InvocationSentTime')
+
+        return Invocation(
+            target=message['MessageAttributes']['InvocationTarget']['StringValue'],
+            id=message['MessageAttributes']['InvocationId']['StringValue'],
+            parameters=message_payload['parameters'],
+            # Stamped in milliseconds since the epoch by test double invocation handlers that support it
+            sent_time=int(sent_time_attribute['StringValue']) / 1000 if sent_time_attribute else None
+        )
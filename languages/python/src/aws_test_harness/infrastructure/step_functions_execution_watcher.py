@@ -0,0 +1,155 @@
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from heapq import heappush, heappop
+from itertools import count
+from logging import Logger
+from threading import Condition, Thread
+from time import monotonic
+from typing import Dict, Iterator, List, Optional
+
+from botocore.exceptions import ClientError
+
+from aws_test_harness.domain.exponential_backoff import ExponentialBackoff
+from aws_test_harness.domain.state_machine_execution import StateMachineExecution
+from aws_test_harness.domain.state_machine_execution_description import StateMachineExecutionDescription
+
+DEFAULT_MAXIMUM_REQUESTS_PER_SECOND = 10
+
+DEFAULT_EXECUTION_POLLING_BACKOFF = ExponentialBackoff(
+    initial_delay_seconds=0.05,
+    maximum_delay_seconds=0.5,
+    multiplier=1.5
+)
+
+DEFAULT_THROTTLING_BACKOFF = ExponentialBackoff(
+    initial_delay_seconds=0.5,
+    maximum_delay_seconds=10
+)
+
+THROTTLING_ERROR_CODES = frozenset({'ThrottlingException', 'Throttling', 'TooManyRequestsException'})
+
+
+@dataclass(order=True)
+class WatchedExecution:
+    next_poll_time: float
+    # Breaks ties between executions due at the same time in the order that they were queued
+    sequence_number: int
+    execution: StateMachineExecution = field(compare=False)
+    polling_delays: Iterator[float] = field(compare=False)
+
+
+# Polls every watched execution from a single thread, each in turn as it falls due, so that the rate of
+# DescribeExecution requests is bounded by the request budget however many executions are being waited on
+class StepFunctionsExecutionWatcher:
+    def __init__(self, logger: Logger,
+                 maximum_requests_per_second: float = DEFAULT_MAXIMUM_REQUESTS_PER_SECOND,
+                 execution_polling_backoff: ExponentialBackoff = DEFAULT_EXECUTION_POLLING_BACKOFF,
+                 throttling_backoff: ExponentialBackoff = DEFAULT_THROTTLING_BACKOFF):
+        if maximum_requests_per_second <= 0:
+            raise ValueError(f'Maximum requests per second must be positive but was {maximum_requests_per_second}')
+
+        self.__logger = logger
+        self.__minimum_request_interval = 1 / maximum_requests_per_second
+        self.__execution_polling_backoff = execution_polling_backoff
+        self.__throttling_backoff = throttling_backoff
+        self.__condition = Condition()
+        self.__sequence_numbers = count()
+        self.__outstanding_executions: List[WatchedExecution] = []
+        self.__completion_futures: Dict[StateMachineExecution, Future[StateMachineExecutionDescription]] = {}
+        self.__polling_thread: Optional[Thread] = None
+        self.__next_request_time = 0.0
+
+    def watch(self, execution: StateMachineExecution) -> Future[StateMachineExecutionDescription]:
+        with self.__condition:
+            completion_future = self.__completion_futures.get(execution)
+
+            if completion_future is None:
+                completion_future = Future()
+                self.__completion_futures[execution] = completion_future
+
+                self.__queue(WatchedExecution(
+                    next_poll_time=monotonic(),
+                    sequence_number=next(self.__sequence_numbers),
+                    execution=execution,
+                    polling_delays=self.__execution_polling_backoff.delays()
+                ))
+
+                if self.__polling_thread is None:
+                    self.__polling_thread = Thread(target=self.__poll_until_none_outstanding, daemon=True,
+                                                   name='StepFunctionsExecutionWatcher')
+                    self.__polling_thread.start()
+
+            return completion_future
+
+    def __poll_until_none_outstanding(self) -> None:
+        throttling_delays: Optional[Iterator[float]] = None
+
+        while True:
+            watched_execution = self.__wait_for_next_execution_due()
+
+            if watched_execution is None:
+                return
+
+            self.__next_request_time = monotonic() + self.__minimum_request_interval
+
+            try:
+                description = watched_execution.execution.describe()
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') not in THROTTLING_ERROR_CODES:
+                    self.__fail(watched_execution.execution, e)
+                    continue
+
+                throttling_delays = throttling_delays or self.__throttling_backoff.delays()
+                throttling_delay = next(throttling_delays)
+                self.__logger.warning(f'Describing state machine executions throttled; pausing for {throttling_delay}s')
+                self.__next_request_time = monotonic() + throttling_delay
+
+                with self.__condition:
+                    self.__queue(watched_execution)
+
+                continue
+            except Exception as e:
+                self.__fail(watched_execution.execution, e)
+                continue
+
+            throttling_delays = None
+
+            if description.terminal:
+                self.__complete(watched_execution.execution, description)
+            else:
+                watched_execution.next_poll_time = monotonic() + next(watched_execution.polling_delays)
+                watched_execution.sequence_number = next(self.__sequence_numbers)
+
+                with self.__condition:
+                    self.__queue(watched_execution)
+
+    def __wait_for_next_execution_due(self) -> Optional[WatchedExecution]:
+        with self.__condition:
+            while True:
+                if not self.__outstanding_executions:
+                    # Stop rather than idle, so that a watcher that is no longer used holds no thread
+                    self.__polling_thread = None
+                    return None
+
+                next_execution_due = self.__outstanding_executions[0]
+                delay = max(next_execution_due.next_poll_time, self.__next_request_time) - monotonic()
+
+                if delay <= 0:
+                    return heappop(self.__outstanding_executions)
+
+                # Woken early if an execution is queued that is due sooner
+                self.__condition.wait(delay)
+
+    def __queue(self, watched_execution: WatchedExecution) -> None:
+        heappush(self.__outstanding_executions, watched_execution)
+        self.__condition.notify()
+
+    def __complete(self, execution: StateMachineExecution, description: StateMachineExecutionDescription) -> None:
+        self.__stop_watching(execution).set_result(description)
+
+    def __fail(self, execution: StateMachineExecution, exception: BaseException) -> None:
+        self.__stop_watching(execution).set_exception(exception)
+
+    def __stop_watching(self, execution: StateMachineExecution) -> Future[StateMachineExecutionDescription]:
+        with self.__condition:
+            return self.__completion_futures.pop(execution)
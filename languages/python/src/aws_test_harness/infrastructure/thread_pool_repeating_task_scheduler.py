@@ -0,0 +1,56 @@
+from logging import Logger
+from threading import Thread, Event
+from typing import Callable, Any, List
+
+from aws_test_harness.domain.repeating_task_scheduler import RepeatingTaskScheduler
+
+
+class ThreadPoolRepeatingTaskScheduler(RepeatingTaskScheduler):
+    def __init__(self, logger: Logger, worker_count: int):
+        if worker_count < 1:
+            raise ValueError(f'Worker count must be at least 1 but was {worker_count}')
+
+        self.__logger = logger
+        self.__worker_count = worker_count
+        self.__reset_schedule_event = Event()
+        self.__threads: List[Thread] = []
+
+    def schedule(self, task: Callable[..., Any]) -> None:
+        if self.__threads:
+            raise RuntimeError('Task is already scheduled')
+
+        def repeat_task_until_signalled() -> None:
+            while not self.__reset_schedule_event.is_set():
+                try:
+                    task()
+                except BaseException as e:
+                    self.__logger.exception('Uncaught exception in thread pool repeating task scheduler thread',
+                                            exc_info=e)
+
+        self.__logger.debug(f'Starting {self.__worker_count} repeating task scheduler threads...')
+
+        self.__threads = [
+            Thread(target=repeat_task_until_signalled, daemon=True, name=f'RepeatingTaskSchedulerWorker-{index}')
+            for index in range(self.__worker_count)
+        ]
+
+        for thread in self.__threads:
+            thread.start()
+
+        self.__logger.debug('Repeating task scheduler threads started.')
+
+    def scheduled(self) -> bool:
+        return len(self.__threads) > 0
+
+    def reset_schedule(self) -> None:
+        self.__logger.debug('Signalling repeating task schedule should reset...')
+        self.__reset_schedule_event.set()
+
+        for thread in self.__threads:
+            thread.join()
+
+        self.__threads = []
+
+        self.__logger.debug('Repeating task schedule reset.')
+
+        self.__reset_schedule_event.clear()
@@ -1,12 +1,13 @@
+import asyncio
 import json
 from logging import Logger
-from typing import Generator
+from typing import Any, Dict, Generator
 from uuid import uuid4
 
 import pytest
 from boto3 import Session
 
-from aws_test_harness import aws_test_harness, TestHarness
+from aws_test_harness import aws_test_harness, TestHarness, async_aws_test_harness
 from aws_test_harness.domain.state_machine_execution_failure import StateMachineExecutionFailure
 from aws_test_harness_test_support.step_functions_utils import assert_describes_successful_execution, \
     assert_describes_failed_execution
@@ -67,6 +68,15 @@ def test_executing_state_machine_specified_by_cfn_resource_logical_id(
     assert execution.output == '3'
 
 
+def test_running_state_machine_executions_in_parallel(test_harness: TestHarness) -> None:
+    state_machine = test_harness.state_machine('AddNumbersStateMachine')
+
+    executions = [state_machine.start({'firstNumber': number, 'secondNumber': 1}) for number in range(10)]
+    test_harness.wait_for_state_machine_executions(executions)
+
+    assert [execution.output for execution in executions] == [str(number + 1) for number in range(10)]
+
+
 def test_interacting_with_test_s3_bucket(
         test_harness: TestHarness, test_stack: TestCloudFormationStack, s3_test_client: S3TestClient
 ) -> None:
@@ -147,3 +157,28 @@ def test_ignoring_state_machine_invocations_after_being_torn_down(
 
     step_functions_test_client.execute_state_machine(state_machine_arn, {})
     assert test_double_state_machine.invocation_count == call_count_before_teardown
+
+
+def test_executing_many_state_machines_concurrently_with_asynchronous_twins(
+        test_stack: TestCloudFormationStack, logger: Logger, aws_profile: str) -> None:
+    async_test_harness = async_aws_test_harness(test_stack.name, aws_profile, logger)
+
+    async def execution_handler(execution_input: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(0.1)
+        return dict(orangeNumber=execution_input['number'])
+
+    async def execute_all() -> None:
+        orange_state_machine = async_test_harness.twin_state_machine('Orange', execution_handler)
+
+        try:
+            state_machine = async_test_harness.state_machine('OrangeAWSTestHarnessStateMachine')
+            executions = await asyncio.gather(*[state_machine.execute(dict(number=number)) for number in range(20)])
+        finally:
+            await async_test_harness.tear_down()
+
+        assert [json.loads(execution.output or 'null') for execution in executions] == [
+            dict(orangeNumber=number) for number in range(20)
+        ]
+        assert orange_state_machine.invocation_count == 20
+
+    asyncio.run(execute_all())
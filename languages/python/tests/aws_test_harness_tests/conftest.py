@@ -5,6 +5,7 @@ from typing import Dict
 import pytest
 from boto3 import Session
 
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
 from aws_test_harness_test_support import load_test_configuration
 from aws_test_harness_test_support.system_command_executor import SystemCommandExecutor
 from aws_test_harness_test_support.test_s3_bucket_stack import TestS3BucketStack
@@ -38,6 +39,11 @@ def boto_session(aws_profile: str) -> Session:
     return Session(profile_name=aws_profile)
 
 
+@pytest.fixture(scope="session")
+def boto_client_pool(boto_session: Session) -> BotoClientPool:
+    return BotoClientPool(boto_session)
+
+
 @pytest.fixture(scope="session")
 def system_command_executor(logger: Logger) -> SystemCommandExecutor:
     return SystemCommandExecutor(logger)
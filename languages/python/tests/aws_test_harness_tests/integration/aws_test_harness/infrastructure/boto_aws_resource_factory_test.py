@@ -6,6 +6,7 @@ from boto3 import Session
 
 from aws_test_harness.domain.aws_resource_registry import AwsResourceRegistry
 from aws_test_harness.infrastructure.boto_aws_resource_factory import BotoAwsResourceFactory
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
 from aws_test_harness_test_support.test_cloudformation_stack import TestCloudFormationStack
 from aws_test_harness_test_support.mocking import mock_class, when_calling
 from aws_test_harness_tests.support.s3_test_client import S3TestClient
@@ -42,7 +43,8 @@ def before_all(test_stack: TestCloudFormationStack) -> None:
 
 
 def test_provides_object_for_interacting_with_s3_bucket_in_cfn_stack(
-        test_stack: TestCloudFormationStack, boto_session: Session, s3_test_client: S3TestClient, logger: Logger
+        test_stack: TestCloudFormationStack, boto_client_pool: BotoClientPool, s3_test_client: S3TestClient,
+        logger: Logger
 ) -> None:
     bucket_name = test_stack.get_stack_resource_physical_id('Bucket')
 
@@ -51,7 +53,7 @@ def test_provides_object_for_interacting_with_s3_bucket_in_cfn_stack(
         lambda resource_id: f'arn:aws:s3:::{bucket_name}' if resource_id == 'Bucket' else None
     )
 
-    aws_resource_factory = BotoAwsResourceFactory(boto_session, aws_resource_registry, logger)
+    aws_resource_factory = BotoAwsResourceFactory(boto_client_pool, aws_resource_registry, logger)
 
     s3_bucket = aws_resource_factory.get_s3_bucket('Bucket')
 
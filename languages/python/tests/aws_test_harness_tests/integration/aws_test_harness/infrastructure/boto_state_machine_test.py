@@ -1,10 +1,14 @@
+import asyncio
 import json
 from logging import Logger
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import pytest
 from boto3 import Session
 
+from aws_test_harness.domain.state_machine_execution import StateMachineExecution
+from aws_test_harness.domain.state_machine_execution_description import StateMachineExecutionDescription
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
 from aws_test_harness.infrastructure.boto_state_machine import BotoStateMachine
 from aws_test_harness_test_support.test_cloudformation_stack import TestCloudFormationStack
 from aws_test_harness_tests.support.step_functions_test_client import StepFunctionsTestClient
@@ -86,12 +90,12 @@ def before_all(test_stack: TestCloudFormationStack) -> None:
     )
 
 
-def test_executes_state_machine_with_provided_input(boto_session: Session, logger: Logger,
+def test_executes_state_machine_with_provided_input(boto_client_pool: BotoClientPool, logger: Logger,
                                                     step_functions_test_client: StepFunctionsTestClient,
                                                     test_stack: TestCloudFormationStack) -> None:
     state_machine_arn = test_stack.get_output_value('PassThroughStateMachineArn')
     previous_execution_arn = step_functions_test_client.get_latest_execution_arn(state_machine_arn)
-    state_machine = BotoStateMachine(state_machine_arn, boto_session, logger)
+    state_machine = BotoStateMachine(state_machine_arn, boto_client_pool, logger)
 
     execution_input = {
         'aParameter': 'aValue',
@@ -111,20 +115,20 @@ def test_executes_state_machine_with_provided_input(boto_session: Session, logge
     assert execution_name.startswith('test-')
 
 
-def test_reports_execution_success(boto_session: Session, logger: Logger,
+def test_reports_execution_success(boto_client_pool: BotoClientPool, logger: Logger,
                                    test_stack: TestCloudFormationStack) -> None:
     state_machine_arn = test_stack.get_output_value('PassThroughStateMachineArn')
-    state_machine = BotoStateMachine(state_machine_arn, boto_session, logger)
+    state_machine = BotoStateMachine(state_machine_arn, boto_client_pool, logger)
 
     execution = state_machine.execute(ANY_EXECUTION_INPUT)
 
     assert execution.status == 'SUCCEEDED'
 
 
-def test_reports_execution_failure(boto_session: Session,
+def test_reports_execution_failure(boto_client_pool: BotoClientPool,
                                    logger: Logger, test_stack: TestCloudFormationStack) -> None:
     state_machine_arn = test_stack.get_output_value('AddNumbersStateMachineArn')
-    state_machine = BotoStateMachine(state_machine_arn, boto_session, logger)
+    state_machine = BotoStateMachine(state_machine_arn, boto_client_pool, logger)
 
     execution_input = {'firstNumber': 1, 'secondNumber': 'NOT A NUMBER'}
 
@@ -136,23 +140,62 @@ def test_reports_execution_failure(boto_session: Session,
     assert 'Invalid arguments in States.MathAdd' in execution.cause
 
 
-def test_reports_execution_timeout(boto_session: Session, logger: Logger,
+def test_reports_execution_timeout(boto_client_pool: BotoClientPool, logger: Logger,
                                    test_stack: TestCloudFormationStack) -> None:
     state_machine_arn = test_stack.get_output_value('TimingOutStateMachineArn')
-    state_machine = BotoStateMachine(state_machine_arn, boto_session, logger)
+    state_machine = BotoStateMachine(state_machine_arn, boto_client_pool, logger)
 
     execution = state_machine.execute(ANY_EXECUTION_INPUT)
 
     assert execution.status == 'TIMED_OUT'
 
 
-def test_provides_execution_result(boto_session: Session, logger: Logger,
+def test_provides_execution_result(boto_client_pool: BotoClientPool, logger: Logger,
                                    test_stack: TestCloudFormationStack) -> None:
     state_machine_arn = test_stack.get_output_value('AddNumbersStateMachineArn')
-    state_machine = BotoStateMachine(state_machine_arn, boto_session, logger)
+    state_machine = BotoStateMachine(state_machine_arn, boto_client_pool, logger)
 
     execution_input = {'firstNumber': 1, 'secondNumber': 2}
 
     execution = state_machine.execute(execution_input)
 
     assert execution.output == '3'
+
+
+def test_provides_description_of_completed_execution(boto_client_pool: BotoClientPool, logger: Logger,
+                                                     test_stack: TestCloudFormationStack) -> None:
+    state_machine_arn = test_stack.get_output_value('AddNumbersStateMachineArn')
+    state_machine = BotoStateMachine(state_machine_arn, boto_client_pool, logger)
+
+    execution = state_machine.execute({'firstNumber': 1, 'secondNumber': 2})
+
+    assert execution.describe() == StateMachineExecutionDescription(status='SUCCEEDED', output='3')
+
+
+def test_executes_state_machines_concurrently_on_event_loop(boto_client_pool: BotoClientPool, logger: Logger,
+                                                            test_stack: TestCloudFormationStack) -> None:
+    state_machine_arn = test_stack.get_output_value('AddNumbersStateMachineArn')
+    state_machine = BotoStateMachine(state_machine_arn, boto_client_pool, logger)
+
+    async def execute_all() -> List[StateMachineExecution]:
+        return await asyncio.gather(*[
+            state_machine.execute_async({'firstNumber': number, 'secondNumber': 1}) for number in range(5)
+        ])
+
+    executions = asyncio.run(execute_all())
+
+    assert [execution.output for execution in executions] == ['1', '2', '3', '4', '5']
+
+
+def test_starts_execution_without_waiting_for_completion(boto_client_pool: BotoClientPool, logger: Logger,
+                                                         test_stack: TestCloudFormationStack) -> None:
+    state_machine_arn = test_stack.get_output_value('TimingOutStateMachineArn')
+    state_machine = BotoStateMachine(state_machine_arn, boto_client_pool, logger)
+
+    execution = state_machine.start(ANY_EXECUTION_INPUT)
+
+    assert execution.status == 'RUNNING'
+
+    execution.wait_for_completion()
+
+    assert execution.status == 'TIMED_OUT'
@@ -3,6 +3,8 @@ from logging import Logger
 import pytest
 from boto3 import Session
 
+from aws_test_harness.domain.unknown_aws_resource_exception import UnknownAwsResourceException
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
 from aws_test_harness.infrastructure.cloudformation_aws_resource_registry import CloudFormationAwsResourceRegistry
 from aws_test_harness_test_support.test_cloudformation_stack import TestCloudFormationStack
 
@@ -49,19 +51,29 @@ def before_all(test_stack: TestCloudFormationStack) -> None:
     )
 
 
-def test_provides_arn_for_state_machine_in_stack(test_stack: TestCloudFormationStack, boto_session: Session) -> None:
+def test_provides_arn_for_state_machine_in_stack(test_stack: TestCloudFormationStack,
+                                                 boto_client_pool: BotoClientPool) -> None:
     state_machine_arn = test_stack.get_output_value('StateMachineArn')
-    resource_registry = CloudFormationAwsResourceRegistry(test_stack.name, boto_session)
+    resource_registry = CloudFormationAwsResourceRegistry(test_stack.name, boto_client_pool)
 
     retrieved_value = resource_registry.get_resource_arn('StateMachine')
 
     assert retrieved_value == state_machine_arn
 
 
-def test_provides_arn_for_s3_bucket_in_stack(test_stack: TestCloudFormationStack, boto_session: Session) -> None:
+def test_provides_arn_for_s3_bucket_in_stack(test_stack: TestCloudFormationStack,
+                                             boto_client_pool: BotoClientPool) -> None:
     bucket_arn = test_stack.get_output_value('BucketArn')
-    resource_registry = CloudFormationAwsResourceRegistry(test_stack.name, boto_session)
+    resource_registry = CloudFormationAwsResourceRegistry(test_stack.name, boto_client_pool)
 
     retrieved_value = resource_registry.get_resource_arn('Bucket')
 
     assert retrieved_value == bucket_arn
+
+
+def test_raises_exception_for_resource_not_in_stack(test_stack: TestCloudFormationStack,
+                                                    boto_client_pool: BotoClientPool) -> None:
+    resource_registry = CloudFormationAwsResourceRegistry(test_stack.name, boto_client_pool)
+
+    with pytest.raises(UnknownAwsResourceException, match='NonExistentResource'):
+        resource_registry.get_resource_arn('NonExistentResource')
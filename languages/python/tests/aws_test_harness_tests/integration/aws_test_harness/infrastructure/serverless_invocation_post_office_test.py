@@ -2,7 +2,7 @@ import json
 from datetime import datetime, timedelta
 from decimal import Decimal
 from logging import Logger
-from typing import cast
+from typing import cast, Set
 from uuid import uuid4
 
 import pytest
@@ -11,6 +11,7 @@ from mypy_boto3_dynamodb import DynamoDBServiceResource
 from mypy_boto3_dynamodb.service_resource import Table
 from mypy_boto3_sqs.client import SQSClient
 
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
 from aws_test_harness.infrastructure.serverless_invocation_post_office import ServerlessInvocationPostOffice
 from aws_test_harness_test_support.eventual_consistency_utils import wait_for_value_matching
 from aws_test_harness_test_support.test_cloudformation_stack import TestCloudFormationStack
@@ -60,9 +61,9 @@ def invocation_table(invocation_table_name: str, boto_session: Session) -> Table
 
 
 @pytest.fixture(scope="function")
-def invocation_post_office(invocation_queue_url: str, invocation_table_name: str, boto_session: Session,
-                           logger: Logger) -> ServerlessInvocationPostOffice:
-    return ServerlessInvocationPostOffice(invocation_queue_url, invocation_table_name, boto_session, logger)
+def invocation_post_office(invocation_queue_url: str, invocation_table_name: str,
+                           boto_client_pool: BotoClientPool, logger: Logger) -> ServerlessInvocationPostOffice:
+    return ServerlessInvocationPostOffice(invocation_queue_url, invocation_table_name, boto_client_pool, logger)
 
 
 def test_collects_invocation_from_sqs_queue(invocation_post_office: ServerlessInvocationPostOffice,
@@ -83,23 +84,61 @@ def test_collects_invocation_from_sqs_queue(invocation_post_office: ServerlessIn
         )
     )
 
-    retrieved_invocation = wait_for_value_matching(
-        invocation_post_office.maybe_collect_invocation,
+    retrieved_invocations = wait_for_value_matching(
+        invocation_post_office.collect_invocations,
         f'invocation with target "{the_invocation_target}" and id "{the_invocation_id}"',
-        lambda invocation: invocation is not None and invocation.id == the_invocation_id
+        lambda invocations: invocations is not None and any(
+            invocation.id == the_invocation_id for invocation in invocations
+        )
     )
 
-    assert retrieved_invocation is not None
+    assert retrieved_invocations is not None
+    retrieved_invocation = next(
+        invocation for invocation in retrieved_invocations if invocation.id == the_invocation_id
+    )
     assert retrieved_invocation.target == the_invocation_target
     assert retrieved_invocation.parameters == the_invocation_parameters
 
 
-def test_returns_none_when_no_invocation_message_found_on_queue(
+def test_collects_batch_of_invocations_from_sqs_queue(invocation_post_office: ServerlessInvocationPostOffice,
+                                                     boto_session: Session, invocation_queue_url: str) -> None:
+    sqs_client: SQSClient = boto_session.client('sqs')
+    invocation_ids = [str(uuid4()) for _ in range(3)]
+
+    sqs_client.send_message_batch(
+        QueueUrl=invocation_queue_url,
+        Entries=[
+            dict(
+                Id=str(index),
+                MessageBody=json.dumps(dict(parameters=dict())),
+                MessageAttributes=dict(
+                    InvocationTarget=dict(DataType='String', StringValue='any-invocation-target'),
+                    InvocationId=dict(DataType='String', StringValue=invocation_id),
+                )
+            )
+            for index, invocation_id in enumerate(invocation_ids)
+        ]
+    )
+
+    collected_invocation_ids: Set[str] = set()
+
+    def collect_invocation_ids() -> Set[str]:
+        collected_invocation_ids.update(invocation.id for invocation in invocation_post_office.collect_invocations())
+        return collected_invocation_ids
+
+    wait_for_value_matching(
+        collect_invocation_ids,
+        f'invocations with ids {invocation_ids}',
+        lambda invocation_id_set: invocation_id_set is not None and invocation_id_set.issuperset(invocation_ids)
+    )
+
+
+def test_returns_empty_list_when_no_invocation_message_found_on_queue(
         invocation_post_office: ServerlessInvocationPostOffice) -> None:
     wait_for_value_matching(
-        invocation_post_office.maybe_collect_invocation,
-        'None value',
-        lambda invocation: invocation is None
+        invocation_post_office.collect_invocations,
+        'empty list',
+        lambda invocations: invocations == []
     )
 
 
@@ -138,3 +177,14 @@ def test_expires_invocation_results_after_24_hours(invocation_post_office: Serve
     ttl_datetime = datetime.fromtimestamp(int(cast(Decimal, ttl)))
     current_datetime = datetime.now()
     assert ttl_datetime - current_datetime < timedelta(days=1, seconds=5)
+
+
+def test_puts_many_invocation_result_items_in_dynamodb_table(invocation_post_office: ServerlessInvocationPostOffice,
+                                                             invocation_table: Table) -> None:
+    results = {str(uuid4()): dict(value=f'result value {index}') for index in range(30)}
+
+    invocation_post_office.post_results(results)
+
+    for invocation_id, result in results.items():
+        get_item_result = invocation_table.get_item(Key=dict(id=invocation_id))
+        assert get_item_result['Item']['result'] == result
@@ -1,49 +1,88 @@
 from logging import Logger
+from threading import Barrier, Lock, current_thread
 from time import sleep
-from typing import cast, Generator
+from typing import cast, Generator, Set
 from unittest.mock import Mock
 
 import pytest
 
-from aws_test_harness.infrastructure.thread_based_repeating_task_scheduler import ThreadBasedRepeatingTaskScheduler
+from aws_test_harness.infrastructure.thread_pool_repeating_task_scheduler import ThreadPoolRepeatingTaskScheduler
 from aws_test_harness_test_support.eventual_consistency_utils import wait_for_value_matching
 
+WORKER_COUNT = 3
+
 
 @pytest.fixture(scope='function')
-def repeating_task_scheduler(logger: Logger) -> Generator[ThreadBasedRepeatingTaskScheduler]:
-    repeating_task_scheduler = ThreadBasedRepeatingTaskScheduler(logger)
+def repeating_task_scheduler(logger: Logger) -> Generator[ThreadPoolRepeatingTaskScheduler]:
+    repeating_task_scheduler = ThreadPoolRepeatingTaskScheduler(logger, WORKER_COUNT)
 
     yield repeating_task_scheduler
 
     repeating_task_scheduler.reset_schedule()
 
 
-def test_executes_scheduled_task(repeating_task_scheduler: ThreadBasedRepeatingTaskScheduler) -> None:
+def test_rejects_worker_count_below_one(logger: Logger) -> None:
+    with pytest.raises(ValueError, match='Worker count must be at least 1 but was 0'):
+        ThreadPoolRepeatingTaskScheduler(logger, 0)
+
+
+def test_repeatedly_executes_scheduled_task(repeating_task_scheduler: ThreadPoolRepeatingTaskScheduler) -> None:
     task = Mock()
 
     repeating_task_scheduler.schedule(task)
 
     wait_for_value_matching(
         lambda: task,
-        'task mock to have been called',
-        lambda the_task: cast(Mock, the_task).called
+        'task mock to have been called more than twice',
+        lambda the_task: cast(Mock, the_task).call_count > 2
+    )
+
+
+def test_executes_scheduled_task_on_each_worker_concurrently(
+        repeating_task_scheduler: ThreadPoolRepeatingTaskScheduler) -> None:
+    # Only passable once every worker is executing the task at the same time
+    barrier = Barrier(WORKER_COUNT, timeout=5)
+    worker_thread_names: Set[str] = set()
+
+    def task() -> None:
+        worker_thread_names.add(current_thread().name)
+        barrier.wait()
+
+    repeating_task_scheduler.schedule(task)
+
+    wait_for_value_matching(
+        lambda: worker_thread_names,
+        f'task to have been executed by {WORKER_COUNT} worker threads',
+        lambda thread_names: thread_names is not None and len(thread_names) == WORKER_COUNT
     )
 
+    assert not barrier.broken
 
-def test_repeatedly_executes_scheduled_task(repeating_task_scheduler: ThreadBasedRepeatingTaskScheduler) -> None:
+
+def test_continues_executing_task_on_other_workers_whilst_one_worker_is_blocked(
+        repeating_task_scheduler: ThreadPoolRepeatingTaskScheduler) -> None:
     task = Mock()
+    blocked_worker_lock = Lock()
+
+    def task_side_effect() -> None:
+        # Only ever acquirable once, so exactly one worker becomes blocked
+        if blocked_worker_lock.acquire(blocking=False):
+            sleep(1)
+
+    task.side_effect = task_side_effect
 
     repeating_task_scheduler.schedule(task)
 
     wait_for_value_matching(
         lambda: task,
-        'task mock to have been called more than twice',
-        lambda the_task: cast(Mock, the_task).call_count > 2
+        'task mock to have been called many times',
+        lambda the_task: cast(Mock, the_task).call_count > 10,
+        timeout_millis=500
     )
 
 
 def test_throws_exception_if_asked_to_schedule_task_when_one_is_already_scheduled(
-        repeating_task_scheduler: ThreadBasedRepeatingTaskScheduler) -> None:
+        repeating_task_scheduler: ThreadPoolRepeatingTaskScheduler) -> None:
     task1 = Mock()
     task2 = Mock()
 
@@ -52,16 +91,11 @@ def test_throws_exception_if_asked_to_schedule_task_when_one_is_already_schedule
     with pytest.raises(RuntimeError, match='Task is already scheduled'):
         repeating_task_scheduler.schedule(task2)
 
-    wait_for_value_matching(
-        lambda: task1,
-        'task mock to have been called',
-        lambda the_task: cast(Mock, the_task).called
-    )
-
     task2.assert_not_called()
 
 
-def test_stops_scheduling_task_when_instructed(repeating_task_scheduler: ThreadBasedRepeatingTaskScheduler) -> None:
+def test_stops_scheduling_task_on_all_workers_when_instructed(
+        repeating_task_scheduler: ThreadPoolRepeatingTaskScheduler) -> None:
     task = Mock()
 
     repeating_task_scheduler.schedule(task)
@@ -73,23 +107,15 @@ def test_stops_scheduling_task_when_instructed(repeating_task_scheduler: ThreadB
     )
 
     repeating_task_scheduler.reset_schedule()
-
-    # Assume that 50ms is enough time for the final invocation of the task to complete
-    sleep(0.05)
     task_call_count_snapshot = task.call_count
 
-    # Wait another 50ms to give the task a chance to run again (if the stop feature is broken)
+    # Give the task a chance to run again (if the stop feature is broken)
     sleep(0.05)
     assert task.call_count == task_call_count_snapshot
 
 
-def test_does_not_throw_exception_if_asked_to_reset_schedule_before_a_task_is_scheduled(
-        repeating_task_scheduler: ThreadBasedRepeatingTaskScheduler) -> None:
-    repeating_task_scheduler.reset_schedule()
-
-
 def test_can_schedule_again_after_resetting_schedule(
-        repeating_task_scheduler: ThreadBasedRepeatingTaskScheduler) -> None:
+        repeating_task_scheduler: ThreadPoolRepeatingTaskScheduler) -> None:
     first_task = Mock()
 
     repeating_task_scheduler.schedule(first_task)
@@ -113,7 +139,7 @@ def test_can_schedule_again_after_resetting_schedule(
 
 
 def test_continues_scheduling_task_after_task_throws_exception(
-        repeating_task_scheduler: ThreadBasedRepeatingTaskScheduler) -> None:
+        repeating_task_scheduler: ThreadPoolRepeatingTaskScheduler) -> None:
     task = Mock()
 
     def task_side_effect() -> int:
@@ -133,23 +159,13 @@ def test_continues_scheduling_task_after_task_throws_exception(
     )
 
 
-def test_indicates_that_a_task_has_been_scheduled(repeating_task_scheduler: ThreadBasedRepeatingTaskScheduler) -> None:
+def test_indicates_whether_a_task_has_been_scheduled(
+        repeating_task_scheduler: ThreadPoolRepeatingTaskScheduler) -> None:
     task = Mock()
     assert repeating_task_scheduler.scheduled() is False
 
-    repeating_task_scheduler.schedule(task)
-
-    assert repeating_task_scheduler.scheduled() is True
-
-
-def test_indicates_that_a_task_has_not_been_scheduled_after_resetting_schedule(
-        repeating_task_scheduler: ThreadBasedRepeatingTaskScheduler) -> None:
-    task = Mock()
     repeating_task_scheduler.schedule(task)
     assert repeating_task_scheduler.scheduled() is True
 
     repeating_task_scheduler.reset_schedule()
-
-    # Assume that 50ms is enough time for the final invocation of the task to complete
-    sleep(0.05)
     assert repeating_task_scheduler.scheduled() is False
@@ -8,5 +8,6 @@ def any_invocation() -> Invocation:
 
 
 def an_invocation_with(target: str = 'any-invocation-target', invocation_id: str = 'any-invocation-id',
-                       parameters: Optional[Dict[str, Any]] = None) -> Invocation:
-    return Invocation(target=target, id=invocation_id, parameters=parameters or dict(input=dict()))
+                       parameters: Optional[Dict[str, Any]] = None, sent_time: Optional[float] = None) -> Invocation:
+    return Invocation(target=target, id=invocation_id, parameters=parameters or dict(input=dict()),
+                      sent_time=sent_time)
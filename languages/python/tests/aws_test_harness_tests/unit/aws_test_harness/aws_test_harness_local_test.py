@@ -0,0 +1,174 @@
+import asyncio
+import json
+from logging import Logger
+from typing import Any, Dict, Generator
+
+import pytest
+
+from aws_test_harness import aws_test_harness_local, TestHarness
+from aws_test_harness.domain.invocation_stage_timing import QUEUE_DELIVERY_STAGE, COLLECTION_STAGE, \
+    RESULT_GENERATION_STAGE, RESULT_POSTING_STAGE
+from aws_test_harness.domain.invocation_timing_recorder import InvocationTimingRecorder
+from aws_test_harness.domain.state_machine_execution_failure import StateMachineExecutionFailure
+from aws_test_harness.infrastructure.in_memory_s3_bucket import InMemoryS3Bucket
+
+
+@pytest.fixture(scope="function")
+def test_harness(logger: Logger) -> Generator[TestHarness]:
+    test_harness = aws_test_harness_local(logger, dict(
+        AddNumbersStateMachine=lambda execution_input: execution_input['firstNumber'] + execution_input['secondNumber']
+    ))
+    yield test_harness
+    test_harness.tear_down()
+
+
+def test_executing_state_machine_defined_in_memory(test_harness: TestHarness) -> None:
+    state_machine = test_harness.state_machine('AddNumbersStateMachine')
+
+    execution = state_machine.execute({'firstNumber': 1, 'secondNumber': 2})
+    assert execution.status == 'SUCCEEDED'
+    assert execution.output == '3'
+
+
+def test_running_state_machine_executions_in_parallel(test_harness: TestHarness) -> None:
+    state_machine = test_harness.state_machine('AddNumbersStateMachine')
+
+    executions = [state_machine.start({'firstNumber': number, 'secondNumber': 1}) for number in range(10)]
+    test_harness.wait_for_state_machine_executions(executions)
+
+    assert [execution.output for execution in executions] == [str(number + 1) for number in range(10)]
+
+
+def test_interacting_with_test_s3_bucket(test_harness: TestHarness) -> None:
+    s3_bucket = test_harness.test_s3_bucket('Messages')
+
+    s3_bucket.put_object(Key='the object key', Body='the object content')
+
+    assert isinstance(s3_bucket, InMemoryS3Bucket)
+    assert s3_bucket.objects == {'the object key': 'the object content'}
+
+
+def test_generating_twin_state_machine_execution_results(test_harness: TestHarness) -> None:
+    def handle_execution(execution_input: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(greeting=f'Hello {execution_input['name']}')
+
+    twin_state_machine = test_harness.twin_state_machine('Orange', handle_execution)
+    state_machine = test_harness.state_machine('OrangeAWSTestHarnessStateMachine')
+
+    execution = state_machine.execute(dict(name='Bob'))
+
+    assert execution.status == 'SUCCEEDED'
+    assert json.loads(execution.output or '') == dict(greeting='Hello Bob')
+    assert twin_state_machine.invocations == [[dict(name='Bob')]]
+
+
+def test_failing_twin_state_machine_executions(test_harness: TestHarness) -> None:
+    test_harness.twin_state_machine(
+        'Blue',
+        lambda _: StateMachineExecutionFailure(error='the error', cause='the cause')
+    )
+
+    execution = test_harness.state_machine('BlueAWSTestHarnessStateMachine').execute({})
+
+    assert execution.status == 'FAILED'
+    assert execution.error == 'the error'
+    assert execution.cause == 'the cause'
+
+
+def test_executing_twin_state_machines_asynchronously(test_harness: TestHarness) -> None:
+    async def handle_execution(execution_input: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(0.01)
+        return dict(number=execution_input['number'])
+
+    test_harness.twin_state_machine('Orange', handle_execution)
+    state_machine = test_harness.state_machine('OrangeAWSTestHarnessStateMachine')
+
+    async def execute_all() -> list[str | None]:
+        executions = await asyncio.gather(*[state_machine.execute_async(dict(number=number)) for number in range(5)])
+        return [execution.output for execution in executions]
+
+    assert asyncio.run(execute_all()) == [json.dumps(dict(number=number)) for number in range(5)]
+
+
+def test_executing_amazon_states_language_definition_that_starts_twin_state_machine(logger: Logger) -> None:
+    test_harness = aws_test_harness_local(logger, dict(
+        GreetingStateMachine=dict(
+            StartAt='GetGreeting',
+            States=dict(
+                GetGreeting=dict(
+                    Type='Task',
+                    Resource='arn:aws:states:::states:startExecution.sync:2',
+                    Parameters={'StateMachineArn': 'OrangeAWSTestHarnessStateMachine', 'Input': {'name.$': '$.name'}},
+                    OutputPath='$.Output',
+                    End=True
+                )
+            )
+        )
+    ))
+
+    try:
+        twin_state_machine = test_harness.twin_state_machine(
+            'Orange', lambda execution_input: dict(greeting=f'Hello {execution_input['name']}')
+        )
+
+        execution = test_harness.state_machine('GreetingStateMachine').execute(dict(name='Bob'))
+
+        assert execution.status == 'SUCCEEDED'
+        assert json.loads(execution.output or '') == dict(greeting='Hello Bob')
+        assert twin_state_machine.invocations == [[dict(name='Bob')]]
+    finally:
+        test_harness.tear_down()
+
+
+def test_passing_execution_id_from_context_object_to_started_twin_state_machine(logger: Logger) -> None:
+    test_harness = aws_test_harness_local(logger, dict(
+        StarterStateMachine=dict(
+            StartAt='StartExecution',
+            States=dict(
+                StartExecution={
+                    'Type': 'Task',
+                    'Resource': 'arn:aws:states:::states:startExecution.sync:2',
+                    'Parameters': {
+                        'StateMachineArn': 'RandomStringAWSTestHarnessStateMachine',
+                        'Input': {
+                            'StatePayload': 'Hello from Step Functions!',
+                            'AWS_STEP_FUNCTIONS_STARTED_BY_EXECUTION_ID.$': '$$.Execution.Id'
+                        }
+                    },
+                    'ResultSelector': {'result.$': '$.Output'},
+                    'ResultPath': '$.startExecution',
+                    'End': True
+                }
+            )
+        )
+    ))
+
+    try:
+        twin_state_machine = test_harness.twin_state_machine('RandomString', lambda _: dict(value='random string'))
+
+        execution = test_harness.state_machine('StarterStateMachine').execute({})
+
+        assert execution.status == 'SUCCEEDED'
+        assert json.loads(execution.output or '') == dict(startExecution=dict(result=dict(value='random string')))
+        [[twin_execution_input]] = twin_state_machine.invocations
+        assert twin_execution_input['StatePayload'] == 'Hello from Step Functions!'
+        assert twin_execution_input['AWS_STEP_FUNCTIONS_STARTED_BY_EXECUTION_ID'].startswith(
+            'arn:aws:states:local:000000000000:execution:StarterStateMachine:'
+        )
+    finally:
+        test_harness.tear_down()
+
+
+def test_recording_time_spent_by_invocations_in_each_stage(logger: Logger) -> None:
+    timing_recorder = InvocationTimingRecorder()
+    test_harness = aws_test_harness_local(logger, invocation_timing_sink=timing_recorder)
+
+    try:
+        test_harness.twin_state_machine('Orange', lambda _: dict())
+        test_harness.state_machine('OrangeAWSTestHarnessStateMachine').execute({})
+    finally:
+        test_harness.tear_down()
+
+    assert sorted(set(timing.stage for timing in timing_recorder.timings)) == sorted(
+        [QUEUE_DELIVERY_STAGE, COLLECTION_STAGE, RESULT_GENERATION_STAGE, RESULT_POSTING_STAGE]
+    )
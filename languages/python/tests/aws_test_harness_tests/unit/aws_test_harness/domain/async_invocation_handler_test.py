@@ -0,0 +1,91 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from aws_test_harness.domain.async_invocation_handler import AsyncInvocationHandler
+from aws_test_harness.domain.invocation import Invocation
+from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
+from aws_test_harness_tests.support.builders.invocation_builder import an_invocation_with
+from aws_test_harness_test_support.mocking import mock_class, verify, when_calling, as_calls, typed_call
+
+
+def test_posts_generated_result_for_each_invocation_collected_from_post_office() -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.collect_invocations).always_return([
+        an_invocation_with(invocation_id='first invocation id'),
+        an_invocation_with(invocation_id='second invocation id'),
+    ])
+
+    async def get_invocation_result(invocation: Invocation) -> Any:
+        return dict(value=f'result for {invocation.id}')
+
+    invocation_handler = AsyncInvocationHandler(invocation_post_office, get_invocation_result)
+
+    asyncio.run(invocation_handler.handle_pending_invocations())
+
+    verify(invocation_post_office).had_calls(
+        as_calls(
+            typed_call(InvocationPostOffice).post_result('first invocation id',
+                                                         dict(value='result for first invocation id')),
+            typed_call(InvocationPostOffice).post_result('second invocation id',
+                                                         dict(value='result for second invocation id')),
+        ),
+        any_order=True
+    )
+
+
+def test_generates_results_for_invocations_in_batch_concurrently() -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.collect_invocations).always_return([
+        an_invocation_with(invocation_id=f'invocation {index}') for index in range(3)
+    ])
+
+    async def handle_all_invocations() -> None:
+        # Only released once every invocation in the batch is being handled at the same time
+        barrier = asyncio.Barrier(3)
+
+        async def get_invocation_result(invocation: Invocation) -> Any:
+            await asyncio.wait_for(barrier.wait(), timeout=5)
+            return invocation.id
+
+        await AsyncInvocationHandler(invocation_post_office, get_invocation_result).handle_pending_invocations()
+
+    asyncio.run(handle_all_invocations())
+
+    verify(invocation_post_office).had_calls(
+        as_calls(*[
+            typed_call(InvocationPostOffice).post_result(f'invocation {index}', f'invocation {index}')
+            for index in range(3)
+        ]),
+        any_order=True
+    )
+
+
+def test_posts_results_for_other_invocations_in_batch_before_raising_failure() -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.collect_invocations).always_return([
+        an_invocation_with(invocation_id='failing invocation id'),
+        an_invocation_with(invocation_id='other invocation id'),
+    ])
+
+    async def get_invocation_result(invocation: Invocation) -> Any:
+        if invocation.id == 'failing invocation id':
+            raise RuntimeError('the failure')
+
+        return 'the result'
+
+    invocation_handler = AsyncInvocationHandler(invocation_post_office, get_invocation_result)
+
+    with pytest.raises(RuntimeError, match='the failure'):
+        asyncio.run(invocation_handler.handle_pending_invocations())
+
+    verify(invocation_post_office).had_calls(
+        as_calls(
+            typed_call(InvocationPostOffice).post_result('other invocation id', 'the result'),
+            typed_call(InvocationPostOffice).post_result(
+                'failing invocation id', dict(status='failed', context=dict(error='RuntimeError', cause='the failure'))
+            ),
+        ),
+        any_order=True
+    )
@@ -0,0 +1,169 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from aws_test_harness import AsyncTestHarness
+from aws_test_harness.domain.async_repeating_task_scheduler import AsyncRepeatingTaskScheduler
+from aws_test_harness.domain.aws_resource_factory import AwsResourceFactory
+from aws_test_harness.domain.aws_resource_registry import AwsResourceRegistry
+from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
+from aws_test_harness.domain.state_machine import StateMachine
+from aws_test_harness.domain.state_machine_execution import StateMachineExecution
+from aws_test_harness.domain.unknown_invocation_target_exception import UnknownInvocationTargetException
+from aws_test_harness_test_support.mocking import mock_class, when_calling, verify, inspect
+from aws_test_harness_tests.support.builders.invocation_builder import an_invocation_with
+
+
+@pytest.fixture(scope='function')
+def aws_resource_registry() -> AwsResourceRegistry:
+    return mock_class(AwsResourceRegistry)
+
+
+@pytest.fixture(scope='function')
+def aws_resource_factory() -> AwsResourceFactory:
+    return mock_class(AwsResourceFactory)
+
+
+@pytest.fixture(scope='function')
+def invocation_handler_repeating_task_scheduler() -> AsyncRepeatingTaskScheduler:
+    return mock_class(AsyncRepeatingTaskScheduler)
+
+
+@pytest.fixture(scope='function')
+def invocation_post_office() -> InvocationPostOffice:
+    return mock_class(InvocationPostOffice)
+
+
+@pytest.fixture(scope='function')
+def test_harness(aws_resource_registry: AwsResourceRegistry, invocation_post_office: InvocationPostOffice,
+                 invocation_handler_repeating_task_scheduler: AsyncRepeatingTaskScheduler,
+                 aws_resource_factory: AwsResourceFactory) -> AsyncTestHarness:
+    return AsyncTestHarness(aws_resource_registry, invocation_post_office, invocation_handler_repeating_task_scheduler,
+                            aws_resource_factory)
+
+
+def test_executes_state_machine_asynchronously(test_harness: AsyncTestHarness,
+                                               aws_resource_factory: AwsResourceFactory) -> None:
+    the_state_machine = mock_class(StateMachine)
+    the_execution = mock_class(StateMachineExecution)
+
+    async def execute_async(execution_input: Dict[str, Any]) -> StateMachineExecution:
+        return the_execution if execution_input == dict(number=1) else mock_class(StateMachineExecution)
+
+    when_calling(the_state_machine.execute_async).invoke(execute_async)
+    when_calling(aws_resource_factory.get_state_machine).invoke(
+        lambda resource_id: the_state_machine if resource_id == 'AddNumbersStateMachine' else None
+    )
+
+    execution = asyncio.run(test_harness.state_machine('AddNumbersStateMachine').execute(dict(number=1)))
+
+    assert execution == the_execution
+
+
+def test_handles_invocations_of_test_double_state_machine_with_asynchronous_handler(
+        test_harness: AsyncTestHarness, aws_resource_registry: AwsResourceRegistry,
+        invocation_handler_repeating_task_scheduler: AsyncRepeatingTaskScheduler,
+        invocation_post_office: InvocationPostOffice
+) -> None:
+    when_calling(aws_resource_registry.get_resource_arn).invoke(lambda resource_id: resource_id + 'ARN')
+    when_calling(invocation_handler_repeating_task_scheduler.scheduled).always_return(False)
+    when_calling(invocation_post_office.collect_invocations).always_return([
+        an_invocation_with(target='OrangeAWSTestHarnessStateMachineARN', invocation_id='123456789')
+    ])
+
+    async def execution_handler(_: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(0)
+        return dict(message='result message')
+
+    test_harness.twin_state_machine('Orange', execution_handler)
+
+    verify(invocation_handler_repeating_task_scheduler.schedule).was_called()
+    scheduled_task = inspect(invocation_handler_repeating_task_scheduler.schedule).call_args[0][0]
+    asyncio.run(scheduled_task())
+
+    verify(invocation_post_office.post_result).was_called_once_with(
+        '123456789',
+        dict(status='succeeded', context=dict(result=dict(message='result message')))
+    )
+
+
+def test_forgets_twins_and_resets_scheduler_when_asked_to_tear_down(
+        test_harness: AsyncTestHarness, aws_resource_registry: AwsResourceRegistry,
+        invocation_handler_repeating_task_scheduler: AsyncRepeatingTaskScheduler,
+        invocation_post_office: InvocationPostOffice
+) -> None:
+    when_calling(aws_resource_registry.get_resource_arn).invoke(lambda resource_id: resource_id + 'ARN')
+    when_calling(invocation_handler_repeating_task_scheduler.scheduled).always_return(False)
+    when_calling(invocation_post_office.collect_invocations).always_return([
+        an_invocation_with(target='OrangeAWSTestHarnessStateMachineARN')
+    ])
+
+    test_harness.twin_state_machine('Orange')
+    scheduled_task = inspect(invocation_handler_repeating_task_scheduler.schedule).call_args[0][0]
+
+    asyncio.run(test_harness.tear_down())
+
+    verify(invocation_handler_repeating_task_scheduler.reset_schedule_async).was_called()
+
+    with pytest.raises(UnknownInvocationTargetException):
+        asyncio.run(scheduled_task())
+
+
+def test_interrupts_collection_whilst_resetting_scheduler_then_flushes_results_when_asked_to_tear_down(
+        test_harness: AsyncTestHarness, invocation_handler_repeating_task_scheduler: AsyncRepeatingTaskScheduler,
+        invocation_post_office: InvocationPostOffice
+) -> None:
+    tear_down_steps: List[str] = []
+    when_calling(invocation_post_office.interrupt_collection).invoke(lambda: tear_down_steps.append('interrupt'))
+    when_calling(invocation_handler_repeating_task_scheduler.reset_schedule_async).invoke(
+        lambda: tear_down_steps.append('reset')
+    )
+    when_calling(invocation_post_office.resume_collection).invoke(lambda: tear_down_steps.append('resume'))
+    when_calling(invocation_post_office.flush).invoke(lambda: tear_down_steps.append('flush'))
+
+    asyncio.run(test_harness.tear_down())
+
+    assert tear_down_steps == ['interrupt', 'reset', 'resume', 'flush']
+
+
+def test_posts_results_for_invocations_already_collected_before_flushing_when_asked_to_tear_down(
+        test_harness: AsyncTestHarness, aws_resource_registry: AwsResourceRegistry,
+        invocation_handler_repeating_task_scheduler: AsyncRepeatingTaskScheduler,
+        invocation_post_office: InvocationPostOffice
+) -> None:
+    tear_down_steps: List[str] = []
+    when_calling(aws_resource_registry.get_resource_arn).invoke(lambda resource_id: resource_id + 'ARN')
+    when_calling(invocation_handler_repeating_task_scheduler.scheduled).always_return(False)
+    when_calling(invocation_post_office.collect_invocations).always_return([
+        an_invocation_with(target='OrangeAWSTestHarnessStateMachineARN', invocation_id='123456789')
+    ])
+    when_calling(invocation_post_office.post_result).invoke(lambda *_: tear_down_steps.append('post result'))
+    when_calling(invocation_post_office.flush).invoke(lambda: tear_down_steps.append('flush'))
+
+    async def handle_invocation_whilst_tearing_down() -> None:
+        execution_handler_started = asyncio.Event()
+        execution_handler_released = asyncio.Event()
+
+        async def execution_handler(_: Dict[str, Any]) -> Dict[str, Any]:
+            execution_handler_started.set()
+            await execution_handler_released.wait()
+            return dict(message='result message')
+
+        test_harness.twin_state_machine('Orange', execution_handler)
+        scheduled_task = inspect(invocation_handler_repeating_task_scheduler.schedule).call_args[0][0]
+        invocation_handling = asyncio.create_task(scheduled_task())
+        await asyncio.wait_for(execution_handler_started.wait(), timeout=5)
+
+        # Stopped as the scheduler would stop it, whilst waiting for the result
+        invocation_handling.cancel()
+        tear_down = asyncio.create_task(test_harness.tear_down())
+        await asyncio.sleep(0.01)
+        assert not tear_down.done()
+
+        execution_handler_released.set()
+        await asyncio.wait_for(tear_down, timeout=5)
+
+    asyncio.run(handle_invocation_whilst_tearing_down())
+
+    assert tear_down_steps == ['post result', 'flush']
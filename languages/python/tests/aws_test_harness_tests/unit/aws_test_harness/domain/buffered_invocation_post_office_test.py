@@ -0,0 +1,232 @@
+import threading
+from logging import Logger
+from threading import Event, Thread
+from time import time
+from typing import Any, Dict, List
+
+import pytest
+
+from aws_test_harness.domain.buffered_invocation_post_office import BufferedInvocationPostOffice
+from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
+from aws_test_harness.domain.results_not_posted_exception import ResultsNotPostedException
+from aws_test_harness_tests.support.builders.invocation_builder import an_invocation_with
+from aws_test_harness_test_support.eventual_consistency_utils import wait_for_value_matching
+from aws_test_harness_test_support.mocking import mock_class, when_calling, verify, inspect, as_calls, typed_call
+
+
+def test_provides_invocations_collected_from_underlying_post_office(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    invocations = [an_invocation_with(invocation_id='the invocation id')]
+    when_calling(invocation_post_office.collect_invocations).always_return(invocations)
+
+    buffered_post_office = BufferedInvocationPostOffice(invocation_post_office, logger)
+
+    assert buffered_post_office.collect_invocations() == invocations
+
+
+def test_posts_results_generated_within_linger_time_together(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    buffered_post_office = BufferedInvocationPostOffice(invocation_post_office, logger, result_linger_seconds=0.5)
+
+    buffered_post_office.post_result('first invocation id', 'first result')
+    buffered_post_office.post_result('second invocation id', 'second result')
+    buffered_post_office.flush()
+
+    verify(invocation_post_office.post_results).was_called_once_with(
+        {'first invocation id': 'first result', 'second invocation id': 'second result'}
+    )
+    verify(invocation_post_office.post_result).was_not_called()
+
+
+def test_posts_full_batch_without_waiting_for_linger_time(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    buffered_post_office = BufferedInvocationPostOffice(invocation_post_office, logger, result_linger_seconds=1,
+                                                        maximum_result_batch_size=2)
+
+    start_time = time()
+    buffered_post_office.post_results({'first invocation id': 'first result', 'second invocation id': 'second result',
+                                       'third invocation id': 'third result'})
+
+    wait_for_value_matching(
+        lambda: inspect(invocation_post_office.post_results).call_count,
+        'first batch posted',
+        lambda call_count: call_count == 1
+    )
+
+    assert time() - start_time < 0.5
+    verify(invocation_post_office.post_results).was_called_once_with(
+        {'first invocation id': 'first result', 'second invocation id': 'second result'}
+    )
+
+    buffered_post_office.flush()
+
+
+def test_posts_partial_batch_once_linger_time_elapsed(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    buffered_post_office = BufferedInvocationPostOffice(invocation_post_office, logger, result_linger_seconds=0.05)
+
+    buffered_post_office.post_result('the invocation id', 'the result')
+
+    wait_for_value_matching(
+        lambda: inspect(invocation_post_office.post_results).call_count,
+        'partial batch posted',
+        lambda call_count: call_count == 1
+    )
+
+    verify(invocation_post_office.post_results).was_called_once_with({'the invocation id': 'the result'})
+
+
+def test_blocks_posting_once_buffer_full_until_results_written(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    writes_permitted = Event()
+    posted_batches: List[Dict[str, Any]] = []
+
+    def post_results(results: Dict[str, Any]) -> None:
+        writes_permitted.wait(timeout=5)
+        posted_batches.append(results)
+
+    when_calling(invocation_post_office.post_results).invoke(post_results)
+
+    buffered_post_office = BufferedInvocationPostOffice(invocation_post_office, logger, result_linger_seconds=0.001,
+                                                        maximum_result_batch_size=1, maximum_buffered_results=1)
+
+    # Taken by the posting thread, which then waits until writes are permitted
+    buffered_post_office.post_result('first invocation id', 'first result')
+    wait_for_value_matching(
+        lambda: inspect(invocation_post_office.post_results).call_count,
+        'first result being written',
+        lambda call_count: call_count == 1
+    )
+
+    # Fills the buffer
+    buffered_post_office.post_result('second invocation id', 'second result')
+
+    posting_thread = Thread(target=buffered_post_office.post_result, args=('third invocation id', 'third result'),
+                            daemon=True)
+    posting_thread.start()
+    posting_thread.join(timeout=0.1)
+
+    assert posting_thread.is_alive()
+
+    writes_permitted.set()
+    posting_thread.join(timeout=5)
+    buffered_post_office.flush()
+
+    assert not posting_thread.is_alive()
+    assert posted_batches == [
+        {'first invocation id': 'first result'},
+        {'second invocation id': 'second result'},
+        {'third invocation id': 'third result'},
+    ]
+
+
+def test_posts_batch_again_after_failing_to_post_it() -> None:
+    logger = mock_class(Logger)
+    invocation_post_office = mock_class(InvocationPostOffice)
+    exception = Exception('Simulated exception')
+    when_calling(invocation_post_office.post_results).respond_with(exception, None)
+
+    buffered_post_office = BufferedInvocationPostOffice(invocation_post_office, logger,
+                                                        result_posting_retry_delay_seconds=0.001)
+
+    buffered_post_office.post_result('the invocation id', 'the result')
+    buffered_post_office.flush()
+
+    verify(logger.exception).was_called_once_with('Failed to post results for 1 invocation(s)', exc_info=exception)
+    verify(invocation_post_office).had_calls(as_calls(
+        typed_call(InvocationPostOffice).post_results({'the invocation id': 'the result'}),
+        typed_call(InvocationPostOffice).post_results({'the invocation id': 'the result'}),
+    ))
+
+
+def test_posts_again_only_results_that_failed_to_post_from_batch(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.post_results).respond_with(
+        ResultsNotPostedException('Simulated failure', ['second invocation id']),
+        None
+    )
+
+    buffered_post_office = BufferedInvocationPostOffice(invocation_post_office, logger, result_linger_seconds=0.5,
+                                                        result_posting_retry_delay_seconds=0.001)
+
+    buffered_post_office.post_results({'first invocation id': 'first result', 'second invocation id': 'second result'})
+    buffered_post_office.flush()
+
+    verify(invocation_post_office).had_calls(as_calls(
+        typed_call(InvocationPostOffice).post_results(
+            {'first invocation id': 'first result', 'second invocation id': 'second result'}
+        ),
+        typed_call(InvocationPostOffice).post_results({'second invocation id': 'second result'}),
+    ))
+
+
+def test_gives_up_posting_result_after_maximum_attempts() -> None:
+    logger = mock_class(Logger)
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.post_results).always_raise(Exception('Simulated exception'))
+
+    buffered_post_office = BufferedInvocationPostOffice(invocation_post_office, logger,
+                                                        maximum_result_posting_attempts=2,
+                                                        result_posting_retry_delay_seconds=0.001)
+
+    buffered_post_office.post_result('the invocation id', 'the result')
+    buffered_post_office.flush()
+
+    assert inspect(invocation_post_office.post_results).call_count == 2
+    verify(logger.error).was_called_once_with('Gave up posting result for invocation the invocation id after 2 '
+                                              'attempt(s)')
+
+
+def test_continues_posting_results_after_giving_up_on_others(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.post_results).respond_with(Exception('Simulated exception'), None)
+
+    buffered_post_office = BufferedInvocationPostOffice(invocation_post_office, logger,
+                                                        maximum_result_posting_attempts=1)
+
+    buffered_post_office.post_result('first invocation id', 'first result')
+    buffered_post_office.flush()
+    buffered_post_office.post_result('second invocation id', 'second result')
+    buffered_post_office.flush()
+
+    verify(invocation_post_office.post_results).was_called_with({'second invocation id': 'second result'})
+
+
+def test_stops_posting_thread_once_no_results_buffered(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    buffered_post_office = BufferedInvocationPostOffice(invocation_post_office, logger, result_linger_seconds=0.001)
+
+    buffered_post_office.post_result('first invocation id', 'first result')
+    buffered_post_office.flush()
+
+    wait_for_value_matching(
+        lambda: [thread for thread in threading.enumerate() if thread.name == 'BufferedInvocationPostOffice'],
+        'no posting threads',
+        lambda threads: threads == []
+    )
+
+    buffered_post_office.post_result('second invocation id', 'second result')
+    buffered_post_office.flush()
+
+    verify(invocation_post_office.post_results).was_called_with({'second invocation id': 'second result'})
+
+
+def test_rejects_maximum_result_posting_attempts_below_one(logger: Logger) -> None:
+    with pytest.raises(ValueError, match='Maximum result posting attempts must be at least 1 but was 0'):
+        BufferedInvocationPostOffice(mock_class(InvocationPostOffice), logger, maximum_result_posting_attempts=0)
+
+
+def test_rejects_batch_size_below_one(logger: Logger) -> None:
+    with pytest.raises(ValueError, match='Maximum result batch size must be at least 1 but was 0'):
+        BufferedInvocationPostOffice(mock_class(InvocationPostOffice), logger, maximum_result_batch_size=0)
+
+
+def test_interrupts_and_resumes_collection_by_underlying_post_office(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    buffered_post_office = BufferedInvocationPostOffice(invocation_post_office, logger)
+
+    buffered_post_office.interrupt_collection()
+    verify(invocation_post_office.interrupt_collection).was_called_once()
+
+    buffered_post_office.resume_collection()
+    verify(invocation_post_office.resume_collection).was_called_once()
@@ -0,0 +1,32 @@
+from itertools import islice
+
+import pytest
+
+from aws_test_harness.domain.exponential_backoff import ExponentialBackoff
+
+
+def test_multiplies_delay_after_each_attempt() -> None:
+    backoff = ExponentialBackoff(initial_delay_seconds=0.1, maximum_delay_seconds=10, multiplier=3)
+
+    assert list(islice(backoff.delays(), 4)) == pytest.approx([0.1, 0.3, 0.9, 2.7])
+
+
+def test_caps_delay_at_maximum() -> None:
+    backoff = ExponentialBackoff(initial_delay_seconds=1, maximum_delay_seconds=5, multiplier=2)
+
+    assert list(islice(backoff.delays(), 6)) == [1, 2, 4, 5, 5, 5]
+
+
+def test_rejects_non_positive_initial_delay() -> None:
+    with pytest.raises(ValueError, match='Initial delay must be positive'):
+        ExponentialBackoff(initial_delay_seconds=0, maximum_delay_seconds=1)
+
+
+def test_rejects_maximum_delay_below_initial_delay() -> None:
+    with pytest.raises(ValueError, match='must be at least the initial delay'):
+        ExponentialBackoff(initial_delay_seconds=2, maximum_delay_seconds=1)
+
+
+def test_rejects_multiplier_below_one() -> None:
+    with pytest.raises(ValueError, match='Multiplier must be at least 1'):
+        ExponentialBackoff(initial_delay_seconds=1, maximum_delay_seconds=2, multiplier=0.5)
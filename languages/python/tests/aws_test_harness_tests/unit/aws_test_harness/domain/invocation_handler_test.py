@@ -1,22 +1,32 @@
+from logging import Logger
+from threading import Barrier, Event, Thread, enumerate as enumerate_threads
+from typing import Any, List
+
+import pytest
+
+from aws_test_harness.domain.invocation import Invocation
 from aws_test_harness.domain.invocation_handler import InvocationHandler
 from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
 from aws_test_harness_tests.support.builders.invocation_builder import an_invocation_with
-from aws_test_harness_test_support.mocking import mock_class, verify, when_calling
+from aws_test_harness_test_support.eventual_consistency_utils import wait_for_value_matching
+from aws_test_harness_test_support.mocking import mock_class, verify, when_calling, as_calls, typed_call, inspect
 
 
-def test_posts_generated_result_for_invocation_collected_from_post_office() -> None:
+def test_posts_generated_result_for_invocation_collected_from_post_office(logger: Logger) -> None:
     invocation_post_office = mock_class(InvocationPostOffice)
     the_invocation = an_invocation_with(invocation_id='the invocation id')
-    when_calling(invocation_post_office.maybe_collect_invocation).always_return(the_invocation)
+    when_calling(invocation_post_office.collect_invocations).always_return([the_invocation])
 
     invocation_handler = InvocationHandler(
         invocation_post_office,
         get_invocation_result=(
             lambda invocation: dict(value="the invocation result") if invocation == the_invocation else None
-        )
+        ),
+        logger=logger
     )
 
-    invocation_handler.handle_pending_invocation()
+    invocation_handler.handle_pending_invocations()
+    invocation_handler.wait_for_pending_invocations()
 
     verify(invocation_post_office.post_result).was_called_once_with(
         "the invocation id",
@@ -24,15 +34,225 @@ def test_posts_generated_result_for_invocation_collected_from_post_office() -> N
     )
 
 
-def test_does_not_post_a_result_if_no_invocation_collected() -> None:
+def test_posts_generated_result_for_each_invocation_in_batch_collected_from_post_office(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.collect_invocations).always_return([
+        an_invocation_with(invocation_id='first invocation id'),
+        an_invocation_with(invocation_id='second invocation id'),
+        an_invocation_with(invocation_id='third invocation id'),
+    ])
+
+    invocation_handler = InvocationHandler(
+        invocation_post_office,
+        get_invocation_result=lambda invocation: dict(value=f'result for {invocation.id}'),
+        logger=logger
+    )
+
+    invocation_handler.handle_pending_invocations()
+    invocation_handler.wait_for_pending_invocations()
+
+    verify(invocation_post_office).had_calls(
+        as_calls(
+            typed_call(InvocationPostOffice).post_result('first invocation id',
+                                                         dict(value='result for first invocation id')),
+            typed_call(InvocationPostOffice).post_result('second invocation id',
+                                                         dict(value='result for second invocation id')),
+            typed_call(InvocationPostOffice).post_result('third invocation id',
+                                                         dict(value='result for third invocation id')),
+        ),
+        any_order=True
+    )
+
+
+def test_generates_results_for_invocations_in_batch_concurrently(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.collect_invocations).always_return([
+        an_invocation_with(invocation_id='first invocation id'),
+        an_invocation_with(invocation_id='second invocation id'),
+    ])
+
+    # Each result can only be generated once both invocations are being handled at the same time
+    barrier = Barrier(2, timeout=5)
+
+    def get_invocation_result(invocation: Invocation) -> Any:
+        barrier.wait()
+        return dict(value=f'result for {invocation.id}')
+
+    invocation_handler = InvocationHandler(invocation_post_office, get_invocation_result, logger)
+
+    invocation_handler.handle_pending_invocations()
+    invocation_handler.wait_for_pending_invocations()
+
+    verify(invocation_post_office.post_result).had_call('first invocation id',
+                                                       dict(value='result for first invocation id'))
+    verify(invocation_post_office.post_result).had_call('second invocation id',
+                                                       dict(value='result for second invocation id'))
+
+
+def test_collects_next_invocations_whilst_results_generated_for_last(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.collect_invocations).respond_with(
+        [an_invocation_with(invocation_id='first invocation id')],
+        [an_invocation_with(invocation_id='second invocation id')]
+    )
+    first_result_permitted = Event()
+
+    def get_invocation_result(invocation: Invocation) -> Any:
+        if invocation.id == 'first invocation id':
+            first_result_permitted.wait(timeout=5)
+
+        return dict(value=f'result for {invocation.id}')
+
+    invocation_handler = InvocationHandler(invocation_post_office, get_invocation_result, logger)
+
+    invocation_handler.handle_pending_invocations()
+    invocation_handler.handle_pending_invocations()
+
+    wait_for_value_matching(
+        lambda: inspect(invocation_post_office.post_result).call_count,
+        'second result posted',
+        lambda call_count: call_count == 1
+    )
+    verify(invocation_post_office.post_result).was_called_once_with('second invocation id',
+                                                                    dict(value='result for second invocation id'))
+
+    first_result_permitted.set()
+    invocation_handler.wait_for_pending_invocations()
+
+
+def test_blocks_collection_once_maximum_pending_invocations_reached(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.collect_invocations).always_return([
+        an_invocation_with(invocation_id='first invocation id'),
+        an_invocation_with(invocation_id='second invocation id'),
+    ])
+    results_permitted = Event()
+    handled_invocation_ids: List[str] = []
+
+    def get_invocation_result(invocation: Invocation) -> Any:
+        results_permitted.wait(timeout=5)
+        handled_invocation_ids.append(invocation.id)
+        return dict(value=f'result for {invocation.id}')
+
+    invocation_handler = InvocationHandler(invocation_post_office, get_invocation_result, logger,
+                                           max_concurrent_invocations=1, max_pending_invocations=1)
+
+    collecting_thread = Thread(target=invocation_handler.handle_pending_invocations, daemon=True)
+    collecting_thread.start()
+    collecting_thread.join(timeout=0.1)
+
+    assert collecting_thread.is_alive()
+
+    results_permitted.set()
+    collecting_thread.join(timeout=5)
+    invocation_handler.wait_for_pending_invocations()
+
+    assert not collecting_thread.is_alive()
+    assert handled_invocation_ids == ['first invocation id', 'second invocation id']
+
+
+def test_posts_error_result_for_invocation_whose_result_fails_to_generate() -> None:
+    logger = mock_class(Logger)
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.collect_invocations).always_return([
+        an_invocation_with(invocation_id='failing invocation id'),
+        an_invocation_with(invocation_id='successful invocation id'),
+    ])
+    exception = Exception('Simulated exception')
+
+    def get_invocation_result(invocation: Invocation) -> Any:
+        if invocation.id == 'failing invocation id':
+            raise exception
+
+        return dict(value='the invocation result')
+
+    invocation_handler = InvocationHandler(invocation_post_office, get_invocation_result, logger)
+
+    invocation_handler.handle_pending_invocations()
+    invocation_handler.wait_for_pending_invocations()
+
+    verify(invocation_post_office).had_calls(
+        as_calls(
+            typed_call(InvocationPostOffice).post_result('successful invocation id',
+                                                         dict(value='the invocation result')),
+            typed_call(InvocationPostOffice).post_result(
+                'failing invocation id',
+                dict(status='failed', context=dict(error='Exception', cause='Simulated exception'))
+            ),
+        ),
+        any_order=True
+    )
+    verify(logger.exception).was_called_once_with('Failed to generate result for invocation failing invocation id',
+                                                  exc_info=exception)
+
+
+def test_reports_invocation_whose_result_fails_to_post() -> None:
+    logger = mock_class(Logger)
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.collect_invocations).always_return([
+        an_invocation_with(invocation_id='the invocation id')
+    ])
+    exception = Exception('Simulated exception')
+    when_calling(invocation_post_office.post_result).always_raise(exception)
+
+    invocation_handler = InvocationHandler(invocation_post_office, lambda _: dict(), logger)
+
+    invocation_handler.handle_pending_invocations()
+    invocation_handler.wait_for_pending_invocations()
+
+    verify(logger.exception).was_called_once_with('Failed to handle invocation the invocation id', exc_info=exception)
+
+
+def test_does_not_post_a_result_if_no_invocation_collected(logger: Logger) -> None:
     invocation_post_office = mock_class(InvocationPostOffice)
-    when_calling(invocation_post_office.maybe_collect_invocation).always_return(None)
+    when_calling(invocation_post_office.collect_invocations).always_return([])
 
     invocation_handler = InvocationHandler(
         invocation_post_office,
-        get_invocation_result=lambda _: dict(value="any invocation result")
+        get_invocation_result=lambda _: dict(value="any invocation result"),
+        logger=logger
     )
 
-    invocation_handler.handle_pending_invocation()
+    invocation_handler.handle_pending_invocations()
+    invocation_handler.wait_for_pending_invocations()
 
     verify(invocation_post_office.post_result).was_not_called()
+
+
+def test_stops_worker_threads_on_shutdown(logger: Logger) -> None:
+    threads_before = set(enumerate_threads())
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.collect_invocations).always_return([an_invocation_with()])
+    invocation_handler = InvocationHandler(invocation_post_office, lambda _: dict(), logger)
+
+    invocation_handler.handle_pending_invocations()
+    invocation_handler.wait_for_pending_invocations()
+    invocation_handler.shutdown()
+
+    assert [thread for thread in enumerate_threads()
+            if thread not in threads_before and thread.name.startswith('InvocationHandler')] == []
+
+
+def test_handles_invocations_collected_after_shutdown(logger: Logger) -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.collect_invocations).respond_with(
+        [an_invocation_with(invocation_id='first invocation id')],
+        [an_invocation_with(invocation_id='second invocation id')]
+    )
+    invocation_handler = InvocationHandler(invocation_post_office, lambda invocation: dict(value=invocation.id), logger)
+
+    invocation_handler.handle_pending_invocations()
+    invocation_handler.wait_for_pending_invocations()
+    invocation_handler.shutdown()
+    invocation_handler.handle_pending_invocations()
+    invocation_handler.wait_for_pending_invocations()
+    invocation_handler.shutdown()
+
+    verify(invocation_post_office.post_result).had_call('second invocation id', dict(value='second invocation id'))
+
+
+def test_rejects_maximum_pending_invocations_below_maximum_concurrent_invocations(logger: Logger) -> None:
+    with pytest.raises(ValueError, match=r'Maximum pending invocations must be at least the maximum concurrent '
+                                         r'invocations \(2\) but was 1'):
+        InvocationHandler(mock_class(InvocationPostOffice), lambda _: None, logger, max_concurrent_invocations=2,
+                          max_pending_invocations=1)
@@ -1,7 +1,9 @@
 import pytest
 
 from aws_test_harness.domain.aws_resource_registry import AwsResourceRegistry
+from aws_test_harness.domain.invocation_stage_timing import RESULT_GENERATION_STAGE
 from aws_test_harness.domain.invocation_target_twin_service import InvocationTargetTwinService
+from aws_test_harness.domain.invocation_timing_recorder import InvocationTimingRecorder
 from aws_test_harness.domain.unknown_invocation_target_exception import UnknownInvocationTargetException
 from aws_test_harness_test_support.mocking import mock_class, when_calling
 from aws_test_harness_tests.support.builders.invocation_builder import an_invocation_with
@@ -61,3 +63,19 @@ def test_forgets_invocation_targets_when_reset() -> None:
 
     with pytest.raises(UnknownInvocationTargetException, match='OrangeAWSTestHarnessStateMachineARN'):
         twin_service.generate_result_for_invocation(invocation)
+
+
+def test_records_time_taken_by_twin_to_generate_result_when_timing_invocations() -> None:
+    aws_resource_registry = mock_class(AwsResourceRegistry)
+    when_calling(aws_resource_registry.get_resource_arn).invoke(lambda resource_id: f'{resource_id}ARN')
+    timing_recorder = InvocationTimingRecorder()
+    twin_service = InvocationTargetTwinService(aws_resource_registry, timing_recorder)
+    twin_service.create_twin_for_state_machine('Orange', lambda _: dict())
+
+    twin_service.generate_result_for_invocation(
+        an_invocation_with(target='OrangeAWSTestHarnessStateMachineARN', invocation_id='the invocation id')
+    )
+
+    assert [(timing.stage, timing.invocation_id) for timing in timing_recorder.timings] == [
+        (RESULT_GENERATION_STAGE, 'the invocation id')
+    ]
@@ -0,0 +1,36 @@
+from aws_test_harness.domain.invocation_stage_timing import InvocationStageTiming
+from aws_test_harness.domain.invocation_trace_report import InvocationTraceReport
+
+
+def test_provides_timings_recorded_for_invocation_in_order_of_start_time() -> None:
+    report = InvocationTraceReport()
+    result_posting_timing = InvocationStageTiming('result_posting', 3, 0.5, 'the invocation id')
+    queue_delivery_timing = InvocationStageTiming('queue_delivery', 1, 0.5, 'the invocation id')
+    report.record(result_posting_timing)
+    report.record(queue_delivery_timing)
+    report.record(InvocationStageTiming('queue_delivery', 2, 0.5, 'another invocation id'))
+
+    assert report.timings_for('the invocation id') == [queue_delivery_timing, result_posting_timing]
+    assert report.invocation_ids == ['the invocation id', 'another invocation id']
+
+
+def test_ignores_timings_for_batches_of_invocations() -> None:
+    report = InvocationTraceReport()
+
+    report.record(InvocationStageTiming('collection', 1, 0.5))
+
+    assert report.invocation_ids == []
+
+
+def test_provides_no_timings_for_unknown_invocation() -> None:
+    assert InvocationTraceReport().timings_for('unknown invocation id') == []
+
+
+def test_forgets_timings_once_cleared() -> None:
+    report = InvocationTraceReport()
+    report.record(InvocationStageTiming('queue_delivery', 1, 0.5, 'the invocation id'))
+
+    report.clear()
+
+    assert report.invocation_ids == []
+    assert report.timings_for('the invocation id') == []
@@ -0,0 +1,21 @@
+from logging import Logger
+
+from aws_test_harness.domain.invocation_stage_timing import InvocationStageTiming
+from aws_test_harness.domain.logging_invocation_timing_sink import LoggingInvocationTimingSink
+from aws_test_harness_test_support.mocking import mock_class, verify
+
+
+def test_logs_duration_of_stage_for_invocation() -> None:
+    logger = mock_class(Logger)
+
+    LoggingInvocationTimingSink(logger).record(InvocationStageTiming('the_stage', 0, 0.0125, 'the invocation id'))
+
+    verify(logger.info).was_called_once_with('Stage the_stage took 12.5ms for invocation the invocation id')
+
+
+def test_logs_duration_of_stage_for_batch_of_invocations() -> None:
+    logger = mock_class(Logger)
+
+    LoggingInvocationTimingSink(logger).record(InvocationStageTiming('the_stage', 0, 0.5))
+
+    verify(logger.info).was_called_once_with('Stage the_stage took 500.0ms')
@@ -0,0 +1,71 @@
+from concurrent.futures import Future
+from logging import Logger
+from typing import List
+
+import pytest
+
+from aws_test_harness.domain.exponential_backoff import ExponentialBackoff
+from aws_test_harness.domain.state_machine_execution import StateMachineExecution
+from aws_test_harness.domain.state_machine_execution_batch_waiter import StateMachineExecutionBatchWaiter
+from aws_test_harness.domain.state_machine_execution_description import StateMachineExecutionDescription
+from aws_test_harness.infrastructure.step_functions_execution_watcher import StepFunctionsExecutionWatcher
+from aws_test_harness_test_support.mocking import mock_class, when_calling, verify
+
+RUNNING = StateMachineExecutionDescription(status='RUNNING')
+SUCCEEDED = StateMachineExecutionDescription(status='SUCCEEDED')
+
+
+def a_completed_future(description: StateMachineExecutionDescription) -> Future[StateMachineExecutionDescription]:
+    future: Future[StateMachineExecutionDescription] = Future()
+    future.set_result(description)
+    return future
+
+
+def test_waits_for_every_execution_to_complete() -> None:
+    executions = [mock_class(StateMachineExecution) for _ in range(3)]
+
+    for execution in executions:
+        when_calling(execution.completion).always_return(a_completed_future(SUCCEEDED))
+
+    StateMachineExecutionBatchWaiter().wait_for_all(executions)
+
+    for execution in executions:
+        verify(execution.completion).was_called_once()
+
+
+def test_polls_executions_sharing_a_watcher_together_rather_than_one_after_another(logger: Logger) -> None:
+    described_executions: List[str] = []
+    watcher = StepFunctionsExecutionWatcher(
+        logger, 1000, ExponentialBackoff(initial_delay_seconds=0.05, maximum_delay_seconds=0.05),
+        ExponentialBackoff(initial_delay_seconds=0.001, maximum_delay_seconds=0.001)
+    )
+
+    def an_execution_named(name: str) -> StateMachineExecution:
+        execution = mock_class(StateMachineExecution)
+        responses = iter([RUNNING, RUNNING, SUCCEEDED])
+
+        def describe() -> StateMachineExecutionDescription:
+            described_executions.append(name)
+            return next(responses)
+
+        when_calling(execution.describe).invoke(describe)
+        when_calling(execution.completion).invoke(lambda: watcher.watch(execution))
+        return execution
+
+    StateMachineExecutionBatchWaiter().wait_for_all([an_execution_named(name) for name in ['first', 'second', 'third']])
+
+    assert described_executions == ['first', 'second', 'third'] * 3
+
+
+def test_raises_failure_to_determine_whether_an_execution_completed() -> None:
+    failed_completion: Future[StateMachineExecutionDescription] = Future()
+    failed_completion.set_exception(Exception('Simulated failure'))
+    execution = mock_class(StateMachineExecution)
+    when_calling(execution.completion).always_return(failed_completion)
+
+    with pytest.raises(Exception, match='Simulated failure'):
+        StateMachineExecutionBatchWaiter().wait_for_all([execution])
+
+
+def test_returns_immediately_when_no_executions_to_wait_for() -> None:
+    StateMachineExecutionBatchWaiter().wait_for_all([])
@@ -1,3 +1,7 @@
+import asyncio
+from threading import Thread
+from typing import Any, Dict
+
 from aws_test_harness.domain.state_machine_execution_failure import StateMachineExecutionFailure
 from aws_test_harness.domain.state_machine_twin import StateMachineTwin
 from aws_test_harness_tests.support.builders.invocation_builder import any_invocation, an_invocation_with
@@ -89,3 +93,92 @@ def test_indicates_failure_result_if_execution_handler_returns_state_machine_exe
     result = state_machine_twin.get_result_for(any_invocation())
 
     assert result == dict(status='failed', context=dict(error='TheError', cause='the cause of failure'))
+
+
+def test_records_every_invocation_when_invoked_concurrently() -> None:
+    state_machine_twin = StateMachineTwin()
+    thread_count = 8
+    invocations_per_thread = 100
+
+    def invoke_repeatedly(thread_index: int) -> None:
+        for invocation_index in range(invocations_per_thread):
+            state_machine_twin.get_result_for(
+                an_invocation_with(parameters=dict(input=dict(message=f'{thread_index}-{invocation_index}')))
+            )
+
+    threads = [Thread(target=invoke_repeatedly, args=[thread_index]) for thread_index in range(thread_count)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert state_machine_twin.invocation_count == thread_count * invocations_per_thread
+    assert len(state_machine_twin.invocations) == thread_count * invocations_per_thread
+    assert {invocation[0]['message'] for invocation in state_machine_twin.invocations} == {
+        f'{thread_index}-{invocation_index}'
+        for thread_index in range(thread_count)
+        for invocation_index in range(invocations_per_thread)
+    }
+
+
+def test_records_invocation_args_as_received_even_if_execution_handler_mutates_them() -> None:
+    def mutating_execution_handler(execution_input: Dict[str, Any]) -> Dict[str, Any]:
+        execution_input['message'] = 'mutated message'
+        return dict()
+
+    state_machine_twin = StateMachineTwin(mutating_execution_handler)
+
+    state_machine_twin.get_result_for(an_invocation_with(parameters=dict(input=dict(message='the message'))))
+
+    assert state_machine_twin.invocations[0][0]['message'] == 'the message'
+
+
+def test_provides_snapshot_of_invocation_history_at_time_of_reading() -> None:
+    state_machine_twin = StateMachineTwin()
+    state_machine_twin.get_result_for(an_invocation_with(parameters=dict(input=dict(message='message 1'))))
+
+    invocations = state_machine_twin.invocations
+    state_machine_twin.get_result_for(an_invocation_with(parameters=dict(input=dict(message='message 2'))))
+
+    assert len(invocations) == 1
+    assert invocations == [[dict(message='message 1')]]
+    assert state_machine_twin.invocations == [[dict(message='message 1')], [dict(message='message 2')]]
+
+
+def test_uses_result_of_asynchronous_execution_handler() -> None:
+    async def execution_handler(execution_input: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(0)
+        return dict(message=f'{execution_input["message"]} handled asynchronously')
+
+    state_machine_twin = StateMachineTwin(execution_handler)
+
+    result = state_machine_twin.get_result_for(an_invocation_with(parameters=dict(input=dict(message='hello'))))
+
+    assert result == dict(status='succeeded', context=dict(result=dict(message='hello handled asynchronously')))
+
+
+def test_awaits_asynchronous_execution_handler_on_running_event_loop() -> None:
+    async def execution_handler(_: Dict[str, Any]) -> StateMachineExecutionFailure:
+        await asyncio.sleep(0)
+        return StateMachineExecutionFailure(error='AnError', cause='a cause')
+
+    state_machine_twin = StateMachineTwin(execution_handler)
+
+    result = asyncio.run(state_machine_twin.get_result_for_async(
+        an_invocation_with(parameters=dict(input=dict(message='hello')))
+    ))
+
+    assert result == dict(status='failed', context=dict(error='AnError', cause='a cause'))
+    assert state_machine_twin.invocations == [[dict(message='hello')]]
+
+
+def test_provides_result_of_synchronous_execution_handler_on_event_loop() -> None:
+    state_machine_twin = StateMachineTwin(lambda execution_input: dict(echo=execution_input['message']))
+
+    result = asyncio.run(state_machine_twin.get_result_for_async(
+        an_invocation_with(parameters=dict(input=dict(message='hello')))
+    ))
+
+    assert result == dict(status='succeeded', context=dict(result=dict(echo='hello')))
@@ -1,3 +1,6 @@
+from logging import Logger
+from typing import List
+
 import pytest
 
 from aws_test_harness.domain.aws_resource_factory import AwsResourceFactory
@@ -5,8 +8,10 @@ from aws_test_harness.domain.aws_resource_registry import AwsResourceRegistry
 from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
 from aws_test_harness.domain.repeating_task_scheduler import RepeatingTaskScheduler
 from aws_test_harness.domain.s3_bucket import S3Bucket
+from aws_test_harness.domain.state_machine_execution import StateMachineExecution
 from aws_test_harness.domain.unknown_invocation_target_exception import UnknownInvocationTargetException
 from aws_test_harness import TestHarness
+from aws_test_harness_test_support.eventual_consistency_utils import wait_for_value_matching
 from aws_test_harness_test_support.mocking import mock_class, when_calling, verify, inspect
 from aws_test_harness_tests.support.builders.invocation_builder import an_invocation_with
 
@@ -31,12 +36,25 @@ def invocation_post_office() -> InvocationPostOffice:
     return mock_class(InvocationPostOffice)
 
 
+@pytest.fixture(scope='function')
+def harness_logger() -> Logger:
+    return mock_class(Logger)
+
+
 @pytest.fixture(scope='function')
 def test_harness(aws_resource_registry: AwsResourceRegistry, invocation_post_office: InvocationPostOffice,
                  invocation_handler_repeating_task_scheduler: RepeatingTaskScheduler,
-                 aws_resource_factory: AwsResourceFactory) -> TestHarness:
+                 aws_resource_factory: AwsResourceFactory, harness_logger: Logger) -> TestHarness:
     return TestHarness(aws_resource_registry, invocation_post_office, invocation_handler_repeating_task_scheduler,
-                       aws_resource_factory)
+                       aws_resource_factory, harness_logger)
+
+
+def wait_for_result_to_be_posted(invocation_post_office: InvocationPostOffice) -> None:
+    wait_for_value_matching(
+        lambda: inspect(invocation_post_office.post_result).call_count,
+        'result posted',
+        lambda call_count: call_count == 1
+    )
 
 
 def test_provides_object_to_interact_with_test_s3_bucket(test_harness: TestHarness,
@@ -58,9 +76,9 @@ def test_provides_object_to_control_test_double_state_machine(
 ) -> None:
     when_calling(aws_resource_registry.get_resource_arn).invoke(lambda resource_id: resource_id + 'ARN')
     when_calling(invocation_handler_repeating_task_scheduler.scheduled).always_return(False)
-    when_calling(invocation_post_office.maybe_collect_invocation).always_return(
+    when_calling(invocation_post_office.collect_invocations).always_return([
         an_invocation_with(target='OrangeAWSTestHarnessStateMachineARN', invocation_id='123456789')
-    )
+    ])
 
     test_harness.twin_state_machine(
         'Orange',
@@ -70,6 +88,7 @@ def test_provides_object_to_control_test_double_state_machine(
     verify(invocation_handler_repeating_task_scheduler.schedule).was_called()
     scheduled_task = inspect(invocation_handler_repeating_task_scheduler.schedule).call_args[0][0]
     scheduled_task()
+    wait_for_result_to_be_posted(invocation_post_office)
 
     verify(invocation_post_office.post_result).was_called_once_with(
         invocation_id='123456789',
@@ -84,15 +103,16 @@ def test_uses_default_test_double_state_machine_execution_handler_if_none_provid
 ) -> None:
     when_calling(aws_resource_registry.get_resource_arn).invoke(lambda resource_id: resource_id + 'ARN')
     when_calling(invocation_handler_repeating_task_scheduler.scheduled).always_return(False)
-    when_calling(invocation_post_office.maybe_collect_invocation).always_return(
+    when_calling(invocation_post_office.collect_invocations).always_return([
         an_invocation_with(target='OrangeAWSTestHarnessStateMachineARN', invocation_id='123456789')
-    )
+    ])
 
     test_harness.twin_state_machine('Orange')
 
     verify(invocation_handler_repeating_task_scheduler.schedule).was_called()
     scheduled_task = inspect(invocation_handler_repeating_task_scheduler.schedule).call_args[0][0]
     scheduled_task()
+    wait_for_result_to_be_posted(invocation_post_office)
 
     verify(invocation_post_office.post_result).was_called_once_with(
         invocation_id='123456789',
@@ -125,20 +145,59 @@ def test_resets_repeating_task_scheduler_when_asked_to_tear_down(
 def test_forgets_mocks_when_asked_to_tear_down(
         test_harness: TestHarness, aws_resource_registry: AwsResourceRegistry,
         invocation_handler_repeating_task_scheduler: RepeatingTaskScheduler,
-        invocation_post_office: InvocationPostOffice
+        invocation_post_office: InvocationPostOffice, harness_logger: Logger
 ) -> None:
     when_calling(aws_resource_registry.get_resource_arn).invoke(lambda resource_id: resource_id + 'ARN')
     when_calling(invocation_handler_repeating_task_scheduler.scheduled).always_return(False)
-    when_calling(invocation_post_office.maybe_collect_invocation).always_return(
+    when_calling(invocation_post_office.collect_invocations).always_return([
         an_invocation_with(target='OrangeAWSTestHarnessStateMachineARN')
-    )
+    ])
 
     test_harness.twin_state_machine('Orange')
 
     verify(invocation_handler_repeating_task_scheduler.schedule).was_called()
     scheduled_task = inspect(invocation_handler_repeating_task_scheduler.schedule).call_args[0][0]
 
+    test_harness.tear_down()
+    scheduled_task()
+
+    wait_for_value_matching(
+        lambda: inspect(harness_logger.exception).call_args,
+        'invocation handling failure reported',
+        lambda call_args: call_args is not None
+    )
+    assert isinstance(inspect(harness_logger.exception).call_args.kwargs['exc_info'],
+                      UnknownInvocationTargetException)
+    wait_for_value_matching(
+        lambda: inspect(invocation_post_office.post_result).call_args,
+        'error result posted',
+        lambda call_args: call_args is not None
+    )
+    assert inspect(invocation_post_office.post_result).call_args.args[1]['context']['error'] == \
+        'UnknownInvocationTargetException'
+
+
+def test_waits_for_all_started_state_machine_executions_to_complete(test_harness: TestHarness) -> None:
+    executions = [mock_class(StateMachineExecution) for _ in range(2)]
+
+    test_harness.wait_for_state_machine_executions(executions)
+
+    for execution in executions:
+        verify(execution.completion).was_called_once()
+
+
+def test_interrupts_collection_whilst_resetting_scheduler_then_flushes_results_when_asked_to_tear_down(
+        test_harness: TestHarness, invocation_handler_repeating_task_scheduler: RepeatingTaskScheduler,
+        invocation_post_office: InvocationPostOffice
+) -> None:
+    tear_down_steps: List[str] = []
+    when_calling(invocation_post_office.interrupt_collection).invoke(lambda: tear_down_steps.append('interrupt'))
+    when_calling(invocation_handler_repeating_task_scheduler.reset_schedule).invoke(
+        lambda: tear_down_steps.append('reset')
+    )
+    when_calling(invocation_post_office.resume_collection).invoke(lambda: tear_down_steps.append('resume'))
+    when_calling(invocation_post_office.flush).invoke(lambda: tear_down_steps.append('flush'))
+
     test_harness.tear_down()
 
-    with pytest.raises(UnknownInvocationTargetException):
-        scheduled_task()
+    assert tear_down_steps == ['interrupt', 'reset', 'resume', 'flush']
@@ -0,0 +1,71 @@
+from time import time
+
+from aws_test_harness.domain.invocation_post_office import InvocationPostOffice
+from aws_test_harness.domain.invocation_stage_timing import COLLECTION_STAGE, QUEUE_DELIVERY_STAGE, \
+    RESULT_POSTING_STAGE
+from aws_test_harness.domain.invocation_timing_recorder import InvocationTimingRecorder
+from aws_test_harness.domain.timed_invocation_post_office import TimedInvocationPostOffice
+from aws_test_harness_tests.support.builders.invocation_builder import an_invocation_with
+from aws_test_harness_test_support.mocking import mock_class, when_calling, verify
+
+
+def test_records_collection_and_queue_delivery_of_collected_invocations() -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    sent_time = time() - 2
+    invocations = [an_invocation_with(invocation_id='the invocation id', sent_time=sent_time),
+                   an_invocation_with(invocation_id='unstamped invocation id')]
+    when_calling(invocation_post_office.collect_invocations).always_return(invocations)
+    timing_recorder = InvocationTimingRecorder()
+
+    collected_invocations = TimedInvocationPostOffice(invocation_post_office, timing_recorder).collect_invocations()
+
+    assert collected_invocations == invocations
+    assert [(timing.stage, timing.invocation_id) for timing in timing_recorder.timings] == [
+        (COLLECTION_STAGE, None),
+        (QUEUE_DELIVERY_STAGE, 'the invocation id'),
+    ]
+
+    queue_delivery_timing = timing_recorder.timings[1]
+    assert queue_delivery_timing.start_time == sent_time
+    assert 2 <= queue_delivery_timing.duration_seconds < 3
+
+
+def test_records_nothing_when_no_invocations_collected() -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    when_calling(invocation_post_office.collect_invocations).always_return([])
+    timing_recorder = InvocationTimingRecorder()
+
+    TimedInvocationPostOffice(invocation_post_office, timing_recorder).collect_invocations()
+
+    assert timing_recorder.timings == []
+
+
+def test_records_result_posting_for_each_posted_result() -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    timing_recorder = InvocationTimingRecorder()
+    timed_invocation_post_office = TimedInvocationPostOffice(invocation_post_office, timing_recorder)
+
+    timed_invocation_post_office.post_result('first invocation id', 'first result')
+    timed_invocation_post_office.post_results({'second invocation id': 'second result',
+                                               'third invocation id': 'third result'})
+
+    verify(invocation_post_office.post_result).was_called_once_with('first invocation id', 'first result')
+    verify(invocation_post_office.post_results).was_called_once_with(
+        {'second invocation id': 'second result', 'third invocation id': 'third result'}
+    )
+    assert [(timing.stage, timing.invocation_id) for timing in timing_recorder.timings] == [
+        (RESULT_POSTING_STAGE, 'first invocation id'),
+        (RESULT_POSTING_STAGE, 'second invocation id'),
+        (RESULT_POSTING_STAGE, 'third invocation id'),
+    ]
+
+
+def test_interrupts_and_resumes_collection_by_underlying_post_office() -> None:
+    invocation_post_office = mock_class(InvocationPostOffice)
+    timed_post_office = TimedInvocationPostOffice(invocation_post_office, InvocationTimingRecorder())
+
+    timed_post_office.interrupt_collection()
+    verify(invocation_post_office.interrupt_collection).was_called_once()
+
+    timed_post_office.resume_collection()
+    verify(invocation_post_office.resume_collection).was_called_once()
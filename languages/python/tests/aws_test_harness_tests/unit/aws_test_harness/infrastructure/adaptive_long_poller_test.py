@@ -0,0 +1,202 @@
+from logging import Logger
+from threading import Event, Lock, Thread
+from time import time
+from typing import List
+
+import pytest
+
+from aws_test_harness.infrastructure.adaptive_long_poller import AdaptiveLongPoller
+from aws_test_harness_test_support.eventual_consistency_utils import wait_for_value_matching
+
+
+def never_release(_: List[str]) -> None:
+    raise AssertionError('Nothing should be released')
+
+
+def test_waits_longer_after_each_poll_that_receives_nothing_up_to_maximum(logger: Logger) -> None:
+    poller: AdaptiveLongPoller[str] = AdaptiveLongPoller(logger, minimum_wait_time_seconds=1,
+                                                         maximum_wait_time_seconds=5)
+    wait_times_seconds: List[int] = []
+
+    def receive(wait_time_seconds: int) -> List[str]:
+        wait_times_seconds.append(wait_time_seconds)
+        return []
+
+    for _ in range(5):
+        poller.poll(receive, never_release)
+
+    assert wait_times_seconds == [1, 2, 4, 5, 5]
+
+
+def test_returns_to_minimum_wait_once_items_received(logger: Logger) -> None:
+    poller: AdaptiveLongPoller[str] = AdaptiveLongPoller(logger, minimum_wait_time_seconds=1,
+                                                         maximum_wait_time_seconds=20)
+    poller.poll(lambda _: [], never_release)
+    poller.poll(lambda _: [], never_release)
+
+    assert poller.poll(lambda _: ['the item'], never_release) == ['the item']
+    assert poller.wait_time_seconds == 1
+
+
+def test_raises_exception_raised_whilst_receiving(logger: Logger) -> None:
+    poller: AdaptiveLongPoller[str] = AdaptiveLongPoller(logger)
+
+    def receive(_: int) -> List[str]:
+        raise Exception('Simulated exception')
+
+    with pytest.raises(Exception, match='Simulated exception'):
+        poller.poll(receive, never_release)
+
+
+def test_returns_nothing_straight_away_when_interrupted_and_releases_items_received_later(logger: Logger) -> None:
+    poller: AdaptiveLongPoller[str] = AdaptiveLongPoller(logger)
+    receiving = Event()
+    items_available = Event()
+    released_items: List[str] = []
+    polled_items: List[List[str]] = []
+
+    def receive(_: int) -> List[str]:
+        receiving.set()
+        items_available.wait(timeout=5)
+        return ['the item']
+
+    polling_thread = Thread(target=lambda: polled_items.append(poller.poll(receive, released_items.extend)),
+                            daemon=True)
+    polling_thread.start()
+    receiving.wait(timeout=5)
+
+    start_time = time()
+    poller.interrupt()
+    polling_thread.join(timeout=5)
+
+    assert time() - start_time < 1
+    assert polled_items == [[]]
+
+    items_available.set()
+
+    wait_for_value_matching(lambda: released_items, 'released items', lambda items: items == ['the item'])
+
+
+def test_receives_nothing_for_poll_interrupted_before_receiving_started(logger: Logger) -> None:
+    poller: AdaptiveLongPoller[str] = AdaptiveLongPoller(logger)
+    first_receive_started = Event()
+    first_receive_permitted = Event()
+    receive_count = 0
+
+    def receive(_: int) -> List[str]:
+        nonlocal receive_count
+        receive_count += 1
+        first_receive_started.set()
+        first_receive_permitted.wait(timeout=5)
+        return []
+
+    first_polling_thread = Thread(target=lambda: poller.poll(receive, never_release), daemon=True)
+    first_polling_thread.start()
+    first_receive_started.wait(timeout=5)
+
+    # Waits for the first poll to finish receiving before it can start
+    second_polling_thread = Thread(target=lambda: poller.poll(receive, never_release), daemon=True)
+    second_polling_thread.start()
+    second_polling_thread.join(timeout=0.1)
+
+    poller.interrupt()
+    first_polling_thread.join(timeout=5)
+    second_polling_thread.join(timeout=5)
+    first_receive_permitted.set()
+    poller.resume()
+
+    assert receive_count == 1
+
+
+def test_polls_without_receiving_until_resumed(logger: Logger) -> None:
+    poller: AdaptiveLongPoller[str] = AdaptiveLongPoller(logger)
+    receive_count = 0
+
+    def receive(_: int) -> List[str]:
+        nonlocal receive_count
+        receive_count += 1
+        return ['the item']
+
+    poller.interrupt()
+
+    assert poller.poll(receive, never_release) == []
+    assert receive_count == 0
+
+    poller.resume()
+
+    assert poller.poll(receive, never_release) == ['the item']
+
+
+def test_resumes_without_waiting_for_interrupted_poll_to_finish(logger: Logger) -> None:
+    poller: AdaptiveLongPoller[str] = AdaptiveLongPoller(logger)
+    receiving = Event()
+    items_available = Event()
+    released_items: List[str] = []
+
+    def receive(_: int) -> List[str]:
+        receiving.set()
+        items_available.wait(timeout=5)
+        return ['the item']
+
+    polling_thread = Thread(target=lambda: poller.poll(receive, released_items.extend), daemon=True)
+    polling_thread.start()
+    receiving.wait(timeout=5)
+    poller.interrupt()
+    polling_thread.join(timeout=5)
+
+    start_time = time()
+    poller.resume()
+
+    assert time() - start_time < 1
+    assert released_items == []
+
+    items_available.set()
+
+    wait_for_value_matching(lambda: released_items, 'released items', lambda items: items == ['the item'])
+
+
+def test_never_receives_for_more_than_one_poll_at_once(logger: Logger) -> None:
+    poller: AdaptiveLongPoller[str] = AdaptiveLongPoller(logger)
+    lock = Lock()
+    receiving_count = 0
+    receiving_counts: List[int] = []
+    first_receive_started = Event()
+    first_receive_permitted = Event()
+
+    def receive(_: int) -> List[str]:
+        nonlocal receiving_count
+
+        with lock:
+            receiving_count += 1
+            receiving_counts.append(receiving_count)
+
+        if not first_receive_started.is_set():
+            first_receive_started.set()
+            first_receive_permitted.wait(timeout=5)
+
+        with lock:
+            receiving_count -= 1
+
+        return []
+
+    interrupted_polling_thread = Thread(target=lambda: poller.poll(receive, never_release), daemon=True)
+    interrupted_polling_thread.start()
+    first_receive_started.wait(timeout=5)
+    poller.interrupt()
+    interrupted_polling_thread.join(timeout=5)
+
+    poller.resume()
+    polling_thread = Thread(target=lambda: poller.poll(receive, never_release), daemon=True)
+    polling_thread.start()
+    polling_thread.join(timeout=0.1)
+
+    first_receive_permitted.set()
+    polling_thread.join(timeout=5)
+    poller.poll(receive, never_release)
+
+    assert max(receiving_counts) == 1
+
+
+def test_rejects_maximum_wait_time_below_minimum_wait_time(logger: Logger) -> None:
+    with pytest.raises(ValueError, match=r'Maximum wait time \(1s\) must be at least the minimum wait time \(2s\)'):
+        AdaptiveLongPoller(logger, minimum_wait_time_seconds=2, maximum_wait_time_seconds=1)
@@ -0,0 +1,55 @@
+import pytest
+
+from aws_test_harness.infrastructure.asl_execution_error import AslExecutionError
+from aws_test_harness.infrastructure.asl_json_path import apply_payload_template, read_path, write_path
+
+
+def test_reads_fields_and_array_items() -> None:
+    data = dict(orders=[dict(id='first'), {'order id': 'second'}])
+
+    assert read_path('$', data, {}) == data
+    assert read_path('$.orders[0].id', data, {}) == 'first'
+    assert read_path("$.orders[1]['order id']", data, {}) == 'second'
+
+
+def test_reads_context_object_paths() -> None:
+    assert read_path('$$.Execution.Input', {}, dict(Execution=dict(Input='the input'))) == 'the input'
+
+
+def test_reports_missing_context_object_path_as_written() -> None:
+    with pytest.raises(AslExecutionError, match=r'Path "\$\$.Execution.Id" could not be found in the context object'):
+        read_path('$$.Execution.Id', {}, dict(Execution=dict(Input='the input')))
+
+
+def test_writes_result_without_modifying_data() -> None:
+    data = dict(existing=dict(value=1))
+
+    assert write_path('$.existing.result', data, 'the result') == dict(existing=dict(value=1, result='the result'))
+    assert data == dict(existing=dict(value=1))
+
+
+def test_evaluates_intrinsic_functions() -> None:
+    template = {
+        'greeting.$': "States.Format('Hello {}, you have {} messages', $.name, States.ArrayLength($.messages))",
+        'parsed.$': 'States.StringToJson($.json)',
+        'serialised.$': 'States.JsonToString($.messages)',
+        'array.$': "States.Array(1, 'two', null, true)",
+        'partitions.$': 'States.ArrayPartition(States.ArrayRange(1, 5, 1), 2)',
+        'escaped.$': "States.Format('It\\'s {}', $.name)",
+    }
+
+    payload = apply_payload_template(template, dict(name='Bob', messages=['a', 'b'], json='{"number": 1}'), {})
+
+    assert payload == {
+        'greeting': 'Hello Bob, you have 2 messages',
+        'parsed': dict(number=1),
+        'serialised': '["a","b"]',
+        'array': [1, 'two', None, True],
+        'partitions': [[1, 2], [3, 4], [5]],
+        'escaped': "It's Bob",
+    }
+
+
+def test_rejects_unsupported_intrinsic_functions() -> None:
+    with pytest.raises(AslExecutionError, match='Intrinsic function "States.Hash" is not supported'):
+        apply_payload_template({'hash.$': "States.Hash($.value, 'SHA-256')"}, dict(value='x'), {})
@@ -0,0 +1,393 @@
+import json
+import re
+from threading import Barrier, Lock
+from time import sleep
+from typing import Any, Dict, List, Tuple
+
+from aws_test_harness.domain.state_machine_execution_failure import StateMachineExecutionFailure
+from aws_test_harness.domain.state_machine_twin import StateMachineExecutionResult
+from aws_test_harness.infrastructure.asl_state_machine_interpreter import AslStateMachineInterpreter, \
+    DEFAULT_MAXIMUM_CONCURRENCY
+
+STATE_MACHINE_ARN = 'arn:aws:states:eu-west-2:123456789012:stateMachine:TheStateMachine'
+
+TIMESTAMP_PATTERN = r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z'
+
+
+def no_state_machines(state_machine_arn: str, _: Dict[str, Any]) -> StateMachineExecutionResult:
+    raise AssertionError(f'Unexpected execution of {state_machine_arn}')
+
+
+def interpret(definition: Dict[str, Any], execution_input: Dict[str, Any]) -> StateMachineExecutionResult:
+    return AslStateMachineInterpreter(STATE_MACHINE_ARN, definition, no_state_machines)(execution_input)
+
+
+def single_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    return dict(StartAt='TheState', States=dict(TheState={**state, 'End': True}))
+
+
+def test_passes_input_through_to_output() -> None:
+    assert interpret(single_state(dict(Type='Pass')), dict(message='Hello')) == dict(message='Hello')
+
+
+def test_processes_input_and_output_of_pass_state() -> None:
+    definition = single_state(dict(
+        Type='Pass',
+        InputPath='$.numbers',
+        Parameters={'sum.$': 'States.MathAdd($.first, $.second)', 'label': 'total'},
+        ResultPath='$.result',
+        OutputPath='$.result'
+    ))
+
+    assert interpret(definition, dict(numbers=dict(first=1, second=2))) == dict(sum=3, label='total')
+
+
+def test_places_result_of_pass_state_within_input() -> None:
+    definition = single_state(dict(Type='Pass', Result=dict(greeting='Hello'), ResultPath='$.detail.result'))
+
+    assert interpret(definition, dict(name='Bob')) == dict(name='Bob', detail=dict(result=dict(greeting='Hello')))
+
+
+def test_discards_result_when_result_path_is_null() -> None:
+    definition = single_state(dict(Type='Pass', Result='ignored', ResultPath=None))
+
+    assert interpret(definition, dict(name='Bob')) == dict(name='Bob')
+
+
+def test_provides_execution_state_machine_and_state_in_context_object() -> None:
+    definition = single_state(dict(Type='Pass', Parameters={'context.$': '$$'}, OutputPath='$.context'))
+
+    context = interpret(definition, dict(name='Bob'))
+
+    assert isinstance(context, dict)
+    execution_name = context['Execution']['Name']
+    assert context['Execution']['Id'] == f'arn:aws:states:eu-west-2:123456789012:execution:TheStateMachine:' \
+                                         f'{execution_name}'
+    assert context['Execution']['Input'] == dict(name='Bob')
+    assert context['Execution']['RoleArn'] == 'arn:aws:iam::123456789012:role/TheStateMachineRole'
+    assert re.fullmatch(TIMESTAMP_PATTERN, context['Execution']['StartTime'])
+    assert context['StateMachine'] == dict(Id=STATE_MACHINE_ARN, Name='TheStateMachine')
+    assert context['State']['Name'] == 'TheState'
+    assert re.fullmatch(TIMESTAMP_PATTERN, context['State']['EnteredTime'])
+
+
+def test_names_each_execution_differently() -> None:
+    interpreter = AslStateMachineInterpreter(STATE_MACHINE_ARN, single_state(dict(
+        Type='Pass', Parameters={'id.$': '$$.Execution.Id'}, OutputPath='$.id'
+    )), no_state_machines)
+
+    assert interpreter({}) != interpreter({})
+
+
+def test_follows_choice_rules_to_next_state() -> None:
+    definition = dict(
+        StartAt='Decide',
+        States=dict(
+            Decide=dict(
+                Type='Choice',
+                Choices=[
+                    dict(Not=dict(Variable='$.colour', IsPresent=True), Next='Colourless'),
+                    dict(And=[dict(Variable='$.size', NumericGreaterThanEquals=10),
+                              dict(Variable='$.colour', StringMatches='bl*')], Next='BigBlue'),
+                    dict(Variable='$.size', NumericLessThanPath='$.threshold', Next='Small'),
+                ],
+                Default='Other'
+            ),
+            BigBlue=dict(Type='Pass', Result='big blue', End=True),
+            Colourless=dict(Type='Pass', Result='colourless', End=True),
+            Small=dict(Type='Pass', Result='small', End=True),
+            Other=dict(Type='Pass', Result='other', End=True),
+        )
+    )
+
+    assert interpret(definition, dict(size=10, colour='blue')) == 'big blue'
+    assert interpret(definition, dict(size=10)) == 'colourless'
+    assert interpret(definition, dict(size=1, colour='red', threshold=5)) == 'small'
+    assert interpret(definition, dict(size=6, colour='red', threshold=5)) == 'other'
+
+
+def test_fails_when_no_choice_rule_matches() -> None:
+    definition = single_state(dict(Type='Choice', Choices=[dict(Variable='$.flag', BooleanEquals=True, Next='X')]))
+    del definition['States']['TheState']['End']
+
+    assert interpret(definition, dict(flag=False)) == StateMachineExecutionFailure(
+        error='States.NoChoiceMatched', cause='No choice rule matched in state "TheState"'
+    )
+
+
+def test_fails_with_error_and_cause_of_fail_state() -> None:
+    definition = dict(StartAt='Fail', States=dict(Fail=dict(Type='Fail', Error='Custom.Error', Cause='the cause')))
+
+    assert interpret(definition, {}) == StateMachineExecutionFailure(error='Custom.Error', cause='the cause')
+
+
+def test_succeeds_with_output_of_succeed_state() -> None:
+    definition = dict(StartAt='Done', States=dict(Done=dict(Type='Succeed', OutputPath='$.result')))
+
+    assert interpret(definition, dict(result='the result')) == 'the result'
+
+
+def test_executes_state_machines_started_by_task_states() -> None:
+    executions: List[Tuple[str, Dict[str, Any]]] = []
+
+    def execute_state_machine(state_machine_arn: str, execution_input: Dict[str, Any]) -> StateMachineExecutionResult:
+        executions.append((state_machine_arn, execution_input))
+        return dict(greeting=f'Hello {execution_input['name']}')
+
+    definition = single_state(dict(
+        Type='Task',
+        Resource='arn:aws:states:::states:startExecution.sync:2',
+        Parameters={'StateMachineArn': 'the state machine arn', 'Input': {'name.$': '$.name'}},
+        ResultSelector={'greeting.$': '$.Output.greeting'},
+        ResultPath='$.result'
+    ))
+
+    output = AslStateMachineInterpreter(STATE_MACHINE_ARN, definition, execute_state_machine)(dict(name='Bob'))
+
+    assert output == dict(name='Bob', result=dict(greeting='Hello Bob'))
+    assert executions == [('the state machine arn', dict(name='Bob'))]
+
+
+def test_provides_output_of_started_state_machine_as_string_for_original_integration() -> None:
+    definition = single_state(dict(
+        Type='Task',
+        Resource='arn:aws:states:::states:startExecution.sync',
+        Parameters={'StateMachineArn': 'the state machine arn'},
+        OutputPath='$.Output'
+    ))
+
+    output = AslStateMachineInterpreter(STATE_MACHINE_ARN, definition, lambda _, __: dict(number=1))({})
+
+    assert output == json.dumps(dict(number=1))
+
+
+def test_retries_failed_task_before_catching_error() -> None:
+    attempts: List[Dict[str, Any]] = []
+
+    def fail_execution(_: str, execution_input: Dict[str, Any]) -> StateMachineExecutionResult:
+        attempts.append(execution_input)
+        return StateMachineExecutionFailure(error='Twin.Error', cause='the cause')
+
+    definition = dict(
+        StartAt='Invoke',
+        States=dict(
+            Invoke=dict(
+                Type='Task',
+                Resource='arn:aws:states:::states:startExecution.sync:2',
+                Parameters={'StateMachineArn': 'the state machine arn'},
+                Retry=[dict(ErrorEquals=['States.TaskFailed'], MaxAttempts=2)],
+                Catch=[dict(ErrorEquals=['States.ALL'], ResultPath='$.error', Next='Recover')],
+                End=True
+            ),
+            Recover=dict(Type='Pass', End=True)
+        )
+    )
+
+    output = AslStateMachineInterpreter(STATE_MACHINE_ARN, definition, fail_execution)(dict(name='Bob'))
+
+    assert len(attempts) == 3
+    assert output == dict(name='Bob', error=dict(
+        Error='States.TaskFailed', Cause=json.dumps(dict(Error='Twin.Error', Cause='the cause'))
+    ))
+
+
+def test_fails_with_error_of_failed_task_that_is_not_caught() -> None:
+    definition = single_state(dict(
+        Type='Task',
+        Resource='arn:aws:states:::states:startExecution.sync:2',
+        Parameters={'StateMachineArn': 'the state machine arn'},
+        Catch=[dict(ErrorEquals=['Other.Error'], Next='Elsewhere')]
+    ))
+
+    output = AslStateMachineInterpreter(
+        STATE_MACHINE_ARN, definition, lambda _, __: StateMachineExecutionFailure(error='Twin.Error', cause='the cause')
+    )({})
+
+    assert isinstance(output, StateMachineExecutionFailure)
+    assert output.error == 'States.TaskFailed'
+
+
+def test_fails_with_runtime_error_for_unsupported_task_resource() -> None:
+    definition = single_state(dict(Type='Task', Resource='arn:aws:lambda:eu-west-2:123456789012:function:Foo'))
+
+    assert interpret(definition, {}) == StateMachineExecutionFailure(
+        error='States.Runtime',
+        cause='Task resource "arn:aws:lambda:eu-west-2:123456789012:function:Foo" is not supported'
+    )
+
+
+def test_processes_each_item_of_map_state() -> None:
+    definition = single_state(dict(
+        Type='Map',
+        ItemsPath='$.numbers',
+        ItemSelector={'number.$': '$$.Map.Item.Value', 'index.$': '$$.Map.Item.Index', 'offset.$': '$.offset'},
+        ItemProcessor=dict(
+            StartAt='Add',
+            States=dict(Add=dict(Type='Pass', Parameters={'sum.$': 'States.MathAdd($.number, $.offset)',
+                                                          'index.$': '$.index'}, End=True))
+        ),
+        ResultPath='$.results'
+    ))
+
+    output = interpret(definition, dict(numbers=[1, 2, 3], offset=10))
+
+    assert output == dict(numbers=[1, 2, 3], offset=10,
+                          results=[dict(sum=11, index=0), dict(sum=12, index=1), dict(sum=13, index=2)])
+
+
+def test_runs_each_branch_of_parallel_state() -> None:
+    definition = single_state(dict(
+        Type='Parallel',
+        Branches=[
+            dict(StartAt='First', States=dict(First=dict(Type='Pass', InputPath='$.first', End=True))),
+            dict(StartAt='Second', States=dict(Second=dict(Type='Pass', InputPath='$.second', End=True))),
+        ]
+    ))
+
+    assert interpret(definition, dict(first='one', second='two')) == ['one', 'two']
+
+
+def test_processes_items_of_map_state_concurrently() -> None:
+    # Each item can only be processed once every item is being processed at the same time
+    barrier = Barrier(3, timeout=5)
+
+    def execute_state_machine(_: str, execution_input: Dict[str, Any]) -> StateMachineExecutionResult:
+        barrier.wait()
+        return dict(doubled=execution_input['number'] * 2)
+
+    definition = single_state(dict(
+        Type='Map',
+        ItemsPath='$.numbers',
+        ItemSelector={'number.$': '$$.Map.Item.Value'},
+        ItemProcessor=single_state(dict(
+            Type='Task',
+            Resource='arn:aws:states:::states:startExecution.sync:2',
+            Parameters={'StateMachineArn': 'the state machine arn', 'Input.$': '$'},
+            OutputPath='$.Output.doubled'
+        ))
+    ))
+
+    output = AslStateMachineInterpreter(STATE_MACHINE_ARN, definition, execute_state_machine)(dict(numbers=[1, 2, 3]))
+
+    assert output == [2, 4, 6]
+
+
+def test_processes_no_more_items_of_map_state_at_once_than_maximum_concurrency() -> None:
+    lock = Lock()
+    running_count = 0
+    running_counts: List[int] = []
+
+    def execute_state_machine(_: str, __: Dict[str, Any]) -> StateMachineExecutionResult:
+        nonlocal running_count
+
+        with lock:
+            running_count += 1
+            running_counts.append(running_count)
+
+        # Long enough for any other item allowed to run at the same time to start
+        sleep(0.02)
+
+        with lock:
+            running_count -= 1
+
+        return {}
+
+    definition = single_state(dict(
+        Type='Map',
+        ItemsPath='$.numbers',
+        MaxConcurrency=1,
+        ItemProcessor=single_state(dict(
+            Type='Task',
+            Resource='arn:aws:states:::states:startExecution.sync:2',
+            Parameters={'StateMachineArn': 'the state machine arn'}
+        ))
+    ))
+
+    AslStateMachineInterpreter(STATE_MACHINE_ARN, definition, execute_state_machine)(dict(numbers=list(range(5))))
+
+    assert running_counts == [1] * 5
+
+
+def test_processes_no_more_items_of_map_state_at_once_than_default_maximum_concurrency_when_unlimited() -> None:
+    lock = Lock()
+    running_count = 0
+    running_counts: List[int] = []
+
+    def execute_state_machine(_: str, __: Dict[str, Any]) -> StateMachineExecutionResult:
+        nonlocal running_count
+
+        with lock:
+            running_count += 1
+            running_counts.append(running_count)
+
+        sleep(0.02)
+
+        with lock:
+            running_count -= 1
+
+        return {}
+
+    definition = single_state(dict(
+        Type='Map',
+        ItemsPath='$.numbers',
+        MaxConcurrency=0,
+        ItemProcessor=single_state(dict(
+            Type='Task',
+            Resource='arn:aws:states:::states:startExecution.sync:2',
+            Parameters={'StateMachineArn': 'the state machine arn'}
+        ))
+    ))
+
+    AslStateMachineInterpreter(STATE_MACHINE_ARN, definition, execute_state_machine)(
+        dict(numbers=list(range(DEFAULT_MAXIMUM_CONCURRENCY * 2)))
+    )
+
+    assert len(running_counts) == DEFAULT_MAXIMUM_CONCURRENCY * 2
+    assert max(running_counts) <= DEFAULT_MAXIMUM_CONCURRENCY
+
+def test_fails_with_error_of_failed_map_item() -> None:
+    definition = single_state(dict(
+        Type='Map',
+        ItemsPath='$.numbers',
+        ItemProcessor=dict(
+            StartAt='Check',
+            States=dict(
+                Check=dict(Type='Choice', Choices=[dict(Variable='$', NumericEquals=2, Next='Reject')],
+                           Default='Accept'),
+                Reject=dict(Type='Fail', Error='Item.Rejected', Cause='the cause'),
+                Accept=dict(Type='Succeed')
+            )
+        )
+    ))
+
+    assert interpret(definition, dict(numbers=[1, 2, 3])) == StateMachineExecutionFailure(error='Item.Rejected',
+                                                                                          cause='the cause')
+
+
+def test_runs_branches_of_parallel_state_concurrently() -> None:
+    barrier = Barrier(2, timeout=5)
+
+    def execute_state_machine(state_machine_arn: str, _: Dict[str, Any]) -> StateMachineExecutionResult:
+        barrier.wait()
+        return dict(arn=state_machine_arn)
+
+    def branch(state_machine_arn: str) -> Dict[str, Any]:
+        return single_state(dict(
+            Type='Task',
+            Resource='arn:aws:states:::states:startExecution.sync:2',
+            Parameters={'StateMachineArn': state_machine_arn},
+            OutputPath='$.Output.arn'
+        ))
+
+    definition = single_state(dict(Type='Parallel', Branches=[branch('first arn'), branch('second arn')]))
+
+    assert AslStateMachineInterpreter(STATE_MACHINE_ARN, definition, execute_state_machine)({}) == ['first arn',
+                                                                                                  'second arn']
+
+
+def test_fails_with_runtime_error_for_missing_path() -> None:
+    definition = single_state(dict(Type='Pass', InputPath='$.missing'))
+
+    assert interpret(definition, {}) == StateMachineExecutionFailure(
+        error='States.Runtime', cause='Path "$.missing" could not be found in the input'
+    )
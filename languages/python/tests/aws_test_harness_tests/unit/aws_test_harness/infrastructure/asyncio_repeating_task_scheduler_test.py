@@ -0,0 +1,110 @@
+import asyncio
+from logging import Logger
+
+import pytest
+
+from aws_test_harness.infrastructure.asyncio_repeating_task_scheduler import AsyncioRepeatingTaskScheduler
+
+
+def test_repeats_coroutine_task_on_event_loop_until_schedule_reset(logger: Logger) -> None:
+    scheduler = AsyncioRepeatingTaskScheduler(logger)
+    run_count = 0
+
+    async def task() -> None:
+        nonlocal run_count
+        run_count += 1
+        await asyncio.sleep(0)
+
+    async def run_scheduler() -> None:
+        scheduler.schedule(task)
+        assert scheduler.scheduled()
+
+        while run_count < 3:
+            await asyncio.sleep(0.001)
+
+        scheduler.reset_schedule()
+        assert not scheduler.scheduled()
+
+        run_count_after_reset = run_count
+        await asyncio.sleep(0.01)
+        assert run_count == run_count_after_reset
+
+    asyncio.run(run_scheduler())
+
+
+def test_repeats_synchronous_task_without_starving_event_loop(logger: Logger) -> None:
+    scheduler = AsyncioRepeatingTaskScheduler(logger)
+    run_count = 0
+
+    def task() -> None:
+        nonlocal run_count
+        run_count += 1
+
+    async def run_scheduler() -> None:
+        scheduler.schedule(task)
+        await asyncio.sleep(0.01)
+        scheduler.reset_schedule()
+
+    asyncio.run(run_scheduler())
+
+    assert run_count > 1
+
+
+def test_waits_for_run_of_task_in_progress_to_stop_when_resetting_schedule_asynchronously(logger: Logger) -> None:
+    scheduler = AsyncioRepeatingTaskScheduler(logger)
+    task_stopped = False
+
+    async def task() -> None:
+        nonlocal task_stopped
+
+        try:
+            await asyncio.sleep(10)
+        finally:
+            await asyncio.sleep(0.01)
+            task_stopped = True
+
+    async def run_scheduler() -> None:
+        scheduler.schedule(task)
+        await asyncio.sleep(0.01)
+
+        await scheduler.reset_schedule_async()
+
+        assert task_stopped
+        assert not scheduler.scheduled()
+
+    asyncio.run(run_scheduler())
+
+
+def test_keeps_repeating_task_after_it_raises_exception(logger: Logger) -> None:
+    scheduler = AsyncioRepeatingTaskScheduler(logger)
+    run_count = 0
+
+    async def task() -> None:
+        nonlocal run_count
+        run_count += 1
+        raise RuntimeError('the failure')
+
+    async def run_scheduler() -> None:
+        scheduler.schedule(task)
+
+        while run_count < 3:
+            await asyncio.sleep(0.001)
+
+        scheduler.reset_schedule()
+
+    asyncio.run(run_scheduler())
+
+
+def test_refuses_to_schedule_second_task(logger: Logger) -> None:
+    scheduler = AsyncioRepeatingTaskScheduler(logger)
+
+    async def run_scheduler() -> None:
+        scheduler.schedule(lambda: None)
+
+        try:
+            with pytest.raises(RuntimeError, match='already scheduled'):
+                scheduler.schedule(lambda: None)
+        finally:
+            scheduler.reset_schedule()
+
+    asyncio.run(run_scheduler())
@@ -0,0 +1,71 @@
+from logging import Logger
+
+import pytest
+
+from aws_test_harness.domain.aws_resource_registry import AwsResourceRegistry
+from aws_test_harness.infrastructure.boto_aws_resource_factory import BotoAwsResourceFactory
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
+from aws_test_harness_test_support.mocking import mock_class, when_calling, inspect
+
+
+def an_aws_resource_registry() -> AwsResourceRegistry:
+    aws_resource_registry = mock_class(AwsResourceRegistry)
+    when_calling(aws_resource_registry.get_resource_arn).invoke(
+        lambda resource_id: f'arn:aws:s3:::{resource_id.lower()}' if resource_id.endswith('Bucket')
+        else f'arn:aws:states:eu-west-2:123456789012:stateMachine:{resource_id}'
+    )
+    return aws_resource_registry
+
+
+def test_provides_same_state_machine_each_time_for_a_resource(logger: Logger) -> None:
+    aws_resource_registry = an_aws_resource_registry()
+    boto_client_pool = mock_class(BotoClientPool)
+    aws_resource_factory = BotoAwsResourceFactory(boto_client_pool, aws_resource_registry, logger)
+
+    state_machine = aws_resource_factory.get_state_machine('StateMachine')
+
+    assert aws_resource_factory.get_state_machine('StateMachine') is state_machine
+    assert aws_resource_factory.get_state_machine('OtherStateMachine') is not state_machine
+    assert inspect(aws_resource_registry.get_resource_arn).call_count == 2
+    assert inspect(boto_client_pool.client).call_count == 2
+
+
+def test_provides_same_s3_bucket_each_time_for_a_resource(logger: Logger) -> None:
+    aws_resource_registry = an_aws_resource_registry()
+    boto_client_pool = mock_class(BotoClientPool)
+    aws_resource_factory = BotoAwsResourceFactory(boto_client_pool, aws_resource_registry, logger)
+
+    s3_bucket = aws_resource_factory.get_s3_bucket('TheBucket')
+
+    assert aws_resource_factory.get_s3_bucket('TheBucket') is s3_bucket
+    assert inspect(aws_resource_registry.get_resource_arn).call_count == 1
+    assert inspect(boto_client_pool.client).call_count == 1
+
+
+def test_counts_resources_reused_rather_than_created(logger: Logger) -> None:
+    aws_resource_factory = BotoAwsResourceFactory(mock_class(BotoClientPool), an_aws_resource_registry(), logger)
+
+    for _ in range(3):
+        aws_resource_factory.get_state_machine('StateMachine')
+        aws_resource_factory.get_s3_bucket('TheBucket')
+
+    assert aws_resource_factory.reused_resource_count == 4
+
+
+def test_forgets_least_recently_used_resource_once_cache_full(logger: Logger) -> None:
+    aws_resource_factory = BotoAwsResourceFactory(mock_class(BotoClientPool), an_aws_resource_registry(), logger,
+                                                  maximum_cached_resources=2)
+
+    first_state_machine = aws_resource_factory.get_state_machine('FirstStateMachine')
+    second_state_machine = aws_resource_factory.get_state_machine('SecondStateMachine')
+    aws_resource_factory.get_state_machine('FirstStateMachine')
+    aws_resource_factory.get_state_machine('ThirdStateMachine')
+
+    assert aws_resource_factory.get_state_machine('FirstStateMachine') is first_state_machine
+    assert aws_resource_factory.get_state_machine('SecondStateMachine') is not second_state_machine
+
+
+def test_rejects_maximum_cached_resources_below_one(logger: Logger) -> None:
+    with pytest.raises(ValueError, match='Maximum cached resources must be at least 1 but was 0'):
+        BotoAwsResourceFactory(mock_class(BotoClientPool), an_aws_resource_registry(), logger,
+                               maximum_cached_resources=0)
@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from boto3 import Session
+from botocore.config import Config
+
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
+
+
+def a_boto_session() -> Session:
+    return Session(aws_access_key_id='the-access-key-id', aws_secret_access_key='the-secret-access-key',
+                   region_name='eu-west-2')
+
+
+def test_provides_same_client_each_time_for_a_service() -> None:
+    boto_client_pool = BotoClientPool(a_boto_session())
+
+    assert boto_client_pool.client('stepfunctions') is boto_client_pool.client('stepfunctions')
+    assert boto_client_pool.client('sqs') is not boto_client_pool.client('stepfunctions')
+
+
+def test_creates_single_client_for_service_when_requested_concurrently() -> None:
+    boto_client_pool = BotoClientPool(a_boto_session())
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: boto_client_pool.client('sqs'), range(8)))
+
+    assert all(client is clients[0] for client in clients)
+
+
+def test_configures_clients_to_keep_connections_alive_and_retry() -> None:
+    boto_client_pool = BotoClientPool(a_boto_session())
+
+    client_config = boto_client_pool.client('stepfunctions').meta.config
+    assert client_config.max_pool_connections == 50
+    assert client_config.tcp_keepalive is True
+    assert client_config.retries['mode'] == 'standard'
+
+
+def test_overrides_default_client_configuration_with_any_provided() -> None:
+    boto_client_pool = BotoClientPool(a_boto_session(), Config(max_pool_connections=5, retries=dict(mode='adaptive')))
+
+    client_config = boto_client_pool.client('stepfunctions').meta.config
+    assert client_config.max_pool_connections == 5
+    assert client_config.retries['mode'] == 'adaptive'
+    assert client_config.tcp_keepalive is True
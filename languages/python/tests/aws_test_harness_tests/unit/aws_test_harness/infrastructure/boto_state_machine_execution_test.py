@@ -0,0 +1,244 @@
+import asyncio
+from concurrent.futures import Future
+from dataclasses import FrozenInstanceError
+from logging import Logger
+from threading import Thread
+from time import time
+from typing import Any, Dict
+
+import pytest
+from mypy_boto3_stepfunctions import SFNClient
+
+from aws_test_harness.domain.exponential_backoff import ExponentialBackoff
+from aws_test_harness.domain.state_machine_execution_description import StateMachineExecutionDescription
+from aws_test_harness.infrastructure.boto_state_machine_execution import BotoStateMachineExecution
+from aws_test_harness.infrastructure.step_functions_execution_watcher import StepFunctionsExecutionWatcher
+from aws_test_harness_test_support.eventual_consistency_utils import wait_for_value_matching
+from aws_test_harness_test_support.mocking import mock_class, when_calling, inspect, verify
+
+EXECUTION_ARN = 'arn:aws:states:eu-west-2:123456789012:execution:StateMachine:test-execution'
+
+FAST_BACKOFF = ExponentialBackoff(initial_delay_seconds=0.001, maximum_delay_seconds=0.001)
+
+
+def an_execution_description_with(status: str, **other_fields: Any) -> Dict[str, Any]:
+    return dict(executionArn=EXECUTION_ARN, status=status, **other_fields)
+
+
+def test_waits_until_execution_reaches_terminal_status(logger: Logger) -> None:
+    step_functions_client = mock_class(SFNClient)
+    when_calling(step_functions_client.describe_execution).respond_with(
+        an_execution_description_with('RUNNING'),
+        an_execution_description_with('RUNNING'),
+        an_execution_description_with('SUCCEEDED'),
+    )
+
+    execution = BotoStateMachineExecution(EXECUTION_ARN, step_functions_client, logger, FAST_BACKOFF)
+
+    execution.wait_for_completion()
+
+    assert inspect(step_functions_client.describe_execution).call_count == 3
+    verify(step_functions_client.describe_execution).was_called_with(executionArn=EXECUTION_ARN)
+
+
+def test_does_not_describe_execution_again_once_terminal(logger: Logger) -> None:
+    step_functions_client = mock_class(SFNClient)
+    when_calling(step_functions_client.describe_execution).respond_with(
+        an_execution_description_with('RUNNING'),
+        an_execution_description_with('FAILED', error='TheError', cause='the cause'),
+    )
+
+    execution = BotoStateMachineExecution(EXECUTION_ARN, step_functions_client, logger, FAST_BACKOFF)
+    execution.wait_for_completion()
+
+    assert execution.status == 'FAILED'
+    assert execution.output is None
+    assert execution.error == 'TheError'
+    assert execution.cause == 'the cause'
+    execution.wait_for_completion()
+
+    assert inspect(step_functions_client.describe_execution).call_count == 2
+
+
+def test_resolves_completion_with_terminal_description_without_blocking_caller(logger: Logger) -> None:
+    step_functions_client = mock_class(SFNClient)
+    when_calling(step_functions_client.describe_execution).respond_with(
+        an_execution_description_with('RUNNING'),
+        an_execution_description_with('SUCCEEDED', output='"the output"'),
+    )
+
+    execution = BotoStateMachineExecution(EXECUTION_ARN, step_functions_client, logger, FAST_BACKOFF)
+
+    assert execution.completion().result(timeout=5) == StateMachineExecutionDescription(status='SUCCEEDED',
+                                                                                         output='"the output"')
+
+
+def test_describes_execution_each_time_status_is_read_whilst_running(logger: Logger) -> None:
+    step_functions_client = mock_class(SFNClient)
+    when_calling(step_functions_client.describe_execution).always_return(an_execution_description_with('RUNNING'))
+
+    execution = BotoStateMachineExecution(EXECUTION_ARN, step_functions_client, logger, FAST_BACKOFF)
+
+    assert execution.status == 'RUNNING'
+    assert execution.status == 'RUNNING'
+
+    assert inspect(step_functions_client.describe_execution).call_count == 2
+
+
+def test_backs_off_between_completion_polls(logger: Logger) -> None:
+    step_functions_client = mock_class(SFNClient)
+    describe_execution_times = []
+
+    def describe_execution(**_: Any) -> Dict[str, Any]:
+        describe_execution_times.append(time())
+        return an_execution_description_with('SUCCEEDED' if len(describe_execution_times) == 4 else 'RUNNING')
+
+    when_calling(step_functions_client.describe_execution).invoke(describe_execution)
+
+    execution = BotoStateMachineExecution(
+        EXECUTION_ARN, step_functions_client, logger,
+        ExponentialBackoff(initial_delay_seconds=0.02, maximum_delay_seconds=1, multiplier=2)
+    )
+
+    execution.wait_for_completion()
+
+    intervals = [later - earlier for earlier, later in zip(describe_execution_times, describe_execution_times[1:])]
+    assert len(intervals) == 3
+    assert intervals[0] >= 0.02
+    assert intervals[1] >= 0.04
+    assert intervals[2] >= 0.08
+
+
+def test_stops_waiting_as_soon_as_another_thread_observes_completion(logger: Logger) -> None:
+    step_functions_client = mock_class(SFNClient)
+    when_calling(step_functions_client.describe_execution).respond_with(
+        an_execution_description_with('RUNNING'),
+        an_execution_description_with('SUCCEEDED'),
+    )
+
+    execution = BotoStateMachineExecution(
+        EXECUTION_ARN, step_functions_client, logger,
+        ExponentialBackoff(initial_delay_seconds=10, maximum_delay_seconds=10)
+    )
+
+    waiting_thread = Thread(target=execution.wait_for_completion, daemon=True)
+    waiting_thread.start()
+
+    wait_for_value_matching(
+        lambda: inspect(step_functions_client.describe_execution).call_count,
+        'first completion poll',
+        lambda call_count: call_count == 1
+    )
+
+    assert execution.status == 'SUCCEEDED'
+
+    waiting_thread.join(timeout=1)
+    assert not waiting_thread.is_alive()
+
+
+def test_provides_description_of_execution(logger: Logger) -> None:
+    step_functions_client = mock_class(SFNClient)
+    when_calling(step_functions_client.describe_execution).always_return(
+        an_execution_description_with('SUCCEEDED', output='{"result": 3}')
+    )
+
+    execution = BotoStateMachineExecution(EXECUTION_ARN, step_functions_client, logger, FAST_BACKOFF)
+
+    assert execution.describe() == StateMachineExecutionDescription(status='SUCCEEDED', output='{"result": 3}')
+
+
+def test_provides_same_immutable_description_once_terminal(logger: Logger) -> None:
+    step_functions_client = mock_class(SFNClient)
+    when_calling(step_functions_client.describe_execution).always_return(
+        an_execution_description_with('TIMED_OUT')
+    )
+
+    execution = BotoStateMachineExecution(EXECUTION_ARN, step_functions_client, logger, FAST_BACKOFF)
+    execution.wait_for_completion()
+
+    description = execution.describe()
+    assert execution.describe() is description
+
+    with pytest.raises(FrozenInstanceError):
+        setattr(description, 'status', 'SUCCEEDED')
+
+    assert inspect(step_functions_client.describe_execution).call_count == 1
+
+
+def test_waits_on_event_loop_until_execution_reaches_terminal_status(logger: Logger) -> None:
+    step_functions_client = mock_class(SFNClient)
+    when_calling(step_functions_client.describe_execution).respond_with(
+        an_execution_description_with('RUNNING'),
+        an_execution_description_with('RUNNING'),
+        an_execution_description_with('SUCCEEDED', output='"the output"'),
+    )
+
+    execution = BotoStateMachineExecution(EXECUTION_ARN, step_functions_client, logger, FAST_BACKOFF)
+
+    asyncio.run(execution.wait_for_completion_async())
+
+    assert inspect(step_functions_client.describe_execution).call_count == 3
+    assert execution.output == '"the output"'
+
+
+def test_waits_for_many_executions_concurrently_on_event_loop(logger: Logger) -> None:
+    step_functions_client = mock_class(SFNClient)
+    describe_execution_counts: Dict[str, int] = {}
+
+    def describe_execution(executionArn: str) -> Dict[str, Any]:
+        describe_execution_counts[executionArn] = describe_execution_counts.get(executionArn, 0) + 1
+        return dict(executionArn=executionArn,
+                    status='SUCCEEDED' if describe_execution_counts[executionArn] == 3 else 'RUNNING')
+
+    when_calling(step_functions_client.describe_execution).invoke(describe_execution)
+
+    executions = [
+        BotoStateMachineExecution(
+            f'{EXECUTION_ARN}-{index}', step_functions_client, logger,
+            ExponentialBackoff(initial_delay_seconds=0.1, maximum_delay_seconds=0.1)
+        )
+        for index in range(100)
+    ]
+
+    async def wait_for_all() -> None:
+        await asyncio.gather(*[execution.wait_for_completion_async() for execution in executions])
+
+    start_time = time()
+    asyncio.run(wait_for_all())
+
+    # Waiting in sequence would take at least 100 x 2 x 0.1s
+    assert time() - start_time < 5
+    assert all(execution.status == 'SUCCEEDED' for execution in executions)
+
+
+def test_waits_for_execution_watcher_to_observe_completion_when_provided(logger: Logger) -> None:
+    step_functions_client = mock_class(SFNClient)
+    when_calling(step_functions_client.describe_execution).respond_with(
+        an_execution_description_with('RUNNING'),
+        an_execution_description_with('SUCCEEDED', output='"the output"'),
+    )
+    execution_watcher = StepFunctionsExecutionWatcher(logger, 1000, FAST_BACKOFF, FAST_BACKOFF)
+
+    execution = BotoStateMachineExecution(
+        EXECUTION_ARN, step_functions_client, logger,
+        ExponentialBackoff(initial_delay_seconds=10, maximum_delay_seconds=10),
+        execution_watcher
+    )
+
+    execution.wait_for_completion()
+    asyncio.run(execution.wait_for_completion_async())
+
+    assert execution.output == '"the output"'
+    assert inspect(step_functions_client.describe_execution).call_count == 2
+
+
+def test_provides_execution_watcher_future_as_completion_when_provided(logger: Logger) -> None:
+    execution_watcher = mock_class(StepFunctionsExecutionWatcher)
+    watcher_future: Future[StateMachineExecutionDescription] = Future()
+    when_calling(execution_watcher.watch).always_return(watcher_future)
+
+    execution = BotoStateMachineExecution(EXECUTION_ARN, mock_class(SFNClient), logger, FAST_BACKOFF,
+                                          execution_watcher)
+
+    assert execution.completion() is watcher_future
+    verify(execution_watcher.watch).was_called_once_with(execution)
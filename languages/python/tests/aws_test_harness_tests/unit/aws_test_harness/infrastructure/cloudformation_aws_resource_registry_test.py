@@ -0,0 +1,202 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from mypy_boto3_cloudformation import CloudFormationClient
+from mypy_boto3_cloudformation.paginator import ListStackResourcesPaginator
+
+from aws_test_harness.domain.unknown_aws_resource_exception import UnknownAwsResourceException
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
+from aws_test_harness.infrastructure.cloudformation_aws_resource_registry import CloudFormationAwsResourceRegistry
+from aws_test_harness.infrastructure.file_stack_resource_cache import FileStackResourceCache
+from aws_test_harness_test_support.mocking import mock_class, when_calling, inspect, verify
+
+STACK_NAME = 'the-stack'
+
+
+def a_stack_resource_summary_with(logical_id: str, physical_id: str,
+                                  resource_type: str = 'AWS::StepFunctions::StateMachine') -> Dict[str, Any]:
+    return dict(LogicalResourceId=logical_id, PhysicalResourceId=physical_id, ResourceType=resource_type)
+
+
+def a_list_stack_resources_paginator_returning(*pages: List[Dict[str, Any]]) -> ListStackResourcesPaginator:
+    paginator = mock_class(ListStackResourcesPaginator)
+    when_calling(paginator.paginate).invoke(
+        lambda **_: iter([dict(StackResourceSummaries=page) for page in pages])
+    )
+    return paginator
+
+
+def a_stack_description_with(stack_id: str = 'the-stack-id', **times: datetime) -> Dict[str, Any]:
+    return dict(Stacks=[dict(
+        StackId=stack_id,
+        StackName=STACK_NAME,
+        CreationTime=times.get('CreationTime', datetime(2024, 1, 1, tzinfo=timezone.utc)),
+        **{key: value for key, value in times.items() if key != 'CreationTime'}
+    )])
+
+
+def a_boto_client_pool_with(cloudformation_client: CloudFormationClient) -> BotoClientPool:
+    boto_client_pool = mock_class(BotoClientPool)
+    when_calling(boto_client_pool.client).invoke(
+        lambda service_name: cloudformation_client if service_name == 'cloudformation' else None
+    )
+    return boto_client_pool
+
+
+def test_resolves_all_resource_arns_from_single_sweep_of_stack_resources() -> None:
+    cloudformation_client = mock_class(CloudFormationClient)
+    paginator = a_list_stack_resources_paginator_returning(
+        [a_stack_resource_summary_with('Orange', 'orange-arn'), a_stack_resource_summary_with('Blue', 'blue-arn')],
+        [a_stack_resource_summary_with('Yellow', 'yellow-arn')]
+    )
+    when_calling(cloudformation_client.get_paginator).always_return(paginator)
+
+    registry = CloudFormationAwsResourceRegistry(STACK_NAME, a_boto_client_pool_with(cloudformation_client))
+
+    assert registry.get_resource_arn('Orange') == 'orange-arn'
+    assert registry.get_resource_arn('Blue') == 'blue-arn'
+    assert registry.get_resource_arn('Yellow') == 'yellow-arn'
+
+    verify(cloudformation_client.get_paginator).was_called_once_with('list_stack_resources')
+    verify(paginator.paginate).was_called_once_with(StackName=STACK_NAME)
+
+
+def test_provides_arn_for_s3_bucket() -> None:
+    cloudformation_client = mock_class(CloudFormationClient)
+    when_calling(cloudformation_client.get_paginator).always_return(a_list_stack_resources_paginator_returning(
+        [a_stack_resource_summary_with('Bucket', 'the-bucket-name', 'AWS::S3::Bucket')]
+    ))
+
+    registry = CloudFormationAwsResourceRegistry(STACK_NAME, a_boto_client_pool_with(cloudformation_client))
+
+    assert registry.get_resource_arn('Bucket') == 'arn:aws:s3:::the-bucket-name'
+
+
+def test_reloads_stack_resources_after_being_invalidated() -> None:
+    cloudformation_client = mock_class(CloudFormationClient)
+    when_calling(cloudformation_client.get_paginator).respond_with(
+        a_list_stack_resources_paginator_returning([a_stack_resource_summary_with('Orange', 'old-orange-arn')]),
+        a_list_stack_resources_paginator_returning([a_stack_resource_summary_with('Orange', 'new-orange-arn')]),
+    )
+
+    registry = CloudFormationAwsResourceRegistry(STACK_NAME, a_boto_client_pool_with(cloudformation_client))
+    assert registry.get_resource_arn('Orange') == 'old-orange-arn'
+
+    registry.invalidate()
+
+    assert registry.get_resource_arn('Orange') == 'new-orange-arn'
+
+
+def test_reloads_stack_resources_when_resource_not_found_in_case_stack_has_been_updated() -> None:
+    cloudformation_client = mock_class(CloudFormationClient)
+    when_calling(cloudformation_client.get_paginator).respond_with(
+        a_list_stack_resources_paginator_returning([a_stack_resource_summary_with('Orange', 'orange-arn')]),
+        a_list_stack_resources_paginator_returning([
+            a_stack_resource_summary_with('Orange', 'orange-arn'),
+            a_stack_resource_summary_with('Blue', 'blue-arn')
+        ]),
+    )
+
+    registry = CloudFormationAwsResourceRegistry(STACK_NAME, a_boto_client_pool_with(cloudformation_client))
+    assert registry.get_resource_arn('Orange') == 'orange-arn'
+
+    assert registry.get_resource_arn('Blue') == 'blue-arn'
+
+
+def test_raises_exception_when_resource_not_found_in_reloaded_stack_resources() -> None:
+    cloudformation_client = mock_class(CloudFormationClient)
+    when_calling(cloudformation_client.get_paginator).invoke(
+        lambda _: a_list_stack_resources_paginator_returning([a_stack_resource_summary_with('Orange', 'orange-arn')])
+    )
+
+    registry = CloudFormationAwsResourceRegistry(STACK_NAME, a_boto_client_pool_with(cloudformation_client))
+
+    with pytest.raises(UnknownAwsResourceException, match=f'"Blue" found in stack "{STACK_NAME}"'):
+        registry.get_resource_arn('Blue')
+
+    assert inspect(cloudformation_client.get_paginator).call_count == 2
+
+
+def test_ignores_resources_without_physical_id() -> None:
+    cloudformation_client = mock_class(CloudFormationClient)
+    when_calling(cloudformation_client.get_paginator).invoke(
+        lambda _: a_list_stack_resources_paginator_returning(
+            [dict(LogicalResourceId='Orange', ResourceType='AWS::StepFunctions::StateMachine')]
+        )
+    )
+
+    registry = CloudFormationAwsResourceRegistry(STACK_NAME, a_boto_client_pool_with(cloudformation_client))
+
+    with pytest.raises(UnknownAwsResourceException):
+        registry.get_resource_arn('Orange')
+
+
+def test_uses_cached_stack_resources_whilst_stack_unchanged_across_registries(tmp_path: Path) -> None:
+    cloudformation_client = mock_class(CloudFormationClient)
+    when_calling(cloudformation_client.describe_stacks).always_return(a_stack_description_with())
+    when_calling(cloudformation_client.get_paginator).invoke(
+        lambda _: a_list_stack_resources_paginator_returning([a_stack_resource_summary_with('Orange', 'orange-arn')])
+    )
+    boto_client_pool = a_boto_client_pool_with(cloudformation_client)
+
+    first_registry = CloudFormationAwsResourceRegistry(
+        STACK_NAME, boto_client_pool, FileStackResourceCache(str(tmp_path))
+    )
+    assert first_registry.get_resource_arn('Orange') == 'orange-arn'
+
+    second_registry = CloudFormationAwsResourceRegistry(
+        STACK_NAME, boto_client_pool, FileStackResourceCache(str(tmp_path))
+    )
+    assert second_registry.get_resource_arn('Orange') == 'orange-arn'
+
+    assert inspect(cloudformation_client.get_paginator).call_count == 1
+    assert inspect(cloudformation_client.describe_stacks).call_count == 2
+    verify(cloudformation_client.describe_stacks).was_called_with(StackName=STACK_NAME)
+
+
+def test_reloads_cached_stack_resources_once_stack_updated(tmp_path: Path) -> None:
+    cloudformation_client = mock_class(CloudFormationClient)
+    when_calling(cloudformation_client.describe_stacks).respond_with(
+        a_stack_description_with(),
+        a_stack_description_with(LastUpdatedTime=datetime(2024, 2, 1, tzinfo=timezone.utc)),
+    )
+    when_calling(cloudformation_client.get_paginator).respond_with(
+        a_list_stack_resources_paginator_returning([a_stack_resource_summary_with('Orange', 'old-orange-arn')]),
+        a_list_stack_resources_paginator_returning([a_stack_resource_summary_with('Orange', 'new-orange-arn')]),
+    )
+    boto_client_pool = a_boto_client_pool_with(cloudformation_client)
+
+    first_registry = CloudFormationAwsResourceRegistry(
+        STACK_NAME, boto_client_pool, FileStackResourceCache(str(tmp_path))
+    )
+    assert first_registry.get_resource_arn('Orange') == 'old-orange-arn'
+
+    second_registry = CloudFormationAwsResourceRegistry(
+        STACK_NAME, boto_client_pool, FileStackResourceCache(str(tmp_path))
+    )
+    assert second_registry.get_resource_arn('Orange') == 'new-orange-arn'
+
+
+def test_reloads_cached_stack_resources_once_stack_recreated(tmp_path: Path) -> None:
+    cloudformation_client = mock_class(CloudFormationClient)
+    when_calling(cloudformation_client.describe_stacks).respond_with(
+        a_stack_description_with('the-old-stack-id'),
+        a_stack_description_with('the-new-stack-id'),
+    )
+    when_calling(cloudformation_client.get_paginator).respond_with(
+        a_list_stack_resources_paginator_returning([a_stack_resource_summary_with('Orange', 'old-orange-arn')]),
+        a_list_stack_resources_paginator_returning([a_stack_resource_summary_with('Orange', 'new-orange-arn')]),
+    )
+    boto_client_pool = a_boto_client_pool_with(cloudformation_client)
+
+    first_registry = CloudFormationAwsResourceRegistry(
+        STACK_NAME, boto_client_pool, FileStackResourceCache(str(tmp_path))
+    )
+    assert first_registry.get_resource_arn('Orange') == 'old-orange-arn'
+
+    second_registry = CloudFormationAwsResourceRegistry(
+        STACK_NAME, boto_client_pool, FileStackResourceCache(str(tmp_path))
+    )
+    assert second_registry.get_resource_arn('Orange') == 'new-orange-arn'
@@ -0,0 +1,103 @@
+import os
+from pathlib import Path
+from threading import Thread
+
+from aws_test_harness.infrastructure.cloudformation_stack_resource import CloudFormationStackResource
+from aws_test_harness.infrastructure.file_stack_resource_cache import FileStackResourceCache
+
+STACK_NAME = 'the-stack'
+
+STACK_RESOURCES = dict(
+    Orange=CloudFormationStackResource('orange-arn', 'AWS::StepFunctions::StateMachine'),
+    Bucket=CloudFormationStackResource('the-bucket-name', 'AWS::S3::Bucket'),
+)
+
+
+def test_provides_stack_resources_previously_cached_for_same_stack_version(tmp_path: Path) -> None:
+    FileStackResourceCache(str(tmp_path)).put(STACK_NAME, 'version-1', STACK_RESOURCES)
+
+    assert FileStackResourceCache(str(tmp_path)).get(STACK_NAME, 'version-1') == STACK_RESOURCES
+
+
+def test_provides_nothing_for_different_stack_version(tmp_path: Path) -> None:
+    cache = FileStackResourceCache(str(tmp_path))
+    cache.put(STACK_NAME, 'version-1', STACK_RESOURCES)
+
+    assert cache.get(STACK_NAME, 'version-2') is None
+
+
+def test_provides_nothing_for_uncached_stack(tmp_path: Path) -> None:
+    cache = FileStackResourceCache(str(tmp_path))
+    cache.put(STACK_NAME, 'version-1', STACK_RESOURCES)
+
+    assert cache.get('another-stack', 'version-1') is None
+    assert FileStackResourceCache(str(tmp_path / 'missing')).get(STACK_NAME, 'version-1') is None
+
+
+def test_provides_nothing_for_unreadable_cache_file(tmp_path: Path) -> None:
+    (tmp_path / f'{STACK_NAME}.json').write_text('{"stackVersion": "version-1", "resou')
+
+    assert FileStackResourceCache(str(tmp_path)).get(STACK_NAME, 'version-1') is None
+
+
+def test_replaces_cached_stack_resources_for_new_stack_version(tmp_path: Path) -> None:
+    cache = FileStackResourceCache(str(tmp_path))
+    cache.put(STACK_NAME, 'version-1', STACK_RESOURCES)
+
+    new_stack_resources = dict(Blue=CloudFormationStackResource('blue-arn', 'AWS::StepFunctions::StateMachine'))
+    cache.put(STACK_NAME, 'version-2', new_stack_resources)
+
+    assert cache.get(STACK_NAME, 'version-1') is None
+    assert cache.get(STACK_NAME, 'version-2') == new_stack_resources
+
+
+def test_never_exposes_partially_written_cache_to_concurrent_readers(tmp_path: Path) -> None:
+    large_stack_resources = {
+        f'Resource{index}': CloudFormationStackResource(f'resource-{index}-arn', 'AWS::SQS::Queue')
+        for index in range(1000)
+    }
+    incomplete_reads = []
+
+    def write_repeatedly() -> None:
+        cache = FileStackResourceCache(str(tmp_path))
+        for _ in range(20):
+            cache.put(STACK_NAME, 'version-1', large_stack_resources)
+
+    def read_repeatedly() -> None:
+        cache = FileStackResourceCache(str(tmp_path))
+        for _ in range(200):
+            stack_resources = cache.get(STACK_NAME, 'version-1')
+            if stack_resources is not None and stack_resources != large_stack_resources:
+                incomplete_reads.append(stack_resources)
+
+    threads = [Thread(target=write_repeatedly) for _ in range(3)] + [Thread(target=read_repeatedly) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert incomplete_reads == []
+    assert FileStackResourceCache(str(tmp_path)).get(STACK_NAME, 'version-1') == large_stack_resources
+    assert os.listdir(tmp_path) == [f'{STACK_NAME}.json']
+
+
+def test_provides_stack_resources_cached_since_last_read_by_another_cache(tmp_path: Path) -> None:
+    cache = FileStackResourceCache(str(tmp_path))
+    cache.put(STACK_NAME, 'version-1', STACK_RESOURCES)
+    assert cache.get(STACK_NAME, 'version-1') == STACK_RESOURCES
+
+    new_stack_resources = dict(Blue=CloudFormationStackResource('blue-arn', 'AWS::StepFunctions::StateMachine'))
+    FileStackResourceCache(str(tmp_path)).put(STACK_NAME, 'version-2', new_stack_resources)
+
+    assert cache.get(STACK_NAME, 'version-1') is None
+    assert cache.get(STACK_NAME, 'version-2') == new_stack_resources
+
+
+def test_leaves_cache_file_in_place_when_it_already_holds_stack_resources_being_cached(tmp_path: Path) -> None:
+    cache = FileStackResourceCache(str(tmp_path))
+    cache.put(STACK_NAME, 'version-1', STACK_RESOURCES)
+    cache_file_inode = os.stat(tmp_path / f'{STACK_NAME}.json').st_ino
+
+    cache.put(STACK_NAME, 'version-1', dict(STACK_RESOURCES))
+
+    assert os.stat(tmp_path / f'{STACK_NAME}.json').st_ino == cache_file_inode
@@ -0,0 +1,55 @@
+from logging import Logger
+
+import pytest
+
+from aws_test_harness.domain.unknown_aws_resource_exception import UnknownAwsResourceException
+from aws_test_harness.infrastructure.in_memory_aws_resource_factory import InMemoryAwsResourceFactory
+from aws_test_harness.infrastructure.in_memory_aws_resource_registry import InMemoryAwsResourceRegistry
+from aws_test_harness.infrastructure.in_memory_invocation_post_office import InMemoryInvocationPostOffice
+from aws_test_harness.infrastructure.in_memory_s3_bucket import InMemoryS3Bucket
+
+
+def test_provides_same_s3_bucket_for_same_resource_id(logger: Logger) -> None:
+    factory = InMemoryAwsResourceFactory(InMemoryAwsResourceRegistry(), InMemoryInvocationPostOffice(), logger)
+
+    s3_bucket = factory.get_s3_bucket('MessagesAWSTestHarnessS3Bucket')
+
+    assert isinstance(s3_bucket, InMemoryS3Bucket)
+    assert s3_bucket.name == 'messagesawstestharnesss3bucket'
+    assert factory.get_s3_bucket('MessagesAWSTestHarnessS3Bucket') is s3_bucket
+
+
+def test_provides_twin_state_machine_that_hands_executions_to_harness(logger: Logger) -> None:
+    invocation_post_office = InMemoryInvocationPostOffice()
+    factory = InMemoryAwsResourceFactory(InMemoryAwsResourceRegistry(), invocation_post_office, logger)
+
+    execution = factory.get_state_machine('OrangeAWSTestHarnessStateMachine').start(dict(message='Hello'))
+
+    invocations = invocation_post_office.collect_invocations()
+    assert len(invocations) == 1
+    assert invocations[0].target == 'arn:aws:states:local:000000000000:stateMachine:OrangeAWSTestHarnessStateMachine'
+    assert invocations[0].parameters == dict(input=dict(message='Hello'))
+
+    invocation_post_office.post_result(invocations[0].id, dict(status='succeeded', context=dict(result='the result')))
+    execution.wait_for_completion()
+
+    assert execution.status == 'SUCCEEDED'
+    assert execution.output == '"the result"'
+
+
+def test_fails_twin_state_machine_execution_without_result_in_time(logger: Logger) -> None:
+    factory = InMemoryAwsResourceFactory(InMemoryAwsResourceRegistry(), InMemoryInvocationPostOffice(), logger,
+                                         twin_result_timeout_seconds=0.05)
+
+    execution = factory.get_state_machine('OrangeAWSTestHarnessStateMachine').execute({})
+
+    assert execution.status == 'FAILED'
+    assert execution.error == 'TimeoutError'
+
+
+def test_rejects_state_machine_without_definition(logger: Logger) -> None:
+    factory = InMemoryAwsResourceFactory(InMemoryAwsResourceRegistry(), InMemoryInvocationPostOffice(), logger)
+
+    with pytest.raises(UnknownAwsResourceException,
+                       match='No in-memory state machine defined with logical ID "UndefinedStateMachine"'):
+        factory.get_state_machine('UndefinedStateMachine')
@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+
+import pytest
+
+from aws_test_harness.infrastructure.in_memory_invocation_post_office import InMemoryInvocationPostOffice
+from aws_test_harness_tests.support.builders.invocation_builder import an_invocation_with
+
+
+def test_provides_result_posted_for_invocation_to_invoker() -> None:
+    invocation_post_office = InMemoryInvocationPostOffice()
+    invocation = an_invocation_with(invocation_id='the invocation id')
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        result_future = executor.submit(invocation_post_office.invoke, invocation, 5)
+
+        assert invocation_post_office.collect_invocations() == [invocation]
+
+        invocation_post_office.post_result('the invocation id', 'the result')
+
+        assert result_future.result(timeout=5) == 'the result'
+
+
+def test_provides_every_pending_invocation_in_one_collection() -> None:
+    invocation_post_office = InMemoryInvocationPostOffice(collection_wait_seconds=1)
+    first_invocation = an_invocation_with(invocation_id='first invocation id')
+    second_invocation = an_invocation_with(invocation_id='second invocation id')
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        executor.submit(invocation_post_office.invoke, first_invocation, 5)
+        executor.submit(invocation_post_office.invoke, second_invocation, 5)
+
+        collected_invocations = invocation_post_office.collect_invocations()
+
+        while len(collected_invocations) < 2:
+            collected_invocations.extend(invocation_post_office.collect_invocations())
+
+        invocation_post_office.post_results({'first invocation id': 'first result',
+                                             'second invocation id': 'second result'})
+
+    assert sorted(invocation.id for invocation in collected_invocations) == ['first invocation id',
+                                                                             'second invocation id']
+
+
+def test_provides_no_invocations_once_collection_wait_elapsed() -> None:
+    invocation_post_office = InMemoryInvocationPostOffice(collection_wait_seconds=0.05)
+
+    start_time = time()
+    invocations = invocation_post_office.collect_invocations()
+
+    assert invocations == []
+    assert 0.04 < time() - start_time < 1
+
+
+def test_times_out_invocation_without_posted_result() -> None:
+    invocation_post_office = InMemoryInvocationPostOffice()
+
+    with pytest.raises(TimeoutError, match='No result posted for invocation "the invocation id" within 0.05 seconds'):
+        invocation_post_office.invoke(an_invocation_with(invocation_id='the invocation id'), 0.05)
+
+
+def test_withdraws_invocation_that_timed_out_before_being_collected() -> None:
+    invocation_post_office = InMemoryInvocationPostOffice(collection_wait_seconds=0.05)
+
+    with pytest.raises(TimeoutError):
+        invocation_post_office.invoke(an_invocation_with(invocation_id='the invocation id'), 0.05)
+
+    assert invocation_post_office.collect_invocations() == []
+
+
+def test_discards_result_posted_after_invocation_timed_out() -> None:
+    invocation_post_office = InMemoryInvocationPostOffice()
+    invocation = an_invocation_with(invocation_id='the invocation id')
+
+    with pytest.raises(TimeoutError):
+        invocation_post_office.invoke(invocation, 0.05)
+
+    invocation_post_office.post_result('the invocation id', 'the late result')
+
+    # Kept, the late result would be provided straight away to another invocation with the same id
+    with pytest.raises(TimeoutError):
+        invocation_post_office.invoke(invocation, 0.05)
+
+
+def test_collects_nothing_whilst_collection_interrupted() -> None:
+    invocation_post_office = InMemoryInvocationPostOffice(collection_wait_seconds=5)
+    invocation = an_invocation_with(invocation_id='the invocation id')
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        collection_future = executor.submit(invocation_post_office.collect_invocations)
+        invocation_post_office.interrupt_collection()
+
+        assert collection_future.result(timeout=1) == []
+
+        result_future = executor.submit(invocation_post_office.invoke, invocation, 5)
+
+        assert invocation_post_office.collect_invocations() == []
+
+        invocation_post_office.resume_collection()
+
+        assert invocation_post_office.collect_invocations() == [invocation]
+
+        invocation_post_office.post_result('the invocation id', 'the result')
+        result_future.result(timeout=5)
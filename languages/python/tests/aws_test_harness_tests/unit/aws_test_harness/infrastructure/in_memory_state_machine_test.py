@@ -0,0 +1,83 @@
+import asyncio
+import json
+from logging import Logger
+from threading import Event
+from typing import Any, Dict
+
+from aws_test_harness.domain.state_machine_execution_failure import StateMachineExecutionFailure
+from aws_test_harness.infrastructure.in_memory_state_machine import InMemoryStateMachine
+
+STATE_MACHINE_ARN = 'arn:aws:states:local:000000000000:stateMachine:TheStateMachine'
+
+
+def test_describes_execution_succeeding_with_output_of_definition(logger: Logger) -> None:
+    state_machine = InMemoryStateMachine(STATE_MACHINE_ARN, lambda execution_input: dict(echo=execution_input),
+                                         logger)
+
+    execution = state_machine.execute(dict(message='Hello'))
+
+    assert execution.status == 'SUCCEEDED'
+    assert json.loads(execution.output or '') == dict(echo=dict(message='Hello'))
+
+
+def test_describes_execution_failing_with_failure_returned_by_definition(logger: Logger) -> None:
+    state_machine = InMemoryStateMachine(
+        STATE_MACHINE_ARN,
+        lambda _: StateMachineExecutionFailure(error='the error', cause='the cause'),
+        logger
+    )
+
+    execution = state_machine.execute({})
+
+    assert execution.status == 'FAILED'
+    assert execution.error == 'the error'
+    assert execution.cause == 'the cause'
+
+
+def test_describes_execution_failing_with_exception_raised_by_definition(logger: Logger) -> None:
+    def raise_exception(_: Dict[str, Any]) -> Dict[str, Any]:
+        raise ValueError('the cause')
+
+    execution = InMemoryStateMachine(STATE_MACHINE_ARN, raise_exception, logger).execute({})
+
+    assert execution.status == 'FAILED'
+    assert execution.error == 'ValueError'
+    assert execution.cause == 'the cause'
+
+
+def test_describes_execution_as_running_until_definition_completes(logger: Logger) -> None:
+    completion_permitted = Event()
+
+    def wait_for_permission(_: Dict[str, Any]) -> Dict[str, Any]:
+        completion_permitted.wait(timeout=5)
+        return {}
+
+    execution = InMemoryStateMachine(STATE_MACHINE_ARN, wait_for_permission, logger).start({})
+
+    assert execution.status == 'RUNNING'
+
+    completion_permitted.set()
+    execution.wait_for_completion()
+
+    assert execution.status == 'SUCCEEDED'
+
+
+def test_provides_definition_with_copy_of_execution_input(logger: Logger) -> None:
+    def mutate_input(execution_input: Dict[str, Any]) -> Dict[str, Any]:
+        execution_input['mutated'] = True
+        return execution_input
+
+    execution_input: Dict[str, Any] = dict(message='Hello')
+    InMemoryStateMachine(STATE_MACHINE_ARN, mutate_input, logger).execute(execution_input)
+
+    assert execution_input == dict(message='Hello')
+
+
+def test_executes_state_machine_asynchronously(logger: Logger) -> None:
+    state_machine = InMemoryStateMachine(STATE_MACHINE_ARN, lambda execution_input: execution_input['number'], logger)
+
+    async def execute_all() -> list[str | None]:
+        executions = await asyncio.gather(*[state_machine.execute_async(dict(number=number)) for number in range(3)])
+        return [execution.output for execution in executions]
+
+    assert asyncio.run(execute_all()) == ['0', '1', '2']
@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from aws_test_harness.domain.invocation_stage_timing import InvocationStageTiming
+from aws_test_harness.domain.invocation_trace_report import InvocationTraceReport
+from aws_test_harness.infrastructure.otlp_json_invocation_trace_exporter import OtlpJsonInvocationTraceExporter
+
+
+def exported_spans(file_path: Path) -> List[Dict[str, Any]]:
+    traces = json.loads(file_path.read_text())
+    [resource_spans] = traces['resourceSpans']
+    [scope_spans] = resource_spans['scopeSpans']
+    return scope_spans['spans']
+
+
+def test_exports_span_for_each_stage_within_span_for_invocation(tmp_path: Path) -> None:
+    report = InvocationTraceReport()
+    report.record(InvocationStageTiming('queue_delivery', 1700000000, 0.25, 'the invocation id'))
+    report.record(InvocationStageTiming('result_generation', 1700000000.25, 0.5, 'the invocation id'))
+    trace_file_path = tmp_path / 'traces.json'
+
+    OtlpJsonInvocationTraceExporter(str(trace_file_path)).export(report)
+
+    [invocation_span, queue_delivery_span, result_generation_span] = exported_spans(trace_file_path)
+    assert invocation_span['name'] == 'invocation'
+    assert invocation_span['startTimeUnixNano'] == '1700000000000000000'
+    assert invocation_span['endTimeUnixNano'] == '1700000000750000000'
+    assert 'parentSpanId' not in invocation_span
+    assert invocation_span['attributes'] == [dict(key='invocation.id', value=dict(stringValue='the invocation id'))]
+
+    assert queue_delivery_span['name'] == 'queue_delivery'
+    assert queue_delivery_span['startTimeUnixNano'] == '1700000000000000000'
+    assert queue_delivery_span['endTimeUnixNano'] == '1700000000250000000'
+    assert queue_delivery_span['parentSpanId'] == invocation_span['spanId']
+
+    assert result_generation_span['name'] == 'result_generation'
+    assert result_generation_span['parentSpanId'] == invocation_span['spanId']
+
+    assert {span['traceId'] for span in [invocation_span, queue_delivery_span, result_generation_span]} == {
+        invocation_span['traceId']
+    }
+    assert len({span['spanId'] for span in [invocation_span, queue_delivery_span, result_generation_span]}) == 3
+
+
+def test_exports_separate_trace_for_each_invocation(tmp_path: Path) -> None:
+    report = InvocationTraceReport()
+    report.record(InvocationStageTiming('queue_delivery', 1, 0.25, 'first invocation id'))
+    report.record(InvocationStageTiming('queue_delivery', 1, 0.25, 'second invocation id'))
+    trace_file_path = tmp_path / 'traces.json'
+
+    OtlpJsonInvocationTraceExporter(str(trace_file_path)).export(report)
+
+    spans = exported_spans(trace_file_path)
+    assert len(spans) == 4
+    assert len({span['traceId'] for span in spans}) == 2
+    assert all(len(span['traceId']) == 32 and len(span['spanId']) == 16 for span in spans)
+
+
+def test_derives_same_trace_id_for_same_invocation_in_every_report(tmp_path: Path) -> None:
+    first_report = InvocationTraceReport()
+    first_report.record(InvocationStageTiming('queue_delivery', 1, 0.25, 'the invocation id'))
+    second_report = InvocationTraceReport()
+    second_report.record(InvocationStageTiming('result_posting', 2, 0.25, 'the invocation id'))
+
+    OtlpJsonInvocationTraceExporter(str(tmp_path / 'first.json')).export(first_report)
+    OtlpJsonInvocationTraceExporter(str(tmp_path / 'second.json')).export(second_report)
+
+    first_trace_id = exported_spans(tmp_path / 'first.json')[0]['traceId']
+    assert exported_spans(tmp_path / 'second.json')[0]['traceId'] == first_trace_id
+
+
+def test_identifies_service_and_creates_directory_for_trace_file(tmp_path: Path) -> None:
+    trace_file_path = tmp_path / 'reports' / 'traces.json'
+
+    OtlpJsonInvocationTraceExporter(str(trace_file_path), service_name='the-service').export(InvocationTraceReport())
+
+    traces = json.loads(trace_file_path.read_text())
+    assert traces['resourceSpans'][0]['resource']['attributes'] == [
+        dict(key='service.name', value=dict(stringValue='the-service'))
+    ]
+    assert exported_spans(trace_file_path) == []
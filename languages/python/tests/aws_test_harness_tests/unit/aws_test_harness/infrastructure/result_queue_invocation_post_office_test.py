@@ -0,0 +1,141 @@
+import json
+import time
+from logging import Logger
+from uuid import uuid4
+
+import pytest
+from mypy_boto3_sqs import SQSClient
+
+from aws_test_harness.domain.results_not_posted_exception import ResultsNotPostedException
+from aws_test_harness.infrastructure.result_queue_invocation_post_office import ResultQueueInvocationPostOffice
+from aws_test_harness_test_support.in_memory_sqs_client import InMemorySQSClient
+from aws_test_harness_test_support.mocking import mock_class, when_calling, inspect
+
+
+@pytest.fixture()
+def sqs_client() -> InMemorySQSClient:
+    return InMemorySQSClient()
+
+
+@pytest.fixture()
+def invocation_queue_url(sqs_client: InMemorySQSClient) -> str:
+    return sqs_client.create_queue(QueueName='invocations')['QueueUrl']
+
+
+@pytest.fixture()
+def result_queue_url(sqs_client: InMemorySQSClient) -> str:
+    return sqs_client.create_queue(QueueName='results')['QueueUrl']
+
+
+@pytest.fixture()
+def invocation_post_office(sqs_client: InMemorySQSClient, invocation_queue_url: str, result_queue_url: str,
+                           logger: Logger) -> ResultQueueInvocationPostOffice:
+    return ResultQueueInvocationPostOffice(invocation_queue_url, result_queue_url, sqs_client.as_sqs_client(), logger)
+
+
+def send_invocation_message(invocation_id: str, invocation_target: str, invocation_queue_url: str,
+                            sqs_client: InMemorySQSClient) -> None:
+    sqs_client.send_message(
+        QueueUrl=invocation_queue_url,
+        MessageBody=json.dumps(dict(parameters=dict(invocationId=invocation_id))),
+        MessageAttributes=dict(
+            InvocationTarget=dict(StringValue=invocation_target, DataType='String'),
+            InvocationId=dict(StringValue=invocation_id, DataType='String'),
+        )
+    )
+
+
+def test_deletes_invocation_messages_in_one_request_once_results_posted(
+        invocation_post_office: ResultQueueInvocationPostOffice, sqs_client: InMemorySQSClient,
+        invocation_queue_url: str) -> None:
+    invocation_ids = [str(uuid4()) for _ in range(3)]
+    for invocation_id in invocation_ids:
+        send_invocation_message(invocation_id, 'the-invocation-target', invocation_queue_url, sqs_client)
+
+    invocations = invocation_post_office.collect_invocations()
+    invocation_post_office.post_results({invocation.id: 'the result' for invocation in invocations})
+
+    assert sqs_client.request_count('delete_message_batch') == 1
+    assert sqs_client.receive_message(QueueUrl=invocation_queue_url, VisibilityTimeout=0) == {}
+
+
+def test_sends_result_to_result_queue(invocation_post_office: ResultQueueInvocationPostOffice,
+                                      sqs_client: InMemorySQSClient, result_queue_url: str) -> None:
+    invocation_id = str(uuid4())
+
+    invocation_post_office.post_result(invocation_id, dict(status='succeeded', context=dict(result='the result')))
+
+    received_message = sqs_client.receive_message(
+        QueueUrl=result_queue_url, MessageAttributeNames=['All']
+    )['Messages'][0]
+    assert received_message['MessageAttributes']['InvocationId']['StringValue'] == invocation_id
+    assert json.loads(received_message['Body']) == dict(
+        result=dict(status='succeeded', context=dict(result='the result'))
+    )
+
+
+def test_sends_many_results_to_result_queue_in_batches(invocation_post_office: ResultQueueInvocationPostOffice,
+                                                       sqs_client: InMemorySQSClient, result_queue_url: str) -> None:
+    results = {str(uuid4()): f'result {index}' for index in range(12)}
+
+    invocation_post_office.post_results(results)
+
+    received_messages = sqs_client.receive_message(
+        QueueUrl=result_queue_url, MessageAttributeNames=['All'], MaxNumberOfMessages=20
+    )['Messages']
+    assert {
+        message['MessageAttributes']['InvocationId']['StringValue']: json.loads(message['Body'])['result']
+        for message in received_messages
+    } == results
+    assert sqs_client.request_count('send_message_batch') == 2
+
+
+def test_stamps_results_with_time_at_which_they_were_posted(invocation_post_office: ResultQueueInvocationPostOffice,
+                                                            sqs_client: InMemorySQSClient,
+                                                            result_queue_url: str) -> None:
+    before_posting_millis = time.time() * 1000
+    invocation_post_office.post_result('first invocation id', 'first result')
+    invocation_post_office.post_results({'second invocation id': 'second result'})
+    after_posting_millis = time.time() * 1000
+
+    received_messages = sqs_client.receive_message(
+        QueueUrl=result_queue_url, MessageAttributeNames=['All'], MaxNumberOfMessages=10
+    )['Messages']
+
+    assert len(received_messages) == 2
+    for message in received_messages:
+        posted_time_millis = int(message['MessageAttributes']['ResultPostedTime']['StringValue'])
+        assert before_posting_millis - 1 <= posted_time_millis <= after_posting_millis + 1
+
+
+def test_names_every_invocation_whose_result_failed_to_post_after_attempting_every_batch(logger: Logger) -> None:
+    sqs_client = mock_class(SQSClient)
+    when_calling(sqs_client.send_message_batch).respond_with(
+        dict(Successful=[], Failed=[dict(Id='1', SenderFault=False, Code='InternalError', Message='the message')]),
+        dict(Successful=[], Failed=[dict(Id='0', SenderFault=False, Code='InternalError', Message='the message')]),
+    )
+    invocation_post_office = ResultQueueInvocationPostOffice('the invocation queue url', 'the result queue url',
+                                                             sqs_client, logger)
+    invocation_ids = [f'invocation {index}' for index in range(12)]
+
+    with pytest.raises(ResultsNotPostedException, match='invocation 1, invocation 10: the message') as exception_info:
+        invocation_post_office.post_results({invocation_id: 'the result' for invocation_id in invocation_ids})
+
+    assert exception_info.value.invocation_ids == ['invocation 1', 'invocation 10']
+    assert inspect(sqs_client.send_message_batch).call_count == 2
+
+
+def test_names_only_invocations_whose_results_were_not_sent_when_a_later_batch_fails(logger: Logger) -> None:
+    sqs_client = mock_class(SQSClient)
+    when_calling(sqs_client.send_message_batch).respond_with(
+        dict(Successful=[], Failed=[dict(Id='1', SenderFault=False, Code='InternalError', Message='the message')]),
+        Exception('the send failure'),
+    )
+    invocation_post_office = ResultQueueInvocationPostOffice('the invocation queue url', 'the result queue url',
+                                                             sqs_client, logger)
+    invocation_ids = [f'invocation {index}' for index in range(12)]
+
+    with pytest.raises(ResultsNotPostedException, match='the send failure') as exception_info:
+        invocation_post_office.post_results({invocation_id: 'the result' for invocation_id in invocation_ids})
+
+    assert exception_info.value.invocation_ids == ['invocation 1', 'invocation 10', 'invocation 11']
@@ -0,0 +1,79 @@
+from logging import Logger
+
+import pytest
+from boto3 import Session
+from mypy_boto3_dynamodb.client import DynamoDBClient
+
+from aws_test_harness.infrastructure.boto_client_pool import BotoClientPool
+from aws_test_harness.infrastructure.serverless_invocation_post_office import ServerlessInvocationPostOffice
+from aws_test_harness_test_support.in_memory_boto_session import InMemoryBotoSession
+from aws_test_harness_test_support.in_memory_dynamodb_resource import InMemoryDynamoDBResource
+from aws_test_harness_test_support.in_memory_sqs_client import InMemorySQSClient
+from aws_test_harness_test_support.mocking import mock_class, when_calling, inspect
+
+
+@pytest.fixture()
+def sqs_client() -> InMemorySQSClient:
+    return InMemorySQSClient()
+
+
+@pytest.fixture()
+def invocation_queue_url(sqs_client: InMemorySQSClient) -> str:
+    return sqs_client.create_queue(QueueName='invocations')['QueueUrl']
+
+
+@pytest.fixture()
+def dynamodb_resource() -> InMemoryDynamoDBResource:
+    dynamodb_resource = InMemoryDynamoDBResource()
+    dynamodb_resource.create_table(TableName='invocations', KeySchema=[dict(AttributeName='id', KeyType='HASH')])
+
+    return dynamodb_resource
+
+
+@pytest.fixture()
+def invocation_post_office(sqs_client: InMemorySQSClient, invocation_queue_url: str,
+                           dynamodb_resource: InMemoryDynamoDBResource,
+                           logger: Logger) -> ServerlessInvocationPostOffice:
+    boto_session = InMemoryBotoSession(sqs_client, dynamodb_resource).as_boto_session()
+    return ServerlessInvocationPostOffice(invocation_queue_url, 'invocations', BotoClientPool(boto_session), logger)
+
+
+def test_puts_result_item_in_invocation_table(invocation_post_office: ServerlessInvocationPostOffice,
+                                              dynamodb_resource: InMemoryDynamoDBResource) -> None:
+    invocation_post_office.post_result('the invocation id', dict(value='the result value', count=2))
+
+    item = dynamodb_resource.Table('invocations').get_item(Key=dict(id='the invocation id'))['Item']
+    assert item['result'] == dict(value='the result value', count=2)
+
+
+def test_writes_many_result_items_to_invocation_table_in_batches(
+        invocation_post_office: ServerlessInvocationPostOffice, dynamodb_resource: InMemoryDynamoDBResource) -> None:
+    results = {f'invocation {index}': dict(value=f'result value {index}') for index in range(30)}
+
+    invocation_post_office.post_results(results)
+
+    assert dynamodb_resource.request_count('batch_write_item') == 2
+    for invocation_id, result in results.items():
+        item = dynamodb_resource.Table('invocations').get_item(Key=dict(id=invocation_id))['Item']
+        assert item['result'] == result
+
+
+def test_writes_result_items_left_unprocessed_again(sqs_client: InMemorySQSClient, invocation_queue_url: str,
+                                                     logger: Logger) -> None:
+    dynamodb_client = mock_class(DynamoDBClient)
+    unprocessed_items = dict(invocations=[dict(PutRequest=dict(Item=dict(id=dict(S='invocation 1'))))])
+    when_calling(dynamodb_client.batch_write_item).respond_with(
+        dict(UnprocessedItems=unprocessed_items),
+        dict(UnprocessedItems={})
+    )
+    boto_session = mock_class(Session)
+    when_calling(boto_session.client).invoke(
+        lambda service_name, **_: sqs_client if service_name == 'sqs' else dynamodb_client
+    )
+    invocation_post_office = ServerlessInvocationPostOffice(invocation_queue_url, 'invocations',
+                                                            BotoClientPool(boto_session), logger)
+
+    invocation_post_office.post_results({'invocation 0': 'the result', 'invocation 1': 'the result'})
+
+    assert inspect(dynamodb_client.batch_write_item).call_count == 2
+    assert inspect(dynamodb_client.batch_write_item).call_args.kwargs['RequestItems'] == unprocessed_items
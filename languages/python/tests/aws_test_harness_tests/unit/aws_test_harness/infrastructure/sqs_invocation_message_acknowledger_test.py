@@ -0,0 +1,95 @@
+import json
+import time
+from logging import Logger
+from typing import Any, Dict, List
+
+import pytest
+
+from aws_test_harness.infrastructure.sqs_invocation_message_acknowledger import SqsInvocationMessageAcknowledger
+from aws_test_harness_test_support.in_memory_sqs_client import InMemorySQSClient
+
+
+@pytest.fixture()
+def sqs_client() -> InMemorySQSClient:
+    return InMemorySQSClient()
+
+
+@pytest.fixture()
+def invocation_queue_url(sqs_client: InMemorySQSClient) -> str:
+    return sqs_client.create_queue(QueueName='invocations')['QueueUrl']
+
+
+def receive_invocation_messages(sqs_client: InMemorySQSClient, invocation_queue_url: str, invocation_count: int,
+                                visibility_timeout_seconds: float) -> List[Dict[str, Any]]:
+    for index in range(invocation_count):
+        sqs_client.send_message(
+            QueueUrl=invocation_queue_url,
+            MessageBody=json.dumps(dict(parameters=dict())),
+            MessageAttributes=dict(InvocationId=dict(StringValue=f'invocation {index}', DataType='String'))
+        )
+
+    return sqs_client.receive_message(QueueUrl=invocation_queue_url, MaxNumberOfMessages=10,
+                                      VisibilityTimeout=visibility_timeout_seconds)['Messages']
+
+
+def test_deletes_held_messages_in_batches_once_acknowledged(sqs_client: InMemorySQSClient, invocation_queue_url: str,
+                                                            logger: Logger) -> None:
+    acknowledger = SqsInvocationMessageAcknowledger(invocation_queue_url, sqs_client.as_sqs_client(), logger)
+    messages = receive_invocation_messages(sqs_client, invocation_queue_url, 10, 30) + \
+        receive_invocation_messages(sqs_client, invocation_queue_url, 2, 30)
+
+    for index, message in enumerate(messages):
+        acknowledger.hold(f'invocation id {index}', message['ReceiptHandle'])
+
+    acknowledger.acknowledge([f'invocation id {index}' for index in range(len(messages))])
+
+    assert sqs_client.request_count('delete_message_batch') == 2
+    assert sqs_client.receive_message(QueueUrl=invocation_queue_url, MaxNumberOfMessages=10) == {}
+
+
+def test_ignores_acknowledgement_of_invocation_not_held(sqs_client: InMemorySQSClient, invocation_queue_url: str,
+                                                        logger: Logger) -> None:
+    acknowledger = SqsInvocationMessageAcknowledger(invocation_queue_url, sqs_client.as_sqs_client(), logger)
+
+    acknowledger.acknowledge(['unknown invocation id'])
+
+    assert sqs_client.request_count('delete_message_batch') == 0
+
+
+def test_keeps_held_messages_hidden_beyond_visibility_timeout(sqs_client: InMemorySQSClient, invocation_queue_url: str,
+                                                              logger: Logger) -> None:
+    acknowledger = SqsInvocationMessageAcknowledger(invocation_queue_url, sqs_client.as_sqs_client(), logger,
+                                                    visibility_timeout_seconds=1)
+    [message] = receive_invocation_messages(sqs_client, invocation_queue_url, 1, 1)
+    acknowledger.hold('the invocation id', message['ReceiptHandle'])
+
+    time.sleep(1.5)
+
+    assert sqs_client.receive_message(QueueUrl=invocation_queue_url) == {}
+    assert sqs_client.request_count('change_message_visibility_batch') >= 1
+
+    acknowledger.acknowledge(['the invocation id'])
+
+
+def test_releases_messages_to_be_delivered_again_once_held_for_maximum_hold_time(
+        sqs_client: InMemorySQSClient, invocation_queue_url: str, logger: Logger) -> None:
+    acknowledger = SqsInvocationMessageAcknowledger(invocation_queue_url, sqs_client.as_sqs_client(), logger,
+                                                    visibility_timeout_seconds=4, maximum_hold_seconds=0.1)
+    [message] = receive_invocation_messages(sqs_client, invocation_queue_url, 1, 4)
+    acknowledger.hold('the invocation id', message['ReceiptHandle'])
+
+    # Delivered again well before the visibility timeout with which the message was received has elapsed
+    redelivered_messages = sqs_client.receive_message(QueueUrl=invocation_queue_url, WaitTimeSeconds=2.5,
+                                                      MessageAttributeNames=['All']).get('Messages', [])
+
+    assert [message['MessageAttributes']['InvocationId']['StringValue'] for message in redelivered_messages] == [
+        'invocation 0'
+    ]
+    assert sqs_client.request_count('change_message_visibility_batch') == 1
+
+
+def test_rejects_visibility_timeout_below_one_second(sqs_client: InMemorySQSClient, invocation_queue_url: str,
+                                                     logger: Logger) -> None:
+    with pytest.raises(ValueError, match='Visibility timeout must be at least 1 second but was 0'):
+        SqsInvocationMessageAcknowledger(invocation_queue_url, sqs_client.as_sqs_client(), logger,
+                                         visibility_timeout_seconds=0)
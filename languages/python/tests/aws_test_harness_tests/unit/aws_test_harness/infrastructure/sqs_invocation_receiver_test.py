@@ -0,0 +1,115 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+from uuid import uuid4
+
+import pytest
+
+from aws_test_harness.domain.invocation import Invocation
+from aws_test_harness.infrastructure.sqs_invocation_receiver import SqsInvocationReceiver
+from aws_test_harness_test_support.eventual_consistency_utils import wait_for_value_matching
+from aws_test_harness_test_support.in_memory_sqs_client import InMemorySQSClient
+
+
+@pytest.fixture()
+def sqs_client() -> InMemorySQSClient:
+    return InMemorySQSClient()
+
+
+@pytest.fixture()
+def invocation_queue_url(sqs_client: InMemorySQSClient) -> str:
+    return sqs_client.create_queue(QueueName='invocations')['QueueUrl']
+
+
+@pytest.fixture()
+def invocation_receiver(sqs_client: InMemorySQSClient, invocation_queue_url: str,
+                        logger: Logger) -> SqsInvocationReceiver:
+    return SqsInvocationReceiver(invocation_queue_url, sqs_client.as_sqs_client(), logger)
+
+
+def send_invocation_message(invocation_id: str, invocation_target: str, invocation_queue_url: str,
+                            sqs_client: InMemorySQSClient) -> None:
+    sqs_client.send_message(
+        QueueUrl=invocation_queue_url,
+        MessageBody=json.dumps(dict(parameters=dict(invocationId=invocation_id))),
+        MessageAttributes=dict(
+            InvocationTarget=dict(StringValue=invocation_target, DataType='String'),
+            InvocationId=dict(StringValue=invocation_id, DataType='String'),
+        )
+    )
+
+
+def test_collects_invocations_from_invocation_queue_leaving_them_hidden_from_other_receivers(
+        invocation_receiver: SqsInvocationReceiver, sqs_client: InMemorySQSClient,
+        invocation_queue_url: str) -> None:
+    invocation_ids = [str(uuid4()) for _ in range(3)]
+    for invocation_id in invocation_ids:
+        send_invocation_message(invocation_id, 'the-invocation-target', invocation_queue_url, sqs_client)
+
+    invocations = invocation_receiver.receive_invocations()
+
+    assert invocations == [
+        Invocation(target='the-invocation-target', id=invocation_id, parameters=dict(invocationId=invocation_id))
+        for invocation_id in invocation_ids
+    ]
+    assert sqs_client.request_count('delete_message_batch') == 0
+    assert sqs_client.receive_message(QueueUrl=invocation_queue_url) == {}
+
+
+def test_collects_no_invocations_when_invocation_queue_empty(invocation_receiver: SqsInvocationReceiver,
+                                                             sqs_client: InMemorySQSClient) -> None:
+    assert invocation_receiver.receive_invocations() == []
+    assert sqs_client.request_count('delete_message_batch') == 0
+
+
+def test_collects_time_at_which_invocation_was_sent_when_stamped(
+        invocation_receiver: SqsInvocationReceiver, sqs_client: InMemorySQSClient,
+        invocation_queue_url: str) -> None:
+    sqs_client.send_message(
+        QueueUrl=invocation_queue_url,
+        MessageBody=json.dumps(dict(parameters=dict())),
+        MessageAttributes=dict(
+            InvocationTarget=dict(StringValue='the-invocation-target', DataType='String'),
+            InvocationId=dict(StringValue='the-invocation-id', DataType='String'),
+            InvocationSentTime=dict(StringValue='1700000000123', DataType='Number'),
+        )
+    )
+
+    invocations = invocation_receiver.receive_invocations()
+
+    assert [invocation.sent_time for invocation in invocations] == [1700000000.123]
+
+
+def test_stops_collecting_straight_away_when_interrupted_leaving_invocations_to_be_collected_once_resumed(
+        invocation_receiver: SqsInvocationReceiver, sqs_client: InMemorySQSClient,
+        invocation_queue_url: str) -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        collection_future = executor.submit(invocation_receiver.receive_invocations)
+        # Lets the long poll begin before it is interrupted
+        wait_for_value_matching(lambda: sqs_client.request_count('receive_message'), 'long poll started',
+                                lambda request_count: request_count == 1)
+
+        invocation_receiver.interrupt()
+
+        assert collection_future.result(timeout=0.5) == []
+
+    # Received by the interrupted long poll and released straight away
+    send_invocation_message('the-invocation-id', 'the-invocation-target', invocation_queue_url, sqs_client)
+    wait_for_value_matching(lambda: sqs_client.request_count('change_message_visibility_batch'), 'message released',
+                            lambda request_count: request_count == 1)
+
+    invocation_receiver.resume()
+
+    assert [invocation.id for invocation in invocation_receiver.receive_invocations()] == ['the-invocation-id']
+
+
+def test_deletes_messages_only_for_invocations_that_it_received(invocation_receiver: SqsInvocationReceiver,
+                                                                sqs_client: InMemorySQSClient,
+                                                                invocation_queue_url: str) -> None:
+    send_invocation_message('the-invocation-id', 'the-invocation-target', invocation_queue_url, sqs_client)
+
+    invocation_receiver.receive_invocations()
+    invocation_receiver.acknowledge(['the-invocation-id', 'unknown-invocation-id'])
+    invocation_receiver.acknowledge(['the-invocation-id'])
+
+    assert sqs_client.request_count('delete_message_batch') == 1
@@ -0,0 +1,141 @@
+import threading
+from logging import Logger
+from time import monotonic
+from typing import List
+
+import pytest
+from botocore.exceptions import ClientError
+
+from aws_test_harness.domain.exponential_backoff import ExponentialBackoff
+from aws_test_harness.domain.state_machine_execution import StateMachineExecution
+from aws_test_harness.domain.state_machine_execution_description import StateMachineExecutionDescription
+from aws_test_harness.infrastructure.step_functions_execution_watcher import StepFunctionsExecutionWatcher
+from aws_test_harness_test_support.eventual_consistency_utils import wait_for_value_matching
+from aws_test_harness_test_support.mocking import mock_class, when_calling, inspect
+
+FAST_BACKOFF = ExponentialBackoff(initial_delay_seconds=0.001, maximum_delay_seconds=0.001)
+
+RUNNING = StateMachineExecutionDescription(status='RUNNING')
+SUCCEEDED = StateMachineExecutionDescription(status='SUCCEEDED')
+
+
+def an_execution_described_as(*descriptions: StateMachineExecutionDescription | Exception) -> StateMachineExecution:
+    execution = mock_class(StateMachineExecution)
+    when_calling(execution.describe).respond_with(*descriptions)
+    return execution
+
+
+def a_client_error_with(code: str) -> ClientError:
+    return ClientError(dict(Error=dict(Code=code, Message='the message')), 'DescribeExecution')
+
+
+def test_resolves_future_with_description_once_execution_reaches_terminal_status(logger: Logger) -> None:
+    watcher = StepFunctionsExecutionWatcher(logger, 1000, FAST_BACKOFF, FAST_BACKOFF)
+    execution = an_execution_described_as(RUNNING, RUNNING, SUCCEEDED)
+
+    description = watcher.watch(execution).result(timeout=5)
+
+    assert description == SUCCEEDED
+    assert inspect(execution.describe).call_count == 3
+
+
+def test_provides_same_future_to_every_waiter_on_an_execution(logger: Logger) -> None:
+    watcher = StepFunctionsExecutionWatcher(logger, 1000, FAST_BACKOFF, FAST_BACKOFF)
+    execution = an_execution_described_as(RUNNING, RUNNING, SUCCEEDED)
+
+    first_future = watcher.watch(execution)
+    second_future = watcher.watch(execution)
+
+    assert second_future is first_future
+    assert first_future.result(timeout=5) == SUCCEEDED
+    assert inspect(execution.describe).call_count == 3
+
+
+def test_keeps_request_rate_within_budget_however_many_executions_watched(logger: Logger) -> None:
+    request_times: List[float] = []
+    executions = []
+
+    for _ in range(10):
+        execution = mock_class(StateMachineExecution)
+        responses = iter([RUNNING, RUNNING, SUCCEEDED])
+
+        def describe(responses=responses) -> StateMachineExecutionDescription:
+            request_times.append(monotonic())
+            return next(responses)
+
+        when_calling(execution.describe).invoke(describe)
+        executions.append(execution)
+
+    watcher = StepFunctionsExecutionWatcher(logger, 100, FAST_BACKOFF, FAST_BACKOFF)
+
+    futures = [watcher.watch(execution) for execution in executions]
+
+    assert [future.result(timeout=5) for future in futures] == [SUCCEEDED] * 10
+    assert len(request_times) == 30
+    # 30 requests at no more than 100 per second
+    assert request_times[-1] - request_times[0] >= 0.29
+
+
+def test_polls_each_execution_in_turn(logger: Logger) -> None:
+    described_executions: List[str] = []
+
+    def an_execution_named(name: str) -> StateMachineExecution:
+        execution = mock_class(StateMachineExecution)
+        responses = iter([RUNNING, RUNNING, SUCCEEDED])
+
+        def describe() -> StateMachineExecutionDescription:
+            described_executions.append(name)
+            return next(responses)
+
+        when_calling(execution.describe).invoke(describe)
+        return execution
+
+    watcher = StepFunctionsExecutionWatcher(
+        logger, 1000, ExponentialBackoff(initial_delay_seconds=0.05, maximum_delay_seconds=0.05), FAST_BACKOFF
+    )
+
+    futures = [watcher.watch(an_execution_named(name)) for name in ['first', 'second', 'third']]
+    for future in futures:
+        future.result(timeout=5)
+
+    assert described_executions == ['first', 'second', 'third'] * 3
+
+
+def test_pauses_all_polling_when_throttled(logger: Logger) -> None:
+    watcher = StepFunctionsExecutionWatcher(
+        logger, 1000, FAST_BACKOFF, ExponentialBackoff(initial_delay_seconds=0.1, maximum_delay_seconds=0.1)
+    )
+    execution = an_execution_described_as(a_client_error_with('ThrottlingException'), SUCCEEDED)
+
+    start_time = monotonic()
+    description = watcher.watch(execution).result(timeout=5)
+
+    assert description == SUCCEEDED
+    assert monotonic() - start_time >= 0.1
+
+
+def test_passes_other_errors_to_waiter(logger: Logger) -> None:
+    watcher = StepFunctionsExecutionWatcher(logger, 1000, FAST_BACKOFF, FAST_BACKOFF)
+    execution = an_execution_described_as(a_client_error_with('ExecutionDoesNotExist'))
+
+    with pytest.raises(ClientError, match='ExecutionDoesNotExist'):
+        watcher.watch(execution).result(timeout=5)
+
+
+def test_stops_polling_thread_once_no_executions_outstanding(logger: Logger) -> None:
+    watcher = StepFunctionsExecutionWatcher(logger, 1000, FAST_BACKOFF, FAST_BACKOFF)
+
+    watcher.watch(an_execution_described_as(SUCCEEDED)).result(timeout=5)
+
+    wait_for_value_matching(
+        lambda: [thread for thread in threading.enumerate() if thread.name == 'StepFunctionsExecutionWatcher'],
+        'no execution watcher threads',
+        lambda threads: threads == []
+    )
+
+    assert watcher.watch(an_execution_described_as(SUCCEEDED)).result(timeout=5) == SUCCEEDED
+
+
+def test_rejects_non_positive_request_budget(logger: Logger) -> None:
+    with pytest.raises(ValueError, match='Maximum requests per second must be positive but was 0'):
+        StepFunctionsExecutionWatcher(logger, 0)
@@ -0,0 +1,41 @@
+import json
+import subprocess
+import sys
+from typing import List
+
+
+def import_in_fresh_interpreter(import_statement: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [
+            sys.executable, '-c',
+            f'{import_statement}; import json, sys; print(json.dumps(sorted(sys.modules)))'
+        ],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+
+def test_imports_harness_entry_point_without_loading_aws_sdk() -> None:
+    completed_process = import_in_fresh_interpreter('from aws_test_harness import aws_test_harness')
+
+    imported_modules: List[str] = json.loads(completed_process.stdout)
+    assert [module for module in imported_modules if module.startswith(('boto', 'mypy_boto3'))] == []
+
+
+def test_imports_package_without_loading_aws_sdk_or_harness_infrastructure() -> None:
+    completed_process = import_in_fresh_interpreter('import aws_test_harness')
+
+    imported_modules: List[str] = json.loads(completed_process.stdout)
+    assert [
+        module for module in imported_modules
+        if module.startswith(('boto', 'mypy_boto3', 'aws_test_harness.infrastructure', 'aws_test_harness.domain'))
+    ] == []
+
+
+def test_provides_harness_classes_on_first_access() -> None:
+    completed_process = import_in_fresh_interpreter('from aws_test_harness import TestHarness, AsyncTestHarness')
+
+    imported_modules: List[str] = json.loads(completed_process.stdout)
+    assert 'aws_test_harness.domain.test_harness' in imported_modules
+    assert 'aws_test_harness.domain.async_test_harness' in imported_modules
@@ -0,0 +1,39 @@
+from typing import Any, cast
+
+from boto3 import Session
+
+from aws_test_harness_test_support.in_memory_dynamodb_client import InMemoryDynamoDBClient
+from aws_test_harness_test_support.in_memory_dynamodb_resource import InMemoryDynamoDBResource
+from aws_test_harness_test_support.in_memory_sqs_client import InMemorySQSClient
+from aws_test_harness_test_support.in_memory_sqs_resource import InMemorySQSResource
+
+
+# Provides in-memory stand-ins in place of the SQS and DynamoDB clients and resources that a boto session would create,
+# so that components taking a session can be exercised without AWS
+class InMemoryBotoSession:
+    def __init__(self, sqs_client: InMemorySQSClient, dynamodb_resource: InMemoryDynamoDBResource) -> None:
+        self.__sqs_client = sqs_client
+        self.__sqs_resource = InMemorySQSResource(sqs_client)
+        self.__dynamodb_resource = dynamodb_resource
+        self.__dynamodb_client = InMemoryDynamoDBClient(dynamodb_resource)
+
+    def as_boto_session(self) -> Session:
+        return cast(Session, self)
+
+    def client(self, service_name: str, **_: Any) -> Any:
+        if service_name == 'sqs':
+            return self.__sqs_client
+
+        if service_name == 'dynamodb':
+            return self.__dynamodb_client
+
+        raise ValueError(f'No in-memory {service_name} client is available')
+
+    def resource(self, service_name: str, **_: Any) -> Any:
+        if service_name == 'sqs':
+            return self.__sqs_resource
+
+        if service_name == 'dynamodb':
+            return self.__dynamodb_resource
+
+        raise ValueError(f'No in-memory {service_name} resource is available')
@@ -0,0 +1,28 @@
+from typing import Any, Dict, List
+
+from boto3.dynamodb.types import TypeDeserializer
+
+from aws_test_harness_test_support.in_memory_dynamodb_resource import InMemoryDynamoDBResource
+
+
+# In-process stand-in for the subset of the low-level DynamoDB client used to write results, storing items in the
+# tables of an in-memory DynamoDB resource so that they can be read back through it
+class InMemoryDynamoDBClient:
+    def __init__(self, dynamodb_resource: InMemoryDynamoDBResource) -> None:
+        self.__dynamodb_resource = dynamodb_resource
+        self.__type_deserializer = TypeDeserializer()
+
+    def put_item(self, TableName: str, Item: Dict[str, Any]) -> Dict[str, Any]:
+        return self.__dynamodb_resource.put_item(TableName, self.__deserialize(Item))
+
+    def batch_write_item(self, RequestItems: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        for table_name, write_requests in RequestItems.items():
+            self.__dynamodb_resource.batch_write_items(
+                table_name,
+                [self.__deserialize(write_request['PutRequest']['Item']) for write_request in write_requests]
+            )
+
+        return dict(UnprocessedItems={})
+
+    def __deserialize(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        return {name: self.__type_deserializer.deserialize(value) for name, value in item.items()}
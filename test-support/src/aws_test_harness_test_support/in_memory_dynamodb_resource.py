@@ -0,0 +1,126 @@
+from collections import Counter
+from copy import deepcopy
+from dataclasses import dataclass, field
+from threading import Lock
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+
+@dataclass
+class InMemoryDynamoDBTableContent:
+    key_attribute_names: List[str]
+    items: Dict[Tuple[Any, ...], Dict[str, Any]] = field(default_factory=dict)
+
+
+class InMemoryDynamoDBBatchWriter:
+    def __init__(self, table: 'InMemoryDynamoDBTable') -> None:
+        self.__table = table
+        self.__items: List[Dict[str, Any]] = []
+
+    def __enter__(self) -> 'InMemoryDynamoDBBatchWriter':
+        return self
+
+    def __exit__(self, exception_type: Optional[Type[BaseException]], exception: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.__table.batch_write_items(self.__items)
+
+    def put_item(self, Item: Dict[str, Any]) -> None:
+        self.__items.append(Item)
+
+
+class InMemoryDynamoDBTable:
+    def __init__(self, resource: 'InMemoryDynamoDBResource', table_name: str) -> None:
+        self.__resource = resource
+        self.__table_name = table_name
+
+    def get_item(self, Key: Dict[str, Any]) -> Dict[str, Any]:
+        return self.__resource.get_item(self.__table_name, Key)
+
+    def put_item(self, Item: Dict[str, Any]) -> Dict[str, Any]:
+        return self.__resource.put_item(self.__table_name, Item)
+
+    def batch_writer(self) -> InMemoryDynamoDBBatchWriter:
+        return InMemoryDynamoDBBatchWriter(self)
+
+    def batch_write_items(self, items: List[Dict[str, Any]]) -> None:
+        self.__resource.batch_write_items(self.__table_name, items)
+
+
+# In-process stand-in for the subset of the DynamoDB service resource used by the serverless invocation post offices,
+# so that they can be exercised without AWS. Items are copied on the way in and out, as they would be serialised.
+class InMemoryDynamoDBResource:
+    def __init__(self) -> None:
+        self.__tables: Dict[str, InMemoryDynamoDBTableContent] = {}
+        self.__lock = Lock()
+        self.__request_counts: Counter[str] = Counter()
+
+    def request_count(self, operation_name: str) -> int:
+        with self.__lock:
+            return self.__request_counts[operation_name]
+
+    def create_table(self, TableName: str, KeySchema: List[Dict[str, str]]) -> InMemoryDynamoDBTable:
+        with self.__lock:
+            self.__request_counts['create_table'] += 1
+            self.__tables[TableName] = InMemoryDynamoDBTableContent(
+                key_attribute_names=[key['AttributeName'] for key in KeySchema]
+            )
+
+        return self.Table(TableName)
+
+    def Table(self, name: str) -> InMemoryDynamoDBTable:
+        return InMemoryDynamoDBTable(self, name)
+
+    def get_item(self, table_name: str, key: Dict[str, Any]) -> Dict[str, Any]:
+        with self.__lock:
+            self.__request_counts['get_item'] += 1
+            table = self.__get_table(table_name)
+            item = table.items.get(self.__to_key(table, key))
+
+        return {} if item is None else dict(Item=deepcopy(item))
+
+    def put_item(self, table_name: str, item: Dict[str, Any]) -> Dict[str, Any]:
+        with self.__lock:
+            self.__request_counts['put_item'] += 1
+            self.__store(table_name, item)
+
+        return {}
+
+    def batch_write_items(self, table_name: str, items: List[Dict[str, Any]]) -> None:
+        # Written 25 at a time, as a batch writer would in BatchWriteItem requests
+        for batch_start in range(0, len(items), 25):
+            with self.__lock:
+                self.__request_counts['batch_write_item'] += 1
+
+                for item in items[batch_start:batch_start + 25]:
+                    self.__store(table_name, item)
+
+    def batch_get_item(self, RequestItems: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        with self.__lock:
+            self.__request_counts['batch_get_item'] += 1
+            responses: Dict[str, List[Dict[str, Any]]] = {}
+
+            for table_name, request in RequestItems.items():
+                table = self.__get_table(table_name)
+                responses[table_name] = [
+                    deepcopy(table.items[self.__to_key(table, key)])
+                    for key in request['Keys']
+                    if self.__to_key(table, key) in table.items
+                ]
+
+        return dict(Responses=responses, UnprocessedKeys={})
+
+    def __store(self, table_name: str, item: Dict[str, Any]) -> None:
+        table = self.__get_table(table_name)
+        table.items[self.__to_key(table, item)] = deepcopy(item)
+
+    def __get_table(self, table_name: str) -> InMemoryDynamoDBTableContent:
+        table = self.__tables.get(table_name)
+
+        if table is None:
+            raise ValueError(f'Table {table_name} does not exist')
+
+        return table
+
+    @staticmethod
+    def __to_key(table: InMemoryDynamoDBTableContent, item: Dict[str, Any]) -> Tuple[Any, ...]:
+        return tuple(item[key_attribute_name] for key_attribute_name in table.key_attribute_names)
@@ -0,0 +1,187 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from threading import Condition
+from time import monotonic
+from typing import Any, Dict, List, Optional, cast
+from uuid import uuid4
+
+from mypy_boto3_sqs import SQSClient
+
+DEFAULT_VISIBILITY_TIMEOUT_SECONDS = 30
+
+
+@dataclass
+class InMemorySQSMessage:
+    message_id: str
+    body: str
+    message_attributes: Dict[str, Any]
+    visible_from: float = 0
+    receipt_handle: Optional[str] = None
+
+
+@dataclass
+class InMemorySQSQueue:
+    visibility_timeout_seconds: float
+    messages: List[InMemorySQSMessage] = field(default_factory=list)
+
+
+# In-process stand-in for the subset of the SQS API used by the invocation post offices, so that they can be tested
+# without AWS. Messages become invisible for the visibility timeout when received and long polls block until a message
+# becomes visible or the wait time elapses, as they do in SQS.
+class InMemorySQSClient:
+    def __init__(self) -> None:
+        self.__queues: Dict[str, InMemorySQSQueue] = {}
+        self.__condition = Condition()
+        self.__request_counts: Counter[str] = Counter()
+
+    def as_sqs_client(self) -> SQSClient:
+        return cast(SQSClient, self)
+
+    def request_count(self, operation_name: str) -> int:
+        with self.__condition:
+            return self.__request_counts[operation_name]
+
+    def create_queue(self, QueueName: str, Attributes: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        attributes = Attributes or {}
+        queue_url = f'https://sqs.in-memory.localhost/000000000000/{QueueName}'
+
+        with self.__condition:
+            self.__request_counts['create_queue'] += 1
+            self.__queues[queue_url] = InMemorySQSQueue(
+                visibility_timeout_seconds=float(
+                    attributes.get('VisibilityTimeout', DEFAULT_VISIBILITY_TIMEOUT_SECONDS)
+                )
+            )
+
+        return dict(QueueUrl=queue_url)
+
+    def send_message(self, QueueUrl: str, MessageBody: str,
+                     MessageAttributes: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        with self.__condition:
+            self.__request_counts['send_message'] += 1
+            message_id = self.__enqueue(QueueUrl, MessageBody, MessageAttributes)
+
+        return dict(MessageId=message_id)
+
+    def send_message_batch(self, QueueUrl: str, Entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        with self.__condition:
+            self.__request_counts['send_message_batch'] += 1
+            successful = [
+                dict(Id=entry['Id'], MessageId=self.__enqueue(QueueUrl, entry['MessageBody'],
+                                                              entry.get('MessageAttributes')))
+                for entry in Entries
+            ]
+
+        return dict(Successful=successful, Failed=[])
+
+    def receive_message(self, QueueUrl: str, MaxNumberOfMessages: int = 1, WaitTimeSeconds: float = 0,
+                        MessageAttributeNames: Optional[List[str]] = None,
+                        VisibilityTimeout: Optional[float] = None) -> Dict[str, Any]:
+        deadline = monotonic() + WaitTimeSeconds
+
+        with self.__condition:
+            self.__request_counts['receive_message'] += 1
+            queue = self.__get_queue(QueueUrl)
+            visibility_timeout = queue.visibility_timeout_seconds if VisibilityTimeout is None else VisibilityTimeout
+
+            while True:
+                now = monotonic()
+                visible_messages = [message for message in queue.messages if message.visible_from <= now]
+
+                if visible_messages or now >= deadline:
+                    break
+
+                invisible_message_visible_from = [message.visible_from for message in queue.messages]
+                self.__condition.wait(min([deadline, *invisible_message_visible_from]) - now)
+
+            received_messages = visible_messages[:MaxNumberOfMessages]
+
+            for message in received_messages:
+                message.visible_from = now + visibility_timeout
+                message.receipt_handle = str(uuid4())
+
+            if not received_messages:
+                return {}
+
+            return dict(Messages=[
+                self.__to_message_description(message, MessageAttributeNames or [])
+                for message in received_messages
+            ])
+
+    def delete_message(self, QueueUrl: str, ReceiptHandle: str) -> Dict[str, Any]:
+        with self.__condition:
+            self.__request_counts['delete_message'] += 1
+            self.__delete(QueueUrl, ReceiptHandle)
+
+        return {}
+
+    def delete_message_batch(self, QueueUrl: str, Entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        with self.__condition:
+            self.__request_counts['delete_message_batch'] += 1
+
+            for entry in Entries:
+                self.__delete(QueueUrl, entry['ReceiptHandle'])
+
+        return dict(Successful=[dict(Id=entry['Id']) for entry in Entries], Failed=[])
+
+    def change_message_visibility(self, QueueUrl: str, ReceiptHandle: str, VisibilityTimeout: float) -> Dict[str, Any]:
+        with self.__condition:
+            self.__request_counts['change_message_visibility'] += 1
+            self.__change_visibility(QueueUrl, ReceiptHandle, VisibilityTimeout)
+
+        return {}
+
+    def change_message_visibility_batch(self, QueueUrl: str, Entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        with self.__condition:
+            self.__request_counts['change_message_visibility_batch'] += 1
+
+            for entry in Entries:
+                self.__change_visibility(QueueUrl, entry['ReceiptHandle'], entry['VisibilityTimeout'])
+
+        return dict(Successful=[dict(Id=entry['Id']) for entry in Entries], Failed=[])
+
+    def __enqueue(self, queue_url: str, message_body: str, message_attributes: Optional[Dict[str, Any]]) -> str:
+        message_id = str(uuid4())
+        self.__get_queue(queue_url).messages.append(
+            InMemorySQSMessage(message_id=message_id, body=message_body, message_attributes=message_attributes or {})
+        )
+        self.__condition.notify_all()
+
+        return message_id
+
+    def __delete(self, queue_url: str, receipt_handle: str) -> None:
+        queue = self.__get_queue(queue_url)
+        queue.messages = [message for message in queue.messages if message.receipt_handle != receipt_handle]
+
+    def __change_visibility(self, queue_url: str, receipt_handle: str, visibility_timeout: float) -> None:
+        for message in self.__get_queue(queue_url).messages:
+            if message.receipt_handle == receipt_handle:
+                message.visible_from = monotonic() + visibility_timeout
+
+        self.__condition.notify_all()
+
+    def __get_queue(self, queue_url: str) -> InMemorySQSQueue:
+        queue = self.__queues.get(queue_url)
+
+        if queue is None:
+            raise ValueError(f'Queue {queue_url} does not exist')
+
+        return queue
+
+    @staticmethod
+    def __to_message_description(message: InMemorySQSMessage, message_attribute_names: List[str]) -> Dict[str, Any]:
+        message_description: Dict[str, Any] = dict(
+            MessageId=message.message_id,
+            ReceiptHandle=message.receipt_handle,
+            Body=message.body
+        )
+
+        message_attributes = {
+            name: value for name, value in message.message_attributes.items()
+            if 'All' in message_attribute_names or name in message_attribute_names
+        }
+
+        if message_attributes:
+            message_description['MessageAttributes'] = message_attributes
+
+        return message_description
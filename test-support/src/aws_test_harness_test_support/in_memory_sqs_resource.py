@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from aws_test_harness_test_support.in_memory_sqs_client import InMemorySQSClient
+
+
+@dataclass(frozen=True)
+class InMemorySQSResourceMessage:
+    message_id: str
+    receipt_handle: str
+    body: str
+    message_attributes: Dict[str, Any]
+
+
+class InMemorySQSResourceQueue:
+    def __init__(self, sqs_client: InMemorySQSClient, queue_url: str) -> None:
+        self.__sqs_client = sqs_client
+        self.__queue_url = queue_url
+
+    def receive_messages(self, **receive_message_kwargs: Any) -> List[InMemorySQSResourceMessage]:
+        receive_message_result = self.__sqs_client.receive_message(QueueUrl=self.__queue_url,
+                                                                   **receive_message_kwargs)
+
+        return [
+            InMemorySQSResourceMessage(
+                message_id=message['MessageId'],
+                receipt_handle=message['ReceiptHandle'],
+                body=message['Body'],
+                message_attributes=message.get('MessageAttributes', {})
+            )
+            for message in receive_message_result.get('Messages', [])
+        ]
+
+    def delete_messages(self, Entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return self.__sqs_client.delete_message_batch(QueueUrl=self.__queue_url, Entries=Entries)
+
+
+# Presents an in-memory SQS client through the subset of the SQS service resource used by the harness
+class InMemorySQSResource:
+    def __init__(self, sqs_client: InMemorySQSClient) -> None:
+        self.__sqs_client = sqs_client
+
+    def Queue(self, url: str) -> InMemorySQSResourceQueue:
+        return InMemorySQSResourceQueue(self.__sqs_client, url)